@@ -0,0 +1,89 @@
+"""API routes streaming a team's player history and matches as files."""
+
+from contextlib import nullcontext
+
+from flask import Blueprint, Response, jsonify, request, stream_with_context
+
+from app.auth_utils import get_team_info, get_user_teams, require_authentication
+from app.db_routing import replica_reads, replicas_active, use_replicas
+from app.error_handlers import ValidationError, validate_team_id
+
+# Create Blueprint for export routes
+export_bp = Blueprint("export", __name__, url_prefix="/api/export")
+
+# These will be set by setup_export_blueprint()
+db = None
+
+
+def setup_export_blueprint(db_instance):
+    """Initialize export blueprint with database instance."""
+    global db
+    db = db_instance
+
+
+@export_bp.route("/players", methods=["GET"])
+@require_authentication
+@replica_reads
+def export_players():
+    """Stream every stored snapshot of a team's players.
+
+    Query parameters:
+    - team_id: Team ID
+    - format: csv (default), ndjson or parquet
+    - columns: Optional comma-separated Players columns
+    """
+    from app.history_export import (
+        PLAYER_COLUMN_TYPES,
+        PLAYER_EXPORT_COLUMNS,
+        player_history_rows,
+    )
+
+    return _stream_team_export("players", player_history_rows, PLAYER_EXPORT_COLUMNS, PLAYER_COLUMN_TYPES)
+
+
+@export_bp.route("/matches", methods=["GET"])
+@require_authentication
+@replica_reads
+def export_matches():
+    """Stream every stored match of a team, including analytics columns.
+
+    Query parameters are the same as for /api/export/players.
+    """
+    from app.history_export import (
+        MATCH_COLUMN_TYPES,
+        MATCH_EXPORT_COLUMNS,
+        team_match_rows,
+    )
+
+    return _stream_team_export("matches", team_match_rows, MATCH_EXPORT_COLUMNS, MATCH_COLUMN_TYPES)
+
+
+def _stream_team_export(kind, rows_for_team, available_columns, column_types):
+    from app.history_export import export_format, select_columns, stream_export
+
+    try:
+        team_id = validate_team_id(request.args.get("team_id"))
+        fmt = request.args.get("format", "csv")
+        mimetype = export_format(fmt)
+        columns = select_columns(request.args.get("columns"), available_columns)
+    except ValidationError as e:
+        return jsonify({"error": str(e)}), 400
+
+    is_valid, _teamname, error_msg = get_team_info(team_id, get_user_teams())
+    if not is_valid:
+        return jsonify({"error": error_msg}), 403
+
+    # The response body is generated after the view returns, so carry the
+    # replica routing decision into the generator
+    routing = use_replicas if replicas_active() else nullcontext
+
+    def generate():
+        with routing():
+            rows = rows_for_team(db.session, team_id, columns)
+            yield from stream_export(rows, columns, fmt, column_types)
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype=mimetype,
+        headers={"Content-Disposition": f'attachment; filename="{kind}_{team_id}.{fmt}"'},
+    )
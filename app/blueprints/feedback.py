@@ -9,7 +9,8 @@ from flask import (
     session,
     url_for,
 )
-from sqlalchemy import desc
+from sqlalchemy import desc, func
+from sqlalchemy.orm import selectinload
 from werkzeug.exceptions import abort
 
 from app.utils import create_page, dprint
@@ -21,6 +22,9 @@ feedback_bp = Blueprint("feedback", __name__, url_prefix="/feedback")
 app = None
 db = None
 
+# Archived feedback is paged so the board renders in a fixed number of queries
+ARCHIVED_PER_PAGE = 20
+
 
 def setup_feedback_blueprint(app_instance, db_instance):
     """Initialize feedback blueprint with app and db instances."""
@@ -41,7 +45,7 @@ def setup_feedback_blueprint(app_instance, db_instance):
 def list_feedback():
     """Display list of all feedback items with voting and handle new submissions."""
 
-    from models import Feedback, FeedbackVote, User
+    from models import Feedback, FeedbackComment, FeedbackVote, User
 
     # Check authentication - session only, no CHPP calls
     if "access_key" not in session or "current_user_id" not in session:
@@ -92,11 +96,43 @@ def list_feedback():
         flash("Thank you for your feedback!", "success")
         return redirect(url_for("feedback.list_feedback"))
 
-    # Get active feedback (non-archived) ordered by vote score and creation date
-    active_feedback = Feedback.query.filter(~Feedback.archived).order_by(desc(Feedback.vote_score), desc(Feedback.created_at)).all()
+    # Get active feedback (non-archived) ordered by vote score and creation date.
+    # Authors are eager-loaded so the template does not lazy-load them per item.
+    active_feedback = (
+        Feedback.query.options(selectinload(Feedback.author))
+        .filter(~Feedback.archived)
+        .order_by(desc(Feedback.vote_score), desc(Feedback.created_at))
+        .all()
+    )
+
+    # Get one page of archived feedback ordered by creation date (newest first)
+    archived_page = request.args.get("archived_page", 1, type=int)
+    archived_query = (
+        Feedback.query.options(selectinload(Feedback.author))
+        .filter(Feedback.archived)
+        .order_by(desc(Feedback.created_at))
+    )
+    archived_pagination = archived_query.paginate(
+        page=archived_page, per_page=ARCHIVED_PER_PAGE, error_out=False
+    )
+    if archived_pagination.pages and archived_page > archived_pagination.pages:
+        # Past the end (e.g. a stale link after unarchiving): show the last page
+        archived_pagination = archived_query.paginate(
+            page=archived_pagination.pages, per_page=ARCHIVED_PER_PAGE, error_out=False
+        )
+    archived_feedback = archived_pagination.items
+
+    # Comment counts via a grouped query instead of loading comment bodies
+    feedback_ids = [f.id for f in active_feedback] + [f.id for f in archived_feedback]
+    comment_counts = {}
+    if feedback_ids:
+        comment_counts = dict(
+            db.session.query(FeedbackComment.feedback_id, func.count(FeedbackComment.id))
+            .filter(FeedbackComment.feedback_id.in_(feedback_ids))
+            .group_by(FeedbackComment.feedback_id)
+            .all()
+        )
 
-    # Get archived feedback ordered by creation date (newest first)
-    archived_feedback = Feedback.query.filter(Feedback.archived).order_by(desc(Feedback.created_at)).all()
     # Get user's votes for quick lookup
     user_votes = {}
     votes = FeedbackVote.query.filter_by(user_id=user.ht_id).all()
@@ -114,6 +150,8 @@ def list_feedback():
         title="Feedback",
         active_feedback=active_feedback,
         archived_feedback=archived_feedback,
+        archived_pagination=archived_pagination,
+        comment_counts=comment_counts,
         user_votes=user_votes,
         user_context=user_context
     )
@@ -299,49 +299,71 @@ def settings():
     )
 
 
-@main_bp.route("/changes")
-def changes():
-    """Public changes and changelog page."""
-    # Track changes page access for authenticated users
-    if "current_user_id" in session:
-        User = get_user_model()
-        current_user_id = get_current_user_id()
-        user = db.session.query(User).filter_by(ht_id=current_user_id).first()
-        if user:
-            user.changes()
-            db.session.commit()
+# Changelog sources in the static folder, merged into one timeline by /changes
+CHANGELOG_SOURCES = ("changelog.json", "releases.json", "releases-internal.json")
+CHANGELOG_PER_PAGE = 200
+
+# Pre-rendered changelog lines and the first line of each page, rebuilt only
+# when a source file's mtime changes
+_changelog_cache = {"key": None, "lines": [], "page_starts": [0]}
+
+
+def _changelog_cache_key(static_folder):
+    """Return a tuple of source file mtimes (None for missing files)."""
+    key = []
+    for filename in CHANGELOG_SOURCES:
+        try:
+            key.append(os.stat(os.path.join(static_folder, filename)).st_mtime_ns)
+        except OSError:
+            key.append(None)
+    return tuple(key)
+
+
+def _get_changelog(static_folder):
+    """Get the merged, sorted and rendered changelog and its page starts, using the mtime cache."""
+    key = (static_folder, _changelog_cache_key(static_folder))
+    if _changelog_cache["key"] != key:
+        lines, release_starts = _build_changelog_lines(static_folder)
+        _changelog_cache["lines"] = lines
+        _changelog_cache["page_starts"] = _changelog_page_starts(len(lines), release_starts)
+        _changelog_cache["key"] = key
+    return _changelog_cache["lines"], _changelog_cache["page_starts"]
+
+
+def _changelog_page_starts(line_count, release_starts):
+    """Return the first line of each page, only ever cutting before a release header.
+
+    Releases are added to a page while it stays within CHANGELOG_PER_PAGE
+    lines, so a release is never split from its commits; a single release
+    longer than that gets a page of its own.
+    """
+    sections = sorted({0, *release_starts})
+    page_starts = [0]
+    for start, end in zip(sections, [*sections[1:], line_count], strict=True):
+        if start > page_starts[-1] and end - page_starts[-1] > CHANGELOG_PER_PAGE:
+            page_starts.append(start)
+    return page_starts
+
+
+def _build_changelog_lines(static_folder):
+    """Read changelog JSON sources and render them as HTML lines.
+
+    Returns:
+        tuple: (lines, indexes of the release header lines)
+    """
     changelogfull = []
+    release_starts = []
     try:
-        import json
-
         all_entries = []
 
-        # Read commits JSON
-        commits_path = os.path.join(current_app.static_folder, 'changelog.json')
-        try:
-            with open(commits_path, encoding='utf-8') as f:
-                commits_data = json.load(f)
-                all_entries.extend(commits_data.get('entries', []))
-        except Exception as e:
-            dprint(1, f"Error reading commits JSON: {e}")
-
-        # Read user releases JSON
-        releases_path = os.path.join(current_app.static_folder, 'releases.json')
-        try:
-            with open(releases_path, encoding='utf-8') as f:
-                releases_data = json.load(f)
-                all_entries.extend(releases_data.get('entries', []))
-        except Exception as e:
-            dprint(1, f"Error reading releases JSON: {e}")
-
-        # Read internal releases JSON
-        internal_path = os.path.join(current_app.static_folder, 'releases-internal.json')
-        try:
-            with open(internal_path, encoding='utf-8') as f:
-                internal_data = json.load(f)
-                all_entries.extend(internal_data.get('entries', []))
-        except Exception as e:
-            dprint(1, f"Error reading internal releases JSON: {e}")
+        # Read commits, user releases and internal releases JSON
+        for filename in CHANGELOG_SOURCES:
+            path = os.path.join(static_folder, filename)
+            try:
+                with open(path, encoding='utf-8') as f:
+                    all_entries.extend(json.load(f).get('entries', []))
+            except Exception as e:
+                dprint(1, f"Error reading {filename}: {e}")
 
         # Sort all entries by date (newest first) with commit priority
         # When timestamps are equal, commits should appear before releases
@@ -377,12 +399,14 @@ def changes():
                 commit_class = f'commit-group-{current_release_id}' if current_release_id else ''
                 line = f'<div class="mb-1 py-1 px-2 border-left border-success bg-light {commit_class}" style="border-left-width: 3px !important; font-size: 0.9rem;"><small class="text-muted mr-2">{date}</small><code class="text-info small mr-2">{version}</code><span class="text-dark">{message}</span></div>'
             elif entry_type == 'user_release':
+                release_starts.append(len(changelogfull))
                 version = entry.get('version', '')
                 message = entry.get('message', '')
                 line = f'<div class="bg-success text-white p-2 mb-2 rounded shadow-sm"><strong><i class="fas fa-rocket"></i> {date} 🎉 {version} USER RELEASE</strong><br><small>{message}</small></div>'
                 # Reset current release for grouping
                 current_release_id = None
             elif entry_type == 'internal_release':
+                release_starts.append(len(changelogfull))
                 version = entry.get('version', '')
                 message = entry.get('message', '')
                 release_counter += 1
@@ -401,11 +425,37 @@ def changes():
     except Exception as e:
         dprint(1, f"Error reading changelog JSON files: {e}")
         changelogfull = ["Error loading changelog - run 'make changelog' to generate JSON files"]
+        release_starts = []
+
+    return changelogfull, release_starts
+
+
+@main_bp.route("/changes")
+def changes():
+    """Public changes and changelog page."""
+    # Track changes page access for authenticated users
+    if "current_user_id" in session:
+        User = get_user_model()
+        current_user_id = get_current_user_id()
+        user = db.session.query(User).filter_by(ht_id=current_user_id).first()
+        if user:
+            user.changes()
+            db.session.commit()
+
+    page = request.args.get("page", 1, type=int)
+    changelogfull, page_starts = _get_changelog(current_app.static_folder)
+
+    # Page through older releases; only the requested page is sliced from the cache
+    total_pages = len(page_starts)
+    page = min(max(page, 1), total_pages)
+    end = page_starts[page] if page < total_pages else len(changelogfull)
 
     return create_page(
         template="changes.html",
         title="Changes & Development History",
-        changelogfull=changelogfull,
+        changelogfull=changelogfull[page_starts[page - 1]:end],
+        page=page,
+        total_pages=total_pages,
     )
 
 
@@ -511,11 +561,15 @@ def admin():
         }
         errors.append(error_data)
 
+    from app.chpp.circuit_breaker import configured_circuit_breaker
+    breaker = configured_circuit_breaker()
+
     return create_page(
         template="debug.html",
         title="Debug",
         users=users,
         errors=errors,
+        chpp_breaker=breaker.as_dict() if breaker else None,
         form_error=form_error,
     )
 
@@ -656,3 +710,75 @@ def admin_preferences():
     except Exception as e:
         dprint(1, f"Error handling admin preferences: {str(e)}")
         return jsonify({"error": "Internal server error"}), 500
+
+
+@main_bp.route("/api/admin/pool-metrics")
+@require_authentication
+def pool_metrics():
+    """Report connection pool metrics of this worker process."""
+    from app.db_pool import DEFAULT_ENGINE_PROFILE
+    from app.db_pool import pool_metrics as collect_pool_metrics
+
+    try:
+        User = get_user_model()
+        user = db.session.query(User).filter_by(ht_id=get_current_user_id()).first()
+
+        if not user or user.getRole() != "Admin":
+            return jsonify({"error": "Admin access required"}), 403
+
+        return jsonify({
+            "pid": os.getpid(),
+            "profile": current_app.config.get("SQLALCHEMY_ENGINE_PROFILE") or DEFAULT_ENGINE_PROFILE,
+            "engines": collect_pool_metrics(db.engines),
+        }), 200
+
+    except Exception as e:
+        dprint(1, f"Error collecting pool metrics: {str(e)}")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@main_bp.route("/api/admin/chpp-rate-limit")
+@require_authentication
+def chpp_rate_limit_metrics():
+    """Report CHPP rate limiter settings and queue wait times of this worker process."""
+    from app.chpp.rate_limit import rate_limit_metrics
+
+    try:
+        User = get_user_model()
+        user = db.session.query(User).filter_by(ht_id=get_current_user_id()).first()
+
+        if not user or user.getRole() != "Admin":
+            return jsonify({"error": "Admin access required"}), 403
+
+        return jsonify({
+            "pid": os.getpid(),
+            "enabled": bool(current_app.config.get("CHPP_RATE_LIMIT")),
+            "limiter": rate_limit_metrics(),
+        }), 200
+
+    except Exception as e:
+        dprint(1, f"Error collecting CHPP rate limit metrics: {str(e)}")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@main_bp.route("/api/admin/chpp-requests")
+@require_authentication
+def chpp_request_metrics():
+    """Report CHPP request counts, bytes and durations per endpoint of this worker process."""
+    from app.chpp.metrics import request_metrics
+
+    try:
+        User = get_user_model()
+        user = db.session.query(User).filter_by(ht_id=get_current_user_id()).first()
+
+        if not user or user.getRole() != "Admin":
+            return jsonify({"error": "Admin access required"}), 403
+
+        return jsonify({
+            "pid": os.getpid(),
+            "endpoints": request_metrics(),
+        }), 200
+
+    except Exception as e:
+        dprint(1, f"Error collecting CHPP request metrics: {str(e)}")
+        return jsonify({"error": "Internal server error"}), 500
@@ -4,9 +4,11 @@ from datetime import datetime
 
 from flask import Blueprint, request, session
 from sqlalchemy import text
+from sqlalchemy.orm import selectinload
 
 from app.auth_utils import require_authentication
 from app.constants import HT_MATCH_ROLE
+from app.db_routing import replica_reads
 from app.hattrick_countries import get_country_display
 from app.model_registry import get_match_model, get_match_play_model
 from app.utils import (
@@ -58,6 +60,7 @@ def has_enhanced_data_filter(match):
 
 @matches_bp.route("/matches", methods=["GET", "POST"])
 @require_authentication
+@replica_reads
 def matches():
     """Display team matches and match details."""
     try:
@@ -129,6 +132,7 @@ def matches():
         try:
             dbmatches = (
                 db.session.query(Match)
+                .options(selectinload(Match.analytics))
                 .filter((Match.away_team_id == teamid) | (Match.home_team_id == teamid))
                 .order_by(text("datetime desc"))
                 .all()
@@ -243,6 +247,7 @@ def matches():
 
 @matches_bp.route("/formations")
 @require_authentication
+@replica_reads
 def formations():
     """Display formation tester and tactical analyzer."""
     from app.model_registry import get_user_model
@@ -265,21 +270,10 @@ def formations():
     all_team_names = session["all_team_names"]
     teamname = all_team_names[all_teams.index(teamid)]
 
-    # Get all current players for the team
-    current_players = (
-        db.session.query(Players)
-        .filter_by(owner=teamid)
-        .order_by(Players.data_date.desc(), Players.tsi.desc())
-        .all()
-    )
-
-    # Filter to get the most recent data for each player
-    latest_players = {}
-    for player in current_players:
-        if player.ht_id not in latest_players:
-            latest_players[player.ht_id] = player
+    # Get the most recent data for each current player of the team
+    from app.player_snapshots import get_current_roster
 
-    current_players_list = list(latest_players.values())
+    current_players_list = get_current_roster(db.session, teamid, Players.tsi.desc())
 
     # Sort players by number (players without numbers go to end)
     current_players_list.sort(key=lambda p: (p.number is None, p.number or 999))
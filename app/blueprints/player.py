@@ -10,6 +10,7 @@ from app.auth_utils import (
     get_user_teams,
     require_authentication,
 )
+from app.db_routing import replica_reads
 from app.error_handlers import (
     TeamAccessError,
     ValidationError,
@@ -43,6 +44,7 @@ def setup_player_blueprint(
 
 @player_bp.route("/player", methods=["GET", "POST"])
 @require_authentication
+@replica_reads
 def player():
     """Display player list with skill tracking and grouping."""
     # Get model classes from registry
@@ -155,12 +157,10 @@ def player():
     )
 
     # Of each of the players you ever have owned, get the last download
-    players_data = (
-        db.session.query(Players)
-        .filter_by(owner=teamid)
-        .order_by(text("data_date"))
-        .order_by(text("number"))
-        .all()
+    from app.player_snapshots import load_player_history
+
+    players_data = load_player_history(
+        db.session, owner=teamid, order_by=("data_date", "number")
     )
 
     (allplayerids, allplayers, playernames) = get_training(players_data)
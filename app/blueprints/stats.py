@@ -4,6 +4,7 @@ import traceback
 from flask import Blueprint, request, session
 
 from app.auth_utils import require_authentication
+from app.db_routing import replica_reads
 from app.utils import create_page, dprint
 
 # Create Blueprint for stats routes
@@ -21,6 +22,7 @@ def setup_stats_blueprint(db_instance):
 
 @stats_bp.route("/stats")
 @require_authentication
+@replica_reads
 def stats():
     """Display team statistics."""
     from app.model_registry import get_user_model
@@ -43,23 +45,10 @@ def stats():
     all_team_names = session["all_team_names"]
     teamname = all_team_names[all_teams.index(teamid)]
 
-    # Get all current players for the team
-    from models import Players
+    # Get the most recent data for each current player of the team
+    from app.player_snapshots import get_current_roster
 
-    current_players = (
-        db.session.query(Players)
-        .filter_by(owner=teamid)
-        .order_by(Players.data_date.desc())
-        .all()
-    )
-
-    # Filter to get the most recent data for each player
-    latest_players = {}
-    for player in current_players:
-        if player.ht_id not in latest_players:
-            latest_players[player.ht_id] = player
-
-    current_players_list = list(latest_players.values())
+    current_players_list = get_current_roster(db.session, teamid)
 
     # Calculate team statistics
     from app.utils import (
@@ -7,9 +7,11 @@ from datetime import datetime as dt
 from flask import Blueprint, flash, redirect, render_template, request, session, url_for
 
 from app.auth_utils import get_current_user_id, get_user_teams, require_authentication
+from app.chpp.exceptions import CHPPUnavailableError
+from app.chpp.rate_limit import PRIORITY_ARCHIVE
 from app.chpp_utilities import fetch_user_teams, get_chpp_client
 from app.model_registry import get_user_model
-from app.utils import create_page, diff, dprint
+from app.utils import create_page, diff, dprint, player_details_columns
 
 # Create Blueprint for team routes
 team_bp = Blueprint("team", __name__)
@@ -57,6 +59,12 @@ def team():
 @require_authentication
 def update():
     """Update player data from Hattrick API."""
+    from app.player_partitions import ensure_player_partitions
+    from app.player_snapshots import (
+        get_current_roster,
+        release_player,
+        store_player_snapshot,
+    )
     from models import Players  # Import here to avoid circular dependencies
 
     dprint(1, "=== DATA UPDATE PROCESS STARTED ===")
@@ -93,6 +101,9 @@ def update():
             else:
                 raise chpp_user_error
 
+    except CHPPUnavailableError:
+        # CHPP is down: fail fast with the "Hattrick unavailable" page
+        raise
     except Exception as e:
         error_details = traceback.format_exc()
         dprint(1, f"CRITICAL ERROR: CHPP initialization failed: {str(e)}")
@@ -145,6 +156,8 @@ def update():
                     dprint(1, "Warning: Current user not found in database")
 
                 dprint(1, f"Archive download requested for team {archive_team_id}")
+                # Let interactive updates of other users go first
+                chpp.priority = PRIORITY_ARCHIVE
                 result = downloadMatches(archive_team_id, chpp)
                 dprint(1, f"downloadMatches result: {result}")
 
@@ -172,6 +185,12 @@ def update():
     left_players = []
     playernames = {}
 
+    # Make sure today's snapshots have a partition to land in (PostgreSQL only)
+    created_partitions = ensure_player_partitions(db.session)
+    if created_partitions:
+        db.session.commit()
+        dprint(1, f"Created player partitions: {', '.join(created_partitions)}")
+
     for teamid in all_teams:
         try:
             the_team = chpp.team(ht_id=teamid)
@@ -223,6 +242,8 @@ def update():
                 dprint(1, f"Warning: Failed to store competition data for team {teamid}: {str(comp_error)}")
                 # Continue with update process even if competition data storage fails
 
+        except CHPPUnavailableError:
+            raise
         except Exception as e:
             error_details = traceback.format_exc()
             dprint(1, f"ERROR: Failed to fetch team data for team {teamid}: {str(e)}")
@@ -265,6 +286,13 @@ def update():
                 all_team_names=session["all_team_names"],
             )
 
+        # Roster as of the previous update, read before today's snapshots move it
+        roster_before = {
+            p.ht_id: p.first_name + " " + p.last_name
+            for p in get_current_roster(db.session, teamid)
+        }
+        dprint(1, f"Found {len(roster_before)} existing players in database")
+
         players_fromht = []
         for p in the_team.players():
             thisplayer = {}
@@ -319,23 +347,9 @@ def update():
 
             thisplayer["native_league_id"] = None
             thisplayer["native_league_name"] = None
-            thisplayer["tsi"] = the_player.tsi
-            thisplayer["salary"] = the_player.salary
-            thisplayer["caps"] = the_player.caps
-            thisplayer["caps_u20"] = the_player.caps_u20
-            thisplayer["career_goals"] = the_player.career_goals
-            thisplayer["career_hattricks"] = the_player.career_hattricks
-            thisplayer["league_goals"] = the_player.league_goals
-            thisplayer["cup_goals"] = the_player.cup_goals
-            thisplayer["friendly_goals"] = the_player.friendlies_goals  # Custom CHPP field name
-            thisplayer["current_team_matches"] = the_player.matches_current_team  # Custom CHPP field name
-            thisplayer["current_team_goals"] = the_player.goals_current_team  # Custom CHPP field name
-            thisplayer["national_team_id"] = the_player.national_team_id
+            thisplayer.update(player_details_columns(the_player))
             thisplayer["national_team_name"] = None  # Not available in Custom CHPP
-            thisplayer["is_transfer_listed"] = the_player.transfer_listed  # Custom CHPP field name
             thisplayer["team_id"] = None  # Not available in Custom CHPP
-            thisplayer["mother_club_bonus"] = the_player.mother_club_bonus
-            thisplayer["leadership"] = the_player.leadership
 
             # Try to get skill values from CHPPPlayer attributes
             # If they're 0 (not provided by API), fetch old values from database
@@ -376,20 +390,8 @@ def update():
             playernames[p.id] = p.first_name + " " + p.last_name
 
             try:
-                dbplayer = (
-                    db.session.query(Players)
-                    .filter_by(
-                        ht_id=thisplayer["ht_id"], data_date=thisplayer["data_date"]
-                    )
-                    .first()
-                )
-
-                if dbplayer:
-                    db.session.delete(dbplayer)
-                    db.session.commit()
-
-                newplayer = Players(thisplayer)
-                db.session.add(newplayer)
+                # Replaces any snapshot already stored today
+                store_player_snapshot(db.session, thisplayer)
                 db.session.commit()
                 dprint(
                     1,
@@ -429,31 +431,10 @@ def update():
         updated[teamid].append("/player?id=" + str(teamid))
         updated[teamid].append("players")
 
-        # Get the most recent player roster from database to compare
-        # We need to find the latest data_date and get only those players
-        from sqlalchemy import func
+        # Compare against the roster read before this update
         try:
-            dprint(1, f"Querying database for existing players for team {teamid}")
-            latest_date_subquery = (
-                db.session.query(func.max(Players.data_date))
-                .filter_by(owner=teamid)
-                .scalar_subquery()
-            )
-
-            players_data = (
-                db.session.query(Players)
-                .filter_by(owner=teamid)
-                .filter(Players.data_date == latest_date_subquery)
-                .all()
-            )
-
-            dprint(1, f"Found {len(players_data)} existing players in database")
-
-            players_indb = []
-            for p in players_data:
-                players_indb.append(p.ht_id)
-                playernames[p.ht_id] = p.first_name + " " + p.last_name
-            players_indb = list(set(players_indb))
+            players_indb = list(roster_before)
+            playernames.update(roster_before)
 
             # Which players are new
             players_new = diff(players_fromht, players_indb)
@@ -472,11 +453,7 @@ def update():
                 # Get player name from playernames dict, with fallback
                 player_name = playernames.get(p, "Unknown Player")
                 left_players.append([updated[teamid][0], player_name])
-                (
-                    db.session.query(Players)
-                    .filter_by(ht_id=p, owner=teamid)
-                    .update({"old_owner": teamid, "owner": 0})
-                )
+                release_player(db.session, p, teamid)
                 db.session.commit()
 
             dprint(1, f"Player difference calculation completed for team {teamid}")
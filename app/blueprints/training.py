@@ -6,6 +6,7 @@ from flask import Blueprint, request, session
 from sqlalchemy import text
 
 from app.auth_utils import require_authentication
+from app.db_routing import replica_reads
 from app.utils import create_page
 
 # Create Blueprint for training routes
@@ -25,9 +26,11 @@ def setup_training_blueprint(db_instance, trace_cols):
 
 @training_bp.route("/training")
 @require_authentication
+@replica_reads
 def training():
     """Display player training progression and skill development."""
     from app.model_registry import get_user_model
+    from app.player_snapshots import load_player_history
     from models import Players  # Import here to avoid circular dependencies
 
     # Track user activity
@@ -51,12 +54,8 @@ def training():
     teamname = all_team_names[all_teams.index(teamid)]
 
     # Get all players you have ever owned
-    players_data = (
-        db.session.query(Players)
-        .filter_by(owner=teamid)
-        .order_by(text("data_date"))
-        .order_by(text("ht_id"))
-        .all()
+    players_data = load_player_history(
+        db.session, owner=teamid, order_by=("data_date", "ht_id")
     )
 
     allplayerids = []
@@ -6,13 +6,22 @@ This module provides a drop-in replacement for pychpp with:
 - XML parsing for 4 endpoints (managercompendium, teamdetails, players, match)
 - YouthTeamId bug fix (handles as optional field)
 - Comprehensive error handling
+- Client-side rate limiting shared by all clients (rate_limit.py)
+- Fast failure during CHPP outages (circuit_breaker.py)
+- Always-on per-endpoint request metrics (metrics.py)
 - Easy testing with OAuth1Session mocking
 
 Version: 1.0.0
 """
 
 from app.chpp.client import CHPP
-from app.chpp.exceptions import CHPPAPIError, CHPPAuthError, CHPPError
+from app.chpp.exceptions import (
+    CHPPAPIError,
+    CHPPAuthError,
+    CHPPError,
+    CHPPRateLimitError,
+    CHPPUnavailableError,
+)
 
 __version__ = "1.0.0"
-__all__ = ["CHPP", "CHPPError", "CHPPAuthError", "CHPPAPIError"]
+__all__ = ["CHPP", "CHPPError", "CHPPAuthError", "CHPPAPIError", "CHPPRateLimitError", "CHPPUnavailableError"]
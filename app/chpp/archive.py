@@ -0,0 +1,173 @@
+"""Raw CHPP response archive.
+
+Opt-in store of every raw XML response the client receives, so that parser
+fixes can be backfilled from disk (scripts/database/reparse_chpp_archive.py)
+instead of re-downloading from the quota-limited CHPP API, which no longer
+serves old data anyway.
+
+Enabled by setting CHPP_ARCHIVE_DIR. Layout under that directory:
+
+- objects/ab/<sha256>.xml.gz: gzip-compressed response bodies, addressed by
+  the SHA-256 of the uncompressed body, so identical responses are stored once
+- index.ndjson: one JSON line per fetch with the digest, CHPP file, version,
+  query parameters and local fetch time
+
+Usage:
+    archive = ResponseArchive("/var/lib/htstatus/chpp-archive")
+    archive.store("playerdetails", "3.1", {"playerID": 1}, body)
+    for entry in archive.entries(files=["playerdetails"]):
+        root = fromstring(archive.read(entry.digest))
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from flask import current_app, has_app_context
+
+INDEX_FILE = "index.ndjson"
+OBJECTS_DIR = "objects"
+
+
+@dataclass(slots=True)
+class ArchiveEntry:
+    """One archived fetch of a CHPP file."""
+
+    digest: str
+    file: str
+    version: str
+    fetched_at: datetime
+    params: dict[str, Any] = field(default_factory=dict)
+
+
+class ArchiveWriter:
+    """Compresses and hashes one response body as it is written.
+
+    Nothing becomes visible in the archive until commit(); discard() (or an
+    exception before commit) leaves no trace, so partially streamed or failed
+    responses are never archived.
+    """
+
+    def __init__(self, archive: "ResponseArchive", file: str, version: str, params: dict[str, Any]):
+        self.archive = archive
+        self.file = file
+        self.version = version
+        self.params = params
+        self._sha = hashlib.sha256()
+        tmp_dir = archive.root / "tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        # Kept open across write() calls and closed by commit() or discard()
+        self._tmp = tempfile.NamedTemporaryFile(dir=tmp_dir, suffix=".xml.gz", delete=False)  # noqa: SIM115
+        self._gzip = gzip.GzipFile(fileobj=self._tmp, mode="wb", mtime=0)
+
+    def write(self, chunk: bytes) -> None:
+        """Add a chunk of the response body."""
+        self._sha.update(chunk)
+        self._gzip.write(chunk)
+
+    def tee(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Yield chunks unchanged while writing them to the archive."""
+        for chunk in chunks:
+            self.write(chunk)
+            yield chunk
+
+    def commit(self, fetched_at: datetime | None = None) -> str:
+        """Store the body (unless already present), index the fetch and return its digest."""
+        self._gzip.close()
+        self._tmp.close()
+        digest = self._sha.hexdigest()
+        target = self.archive.object_path(digest)
+        if target.exists():
+            os.unlink(self._tmp.name)
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(self._tmp.name, target)
+
+        self.archive._append_index(ArchiveEntry(
+            digest, self.file, self.version, fetched_at or datetime.now(), self.params
+        ))
+        return digest
+
+    def discard(self) -> None:
+        """Drop the partially written body."""
+        self._gzip.close()
+        self._tmp.close()
+        if os.path.exists(self._tmp.name):
+            os.unlink(self._tmp.name)
+
+
+class ResponseArchive:
+    """Content-addressed, deduplicated store of raw CHPP responses."""
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    def object_path(self, digest: str) -> Path:
+        """Return the path of the compressed body with this digest."""
+        return self.root / OBJECTS_DIR / digest[:2] / f"{digest}.xml.gz"
+
+    def writer(self, file: str, version: str, params: dict[str, Any]) -> ArchiveWriter:
+        """Start archiving a response that arrives in chunks."""
+        return ArchiveWriter(self, file, version, params)
+
+    def store(self, file: str, version: str, params: dict[str, Any], body: bytes,
+              fetched_at: datetime | None = None) -> str:
+        """Archive a complete response body and return its digest."""
+        writer = self.writer(file, version, params)
+        writer.write(body)
+        return writer.commit(fetched_at)
+
+    def read(self, digest: str) -> bytes:
+        """Return the uncompressed body with this digest."""
+        with gzip.open(self.object_path(digest), "rb") as f:
+            return f.read()
+
+    def entries(self, files: Iterable[str] | None = None, since: datetime | None = None) -> Iterator[ArchiveEntry]:
+        """Yield indexed fetches in fetch order, optionally filtered by CHPP file and time."""
+        index = self.root / INDEX_FILE
+        if not index.exists():
+            return
+        files = set(files) if files is not None else None
+
+        with open(index, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if files is not None and record["file"] not in files:
+                    continue
+                fetched_at = datetime.fromisoformat(record["fetched_at"])
+                if since is not None and fetched_at < since:
+                    continue
+                yield ArchiveEntry(
+                    record["digest"], record["file"], record["version"], fetched_at, record.get("params", {})
+                )
+
+    def _append_index(self, entry: ArchiveEntry) -> None:
+        # One short line per write: O_APPEND keeps lines from concurrent
+        # workers intact on local filesystems
+        line = json.dumps({
+            "digest": entry.digest,
+            "file": entry.file,
+            "version": entry.version,
+            "params": entry.params,
+            "fetched_at": entry.fetched_at.isoformat(timespec="seconds"),
+        }, default=str)
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / INDEX_FILE, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def configured_archive() -> ResponseArchive | None:
+    """Return the archive configured by CHPP_ARCHIVE_DIR, None when disabled."""
+    if not has_app_context():
+        return None
+    root = current_app.config.get("CHPP_ARCHIVE_DIR")
+    return ResponseArchive(root) if root else None
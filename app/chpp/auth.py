@@ -13,6 +13,7 @@ from app.chpp.constants import (
     CHPP_REQUEST_TOKEN_URL,
 )
 from app.chpp.exceptions import CHPPAuthError
+from app.chpp.transport import mount_shared_adapter
 
 
 def get_request_token(
@@ -50,6 +51,7 @@ def get_request_token(
             client_secret=consumer_secret,
             callback_uri=callback_url,
         )
+        mount_shared_adapter(oauth)
 
         # Fetch request token from CHPP
         tokens = oauth.fetch_request_token(CHPP_REQUEST_TOKEN_URL)
@@ -107,6 +109,7 @@ def get_access_token(
             resource_owner_secret=request_token_secret,
             verifier=verifier,
         )
+        mount_shared_adapter(oauth)
 
         # Exchange temporary tokens for permanent access tokens
         tokens = oauth.fetch_access_token(CHPP_ACCESS_TOKEN_URL)
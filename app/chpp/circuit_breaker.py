@@ -0,0 +1,154 @@
+"""Circuit breaker for CHPP outages.
+
+When Hattrick is down or in maintenance every CHPP call would otherwise sit
+through the full urllib3 retry and backoff schedule before failing, holding a
+worker for each request of each user. The breaker counts consecutive outage
+failures across all CHPP clients of the app:
+
+- closed: requests go through; CHPP_BREAKER_THRESHOLD consecutive failures
+  open the circuit
+- open: requests fail immediately with CHPPUnavailableError for
+  CHPP_BREAKER_COOLDOWN seconds
+- half_open: after the cool-down a single probe request goes through while
+  others keep failing fast; success closes the circuit, failure reopens it
+
+Only signs of an outage count as failures: connection errors, timeouts,
+HTTP 5xx (after retries) and responses that are not XML (maintenance pages).
+CHPP error documents and 4xx responses mean the API is up. State is per
+worker process and reported on the admin debug page.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import requests
+from flask import current_app, has_app_context
+
+from app.chpp.exceptions import CHPPRateLimitError, CHPPUnavailableError
+from app.chpp.xml_backend import PARSE_ERRORS
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def is_outage(error: BaseException) -> bool:
+    """Return True if error means CHPP itself is unreachable or broken."""
+    if isinstance(error, requests.HTTPError):
+        return error.response is not None and error.response.status_code >= 500
+    return isinstance(error, (requests.ConnectionError, requests.Timeout, requests.exceptions.RetryError,
+                              *PARSE_ERRORS))
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open probe.
+
+    Example:
+        >>> breaker = CircuitBreaker(threshold=5, cooldown=60)
+        >>> with breaker.guard():
+        ...     response = session.get(url)
+    """
+
+    def __init__(self, threshold: int = 5, cooldown: float = 60.0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self.state = CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.rejected = 0
+        self.last_error = None
+        self.opened_at = None
+        self._opened = 0.0
+        self._probing = False
+
+    def before_request(self) -> None:
+        """Let the request through or raise CHPPUnavailableError."""
+        with self._lock:
+            if self.state == CLOSED:
+                return
+            retry_after = self._opened + self.cooldown - time.monotonic()
+            if self.state == OPEN and retry_after <= 0:
+                self.state = HALF_OPEN
+            if self.state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            self.rejected += 1
+            raise CHPPUnavailableError(max(retry_after, 0.0), self.last_error)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self, error: BaseException) -> None:
+        with self._lock:
+            self.failures += 1
+            self.last_error = f"{type(error).__name__}: {error}"[:200]
+            if self.state == HALF_OPEN or self.failures >= self.threshold:
+                if self.state != OPEN:
+                    self.trips += 1
+                self.state = OPEN
+                self._opened = time.monotonic()
+                self.opened_at = datetime.now()
+            self._probing = False
+
+    def release(self) -> None:
+        """End a request that says nothing about CHPP health."""
+        with self._lock:
+            self._probing = False
+
+    @contextmanager
+    def guard(self):
+        """Wrap one CHPP request (including reading and parsing its body)."""
+        self.before_request()
+        try:
+            yield
+        except GeneratorExit:
+            # A streaming caller stopped reading early: CHPP was answering
+            self.record_success()
+            raise
+        except CHPPRateLimitError:
+            self.release()
+            raise
+        except BaseException as e:
+            if is_outage(e):
+                self.record_failure(e)
+            else:
+                self.record_success()
+            raise
+        else:
+            self.record_success()
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            retry_after = self._opened + self.cooldown - time.monotonic() if self.state == OPEN else 0.0
+            return {
+                "state": self.state,
+                "consecutive_failures": self.failures,
+                "threshold": self.threshold,
+                "cooldown": self.cooldown,
+                "trips": self.trips,
+                "rejected": self.rejected,
+                "opened_at": self.opened_at,
+                "retry_in": round(max(retry_after, 0.0), 1),
+                "last_error": self.last_error,
+            }
+
+
+def configured_circuit_breaker() -> CircuitBreaker | None:
+    """Return the app's shared breaker configured by CHPP_BREAKER_THRESHOLD, None when disabled."""
+    if not has_app_context():
+        return None
+    if "chpp_circuit_breaker" not in current_app.extensions:
+        threshold = current_app.config.get("CHPP_BREAKER_THRESHOLD")
+        breaker = None
+        if threshold:
+            breaker = CircuitBreaker(
+                int(threshold), float(current_app.config.get("CHPP_BREAKER_COOLDOWN") or 60)
+            )
+        current_app.extensions["chpp_circuit_breaker"] = breaker
+    return current_app.extensions["chpp_circuit_breaker"]
@@ -5,22 +5,28 @@ Orchestrates OAuth, XML parsing, and data models.
 """
 
 import logging
+import time
 import xml.etree.ElementTree as ET
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager, nullcontext
 from typing import Any
 
-from requests.adapters import HTTPAdapter
+import requests
+from flask import current_app, has_app_context
 from requests_oauthlib import OAuth1Session
-from urllib3.util.retry import Retry
 
+from app.chpp.archive import ArchiveWriter, ResponseArchive, configured_archive
 from app.chpp.auth import get_access_token as auth_get_access_token
 from app.chpp.auth import get_request_token as auth_get_request_token
-from app.chpp.constants import (
-    CHPP_BASE_URL,
-    RETRY_BACKOFF_FACTOR,
-    RETRY_REDIRECT,
-    RETRY_TOTAL,
+from app.chpp.circuit_breaker import CircuitBreaker, configured_circuit_breaker
+from app.chpp.constants import CHPP_BASE_URL, STREAM_CHUNK_SIZE
+from app.chpp.exceptions import (
+    CHPPAPIError,
+    CHPPAuthError,
+    CHPPRateLimitError,
+    CHPPUnavailableError,
 )
-from app.chpp.exceptions import CHPPAPIError, CHPPAuthError
+from app.chpp.metrics import record_request
 from app.chpp.models import (
     CHPPMatch,
     CHPPMatchDetails,
@@ -30,11 +36,88 @@ from app.chpp.models import (
     CHPPTeam,
     CHPPUser,
 )
-from app.chpp.parsers import parse_players, parse_team, parse_user
+from app.chpp.parsers import (
+    iterparse_records,
+    parse_match_node,
+    parse_matchdetails_node,
+    parse_players,
+    parse_players_node,
+    parse_team,
+    parse_user,
+)
+from app.chpp.rate_limit import (
+    PRIORITY_INTERACTIVE,
+    RateLimiter,
+    configured_rate_limiter,
+)
+from app.chpp.transport import mount_shared_adapter
+from app.chpp.xml_backend import fromstring
 
 logger = logging.getLogger(__name__)
 
 
+def _raise_for_api_error(root: ET.Element) -> None:
+    """Raise CHPPAPIError if the response is a CHPP error document."""
+    error_code_elem = root.find(".//ErrorCode")
+    if error_code_elem is not None and error_code_elem.text:
+        error_code = int(error_code_elem.text)
+        error_message_elem = root.find(".//Error")
+        error_message = (
+            error_message_elem.text if error_message_elem is not None else "Unknown error"
+        )
+        raise CHPPAPIError(error_code, error_message)
+
+
+def _log_exchange(response: Any) -> None:
+    """Log a CHPP request and its response at DEBUG (for OAuth troubleshooting)."""
+    logger.debug("CHPP response status: %s", response.status_code)
+    logger.debug("CHPP response headers: %s", dict(response.headers))
+    logger.debug("CHPP request URL: %s", response.url)
+    logger.debug("CHPP request method: %s", response.request.method)
+    logger.debug("CHPP request headers: %s", dict(response.request.headers))
+
+    # Log Authorization header details (without exposing signature)
+    auth_header = response.request.headers.get('Authorization', '')
+    if isinstance(auth_header, bytes):
+        auth_header = auth_header.decode('utf-8', errors='replace')
+
+    if auth_header.startswith('OAuth '):
+        # Parse OAuth params (safe to log since it's public info)
+        oauth_params = {}
+        for part in auth_header[6:].split(', '):
+            if '=' in part:
+                key, val = part.split('=', 1)
+                # Truncate long values but show structure
+                display_val = val[:40] + '...' if len(val) > 40 else val
+                oauth_params[key] = display_val
+        logger.debug("OAuth parameters: %s", oauth_params)
+
+    # Log request body if present
+    if response.request.body:
+        logger.debug("CHPP request body: %s", response.request.body[:200])
+
+
+def _matches_archive_params(
+    id_: int,
+    is_youth: bool,
+    season: int | None,
+    first_match_date: str | None,
+    last_match_date: str | None,
+) -> dict[str, Any]:
+    """Build matchesarchive query parameters; season overrides the date range."""
+    params = {"teamID": id_, "isYouthTeam": is_youth}
+
+    if season is not None:
+        params["season"] = season
+    else:
+        if first_match_date:
+            params["FirstMatchDate"] = first_match_date
+        if last_match_date:
+            params["LastMatchDate"] = last_match_date
+
+    return params
+
+
 class CHPP:
     """Main CHPP client matching pychpp interface exactly.
 
@@ -68,6 +151,12 @@ class CHPP:
         consumer_secret: str,
         access_token_key: str | None = None,
         access_token_secret: str | None = None,
+        archive: ResponseArchive | None = None,
+        base_url: str | None = None,
+        rate_limiter: RateLimiter | None = None,
+        user_id: int | None = None,
+        priority: str = PRIORITY_INTERACTIVE,
+        circuit_breaker: CircuitBreaker | None = None,
     ) -> None:
         """Initialize CHPP client with OAuth credentials.
 
@@ -76,11 +165,29 @@ class CHPP:
             consumer_secret: CHPP consumer secret
             access_token_key: OAuth access token (optional)
             access_token_secret: OAuth access token secret (optional)
+            archive: Raw response archive (optional, defaults to the one
+                configured by CHPP_ARCHIVE_DIR)
+            base_url: CHPP XML endpoint (optional, defaults to the CHPP_URL
+                setting, e.g. a local stand-in server, or the live API)
+            rate_limiter: Client-side rate limiter (optional, defaults to the
+                app-wide one configured by CHPP_RATE_LIMIT)
+            user_id: Hattrick user the requests count against for
+                CHPP_USER_BUDGET (optional)
+            priority: Rate limit priority class: "interactive" (default),
+                "archive" or "backfill"
+            circuit_breaker: Outage circuit breaker (optional, defaults to the
+                app-wide one configured by CHPP_BREAKER_THRESHOLD)
         """
         self.consumer_key = consumer_key
         self.consumer_secret = consumer_secret
         self.access_key = access_token_key
         self.access_secret = access_token_secret
+        self.archive = archive
+        self.base_url = base_url
+        self.rate_limiter = rate_limiter
+        self.user_id = user_id
+        self.priority = priority
+        self.circuit_breaker = circuit_breaker
         self.session: OAuth1Session | None = None
 
         # Initialize session if access tokens provided
@@ -88,11 +195,12 @@ class CHPP:
             self._open_session()
 
     def _open_session(self) -> None:
-        """Initialize OAuth1Session with retry strategy.
+        """Initialize OAuth1Session on the shared, retrying transport.
 
         Sets up:
         - OAuth1Session with HMAC-SHA1 signatures
-        - HTTPAdapter with exponential backoff retry
+        - The process-wide HTTPAdapter (app/chpp/transport.py): keep-alive
+          connections reused across clients, exponential backoff retry
         - Automatic handling of transient failures
 
         Raises:
@@ -109,15 +217,8 @@ class CHPP:
                 resource_owner_secret=self.access_secret,
             )
 
-            # Configure retry strategy for transient failures
-            retry_strategy = Retry(
-                total=RETRY_TOTAL,
-                redirect=RETRY_REDIRECT,
-                backoff_factor=RETRY_BACKOFF_FACTOR,
-                status_forcelist=[500, 502, 503, 504],
-            )
-            adapter = HTTPAdapter(max_retries=retry_strategy)
-            self.session.mount("https://", adapter)
+            # Sign per user, but send over the process-wide connection pool
+            mount_shared_adapter(self.session)
 
         except Exception as e:
             raise CHPPAuthError(f"Failed to initialize OAuth session: {e}") from e
@@ -191,6 +292,87 @@ class CHPP:
             code,
         )
 
+    def _get(
+        self, file: str, version: str, params: dict[str, Any], stream: bool = False
+    ) -> tuple[Any, float]:
+        """Send an authenticated GET for a CHPP file and return the checked response.
+
+        The request is recorded in app.chpp.metrics once its body has been
+        read; for a successful streamed response that is left to the caller,
+        using the returned start time.
+
+        Args:
+            file: CHPP endpoint name
+            version: API version
+            params: Additional query parameters
+            stream: Leave the body unread so it can be consumed in chunks
+
+        Returns:
+            The response and its time.perf_counter() start time
+
+        Raises:
+            CHPPRateLimitError: If the client-side rate limit refuses the request
+            requests.HTTPError: If the HTTP status is an error
+        """
+        limiter = self.rate_limiter or configured_rate_limiter()
+        if limiter is not None:
+            limiter.acquire(self.priority, self.user_id)
+
+        # Build request parameters
+        request_params = {
+            "file": file,
+            "version": version,
+            **params,
+        }
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("CHPP request: file=%s, version=%s, params=%s", file, version, params)
+
+        # Make authenticated GET request
+        start = time.perf_counter()
+        try:
+            response = self.session.get(self._base_url(), params=request_params, stream=stream)
+        except requests.RequestException:
+            record_request(file, None, 0, time.perf_counter() - start, ok=False)
+            raise
+        if not stream:
+            record_request(file, response.status_code, len(response.content), time.perf_counter() - start,
+                           ok=response.ok)
+        elif not response.ok:
+            record_request(file, response.status_code, 0, time.perf_counter() - start, ok=False)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            _log_exchange(response)
+
+        if not response.ok:
+            response.close()
+        response.raise_for_status()
+        return response, start
+
+    def _base_url(self) -> str:
+        """Return the XML endpoint: explicit base_url, then CHPP_URL, then the live API."""
+        if self.base_url:
+            return self.base_url
+        if has_app_context() and current_app.config.get("CHPP_URL"):
+            return current_app.config["CHPP_URL"]
+        return CHPP_BASE_URL
+
+    def _breaker_guard(self) -> AbstractContextManager:
+        """Return the circuit breaker guard for one request, a no-op when disabled."""
+        breaker = self.circuit_breaker or configured_circuit_breaker()
+        return breaker.guard() if breaker is not None else nullcontext()
+
+    def _ensure_session(self) -> None:
+        """Open the OAuth session on first use.
+
+        Raises:
+            CHPPAuthError: If not authenticated or session invalid
+        """
+        if not self.session:
+            self._open_session()
+
+        if not self.session:
+            raise CHPPAuthError("OAuth session not initialized")
+
     def request(
         self,
         file: str,
@@ -213,84 +395,133 @@ class CHPP:
         Raises:
             CHPPAuthError: If not authenticated or session invalid
             CHPPAPIError: If CHPP API returns error code
+            CHPPRateLimitError: If the client-side rate limit refuses the request
+            CHPPUnavailableError: If CHPP is failing and the circuit breaker is open
 
         Example:
             >>> root = chpp.request("managercompendium", "1.6")
             >>> user_id = root.find(".//Manager/UserId").text
         """
-        if not self.session:
-            self._open_session()
+        self._ensure_session()
 
-        if not self.session:
-            raise CHPPAuthError("OAuth session not initialized")
+        try:
+            with self._breaker_guard():
+                response, _ = self._get(file, version, params)
 
-        # Build request parameters
-        request_params = {
-            "file": file,
-            "version": version,
-            **params,
-        }
+                # Parse XML response and check for CHPP API errors
+                root = fromstring(response.content)
+                _raise_for_api_error(root)
 
-        try:
-            # Log request details for debugging OAuth issues
-            logger.debug(f"CHPP request: file={file}, version={version}, params={params}")
-            logger.debug(f"Full request params: {request_params}")
-
-            # Make authenticated GET request
-            response = self.session.get(CHPP_BASE_URL, params=request_params)
-
-            # Log response details
-            logger.debug(f"CHPP response status: {response.status_code}")
-            logger.debug(f"CHPP response headers: {dict(response.headers)}")
-            logger.debug(f"CHPP request URL: {response.url}")
-            logger.debug(f"CHPP request method: {response.request.method}")
-            logger.debug(f"CHPP request headers: {dict(response.request.headers)}")
-
-            # Log Authorization header details (without exposing signature)
-            auth_header = response.request.headers.get('Authorization', '')
-            if isinstance(auth_header, bytes):
-                auth_header = auth_header.decode('utf-8', errors='replace')
-
-            if auth_header.startswith('OAuth '):
-                # Parse OAuth params (safe to log since it's public info)
-                oauth_params = {}
-                for part in auth_header[6:].split(', '):
-                    if '=' in part:
-                        key, val = part.split('=', 1)
-                        # Truncate long values but show structure
-                        display_val = val[:40] + '...' if len(val) > 40 else val
-                        oauth_params[key] = display_val
-                logger.debug(f"OAuth parameters: {oauth_params}")
-
-            # Log request body if present
-            if response.request.body:
-                logger.debug(f"CHPP request body: {response.request.body[:200]}")
-
-            response.raise_for_status()
-
-            # Parse XML response
-            root = ET.fromstring(response.content)
-
-            # Check for CHPP API errors
-            error_code_elem = root.find(".//ErrorCode")
-            if error_code_elem is not None and error_code_elem.text:
-                error_code = int(error_code_elem.text)
-                error_message_elem = root.find(".//Error")
-                error_message = (
-                    error_message_elem.text if error_message_elem is not None else "Unknown error"
-                )
-                raise CHPPAPIError(error_code, error_message)
+            archive = self.archive or configured_archive()
+            if archive is not None:
+                try:
+                    archive.store(file, version, params, response.content)
+                except OSError as e:
+                    logger.warning(f"Could not archive CHPP {file} response: {e}")
 
             return root
 
-        except CHPPAPIError:
-            # Re-raise CHPP API errors
+        except (CHPPAPIError, CHPPRateLimitError, CHPPUnavailableError):
+            # Re-raise CHPP API, rate limit and outage errors
             raise
         except Exception as e:
             # Wrap other errors as auth errors
             logger.error(f"CHPP request failed: {e}", exc_info=True)
             raise CHPPAuthError(f"CHPP request failed: {e}") from e
 
+    def stream(
+        self,
+        file: str,
+        version: str,
+        path: str,
+        parse: Callable[[ET.Element], Any],
+        discard: Iterable[str] = (),
+        **params: Any,
+    ) -> Iterator[Any]:
+        """Make authenticated CHPP API request and parse records as they arrive.
+
+        Streaming counterpart of request(): the response body is fed to an
+        incremental XML parser and each record element is parsed and freed as
+        soon as it closes, so memory stays proportional to one record even for
+        multi-season match archives. The HTTP request is only sent once
+        iteration starts; closing the iterator closes the connection.
+
+        Args:
+            file: CHPP endpoint name (e.g., "matchesarchive")
+            version: API version (e.g., "1.5")
+            path: Trailing tags of a record element (e.g., "MatchList/Match")
+            parse: Converts one record element into a model
+            discard: Tags of subtrees to drop unread (e.g., "EventList")
+            **params: Additional query parameters
+
+        Yields:
+            One parsed model per record element
+
+        Raises:
+            CHPPAuthError: If not authenticated, the request fails or the XML is malformed
+            CHPPAPIError: If CHPP API returns error code
+            CHPPRateLimitError: If the client-side rate limit refuses the request
+            CHPPUnavailableError: If CHPP is failing and the circuit breaker is open
+
+        Example:
+            >>> for match in chpp.stream("matchesarchive", "1.5", "MatchList/Match",
+            ...                          parse_match_node, teamID=123456, season=82):
+            ...     print(match.ht_id)
+        """
+        self._ensure_session()
+
+        try:
+            with self._breaker_guard():
+                response, start = self._get(file, version, params, stream=True)
+                received = 0
+
+                def counted(chunks):
+                    nonlocal received
+                    for chunk in chunks:
+                        received += len(chunk)
+                        yield chunk
+
+                chunks = counted(response.iter_content(STREAM_CHUNK_SIZE))
+                writer = self._archive_writer(file, version, params)
+                if writer is not None:
+                    chunks = writer.tee(chunks)
+                try:
+                    yield from iterparse_records(
+                        chunks,
+                        path,
+                        parse,
+                        discard=discard,
+                        check=_raise_for_api_error,
+                    )
+                    if writer is not None:
+                        try:
+                            writer.commit()
+                        except OSError as e:
+                            logger.warning(f"Could not archive CHPP {file} response: {e}")
+                        writer = None
+                finally:
+                    response.close()
+                    record_request(file, response.status_code, received, time.perf_counter() - start, ok=True)
+                    if writer is not None:
+                        writer.discard()
+
+        except (CHPPAPIError, CHPPRateLimitError, CHPPUnavailableError):
+            raise
+        except Exception as e:
+            logger.error(f"CHPP streaming request failed: {e}", exc_info=True)
+            raise CHPPAuthError(f"CHPP request failed: {e}") from e
+
+    def _archive_writer(self, file: str, version: str, params: dict[str, Any]) -> ArchiveWriter | None:
+        """Start archiving a streamed response, None when archiving is off or unavailable."""
+        archive = self.archive or configured_archive()
+        if archive is None:
+            return None
+        try:
+            return archive.writer(file, version, params)
+        except OSError as e:
+            logger.warning(f"Could not archive CHPP {file} response: {e}")
+            return None
+
     def user(self) -> CHPPUser:
         """Get current user information.
 
@@ -348,6 +579,9 @@ class CHPP:
                 detailed_player = self.player(basic_player.player_id)
                 print(f"[DEBUG] Success: {detailed_player.first_name} {detailed_player.last_name}, goals_current_team={getattr(detailed_player, 'goals_current_team', 'MISSING')}, matches_current_team={getattr(detailed_player, 'matches_current_team', 'MISSING')}, career_goals={getattr(detailed_player, 'career_goals', 'MISSING')}")
                 detailed_players.append(detailed_player)
+            except (CHPPRateLimitError, CHPPUnavailableError):
+                # Refused or CHPP is down: don't store a degraded roster, fail the update
+                raise
             except Exception as e:
                 # If individual player fetch fails, use basic info
                 print(f"[WARNING] Failed to fetch details for player {basic_player.player_id}: {e}")
@@ -358,6 +592,25 @@ class CHPP:
         team._players = detailed_players
 
         return team
+
+    def iter_players(self, team_id: int) -> Iterator[CHPPPlayer]:
+        """Stream a team's players list, one CHPPPlayer at a time.
+
+        Streaming counterpart of the players request made by team(); yields
+        the basic (players endpoint) data without per-player detail requests.
+
+        Args:
+            team_id: Hattrick team ID
+
+        Yields:
+            CHPPPlayer objects in roster order
+
+        Raises:
+            CHPPAuthError: If not authenticated
+            CHPPAPIError: If CHPP API returns error (e.g., unknown team ID)
+        """
+        return self.stream("players", "2.7", "PlayerList/Player", parse_players_node, teamId=team_id)
+
     def player(self, id_: int) -> "CHPPPlayer":
         """Get individual player details.
 
@@ -420,21 +673,36 @@ class CHPP:
         """
         from app.chpp.parsers import parse_matches
 
-        # Build parameters
-        params = {"teamID": id_, "isYouthTeam": is_youth}
-
-        if season is not None:
-            params["season"] = season
-        else:
-            if first_match_date:
-                params["FirstMatchDate"] = first_match_date
-            if last_match_date:
-                params["LastMatchDate"] = last_match_date
-
         # Use matchesarchive endpoint with enhanced parameters
+        params = _matches_archive_params(id_, is_youth, season, first_match_date, last_match_date)
         root = self.request("matchesarchive", "1.5", **params)
         return parse_matches(root)
 
+    def iter_matches_archive(self, id_: int, is_youth: bool = False, season: int = None,
+                             first_match_date: str = None, last_match_date: str = None) -> Iterator["CHPPMatch"]:
+        """Stream match history for a team, one CHPPMatch at a time.
+
+        Same request as matches_archive(), but matches are parsed while the
+        response downloads and only one Match element is held in memory, which
+        suits multi-season backfills.
+
+        Args:
+            See matches_archive()
+
+        Yields:
+            CHPPMatch objects in archive order
+
+        Raises:
+            CHPPAuthError: If not authenticated
+            CHPPAPIError: If CHPP API returns error (e.g., unknown team ID)
+
+        Example:
+            >>> for match in chpp.iter_matches_archive(id_=123456, season=82):
+            ...     print(match.ht_id, match.home_goals, match.away_goals)
+        """
+        params = _matches_archive_params(id_, is_youth, season, first_match_date, last_match_date)
+        return self.stream("matchesarchive", "1.5", "MatchList/Match", parse_match_node, **params)
+
     def matches(self, id_: int, is_youth: bool = False) -> list["CHPPMatch"]:
         """Get recent and upcoming matches for a team.
 
@@ -462,7 +730,7 @@ class CHPP:
         root = self.request("matches", "2.6", teamID=id_, isYouth=is_youth)
         return parse_matches(root)
 
-    def matchdetails(self, id_: int, match_events: bool = True) -> "CHPPMatchDetails":
+    def matchdetails(self, id_: int, match_events: bool = True, stream: bool = False) -> "CHPPMatchDetails":
         """Get comprehensive match details and statistics.
 
         Fetches detailed match information including statistics, events, possession,
@@ -471,6 +739,8 @@ class CHPP:
         Args:
             id_: Hattrick match ID
             match_events: Include match events in response (default: True)
+            stream: Parse the response incrementally, discarding the event list
+                instead of building the full tree (default: False)
 
         Returns:
             CHPPMatchDetails object with comprehensive match data
@@ -487,6 +757,14 @@ class CHPP:
         from app.chpp.parsers import parse_matchdetails
 
         # Use matchdetails endpoint v3.1 with matchID parameter (v3.1 added NrOfChances fields in March 2022)
+        if stream:
+            # The parsed fields never include the event text, so drop EventList as it arrives
+            records = list(self.stream(
+                "matchdetails", "3.1", "HattrickData/Match", parse_matchdetails_node,
+                discard=("EventList",), matchID=id_, matchEvents=match_events,
+            ))
+            return records[0] if records else parse_matchdetails(ET.Element("HattrickData"))
+
         root = self.request("matchdetails", "3.1", matchID=id_, matchEvents=match_events)
         return parse_matchdetails(root)
 
@@ -40,6 +40,12 @@ RETRY_TOTAL = 5
 RETRY_BACKOFF_FACTOR = 0.5
 RETRY_REDIRECT = 5
 
+# Idle keep-alive connections per host in the shared transport (app/chpp/transport.py)
+POOL_MAXSIZE = 10
+
+# Streaming responses are fed to the XML parser in chunks of this many bytes
+STREAM_CHUNK_SIZE = 64 * 1024
+
 # Valid OAuth Scopes
 VALID_SCOPES = [
     "",  # Default: read-only access
@@ -44,3 +44,37 @@ class CHPPAPIError(CHPPError):
         self.message = message
         error_type = ERROR_CODES.get(code, "Unknown CHPP error")
         super().__init__(f"CHPP Error {code} ({error_type}): {message}")
+
+
+class CHPPRateLimitError(CHPPError):
+    """Request not sent because of the client-side CHPP rate limit.
+
+    Raised when:
+    - The user's CHPP request budget for the current window is used up
+    - The request waited longer than CHPP_RATE_LIMIT_TIMEOUT for a token
+    """
+
+    pass
+
+
+class CHPPUnavailableError(CHPPError):
+    """Request not sent because CHPP is failing (circuit breaker open).
+
+    Attributes:
+        retry_after: Seconds until the next request is let through
+        last_error: Failure that opened the circuit
+    """
+
+    def __init__(self, retry_after: float, last_error: str | None = None):
+        """Initialize with the remaining cool-down.
+
+        Args:
+            retry_after: Seconds until the next probe request
+            last_error: Description of the last failure
+        """
+        self.retry_after = retry_after
+        self.last_error = last_error
+        super().__init__(
+            f"Hattrick's CHPP API is unavailable (maintenance or outage), "
+            f"retrying in {max(1, round(retry_after))}s"
+        )
@@ -0,0 +1,82 @@
+"""Always-on CHPP request metrics.
+
+Every CHPP request made by CHPP._get() is recorded here with its endpoint
+(CHPP file), HTTP status, response bytes and duration, measured once the body
+has been read (for streamed responses when the stream closes). Recording only
+updates a few counters under a lock, so it stays on in production while the
+verbose request logging in the client only runs with DEBUG enabled.
+
+Per-endpoint totals are kept per worker process and reported by
+/api/admin/chpp-requests. Each request is also logged to the
+"app.chpp.metrics" logger at INFO with the record in
+``extra={"chpp_request": {...}}``, for log-based metrics pipelines; like any
+log record it costs nothing beyond a level check unless that logger is
+enabled.
+"""
+
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class RequestMetrics:
+    """Request counters per CHPP endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+
+    def record(self, file, ok, nbytes, seconds):
+        with self._lock:
+            counters = self._counters.get(file)
+            if counters is None:
+                counters = self._counters[file] = {
+                    "requests": 0, "errors": 0, "bytes": 0, "seconds": 0.0, "max_seconds": 0.0,
+                }
+            counters["requests"] += 1
+            counters["errors"] += int(not ok)
+            counters["bytes"] += nbytes
+            counters["seconds"] += seconds
+            counters["max_seconds"] = max(counters["max_seconds"], seconds)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+
+    def as_dict(self):
+        with self._lock:
+            report = {}
+            for file, counters in sorted(self._counters.items()):
+                requests = counters["requests"]
+                report[file] = {
+                    "requests": requests,
+                    "errors": counters["errors"],
+                    "bytes": counters["bytes"],
+                    "ms_avg": round(counters["seconds"] / requests * 1000, 3),
+                    "ms_max": round(counters["max_seconds"] * 1000, 3),
+                }
+            return report
+
+
+_metrics = RequestMetrics()
+
+
+def record_request(file: str, status: int | None, nbytes: int, seconds: float, ok: bool) -> None:
+    """Record one CHPP request; status is None when no response arrived."""
+    _metrics.record(file, ok, nbytes, seconds)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "CHPP %s %s %dB %.1fms", file, status, nbytes, seconds * 1000,
+            extra={"chpp_request": {"endpoint": file, "status": status, "bytes": nbytes,
+                                    "duration_ms": round(seconds * 1000, 3)}},
+        )
+
+
+def request_metrics() -> dict:
+    """Return per-endpoint request totals of this worker process."""
+    return _metrics.as_dict()
+
+
+def reset_request_metrics() -> None:
+    _metrics.reset()
@@ -2,6 +2,11 @@
 
 Matches pychpp interface exactly for zero breaking changes.
 Supports dict-like access for backward compatibility.
+
+All models are slotted dataclasses: batch jobs hold thousands of players
+and match details, and with 50-70 fields a per-instance __dict__ costs
+more than the values themselves (see scripts/benchmark_chpp_models.py).
+Attributes outside the declared fields cannot be set.
 """
 
 from dataclasses import dataclass, field
@@ -9,7 +14,7 @@ from datetime import datetime
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class BidderTeam:
     """Team information for transfer bid.
 
@@ -26,7 +31,7 @@ class BidderTeam:
         return getattr(self, key)
 
 
-@dataclass
+@dataclass(slots=True)
 class TransferDetails:
     """Transfer details for a player on the transfer list.
 
@@ -49,7 +54,7 @@ class TransferDetails:
         return getattr(self, key)
 
 
-@dataclass
+@dataclass(slots=True)
 class CHPPUser:
     """User data from managercompendium endpoint.
 
@@ -72,7 +77,7 @@ class CHPPUser:
         return getattr(self, key)
 
 
-@dataclass
+@dataclass(slots=True)
 class CHPPTeam:
     """Team data from teamdetails endpoint.
 
@@ -141,7 +146,7 @@ class CHPPTeam:
         return getattr(self, key)
 
 
-@dataclass
+@dataclass(slots=True)
 class CHPPPlayer:
     """Player data from players endpoint.
 
@@ -239,7 +244,7 @@ class CHPPPlayer:
         return getattr(self, key)
 
 
-@dataclass
+@dataclass(slots=True)
 class CHPPMatch:
     """Match data from matches endpoint.
 
@@ -280,7 +285,7 @@ class CHPPMatch:
         return getattr(self, key)
 
 
-@dataclass
+@dataclass(slots=True)
 class CHPPMatchDetails:
     """Enhanced match details with comprehensive statistics from CHPP matchdetails endpoint.
 
@@ -382,7 +387,7 @@ class CHPPMatchDetails:
         return getattr(self, key)
 
 
-@dataclass
+@dataclass(slots=True)
 class CHPPMatchLineupPlayer:
     """Player in match lineup with ratings and position.
 
@@ -413,7 +418,7 @@ class CHPPMatchLineupPlayer:
         return getattr(self, key)
 
 
-@dataclass
+@dataclass(slots=True)
 class CHPPMatchLineup:
     """Complete match lineup with formations and player data.
 
@@ -440,7 +445,7 @@ class CHPPMatchLineup:
         return getattr(self, key)
 
 
-@dataclass
+@dataclass(slots=True)
 class CHPPPlayerEvent:
     """Individual player event for career tracking.
 
@@ -2,11 +2,24 @@
 
 Transforms CHPP XML responses into Python data structures.
 Handles optional fields gracefully (YouthTeamId fix).
+
+The high-volume parsers (players, player, matchdetails) declare their fields
+as a FieldMap and read every element in a single pass over its children;
+scripts/benchmark_chpp_parsers.py compares them with the find-per-field
+versions on recorded responses.
+
+Elements may come from xml.etree.ElementTree or lxml.etree, whichever
+app/chpp/xml_backend.py selected; list parsers locate records with its
+findall(), which uses precompiled XPath objects under lxml.
+
+iterparse_records() parses a response body chunk by chunk and yields one
+model per record element, so large documents never exist as a whole tree.
 """
 
 import xml.etree.ElementTree as ET
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
-from typing import Any
+from typing import Any, TypeVar
 
 from app.chpp.models import (
     CHPPMatch,
@@ -18,6 +31,7 @@ from app.chpp.models import (
     CHPPTeam,
     CHPPUser,
 )
+from app.chpp.xml_backend import findall, pull_parser
 
 
 def safe_find_text(root: ET.Element, xpath: str, default: Any = None) -> Any:
@@ -77,6 +91,169 @@ def safe_find_bool(root: ET.Element, xpath: str, default: bool = False) -> bool:
     return default
 
 
+def _to_text(text: str) -> str:
+    return text
+
+
+def _to_bool(text: str) -> bool:
+    return text.lower() in ("true", "1", "yes")
+
+
+def _to_datetime(text: str) -> datetime:
+    # CHPP format: "2024-01-15 14:30:00"
+    return datetime.fromisoformat(text.replace(" ", "T"))
+
+
+class FieldMap:
+    """Declarative field map compiled into a child-tag lookup table.
+
+    Fields are declared as name -> (path, converter, default), where path is
+    a "/"-separated child path such as "PlayerSkills/StaminaSkill". The paths
+    are compiled once into nested tag -> (name, converter) tables, so read()
+    walks each element's children exactly once instead of running one
+    Element.find() per field.
+
+    A converter may itself be a FieldMap with a list default: every matching
+    child is then read with it and appended, e.g. "Scorers/Goal".
+
+    Values follow the safe_find_* rules: missing, empty or unconvertible text
+    leaves the default. CHPP never repeats a field tag within an element; if
+    it did, the last one would win where Element.find() returns the first.
+
+    Example:
+        >>> SKILLS = FieldMap({"keeper": ("PlayerSkills/KeeperSkill", int, 0)})
+        >>> SKILLS.read(player_elem)
+        {'keeper': 7}
+    """
+
+    __slots__ = ("table", "defaults", "lists")
+
+    def __init__(self, fields: dict[str, tuple[str, Any, Any]]):
+        self.table: dict[str, Any] = {}
+        self.defaults: dict[str, Any] = {}
+        self.lists: list[str] = []
+
+        for name, (path, converter, default) in fields.items():
+            *containers, tag = path.split("/")
+            table = self.table
+            for container in containers:
+                table = table.setdefault(container, {})
+            table[tag] = (name, converter)
+            if isinstance(converter, FieldMap):
+                self.lists.append(name)
+            else:
+                self.defaults[name] = default
+
+    def read(self, elem: ET.Element) -> dict[str, Any]:
+        """Return the converted field values of `elem`, defaults for the rest."""
+        values = self.defaults.copy()
+        for name in self.lists:
+            values[name] = []
+        _read_children(elem, self.table, values)
+        return values
+
+
+T = TypeVar("T")
+
+
+def _pull_events(chunks: Iterable[bytes]) -> Iterator[tuple[str, ET.Element]]:
+    """Feed body chunks to a pull parser and yield its start/end events."""
+    parser = pull_parser(("start", "end"))
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
+
+
+def iterparse_records(
+    chunks: Iterable[bytes],
+    path: str,
+    parse: Callable[[ET.Element], T],
+    discard: Iterable[str] = (),
+    check: Callable[[ET.Element], None] | None = None,
+) -> Iterator[T]:
+    """Parse an XML body incrementally, yielding one model per record element.
+
+    Each element whose trailing tags match path (e.g. "MatchList/Match") is
+    handed to parse as soon as it closes and is then removed from the tree.
+    Elements tagged with one of discard are dropped unread, each descendant
+    as soon as it closes, so a long discarded list never builds up in memory.
+    Peak memory therefore stays proportional to one record rather than the
+    whole document.
+
+    Args:
+        chunks: Response body as an iterable of bytes chunks
+        path: Slash-separated trailing tags identifying a record element
+        parse: Converts one complete record element into a model
+        discard: Tags of subtrees to drop unread (e.g. "EventList")
+        check: Called with the remaining, record-free root element once the
+            document is complete, e.g. to raise on CHPP error responses
+
+    Yields:
+        parse(record) for each record element, in document order
+
+    Example:
+        >>> with open("matchesarchive.xml", "rb") as f:
+        ...     for match in iterparse_records(f, "MatchList/Match", parse_match_node):
+        ...         print(match.ht_id)
+    """
+    parts = path.split("/")
+    depth = len(parts)
+    discard = frozenset(discard)
+    stack: list[ET.Element] = []
+    tags: list[str] = []
+    # Stack index of the discarded element being read, whose descendants are
+    # dropped one by one as they close instead of piling up under it
+    discarded: int | None = None
+
+    for event, elem in _pull_events(chunks):
+        if event == "start":
+            if discarded is None and elem.tag in discard:
+                discarded = len(stack)
+            stack.append(elem)
+            tags.append(elem.tag)
+            continue
+
+        is_record = tags[-depth:] == parts
+        stack.pop()
+        tags.pop()
+        if discarded is not None:
+            if len(stack) == discarded:
+                discarded = None
+        elif is_record:
+            yield parse(elem)
+        else:
+            if not stack and check is not None:
+                check(elem)
+            continue
+
+        elem.clear()
+        if stack:
+            stack[-1].remove(elem)
+
+
+def _read_children(elem: ET.Element, table: dict[str, Any], values: dict[str, Any]) -> None:
+    get = table.get
+    for child in elem:
+        spec = get(child.tag)
+        if spec is None:
+            continue
+        if spec.__class__ is dict:
+            _read_children(child, spec, values)
+            continue
+
+        name, converter = spec
+        if converter.__class__ is FieldMap:
+            values[name].append(converter.read(child))
+        elif child.text:
+            try:
+                values[name] = converter(child.text)
+            except (ValueError, TypeError):
+                # Not contextlib.suppress: a context manager per field doubles parse time
+                continue
+
+
 def parse_user(root: ET.Element) -> CHPPUser:
     """Parse managercompendium XML to CHPPUser object.
 
@@ -102,7 +279,7 @@ def parse_user(root: ET.Element) -> CHPPUser:
     youth_team_id = int(youth_team_id_text) if youth_team_id_text else None
 
     # Extract team IDs (senior teams only)
-    team_nodes = root.findall(".//Teams/Team/TeamId")
+    team_nodes = findall(root, ".//Teams/Team/TeamId")
     teams = [int(node.text) for node in team_nodes if node.text]
 
     return CHPPUser(
@@ -208,6 +385,72 @@ def parse_team(root: ET.Element) -> CHPPTeam:
     )
 
 
+# Skill fields shared by the players and player endpoints (PlayerSkills container)
+_SKILL_FIELDS = {
+    "stamina": ("PlayerSkills/StaminaSkill", int, 0),
+    "keeper": ("PlayerSkills/KeeperSkill", int, 0),
+    "defender": ("PlayerSkills/DefenderSkill", int, 0),
+    "playmaker": ("PlayerSkills/PlaymakerSkill", int, 0),
+    "winger": ("PlayerSkills/WingerSkill", int, 0),
+    "passing": ("PlayerSkills/PassingSkill", int, 0),
+    "scorer": ("PlayerSkills/ScorerSkill", int, 0),
+    "set_pieces": ("PlayerSkills/SetPiecesSkill", int, 0),
+}
+
+PLAYERS_FIELDS = FieldMap({
+    # Player identity
+    "player_id": ("PlayerID", int, 0),
+    "first_name": ("FirstName", _to_text, ""),
+    "last_name": ("LastName", _to_text, ""),
+    "nick_name": ("NickName", _to_text, None),
+    # Player attributes
+    "age": ("Age", int, 0),
+    "age_days": ("AgeDays", int, 0),
+    "tsi": ("TSI", int, 0),
+    "player_number": ("PlayerNumber", int, 0),
+    # Current form and condition
+    "form": ("PlayerForm", int, 0),
+    "experience": ("Experience", int, 0),
+    "loyalty": ("Loyalty", int, 0),
+    **_SKILL_FIELDS,
+    # Additional attributes
+    "specialty": ("Specialty", int, None),
+    "injury_level": ("InjuryLevel", int, 0),
+    "statement": ("Statement", _to_text, None),
+    "owner_notes": ("OwnerNotes", _to_text, None),
+    "transfer_listed": ("TransferListed", _to_bool, False),
+    # Goal statistics
+    "career_goals": ("CareerGoals", int, 0),
+    "career_hattricks": ("CareerHattricks", int, 0),
+    "league_goals": ("LeagueGoals", int, 0),
+    "cup_goals": ("CupGoals", int, 0),
+    "friendlies_goals": ("FriendliesGoals", int, 0),
+    "matches_current_team": ("MatchesCurrentTeam", int, 0),
+    "goals_current_team": ("GoalsCurrentTeam", int, 0),
+    "assists_current_team": ("AssistsCurrentTeam", int, 0),
+    "career_assists": ("CareerAssists", int, 0),
+    # Team and league data
+    "caps": ("Caps", int, 0),
+    "caps_u20": ("CapsU20", int, 0),
+    "country_id": ("NativeLeagueID", int, None),
+    "salary": ("Salary", int, None),
+    "national_team_id": ("NationalTeamID", int, None),
+})
+
+# Fallback: direct skill field names when there is no PlayerSkills container
+# (may not exist in players endpoint)
+_PLAYERS_DIRECT_SKILL_FIELDS = FieldMap({
+    "stamina": ("Stamina", int, 0),
+    "keeper": ("Keeper", int, 0),
+    "defender": ("Defender", int, 0),
+    "playmaker": ("Playmaker", int, 0),
+    "winger": ("Winger", int, 0),
+    "passing": ("Passing", int, 0),
+    "scorer": ("Scorer", int, 0),
+    "set_pieces": ("SetPieces", int, 0),
+})
+
+
 def parse_players(root: ET.Element) -> list[CHPPPlayer]:
     """Parse players XML to list of CHPPPlayer objects.
 
@@ -223,122 +466,70 @@ def parse_players(root: ET.Element) -> list[CHPPPlayer]:
         >>> for player in players:
         ...     print(player.first_name, player.scorer)
     """
-    players = []
-
-    for player_node in root.findall(".//PlayerList/Player"):
-        # Extract player identity
-        player_id = safe_find_int(player_node, "PlayerID")
-        first_name = safe_find_text(player_node, "FirstName", "")
-        last_name = safe_find_text(player_node, "LastName", "")
-        nick_name = safe_find_text(player_node, "NickName")
-
-        # Player attributes
-        age = safe_find_int(player_node, "Age")
-        age_days = safe_find_int(player_node, "AgeDays")
-        tsi = safe_find_int(player_node, "TSI")
-        player_number = safe_find_int(player_node, "PlayerNumber")
-
-        # Current form and condition
-        form = safe_find_int(player_node, "PlayerForm")
-        experience = safe_find_int(player_node, "Experience")
-        loyalty = safe_find_int(player_node, "Loyalty")
-
-        # 7 Core Skills (extract from PlayerSkills container)
-        player_skills = player_node.find("PlayerSkills")
-        if player_skills is not None:
-            # Use correct API field names from PlayerSkills container
-            stamina = safe_find_int(player_skills, "StaminaSkill")
-            keeper = safe_find_int(player_skills, "KeeperSkill")
-            defender = safe_find_int(player_skills, "DefenderSkill")
-            playmaker = safe_find_int(player_skills, "PlaymakerSkill")
-            winger = safe_find_int(player_skills, "WingerSkill")
-            passing = safe_find_int(player_skills, "PassingSkill")
-            scorer = safe_find_int(player_skills, "ScorerSkill")
-            set_pieces = safe_find_int(player_skills, "SetPiecesSkill")
-        else:
-            # Fallback: try direct field names (may not exist in players endpoint)
-            stamina = safe_find_int(player_node, "Stamina")
-            keeper = safe_find_int(player_node, "Keeper")
-            defender = safe_find_int(player_node, "Defender")
-            playmaker = safe_find_int(player_node, "Playmaker")
-            winger = safe_find_int(player_node, "Winger")
-            passing = safe_find_int(player_node, "Passing")
-            scorer = safe_find_int(player_node, "Scorer")
-            set_pieces = safe_find_int(player_node, "SetPieces")
-
-        # Additional attributes
-        specialty = safe_find_int(player_node, "Specialty", None)
-        injury_level = safe_find_int(player_node, "InjuryLevel", 0)
-        statement = safe_find_text(player_node, "Statement")
-        owner_notes = safe_find_text(player_node, "OwnerNotes")
-
-        # Transfer data
-        transfer_listed = safe_find_bool(player_node, "TransferListed")
-
-        # Goal statistics extraction (MISSING IN ORIGINAL IMPLEMENTATION)
-        career_goals = safe_find_int(player_node, "CareerGoals", 0)
-        career_hattricks = safe_find_int(player_node, "CareerHattricks", 0)
-        league_goals = safe_find_int(player_node, "LeagueGoals", 0)
-        cup_goals = safe_find_int(player_node, "CupGoals", 0)
-        friendlies_goals = safe_find_int(player_node, "FriendliesGoals", 0)
-        current_team_matches = safe_find_int(player_node, "MatchesCurrentTeam", 0)
-        goals_current_team = safe_find_int(player_node, "GoalsCurrentTeam", 0)
-        assists_current_team = safe_find_int(player_node, "AssistsCurrentTeam", 0)
-        career_assists = safe_find_int(player_node, "CareerAssists", 0)
-
-        # Team and league data
-        caps = safe_find_int(player_node, "Caps", 0)
-        caps_u20 = safe_find_int(player_node, "CapsU20", 0)
-        country_id = safe_find_int(player_node, "NativeLeagueID", None)
-        salary = safe_find_int(player_node, "Salary", None)
-        national_team_id = safe_find_int(player_node, "NationalTeamID", None)
-
-        player = CHPPPlayer(
-            player_id=player_id,
-            first_name=first_name,
-            last_name=last_name,
-            nick_name=nick_name,
-            age=age,
-            age_days=age_days,
-            tsi=tsi,
-            player_number=player_number,
-            form=form,
-            stamina=stamina,
-            experience=experience,
-            loyalty=loyalty,
-            keeper=keeper,
-            defender=defender,
-            playmaker=playmaker,
-            winger=winger,
-            passing=passing,
-            scorer=scorer,
-            set_pieces=set_pieces,
-            specialty=specialty,
-            injury_level=injury_level,
-            statement=statement,
-            owner_notes=owner_notes,
-            transfer_listed=transfer_listed,
-            # Goal statistics (ADDED)
-            career_goals=career_goals,
-            career_hattricks=career_hattricks,
-            league_goals=league_goals,
-            cup_goals=cup_goals,
-            friendlies_goals=friendlies_goals,
-            matches_current_team=current_team_matches,
-            goals_current_team=goals_current_team,
-            assists_current_team=assists_current_team,
-            career_assists=career_assists,
-            # Team data (ADDED)
-            caps=caps,
-            caps_u20=caps_u20,
-            country_id=country_id,
-            salary=salary,
-            national_team_id=national_team_id,
-            _SOURCE_FILE="players",
-        )
-        players.append(player)
-
-    return players
+    return [parse_players_node(player_node) for player_node in findall(root, ".//PlayerList/Player")]
+
+
+def parse_players_node(player_node: ET.Element) -> CHPPPlayer:
+    """Parse one PlayerList/Player element of a players response."""
+    fields = PLAYERS_FIELDS.read(player_node)
+    if player_node.find("PlayerSkills") is None:
+        fields.update(_PLAYERS_DIRECT_SKILL_FIELDS.read(player_node))
+
+    return CHPPPlayer(**fields, _SOURCE_FILE="players")
+
+
+PLAYER_FIELDS = FieldMap({
+    "player_id": ("PlayerID", int, 0),
+    "first_name": ("FirstName", _to_text, ""),
+    "last_name": ("LastName", _to_text, ""),
+    "nick_name": ("NickName", _to_text, None),
+    "age": ("Age", int, 0),
+    "age_days": ("AgeDays", int, 0),
+    "tsi": ("TSI", int, 0),
+    "player_number": ("PlayerNumber", int, 0),
+    "category_id": ("PlayerCategoryID", int, None),
+    "form": ("PlayerForm", int, 0),  # Form is PlayerForm in API
+    "experience": ("Experience", int, 0),
+    "loyalty": ("Loyalty", int, 0),
+    # 7 core skills - from PlayerSkills container per CHPP API docs, 0 if missing
+    **_SKILL_FIELDS,
+    # Additional attributes
+    "specialty": ("Specialty", int, 0),  # Default to 0, not None
+    "arrival_date": ("ArrivalDate", _to_datetime, None),
+    "cards": ("Cards", int, 0),
+    "agreeability": ("Agreeability", _to_text, None),
+    "aggressiveness": ("Aggressiveness", _to_text, None),
+    "honesty": ("Honesty", _to_text, None),
+    "country_id": ("NativeLeagueID", int, None),
+    "salary": ("Salary", int, None),
+    "caps": ("Caps", int, 0),
+    "caps_u20": ("CapsU20", int, 0),
+    "career_goals": ("CareerGoals", int, 0),
+    "career_hattricks": ("CareerHattricks", int, 0),
+    "league_goals": ("LeagueGoals", int, 0),
+    "cup_goals": ("CupGoals", int, 0),
+    "friendlies_goals": ("FriendliesGoals", int, 0),
+    "matches_current_team": ("MatchesCurrentTeam", int, 0),
+    "goals_current_team": ("GoalsCurrentTeam", int, 0),
+    "assists_current_team": ("AssistsCurrentTeam", int, 0),
+    "career_assists": ("CareerAssists", int, 0),
+    "national_team_id": ("NationalTeamID", int, None),
+    "mother_club_bonus": ("MotherClubBonus", int, 0),
+    "leadership": ("Leadership", int, 0),
+    "injury_level": ("InjuryLevel", int, -1),
+    "statement": ("Statement", _to_text, None),
+    "owner_notes": ("OwnerNotes", _to_text, None),
+    "transfer_listed": ("TransferListed", _to_bool, False),
+})
+
+TRANSFER_DETAILS_FIELDS = FieldMap({
+    "asking_price": ("AskingPrice", int, 0),
+    "deadline": ("Deadline", _to_text, ""),
+    "highest_bid": ("HighestBid", int, 0),
+    "max_bid": ("MaxBid", int, None),
+    "bidder_team_id": ("BidderTeam/TeamID", int, 0),
+    "bidder_team_name": ("BidderTeam/TeamName", _to_text, ""),
+})
 
 
 def parse_player(root: ET.Element) -> CHPPPlayer:
@@ -362,187 +553,25 @@ def parse_player(root: ET.Element) -> CHPPPlayer:
     if player_elem is None:
         raise ValueError("No Player element found in XML response")
 
-    # Extract all player fields using safe_find_* helpers
-    player_id = safe_find_int(player_elem, "PlayerID")
-    first_name = safe_find_text(player_elem, "FirstName", "")
-    last_name = safe_find_text(player_elem, "LastName", "")
-    nick_name = safe_find_text(player_elem, "NickName")
-    age = safe_find_int(player_elem, "Age")
-    age_days = safe_find_int(player_elem, "AgeDays")
-    tsi = safe_find_int(player_elem, "TSI")
-    player_number = safe_find_int(player_elem, "PlayerNumber")
-    category_id_text = safe_find_text(player_elem, "PlayerCategoryID")
-    category_id = int(category_id_text) if category_id_text else None
-    form = safe_find_int(player_elem, "PlayerForm")  # Form is PlayerForm in API
-    experience = safe_find_int(player_elem, "Experience")
-    loyalty = safe_find_int(player_elem, "Loyalty")
-
-    # 7 core skills - from PlayerSkills container per CHPP API docs
-    player_skills_elem = player_elem.find("PlayerSkills")
-    if player_skills_elem is not None:
-        stamina = safe_find_int(player_skills_elem, "StaminaSkill")
-        keeper = safe_find_int(player_skills_elem, "KeeperSkill")
-        defender = safe_find_int(player_skills_elem, "DefenderSkill")
-        playmaker = safe_find_int(player_skills_elem, "PlaymakerSkill")
-        winger = safe_find_int(player_skills_elem, "WingerSkill")
-        passing = safe_find_int(player_skills_elem, "PassingSkill")
-        scorer = safe_find_int(player_skills_elem, "ScorerSkill")
-        set_pieces = safe_find_int(player_skills_elem, "SetPiecesSkill")
-    else:
-        # Fallback if PlayerSkills container not found
-        stamina = 0
-        keeper = 0
-        defender = 0
-        playmaker = 0
-        winger = 0
-        passing = 0
-        scorer = 0
-        set_pieces = 0
-
-    # Additional attributes
-    specialty = safe_find_int(player_elem, "Specialty", 0)  # Default to 0, not None
-    category_id_text = safe_find_text(player_elem, "PlayerCategoryID")
-    category_id = int(category_id_text) if category_id_text else None
-    arrival_date_str = safe_find_text(player_elem, "ArrivalDate")
-    # Parse arrival_date string to datetime object
-    arrival_date = None
-    if arrival_date_str:
-        try:
-            # Try parsing ISO format from API: "2024-01-15 14:30:00"
-            arrival_date = datetime.fromisoformat(arrival_date_str.replace(" ", "T"))
-        except (ValueError, AttributeError, TypeError):
-            # If parsing fails, keep as None
-            arrival_date = None
-    cards = safe_find_int(player_elem, "Cards")
-    agreeability = safe_find_text(player_elem, "Agreeability")
-    aggressiveness = safe_find_text(player_elem, "Aggressiveness")
-    honesty = safe_find_text(player_elem, "Honesty")
-    country_id_text = safe_find_text(player_elem, "NativeLeagueID")
-    country_id = int(country_id_text) if country_id_text else None
-    salary_text = safe_find_text(player_elem, "Salary")
-    salary = int(salary_text) if salary_text else None
-    caps = safe_find_int(player_elem, "Caps")
-    caps_u20 = safe_find_int(player_elem, "CapsU20")
-    career_goals = safe_find_int(player_elem, "CareerGoals")
-    career_hattricks = safe_find_int(player_elem, "CareerHattricks")
-    league_goals = safe_find_int(player_elem, "LeagueGoals")
-    cup_goals = safe_find_int(player_elem, "CupGoals")
-    friendlies_goals = safe_find_int(player_elem, "FriendliesGoals")
-    matches_current_team = safe_find_int(player_elem, "MatchesCurrentTeam")
-    goals_current_team = safe_find_int(player_elem, "GoalsCurrentTeam")
-    assists_current_team = safe_find_int(player_elem, "AssistsCurrentTeam")
-    career_assists = safe_find_int(player_elem, "CareerAssists")
-    # DEBUG: Print actual XML goal field values for investigation
-    player_id_debug = safe_find_int(player_elem, "PlayerID")
-    if player_id_debug in [461202762, 476003339, 474535474]:  # Key test players
-        print(f"[XML DEBUG] Player {player_id_debug}: GoalsCurrentTeam='{player_elem.find('GoalsCurrentTeam')}', MatchesCurrentTeam='{player_elem.find('MatchesCurrentTeam')}'")
-        if player_elem.find('GoalsCurrentTeam') is not None:
-            print(f"[XML DEBUG] GoalsCurrentTeam element text: '{player_elem.find('GoalsCurrentTeam').text}'")
-        if player_elem.find('MatchesCurrentTeam') is not None:
-            print(f"[XML DEBUG] MatchesCurrentTeam element text: '{player_elem.find('MatchesCurrentTeam').text}'")
-
-        # Show ALL available goal-related XML elements for debugging
-        print(f"[XML DEBUG] Available goal fields for player {player_id_debug}:")
-        for child in player_elem:
-            if 'goal' in child.tag.lower() or 'match' in child.tag.lower() or 'assist' in child.tag.lower():
-                print(f"  - {child.tag}: '{child.text}'")
-
-        # Check if goals are in a different container
-        for container in ['PlayerStats', 'Statistics', 'Goals', 'TeamStats']:
-            container_elem = player_elem.find(container)
-            if container_elem is not None:
-                print(f"[XML DEBUG] Found container {container}, checking for goals...")
-                for child in container_elem:
-                    print(f"  - {container}/{child.tag}: '{child.text}'")
-
-    national_team_id_text = safe_find_text(player_elem, "NationalTeamID")
-    national_team_id = int(national_team_id_text) if national_team_id_text else None
-    mother_club_bonus = safe_find_int(player_elem, "MotherClubBonus")
-    leadership = safe_find_int(player_elem, "Leadership")
-    injury_level = safe_find_int(player_elem, "InjuryLevel", -1)
-    statement = safe_find_text(player_elem, "Statement")
-    owner_notes = safe_find_text(player_elem, "OwnerNotes")
-    transfer_listed = safe_find_bool(player_elem, "TransferListed")
+    fields = PLAYER_FIELDS.read(player_elem)
 
     # Parse TransferDetails if player is on transfer list
     transfer_details = None
-    if transfer_listed:
+    if fields["transfer_listed"]:
         transfer_elem = player_elem.find("TransferDetails")
         if transfer_elem is not None:
             from app.chpp.models import BidderTeam, TransferDetails
 
-            asking_price = safe_find_int(transfer_elem, "AskingPrice")
-            deadline = safe_find_text(transfer_elem, "Deadline", "")
-            highest_bid = safe_find_int(transfer_elem, "HighestBid")
-            max_bid_text = safe_find_text(transfer_elem, "MaxBid")
-            max_bid = int(max_bid_text) if max_bid_text else None
-
+            transfer = TRANSFER_DETAILS_FIELDS.read(transfer_elem)
+            bidder_team_id = transfer.pop("bidder_team_id")
+            bidder_team_name = transfer.pop("bidder_team_name")
             bidder_team = None
-            bidder_elem = transfer_elem.find("BidderTeam")
-            if bidder_elem is not None:
-                bidder_team_id = safe_find_int(bidder_elem, "TeamID")
-                bidder_team_name = safe_find_text(bidder_elem, "TeamName", "")
-                if bidder_team_id:  # Only create if we have a team ID
-                    bidder_team = BidderTeam(team_id=bidder_team_id, team_name=bidder_team_name)
-
-            transfer_details = TransferDetails(
-                asking_price=asking_price,
-                deadline=deadline,
-                highest_bid=highest_bid,
-                max_bid=max_bid,
-                bidder_team=bidder_team,
-            )
-
-    return CHPPPlayer(
-        player_id=player_id,
-        first_name=first_name,
-        last_name=last_name,
-        nick_name=nick_name,
-        age=age,
-        age_days=age_days,
-        tsi=tsi,
-        player_number=player_number,
-        form=form,
-        stamina=stamina,
-        experience=experience,
-        loyalty=loyalty,
-        keeper=keeper,
-        defender=defender,
-        playmaker=playmaker,
-        winger=winger,
-        passing=passing,
-        scorer=scorer,
-        set_pieces=set_pieces,
-        specialty=specialty,
-        category_id=category_id,
-        arrival_date=arrival_date,
-        cards=cards,
-        agreeability=agreeability,
-        aggressiveness=aggressiveness,
-        honesty=honesty,
-        country_id=country_id,
-        salary=salary,
-        caps=caps,
-        caps_u20=caps_u20,
-        career_goals=career_goals,
-        career_hattricks=career_hattricks,
-        league_goals=league_goals,
-        cup_goals=cup_goals,
-        friendlies_goals=friendlies_goals,
-        matches_current_team=matches_current_team,
-        goals_current_team=goals_current_team,
-        assists_current_team=assists_current_team,
-        career_assists=career_assists,
-        national_team_id=national_team_id,
-        mother_club_bonus=mother_club_bonus,
-        leadership=leadership,
-        injury_level=injury_level,
-        statement=statement,
-        owner_notes=owner_notes,
-        transfer_listed=transfer_listed,
-        transfer_details=transfer_details,
-        _SOURCE_FILE="player",
-    )
+            if bidder_team_id:  # Only create if we have a team ID
+                bidder_team = BidderTeam(team_id=bidder_team_id, team_name=bidder_team_name)
+
+            transfer_details = TransferDetails(**transfer, bidder_team=bidder_team)
+
+    return CHPPPlayer(**fields, transfer_details=transfer_details, _SOURCE_FILE="player")
 
 
 def parse_matches(root: ET.Element) -> list[CHPPMatch]:
@@ -562,72 +591,156 @@ def parse_matches(root: ET.Element) -> list[CHPPMatch]:
         >>> for match in matches:
         ...     print(match.home_team_name, match.home_goals)
     """
-    matches = []
-
     # Navigate to match list - handle different endpoint structures
     # matchesarchive v1.5: HattrickData/Team/MatchList/Match
     # matches v2.6: Could be different structure
-    match_elements = root.findall(".//Team/MatchList/Match")
+    match_elements = findall(root, ".//Team/MatchList/Match")
     if not match_elements:
         # Try alternative structures for different endpoint versions
-        match_elements = root.findall(".//MatchList/Match")
+        match_elements = findall(root, ".//MatchList/Match")
     if not match_elements:
-        match_elements = root.findall(".//Match")
+        match_elements = findall(root, ".//Match")
 
-    for match_elem in match_elements:
-        # Extract match fields using safe_find_* helpers
-        ht_id = safe_find_int(match_elem, "MatchID")
-        datetime = safe_find_text(match_elem, "MatchDate")
+    return [parse_match_node(match_elem) for match_elem in match_elements]
 
-        # Parse datetime if present (format: "2024-01-15 14:30:00")
-        # Keep as string for compatibility with existing code
-        # (existing code calls match.datetime.year, month, day - will need conversion)
+
+def parse_match_node(match_elem: ET.Element) -> CHPPMatch:
+    """Parse one MatchList/Match element of a matches or matchesarchive response."""
+    # Extract match fields using safe_find_* helpers
+    ht_id = safe_find_int(match_elem, "MatchID")
+    datetime = safe_find_text(match_elem, "MatchDate")
+
+    # Parse datetime if present (format: "2024-01-15 14:30:00")
+    # Keep as string for compatibility with existing code
+    # (existing code calls match.datetime.year, month, day - will need conversion)
 
 # Team information: different structures for different CHPP endpoint versions
-        # matches v2.6: HomeTeam/HomeTeamID and AwayTeam/AwayTeamID
-        # matchesarchive v1.5: HomeTeamID and AwayTeamID directly under Match
-        home_team_id = safe_find_int(match_elem, "HomeTeam/HomeTeamID")
-        home_team_name = safe_find_text(match_elem, "HomeTeam/HomeTeamName", "")
-        away_team_id = safe_find_int(match_elem, "AwayTeam/AwayTeamID")
-        away_team_name = safe_find_text(match_elem, "AwayTeam/AwayTeamName", "")
-
-        # Fallback for matchesarchive v1.5 structure (direct under Match)
-        if not home_team_name:
-            home_team_name = safe_find_text(match_elem, "HomeTeamName", "")
-        if not home_team_id:
-            home_team_id = safe_find_int(match_elem, "HomeTeamID")
-        if not away_team_name:
-            away_team_name = safe_find_text(match_elem, "AwayTeamName", "")
-        if not away_team_id:
-            away_team_id = safe_find_int(match_elem, "AwayTeamID")
-        home_goals = safe_find_int(match_elem, "HomeGoals")
-        away_goals = safe_find_int(match_elem, "AwayGoals")
-
-        matchtype = safe_find_int(match_elem, "MatchType")
-        context_id = safe_find_int(match_elem, "ContextID")
-        rule_id = safe_find_int(match_elem, "RuleID")
-        cup_level = safe_find_int(match_elem, "CupLevel")
-        cup_level_index = safe_find_int(match_elem, "CupLevelIndex")
-
-        match = CHPPMatch(
-            ht_id=ht_id,
-            datetime=datetime,
-            home_team_id=home_team_id,
-            home_team_name=home_team_name,
-            away_team_id=away_team_id,
-            away_team_name=away_team_name,
-            home_goals=home_goals,
-            away_goals=away_goals,
-            matchtype=matchtype,
-            context_id=context_id,
-            rule_id=rule_id,
-            cup_level=cup_level,
-            cup_level_index=cup_level_index,
-            _SOURCE_FILE="matches",
-        )
-        matches.append(match)
+    # matches v2.6: HomeTeam/HomeTeamID and AwayTeam/AwayTeamID
+    # matchesarchive v1.5: HomeTeamID and AwayTeamID directly under Match
+    home_team_id = safe_find_int(match_elem, "HomeTeam/HomeTeamID")
+    home_team_name = safe_find_text(match_elem, "HomeTeam/HomeTeamName", "")
+    away_team_id = safe_find_int(match_elem, "AwayTeam/AwayTeamID")
+    away_team_name = safe_find_text(match_elem, "AwayTeam/AwayTeamName", "")
+
+    # Fallback for matchesarchive v1.5 structure (direct under Match)
+    if not home_team_name:
+        home_team_name = safe_find_text(match_elem, "HomeTeamName", "")
+    if not home_team_id:
+        home_team_id = safe_find_int(match_elem, "HomeTeamID")
+    if not away_team_name:
+        away_team_name = safe_find_text(match_elem, "AwayTeamName", "")
+    if not away_team_id:
+        away_team_id = safe_find_int(match_elem, "AwayTeamID")
+    home_goals = safe_find_int(match_elem, "HomeGoals")
+    away_goals = safe_find_int(match_elem, "AwayGoals")
+
+    matchtype = safe_find_int(match_elem, "MatchType")
+    context_id = safe_find_int(match_elem, "ContextID")
+    rule_id = safe_find_int(match_elem, "RuleID")
+    cup_level = safe_find_int(match_elem, "CupLevel")
+    cup_level_index = safe_find_int(match_elem, "CupLevelIndex")
+
+    return CHPPMatch(
+        ht_id=ht_id,
+        datetime=datetime,
+        home_team_id=home_team_id,
+        home_team_name=home_team_name,
+        away_team_id=away_team_id,
+        away_team_name=away_team_name,
+        home_goals=home_goals,
+        away_goals=away_goals,
+        matchtype=matchtype,
+        context_id=context_id,
+        rule_id=rule_id,
+        cup_level=cup_level,
+        cup_level_index=cup_level_index,
+        _SOURCE_FILE="matches",
+    )
 
-    return matches
+
+def _team_fields(side: str, prefix: str) -> dict[str, tuple[str, Any, Any]]:
+    """Field declarations read from a matchdetails HomeTeam/AwayTeam element."""
+    return {
+        # CHPP API provides 5 chance types per team (added in v3.1, March 2022)
+        f"{prefix}_chances_left": (f"{side}/NrOfChancesLeft", int, None),
+        f"{prefix}_chances_center": (f"{side}/NrOfChancesCenter", int, None),
+        f"{prefix}_chances_right": (f"{side}/NrOfChancesRight", int, None),
+        f"{prefix}_chances_special": (f"{side}/NrOfChancesSpecialEvents", int, None),
+        f"{prefix}_chances_other": (f"{side}/NrOfChancesOther", int, None),
+        # Team ratings - midfield (primary), defense and attack by position
+        f"{prefix}_rating": (f"{side}/RatingMidfield", float, None),
+        f"{prefix}_rating_right_def": (f"{side}/RatingRightDef", float, None),
+        f"{prefix}_rating_mid_def": (f"{side}/RatingMidDef", float, None),
+        f"{prefix}_rating_left_def": (f"{side}/RatingLeftDef", float, None),
+        f"{prefix}_rating_right_att": (f"{side}/RatingRightAtt", float, None),
+        f"{prefix}_rating_mid_att": (f"{side}/RatingMidAtt", float, None),
+        f"{prefix}_rating_left_att": (f"{side}/RatingLeftAtt", float, None),
+        # Set pieces ratings
+        f"{prefix}_rating_set_pieces_def": (f"{side}/RatingIndirectSetPiecesDef", float, None),
+        f"{prefix}_rating_set_pieces_att": (f"{side}/RatingIndirectSetPiecesAtt", float, None),
+        # Team details
+        f"{prefix}_dress_uri": (f"{side}/DressURI", _to_text, ""),
+        f"{prefix}_attitude": (f"{side}/TeamAttitude", int, None),
+        f"{prefix}_tactic_type": (f"{side}/TacticType", int, None),
+        f"{prefix}_tactic_skill": (f"{side}/TacticSkill", int, None),
+    }
+
+
+SCORER_FIELDS = FieldMap({
+    "player_id": ("ScorerPlayerID", int, 0),
+    "player_name": ("ScorerPlayerName", _to_text, ""),
+    "team_id": ("ScorerTeamID", int, 0),
+    "minute": ("ScorerMinute", int, 0),
+    "home_goals": ("ScorerHomeGoals", int, 0),
+    "away_goals": ("ScorerAwayGoals", int, 0),
+})
+
+BOOKING_FIELDS = FieldMap({
+    "player_id": ("BookingPlayerID", int, 0),
+    "player_name": ("BookingPlayerName", _to_text, ""),
+    "team_id": ("BookingTeamID", int, 0),
+    "booking_type": ("BookingType", int, 0),  # 1=yellow, 2=red
+    "minute": ("BookingMinute", int, 0),
+})
+
+INJURY_FIELDS = FieldMap({
+    "player_id": ("InjuryPlayerID", int, 0),
+    "player_name": ("InjuryPlayerName", _to_text, ""),
+    "team_id": ("InjuryTeamID", int, 0),
+    "injury_type": ("InjuryType", int, 0),  # 1=bruise, 2=injury
+    "minute": ("InjuryMinute", int, 0),
+})
+
+# Read from the Match element: HattrickData -> Match -> ...
+MATCHDETAILS_FIELDS = FieldMap({
+    "ht_id": ("MatchID", int, 0),
+    # Team statistics - possession split by halves (at Match level)
+    "possession_first_half_home": ("PossessionFirstHalfHome", int, None),
+    "possession_first_half_away": ("PossessionFirstHalfAway", int, None),
+    "possession_second_half_home": ("PossessionSecondHalfHome", int, None),
+    "possession_second_half_away": ("PossessionSecondHalfAway", int, None),
+    **_team_fields("HomeTeam", "home_team"),
+    **_team_fields("AwayTeam", "away_team"),
+    # Arena data
+    "attendance": ("Arena/SoldTotal", int, None),
+    "arena_capacity_terraces": ("Arena/SoldTerraces", int, None),
+    "arena_capacity_basic": ("Arena/SoldBasic", int, None),
+    "arena_capacity_roof": ("Arena/SoldRoof", int, None),
+    "arena_capacity_vip": ("Arena/SoldVIP", int, None),
+    "weather_id": ("Arena/WeatherID", int, None),
+    "added_minutes": ("AddedMinutes", int, None),
+    # Match officials (primary referee)
+    "referee_id": ("MatchOfficials/Referee/RefereeId", int, None),
+    "referee_name": ("MatchOfficials/Referee/RefereeName", _to_text, ""),
+    "referee_country_id": ("MatchOfficials/Referee/RefereeCountryId", int, None),
+    "referee_country": ("MatchOfficials/Referee/RefereeCountryName", _to_text, ""),
+    "referee_team_id": ("MatchOfficials/Referee/RefereeTeamId", int, None),
+    "referee_team_name": ("MatchOfficials/Referee/RefereeTeamname", _to_text, ""),
+    # Goals, yellow/red cards and injuries
+    "scorers": ("Scorers/Goal", SCORER_FIELDS, []),
+    "bookings": ("Bookings/Booking", BOOKING_FIELDS, []),
+    "injuries": ("Injuries/Injury", INJURY_FIELDS, []),
+})
 
 
 def parse_matchdetails(root: ET.Element) -> "CHPPMatchDetails":
@@ -639,180 +752,13 @@ def parse_matchdetails(root: ET.Element) -> "CHPPMatchDetails":
     Returns:
         CHPPMatchDetails object with comprehensive match statistics
     """
-    from app.chpp.models import CHPPMatchDetails
-
-    # Extract match ID
-    ht_id = safe_find_int(root, ".//Match/MatchID")
+    match_elem = root if root.tag == "Match" else root.find(".//Match")
+    return parse_matchdetails_node(match_elem if match_elem is not None else root)
 
-    # Extract team statistics - possession split by halves (at Match level)
-    possession_first_half_home = safe_find_int(root, ".//PossessionFirstHalfHome", None)
-    possession_first_half_away = safe_find_int(root, ".//PossessionFirstHalfAway", None)
-    possession_second_half_home = safe_find_int(root, ".//PossessionSecondHalfHome", None)
-    possession_second_half_away = safe_find_int(root, ".//PossessionSecondHalfAway", None)
-
-    # CHPP API provides 5 chance types per team (added in v3.1, March 2022)
-    # Path: HattrickData → Match → HomeTeam → NrOfChances*
-    home_team_chances_left = safe_find_int(root, ".//Match/HomeTeam/NrOfChancesLeft", None)
-    home_team_chances_center = safe_find_int(root, ".//Match/HomeTeam/NrOfChancesCenter", None)
-    home_team_chances_right = safe_find_int(root, ".//Match/HomeTeam/NrOfChancesRight", None)
-    home_team_chances_special = safe_find_int(root, ".//Match/HomeTeam/NrOfChancesSpecialEvents", None)
-    home_team_chances_other = safe_find_int(root, ".//Match/HomeTeam/NrOfChancesOther", None)
-
-    away_team_chances_left = safe_find_int(root, ".//Match/AwayTeam/NrOfChancesLeft", None)
-    away_team_chances_center = safe_find_int(root, ".//Match/AwayTeam/NrOfChancesCenter", None)
-    away_team_chances_right = safe_find_int(root, ".//Match/AwayTeam/NrOfChancesRight", None)
-    away_team_chances_special = safe_find_int(root, ".//Match/AwayTeam/NrOfChancesSpecialEvents", None)
-    away_team_chances_other = safe_find_int(root, ".//Match/AwayTeam/NrOfChancesOther", None)
-
-    # Team ratings - midfield (primary)
-    home_team_rating = safe_find_float(root, ".//HomeTeam/RatingMidfield", None)
-    away_team_rating = safe_find_float(root, ".//AwayTeam/RatingMidfield", None)
-
-    # Team ratings - defense by position
-    home_team_rating_right_def = safe_find_float(root, ".//HomeTeam/RatingRightDef", None)
-    home_team_rating_mid_def = safe_find_float(root, ".//HomeTeam/RatingMidDef", None)
-    home_team_rating_left_def = safe_find_float(root, ".//HomeTeam/RatingLeftDef", None)
-    away_team_rating_right_def = safe_find_float(root, ".//AwayTeam/RatingRightDef", None)
-    away_team_rating_mid_def = safe_find_float(root, ".//AwayTeam/RatingMidDef", None)
-    away_team_rating_left_def = safe_find_float(root, ".//AwayTeam/RatingLeftDef", None)
-
-    # Team ratings - attack by position
-    home_team_rating_right_att = safe_find_float(root, ".//HomeTeam/RatingRightAtt", None)
-    home_team_rating_mid_att = safe_find_float(root, ".//HomeTeam/RatingMidAtt", None)
-    home_team_rating_left_att = safe_find_float(root, ".//HomeTeam/RatingLeftAtt", None)
-    away_team_rating_right_att = safe_find_float(root, ".//AwayTeam/RatingRightAtt", None)
-    away_team_rating_mid_att = safe_find_float(root, ".//AwayTeam/RatingMidAtt", None)
-    away_team_rating_left_att = safe_find_float(root, ".//AwayTeam/RatingLeftAtt", None)
-
-    # Set pieces ratings
-    home_team_rating_set_pieces_def = safe_find_float(root, ".//HomeTeam/RatingIndirectSetPiecesDef", None)
-    home_team_rating_set_pieces_att = safe_find_float(root, ".//HomeTeam/RatingIndirectSetPiecesAtt", None)
-    away_team_rating_set_pieces_def = safe_find_float(root, ".//AwayTeam/RatingIndirectSetPiecesDef", None)
-    away_team_rating_set_pieces_att = safe_find_float(root, ".//AwayTeam/RatingIndirectSetPiecesAtt", None)
-
-    # Arena data
-    attendance = safe_find_int(root, ".//Arena/SoldTotal", None)
-    arena_capacity_terraces = safe_find_int(root, ".//Arena/SoldTerraces", None)
-    arena_capacity_basic = safe_find_int(root, ".//Arena/SoldBasic", None)
-    arena_capacity_roof = safe_find_int(root, ".//Arena/SoldRoof", None)
-    arena_capacity_vip = safe_find_int(root, ".//Arena/SoldVIP", None)
-    weather_id = safe_find_int(root, ".//Arena/WeatherID", None)
-    added_minutes = safe_find_int(root, ".//Match/AddedMinutes", None)
 
-    # Match officials (primary referee)
-    referee_id = safe_find_int(root, ".//MatchOfficials/Referee/RefereeId", None)
-    referee_name = safe_find_text(root, ".//MatchOfficials/Referee/RefereeName", "")
-    referee_country_id = safe_find_int(root, ".//MatchOfficials/Referee/RefereeCountryId", None)
-    referee_country = safe_find_text(root, ".//MatchOfficials/Referee/RefereeCountryName", "")
-    referee_team_id = safe_find_int(root, ".//MatchOfficials/Referee/RefereeTeamId", None)
-    referee_team_name = safe_find_text(root, ".//MatchOfficials/Referee/RefereeTeamname", "")
-
-    # Team details
-    home_team_dress_uri = safe_find_text(root, ".//HomeTeam/DressURI", "")
-    away_team_dress_uri = safe_find_text(root, ".//AwayTeam/DressURI", "")
-    home_team_attitude = safe_find_int(root, ".//HomeTeam/TeamAttitude", None)
-    away_team_attitude = safe_find_int(root, ".//AwayTeam/TeamAttitude", None)
-    home_team_tactic_type = safe_find_int(root, ".//HomeTeam/TacticType", None)
-    home_team_tactic_skill = safe_find_int(root, ".//HomeTeam/TacticSkill", None)
-    away_team_tactic_type = safe_find_int(root, ".//AwayTeam/TacticType", None)
-    away_team_tactic_skill = safe_find_int(root, ".//AwayTeam/TacticSkill", None)
-
-    # Parse scorers (goals)
-    scorers = []
-    for goal in root.findall(".//Scorers/Goal"):
-        scorer_data = {
-            "player_id": safe_find_int(goal, "ScorerPlayerID"),
-            "player_name": safe_find_text(goal, "ScorerPlayerName", ""),
-            "team_id": safe_find_int(goal, "ScorerTeamID"),
-            "minute": safe_find_int(goal, "ScorerMinute"),
-            "home_goals": safe_find_int(goal, "ScorerHomeGoals"),
-            "away_goals": safe_find_int(goal, "ScorerAwayGoals"),
-        }
-        scorers.append(scorer_data)
-
-    # Parse bookings (yellow/red cards)
-    bookings = []
-    for booking in root.findall(".//Bookings/Booking"):
-        booking_data = {
-            "player_id": safe_find_int(booking, "BookingPlayerID"),
-            "player_name": safe_find_text(booking, "BookingPlayerName", ""),
-            "team_id": safe_find_int(booking, "BookingTeamID"),
-            "booking_type": safe_find_int(booking, "BookingType"),  # 1=yellow, 2=red
-            "minute": safe_find_int(booking, "BookingMinute"),
-        }
-        bookings.append(booking_data)
-
-    # Parse injuries
-    injuries = []
-    for injury in root.findall(".//Injuries/Injury"):
-        injury_data = {
-            "player_id": safe_find_int(injury, "InjuryPlayerID"),
-            "player_name": safe_find_text(injury, "InjuryPlayerName", ""),
-            "team_id": safe_find_int(injury, "InjuryTeamID"),
-            "injury_type": safe_find_int(injury, "InjuryType"),  # 1=bruise, 2=injury
-            "minute": safe_find_int(injury, "InjuryMinute"),
-        }
-        injuries.append(injury_data)
-
-    return CHPPMatchDetails(
-        ht_id=ht_id,
-        possession_first_half_home=possession_first_half_home,
-        possession_first_half_away=possession_first_half_away,
-        possession_second_half_home=possession_second_half_home,
-        possession_second_half_away=possession_second_half_away,
-        home_team_chances_left=home_team_chances_left,
-        home_team_chances_center=home_team_chances_center,
-        home_team_chances_right=home_team_chances_right,
-        home_team_chances_special=home_team_chances_special,
-        home_team_chances_other=home_team_chances_other,
-        away_team_chances_left=away_team_chances_left,
-        away_team_chances_center=away_team_chances_center,
-        away_team_chances_right=away_team_chances_right,
-        away_team_chances_special=away_team_chances_special,
-        away_team_chances_other=away_team_chances_other,
-        home_team_rating=home_team_rating,
-        away_team_rating=away_team_rating,
-        home_team_rating_right_def=home_team_rating_right_def,
-        home_team_rating_mid_def=home_team_rating_mid_def,
-        home_team_rating_left_def=home_team_rating_left_def,
-        away_team_rating_right_def=away_team_rating_right_def,
-        away_team_rating_mid_def=away_team_rating_mid_def,
-        away_team_rating_left_def=away_team_rating_left_def,
-        home_team_rating_right_att=home_team_rating_right_att,
-        home_team_rating_mid_att=home_team_rating_mid_att,
-        home_team_rating_left_att=home_team_rating_left_att,
-        away_team_rating_right_att=away_team_rating_right_att,
-        away_team_rating_mid_att=away_team_rating_mid_att,
-        away_team_rating_left_att=away_team_rating_left_att,
-        home_team_rating_set_pieces_def=home_team_rating_set_pieces_def,
-        home_team_rating_set_pieces_att=home_team_rating_set_pieces_att,
-        away_team_rating_set_pieces_def=away_team_rating_set_pieces_def,
-        away_team_rating_set_pieces_att=away_team_rating_set_pieces_att,
-        attendance=attendance,
-        arena_capacity_terraces=arena_capacity_terraces,
-        arena_capacity_basic=arena_capacity_basic,
-        arena_capacity_roof=arena_capacity_roof,
-        arena_capacity_vip=arena_capacity_vip,
-        weather_id=weather_id,
-        added_minutes=added_minutes,
-        referee_id=referee_id,
-        referee_name=referee_name,
-        referee_country_id=referee_country_id,
-        referee_country=referee_country,
-        referee_team_id=referee_team_id,
-        referee_team_name=referee_team_name,
-        home_team_dress_uri=home_team_dress_uri,
-        away_team_dress_uri=away_team_dress_uri,
-        home_team_attitude=home_team_attitude,
-        away_team_attitude=away_team_attitude,
-        home_team_tactic_type=home_team_tactic_type,
-        home_team_tactic_skill=home_team_tactic_skill,
-        away_team_tactic_type=away_team_tactic_type,
-        away_team_tactic_skill=away_team_tactic_skill,
-        scorers=scorers,
-        bookings=bookings,
-        injuries=injuries
-    )
+def parse_matchdetails_node(match_elem: ET.Element) -> "CHPPMatchDetails":
+    """Parse the Match element of a matchdetails response."""
+    return CHPPMatchDetails(**MATCHDETAILS_FIELDS.read(match_elem))
 
 
 def parse_matchlineup(root: ET.Element) -> "CHPPMatchLineup":
@@ -839,7 +785,7 @@ def parse_matchlineup(root: ET.Element) -> "CHPPMatchLineup":
 
     # Parse home team players
     home_team_players = []
-    for player_elem in root.findall(".//HomeTeam/StartingLineup/Player"):
+    for player_elem in findall(root, ".//HomeTeam/StartingLineup/Player"):
         player = CHPPMatchLineupPlayer(
             player_id=safe_find_int(player_elem, "PlayerID"),
             name=safe_find_text(player_elem, "PlayerName", ""),
@@ -853,7 +799,7 @@ def parse_matchlineup(root: ET.Element) -> "CHPPMatchLineup":
 
     # Parse away team players
     away_team_players = []
-    for player_elem in root.findall(".//AwayTeam/StartingLineup/Player"):
+    for player_elem in findall(root, ".//AwayTeam/StartingLineup/Player"):
         player = CHPPMatchLineupPlayer(
             player_id=safe_find_int(player_elem, "PlayerID"),
             name=safe_find_text(player_elem, "PlayerName", ""),
@@ -888,7 +834,7 @@ def parse_playerevents(root: ET.Element) -> list["CHPPPlayerEvent"]:
     from app.chpp.models import CHPPPlayerEvent
 
     events = []
-    for event_elem in root.findall(".//PlayerEvent"):
+    for event_elem in findall(root, ".//PlayerEvent"):
         event = CHPPPlayerEvent(
             player_id=safe_find_int(event_elem, "PlayerID"),
             match_id=safe_find_int(event_elem, "MatchID"),
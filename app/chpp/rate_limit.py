@@ -0,0 +1,287 @@
+"""Client-side CHPP rate limiting.
+
+CHPP throttles each application as a whole, so when many users press Update
+at once the only safe place to slow down is before the request is sent.
+Every CHPP request takes a token from one bucket shared by all CHPP clients
+of the app (CHPP_RATE_LIMIT requests per second, bursts of CHPP_RATE_BURST).
+With CHPP_RATE_LIMIT_REDIS_URL set the bucket lives in Redis and is shared by
+every worker process; otherwise it is per process.
+
+Waiting requests are served by priority class, so an interactive /update is
+not stuck behind a match archive download or a backfill job:
+
+- interactive: a user waiting on a page (default)
+- archive: user-triggered match archive downloads
+- backfill: scripts and background jobs
+
+Priority ordering applies between threads of one process; across processes
+the Redis bucket is first come, first served.
+
+CHPP_USER_BUDGET caps the requests one user may make per
+CHPP_USER_BUDGET_WINDOW seconds. Requests over budget, or still waiting after
+CHPP_RATE_LIMIT_TIMEOUT seconds, raise CHPPRateLimitError instead of being
+sent. Queue wait times are recorded per priority and reported by
+/api/admin/chpp-rate-limit.
+"""
+
+import logging
+import threading
+import time
+
+from flask import current_app, has_app_context
+
+from app.chpp.exceptions import CHPPRateLimitError
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_ARCHIVE = "archive"
+PRIORITY_BACKFILL = "backfill"
+
+# Highest priority first
+PRIORITIES = (PRIORITY_INTERACTIVE, PRIORITY_ARCHIVE, PRIORITY_BACKFILL)
+
+REDIS_KEY_PREFIX = "htstatus:chpp"
+
+# Atomic token bucket on Redis server time; returns seconds until a token is free (0 = taken)
+_REDIS_TAKE = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return tostring(wait)
+"""
+
+
+class LocalStore:
+    """Token buckets and budget counters in this process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._counters = {}
+
+    def take(self, key, rate, burst):
+        """Take a token from bucket key; return 0, or the seconds until one is free."""
+        with self._lock:
+            now = time.monotonic()
+            tokens, refilled = self._buckets.get(key, (burst, now))
+            tokens = min(burst, tokens + (now - refilled) * rate)
+            wait = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / rate
+            self._buckets[key] = (tokens, now)
+            return wait
+
+    def count(self, key, window):
+        """Count one use of key in the current window; return the uses so far."""
+        current = int(time.time() // window)
+        with self._lock:
+            # Drop counters of windows that have ended
+            self._counters = {k: v for k, v in self._counters.items() if k[1] == current}
+            used = self._counters.get((key, current), 0) + 1
+            self._counters[(key, current)] = used
+            return used
+
+
+class RedisStore:
+    """Token buckets and budget counters shared through Redis."""
+
+    def __init__(self, client, prefix=REDIS_KEY_PREFIX):
+        self.client = client
+        self.prefix = prefix
+        self._take = client.register_script(_REDIS_TAKE)
+
+    def take(self, key, rate, burst):
+        """Take a token from bucket key; return 0, or the seconds until one is free."""
+        return float(self._take(keys=[f"{self.prefix}:{key}"], args=[rate, burst]))
+
+    def count(self, key, window):
+        """Count one use of key in the current window; return the uses so far."""
+        redis_key = f"{self.prefix}:{key}:{int(time.time() // window)}"
+        pipeline = self.client.pipeline()
+        pipeline.incr(redis_key)
+        pipeline.expire(redis_key, int(window) + 1)
+        used, _ = pipeline.execute()
+        return int(used)
+
+
+class RateLimitMetrics:
+    """Queue wait counters per priority class."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {
+            priority: {
+                "requests": 0, "waited": 0, "wait_seconds": 0.0, "max_wait_seconds": 0.0,
+                "timeouts": 0, "over_budget": 0,
+            }
+            for priority in PRIORITIES
+        }
+
+    def record(self, priority, seconds):
+        with self._lock:
+            counters = self._counters[priority]
+            counters["requests"] += 1
+            counters["waited"] += int(seconds > 0)
+            counters["wait_seconds"] += seconds
+            counters["max_wait_seconds"] = max(counters["max_wait_seconds"], seconds)
+
+    def record_rejected(self, priority, reason):
+        with self._lock:
+            self._counters[priority][reason] += 1
+
+    def as_dict(self):
+        with self._lock:
+            report = {}
+            for priority, counters in self._counters.items():
+                requests = counters["requests"]
+                report[priority] = {
+                    "requests": requests,
+                    "waited": counters["waited"],
+                    "timeouts": counters["timeouts"],
+                    "over_budget": counters["over_budget"],
+                    "wait_ms_avg": round(counters["wait_seconds"] / requests * 1000, 3) if requests else 0.0,
+                    "wait_ms_max": round(counters["max_wait_seconds"] * 1000, 3),
+                }
+            return report
+
+
+class RateLimiter:
+    """Token bucket with priority classes and per-user budgets.
+
+    Example:
+        >>> limiter = RateLimiter(rate=10, burst=20, user_budget=500)
+        >>> limiter.acquire(PRIORITY_ARCHIVE, user_id=182085)  # blocks until allowed
+        0.0
+    """
+
+    def __init__(self, rate, burst=None, user_budget=None, budget_window=3600, timeout=None, store=None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst or max(1.0, rate))
+        self.user_budget = user_budget
+        self.budget_window = budget_window
+        self.timeout = timeout
+        self.store = store or LocalStore()
+        self.metrics = RateLimitMetrics()
+        self._condition = threading.Condition()
+        self._waiting = [0] * len(PRIORITIES)
+
+    def acquire(self, priority=PRIORITY_INTERACTIVE, user_id=None):
+        """Block until a request may be sent; return the seconds spent waiting.
+
+        Raises:
+            CHPPRateLimitError: If user_id is over budget or the wait exceeds timeout
+            ValueError: If priority is not one of PRIORITIES
+        """
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown CHPP priority {priority!r}, expected one of {', '.join(PRIORITIES)}")
+
+        if user_id is not None and self.user_budget:
+            used = self.store.count(f"budget:{user_id}", self.budget_window)
+            if used > self.user_budget:
+                self.metrics.record_rejected(priority, "over_budget")
+                raise CHPPRateLimitError(
+                    f"CHPP request budget of {self.user_budget} per {self.budget_window}s used up for user {user_id}"
+                )
+
+        rank = PRIORITIES.index(priority)
+        start = time.monotonic()
+        queued = False
+        with self._condition:
+            self._waiting[rank] += 1
+            try:
+                while True:
+                    if any(self._waiting[:rank]):
+                        # A higher priority request is queued: let it go first
+                        wait = 1 / self.rate
+                    else:
+                        wait = self.store.take("bucket", self.rate, self.burst)
+                        if not wait:
+                            break
+                    if self.timeout is not None:
+                        remaining = start + self.timeout - time.monotonic()
+                        if remaining <= 0:
+                            self.metrics.record_rejected(priority, "timeouts")
+                            raise CHPPRateLimitError(
+                                f"Waited over {self.timeout}s for the CHPP rate limit ({priority})"
+                            )
+                        wait = min(wait, remaining)
+                    queued = True
+                    self._condition.wait(wait)
+            finally:
+                self._waiting[rank] -= 1
+                self._condition.notify_all()
+
+        waited = time.monotonic() - start if queued else 0.0
+        self.metrics.record(priority, waited)
+        if waited:
+            logger.debug("CHPP %s request waited %.0fms for the rate limit", priority, waited * 1000)
+        return waited
+
+
+def _redis_store(url):
+    try:
+        import redis
+    except ImportError:
+        logger.warning(
+            "CHPP_RATE_LIMIT_REDIS_URL is set but redis is not installed "
+            "(uv sync --extra redis), limiting per process"
+        )
+        return None
+    return RedisStore(redis.Redis.from_url(url))
+
+
+def configured_rate_limiter():
+    """Return the app's shared limiter configured by CHPP_RATE_LIMIT, None when disabled."""
+    if not has_app_context():
+        return None
+    if "chpp_rate_limiter" not in current_app.extensions:
+        config = current_app.config
+        rate = config.get("CHPP_RATE_LIMIT")
+        limiter = None
+        if rate:
+            redis_url = config.get("CHPP_RATE_LIMIT_REDIS_URL")
+            burst = config.get("CHPP_RATE_BURST")
+            user_budget = config.get("CHPP_USER_BUDGET")
+            limiter = RateLimiter(
+                float(rate),
+                burst=float(burst) if burst else None,
+                user_budget=int(user_budget) if user_budget else None,
+                budget_window=config.get("CHPP_USER_BUDGET_WINDOW") or 3600,
+                timeout=config.get("CHPP_RATE_LIMIT_TIMEOUT"),
+                store=_redis_store(redis_url) if redis_url else None,
+            )
+        current_app.extensions["chpp_rate_limiter"] = limiter
+    return current_app.extensions["chpp_rate_limiter"]
+
+
+def rate_limit_metrics():
+    """Limiter settings and queue wait metrics for this process, None when disabled."""
+    limiter = configured_rate_limiter()
+    if limiter is None:
+        return None
+    return {
+        "rate": limiter.rate,
+        "burst": limiter.burst,
+        "shared": isinstance(limiter.store, RedisStore),
+        "user_budget": limiter.user_budget,
+        "budget_window": limiter.budget_window,
+        "priorities": limiter.metrics.as_dict(),
+    }
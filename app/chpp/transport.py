@@ -0,0 +1,83 @@
+"""Process-wide pooled HTTP transport for CHPP requests.
+
+Every request handler builds its own CHPP client, and with it an
+OAuth1Session, because the OAuth tokens are per user. Connections, however,
+live in the HTTPAdapter's urllib3 pools, so all sessions mount one shared
+adapter: per-user sessions sign their own requests while keep-alive
+connections (and their TLS handshakes) to chpp.hattrick.org are reused by
+every client in the worker process.
+
+CHPP_POOL_MAXSIZE sets how many idle connections per host are kept for reuse
+(default 10, about one per concurrent request thread). A new adapter is built
+after a fork, so worker processes never share sockets with their parent.
+Sessions using the shared adapter must not be closed, as Session.close()
+would close the pools of every client.
+"""
+
+import os
+import threading
+
+from flask import current_app, has_app_context
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.chpp.constants import (
+    POOL_MAXSIZE,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_REDIRECT,
+    RETRY_TOTAL,
+)
+
+_lock = threading.Lock()
+_adapter = None
+_adapter_pid = None
+
+
+def _pool_maxsize() -> int:
+    if has_app_context() and current_app.config.get("CHPP_POOL_MAXSIZE"):
+        return int(current_app.config["CHPP_POOL_MAXSIZE"])
+    return POOL_MAXSIZE
+
+
+def build_adapter(pool_maxsize: int = POOL_MAXSIZE) -> HTTPAdapter:
+    """Return an adapter with the CHPP retry strategy and keep-alive pools."""
+    retry_strategy = Retry(
+        total=RETRY_TOTAL,
+        redirect=RETRY_REDIRECT,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=[500, 502, 503, 504],
+    )
+    return HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry_strategy,
+    )
+
+
+def shared_adapter() -> HTTPAdapter:
+    """Return the adapter shared by all CHPP sessions of this process."""
+    global _adapter, _adapter_pid
+    with _lock:
+        if _adapter is None or _adapter_pid != os.getpid():
+            _adapter = build_adapter(_pool_maxsize())
+            _adapter_pid = os.getpid()
+        return _adapter
+
+
+def mount_shared_adapter(session: Session) -> Session:
+    """Route the session's HTTP(S) requests through the shared adapter."""
+    adapter = shared_adapter()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def reset_shared_adapter() -> None:
+    """Close the shared pools; the next request builds a fresh adapter."""
+    global _adapter, _adapter_pid
+    with _lock:
+        if _adapter is not None and _adapter_pid == os.getpid():
+            _adapter.close()
+        _adapter = None
+        _adapter_pid = None
@@ -0,0 +1,98 @@
+"""XML backend selection for CHPP parsing.
+
+The parsers only use the Element API shared by xml.etree.ElementTree and
+lxml.etree (find, findall, iteration, tag/text), so either library can build
+the trees they read. The standard library is always available; lxml is the
+optional "xml" extra (uv sync --extra xml) and is picked via the
+CHPP_XML_BACKEND setting:
+
+- "etree": always use xml.etree.ElementTree
+- "lxml": use lxml.etree, failing at startup if it is not installed
+- "auto": use lxml.etree when installed, otherwise ElementTree (default)
+
+With lxml, record-locating paths run through precompiled XPath objects and
+documents are parsed without entity resolution or network access.
+"""
+
+import xml.etree.ElementTree as ET
+from functools import cache
+from typing import Any
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # pragma: no cover - depends on installed extras
+    lxml_etree = None
+
+BACKENDS = ("etree", "lxml", "auto")
+
+# Raised by fromstring() and pull parsers of either backend on malformed XML
+PARSE_ERRORS: tuple[type[Exception], ...] = (ET.ParseError,)
+if lxml_etree is not None:
+    PARSE_ERRORS += (lxml_etree.XMLSyntaxError,)
+
+_PARSER_OPTIONS = {"resolve_entities": False, "no_network": True}
+
+_active: Any = ET
+
+
+def set_backend(name: str) -> str:
+    """Select the XML backend used to parse CHPP responses.
+
+    Args:
+        name: One of BACKENDS
+
+    Returns:
+        Name of the backend now in use ("etree" or "lxml")
+
+    Raises:
+        ValueError: If name is not a known backend
+        ImportError: If "lxml" is requested but not installed
+    """
+    global _active
+
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown CHPP XML backend {name!r}, expected one of {', '.join(BACKENDS)}")
+    if name == "lxml" and lxml_etree is None:
+        raise ImportError('CHPP_XML_BACKEND "lxml" requires the optional lxml package (uv sync --extra xml)')
+
+    use_lxml = lxml_etree is not None and name in ("lxml", "auto")
+    _active = lxml_etree if use_lxml else ET
+    return backend_name()
+
+
+def backend_name() -> str:
+    """Return the name of the backend in use."""
+    return "lxml" if _active is not ET else "etree"
+
+
+def fromstring(data: bytes | str) -> Any:
+    """Parse a complete XML document and return its root element."""
+    if _active is ET:
+        return ET.fromstring(data)
+    if isinstance(data, str):
+        # lxml rejects str input that carries an encoding declaration
+        data = data.encode("utf-8")
+    return lxml_etree.fromstring(data, lxml_etree.XMLParser(**_PARSER_OPTIONS))
+
+
+def pull_parser(events: tuple[str, ...]) -> Any:
+    """Return an incremental XMLPullParser reporting the given events."""
+    if _active is ET:
+        return ET.XMLPullParser(events=events)
+    return lxml_etree.XMLPullParser(events=events, **_PARSER_OPTIONS)
+
+
+@cache
+def _compiled_xpath(path: str) -> Any:
+    return lxml_etree.XPath(path)
+
+
+def findall(root: Any, path: str) -> list[Any]:
+    """Return root.findall(path), using a precompiled XPath for lxml elements.
+
+    path must be valid in both ElementPath and XPath, which holds for the
+    plain ".//A/B" child paths the parsers use.
+    """
+    if lxml_etree is not None and isinstance(root, lxml_etree._Element):
+        return _compiled_xpath(path)(root)
+    return root.findall(path)
@@ -31,6 +31,7 @@ def get_chpp_client(
 
     Args:
         flask_session: Flask session containing access_key and access_secret
+            (and current_user_id, charged for CHPP_USER_BUDGET)
         consumer_key: Optional CHPP consumer key (uses app config if not provided)
         consumer_secret: Optional CHPP consumer secret (uses app config if not provided)
 
@@ -56,6 +57,7 @@ def get_chpp_client(
         consumer_secret,
         flask_session["access_key"],
         flask_session["access_secret"],
+        user_id=flask_session.get("current_user_id"),
     )
 
 
@@ -0,0 +1,126 @@
+"""Chunked reads and batched deletes for maintenance scripts.
+
+Loading whole tables with .all() or deleting a team's history in one statement
+does not survive a production-size database: memory grows with the table and a
+single huge transaction holds locks and bloats the WAL until it commits.
+
+- stream_rows() reads through a server-side cursor (yield_per), for reports
+  that run in one read-only transaction
+- iter_keyset() pages through a query by its key columns, each page a short
+  query of its own, for loops that commit between pages
+- batched_delete() removes matching rows batch_size at a time, committing
+  after every batch, and estimate_rows() sizes the work up front for dry runs
+
+Usage:
+    from app.db_batching import batched_delete, estimate_rows
+
+    rows = estimate_rows(db.session, Players, Players.team_id == team_id)
+    batched_delete(db.session, Players, Players.team_id == team_id, progress=report)
+"""
+
+import json
+
+from sqlalchemy import func, select, tuple_
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def _table(target):
+    return getattr(target, "__table__", target)
+
+
+def _key(columns):
+    return columns[0] if len(columns) == 1 else tuple_(*columns)
+
+
+def _key_value(columns, values):
+    return values[0] if len(columns) == 1 else tuple_(*values)
+
+
+def stream_rows(session, stmt, chunk_size=DEFAULT_BATCH_SIZE):
+    """Execute `stmt` through a server-side cursor fetching chunk_size rows at a time."""
+    return session.execute(stmt.execution_options(yield_per=chunk_size))
+
+
+def iter_keyset(session, stmt, key_columns, chunk_size=DEFAULT_BATCH_SIZE, after=None):
+    """Yield `stmt` results as lists of at most chunk_size rows, in key order.
+
+    Pages are fetched with WHERE key > last_key rather than OFFSET, so every
+    page is an index range scan and the caller may commit between pages.
+
+    Args:
+        session: SQLAlchemy session
+        stmt: Column select that includes every key column
+        key_columns: Columns that uniquely identify a row
+        chunk_size: Rows per page
+        after: Key values to resume after, as returned for the last row of a page
+    """
+    key_columns = list(key_columns)
+    last = after
+    while True:
+        page = stmt.order_by(*key_columns).limit(chunk_size)
+        if last is not None:
+            page = page.where(_key(key_columns) > _key_value(key_columns, last))
+        rows = session.execute(page).all()
+        if rows:
+            yield rows
+        if len(rows) < chunk_size:
+            return
+        last = [rows[-1]._mapping[column] for column in key_columns]
+
+
+def estimate_rows(session, target, *where):
+    """Return how many rows of `target` match `where`.
+
+    On PostgreSQL this is the planner's estimate from EXPLAIN, which does not
+    scan the table; other databases count exactly.
+    """
+    count = select(func.count()).select_from(_table(target)).where(*where)
+    bind = session.get_bind(clause=count)
+    if bind.dialect.name != "postgresql":
+        return session.execute(count).scalar_one()
+
+    # Explain the row select rather than the count, whose plan is always one row
+    rows = select(*_table(target).primary_key.columns).where(*where)
+    compiled = rows.compile(dialect=bind.dialect, compile_kwargs={"render_postcompile": True})
+    plan = session.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def batched_delete(session, target, *where, batch_size=DEFAULT_BATCH_SIZE, progress=None):
+    """Delete the rows of `target` matching `where`, committing every batch_size rows.
+
+    Each batch selects the next batch_size keys in primary key order and
+    deletes the matching rows up to the last of them, so no transaction grows
+    beyond one batch and an interrupted run can simply be restarted.
+
+    Args:
+        session: SQLAlchemy session
+        target: Model or Table to delete from
+        where: Filter clauses selecting the rows to delete
+        batch_size: Rows per transaction
+        progress: Optional callable receiving the running total after each batch
+
+    Returns:
+        Number of rows deleted
+    """
+    table = _table(target)
+    key_columns = list(table.primary_key.columns)
+    next_batch = select(*key_columns).where(*where).order_by(*key_columns).limit(batch_size)
+
+    deleted = 0
+    while True:
+        keys = session.execute(next_batch).all()
+        if not keys:
+            return deleted
+        result = session.execute(
+            table.delete().where(*where, _key(key_columns) <= _key_value(key_columns, keys[-1]))
+        )
+        session.commit()
+        deleted += result.rowcount
+        if progress:
+            progress(deleted)
+        if len(keys) < batch_size:
+            return deleted
@@ -0,0 +1,192 @@
+"""Engine option profiles and connection pool metrics.
+
+SQLALCHEMY_ENGINE_PROFILE picks one of ENGINE_PROFILES for every engine
+(primary and replicas):
+
+- direct: a persistent QueuePool per gunicorn worker talking straight to
+  PostgreSQL, with pre-ping and recycle so idle connections dropped by the
+  server or a firewall are replaced transparently.
+- pgbouncer-transaction: pgbouncer in transaction mode owns the pooling, so
+  each checkout opens a fresh client connection (NullPool) and server-side
+  prepared statements are disabled for drivers that use them.
+- tests: a small pool that fails fast instead of hanging a test run.
+
+DB_POOL_SIZE / DB_MAX_OVERFLOW override the profile's sizing, and explicit
+SQLALCHEMY_ENGINE_OPTIONS win over both. SQLite engines keep Flask-SQLAlchemy's
+own pool defaults.
+
+The pools record checkout latency, waits on an exhausted pool, timeouts and
+overflow per worker process; pool_metrics() reports them for /api/admin/pool-metrics.
+"""
+
+import threading
+import time
+
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import NullPool, QueuePool
+
+DEFAULT_ENGINE_PROFILE = "direct"
+POOL_SIZING_OPTIONS = ("pool_size", "max_overflow", "pool_timeout", "pool_use_lifo")
+
+
+class PoolMetrics:
+    """Checkout counters for one pool, shared with its recreated successors."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.waits = 0
+        self.timeouts = 0
+        self.checkout_seconds = 0.0
+        self.max_checkout_seconds = 0.0
+        self.peak_overflow = 0
+
+    def record(self, seconds, waited, overflow):
+        with self._lock:
+            self.checkouts += 1
+            self.waits += int(waited)
+            self.checkout_seconds += seconds
+            self.max_checkout_seconds = max(self.max_checkout_seconds, seconds)
+            self.peak_overflow = max(self.peak_overflow, overflow)
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def as_dict(self):
+        with self._lock:
+            average = self.checkout_seconds / self.checkouts if self.checkouts else 0.0
+            return {
+                "checkouts": self.checkouts,
+                "waits": self.waits,
+                "timeouts": self.timeouts,
+                "checkout_ms_avg": round(average * 1000, 3),
+                "checkout_ms_max": round(self.max_checkout_seconds * 1000, 3),
+                "peak_overflow": self.peak_overflow,
+            }
+
+
+class _MeasuredPool:
+    """Mixin timing Pool.connect() into a PoolMetrics instance."""
+
+    @property
+    def metrics(self):
+        if getattr(self, "_metrics", None) is None:
+            self._metrics = PoolMetrics()
+        return self._metrics
+
+    def _must_wait(self):
+        return False
+
+    def _current_overflow(self):
+        return 0
+
+    def connect(self):
+        waited = self._must_wait()
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except sa_exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.record(time.perf_counter() - start, waited, self._current_overflow())
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        pool._metrics = self.metrics
+        return pool
+
+
+class MeasuredQueuePool(_MeasuredPool, QueuePool):
+    """QueuePool that records checkout metrics."""
+
+    def _must_wait(self):
+        # No idle connection left and no overflow headroom: the checkout blocks
+        return self.checkedin() == 0 and -1 < self._max_overflow <= self.overflow()
+
+    def _current_overflow(self):
+        return max(self.overflow(), 0)
+
+
+class MeasuredNullPool(_MeasuredPool, NullPool):
+    """NullPool that records connect latency (pgbouncer does the pooling)."""
+
+
+ENGINE_PROFILES = {
+    "direct": {
+        "poolclass": MeasuredQueuePool,
+        "pool_size": 5,
+        "max_overflow": 10,
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+        "pool_use_lifo": True,
+    },
+    "pgbouncer-transaction": {
+        "poolclass": MeasuredNullPool,
+        "pool_pre_ping": False,
+    },
+    "tests": {
+        "poolclass": MeasuredQueuePool,
+        "pool_size": 2,
+        "max_overflow": 2,
+        "pool_timeout": 5,
+        "pool_pre_ping": False,
+    },
+}
+
+
+def engine_options(profile, uri, pool_size=None, max_overflow=None):
+    """Return create_engine() options for `profile` and the database at `uri`."""
+    if profile not in ENGINE_PROFILES:
+        raise ValueError(
+            f"Unknown SQLALCHEMY_ENGINE_PROFILE {profile!r}, expected one of {', '.join(ENGINE_PROFILES)}"
+        )
+    options = dict(ENGINE_PROFILES[profile])
+    if "pool_size" in options:
+        if pool_size is not None:
+            options["pool_size"] = int(pool_size)
+        if max_overflow is not None:
+            options["max_overflow"] = int(max_overflow)
+
+    url = make_url(uri)
+    if url.get_backend_name() == "sqlite":
+        for name in ("poolclass", *POOL_SIZING_OPTIONS):
+            options.pop(name, None)
+    elif profile == "pgbouncer-transaction" and url.get_driver_name() == "psycopg":
+        # psycopg 3 prepares repeated statements server-side, which breaks when
+        # pgbouncer hands the next transaction to another server connection
+        options["connect_args"] = {"prepare_threshold": None}
+    return options
+
+
+def configure_engine_options(app):
+    """Apply the configured engine profile before db.init_app()."""
+    options = engine_options(
+        app.config.get("SQLALCHEMY_ENGINE_PROFILE") or DEFAULT_ENGINE_PROFILE,
+        app.config["SQLALCHEMY_DATABASE_URI"],
+        pool_size=app.config.get("DB_POOL_SIZE"),
+        max_overflow=app.config.get("DB_MAX_OVERFLOW"),
+    )
+    options.update(app.config.get("SQLALCHEMY_ENGINE_OPTIONS") or {})
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = options
+
+
+def pool_metrics(engines):
+    """Pool status and checkout metrics for each engine, keyed by bind name."""
+    report = {}
+    for key, engine in engines.items():
+        pool = engine.pool
+        status = {"pool": type(pool).__name__, "status": pool.status()}
+        if isinstance(pool, QueuePool):
+            status.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                overflow=max(pool.overflow(), 0),
+            )
+        if isinstance(pool, _MeasuredPool):
+            status.update(pool.metrics.as_dict())
+        report[key or "primary"] = status
+    return report
@@ -0,0 +1,153 @@
+"""Read-replica routing for the Flask-SQLAlchemy session.
+
+Replicas are configured as SQLALCHEMY_REPLICA_URIS and registered as the binds
+replica_1..replica_N. RoutingSession sends reads to a random replica while
+use_replicas() is active (read-only routes via @replica_reads, report scripts
+via the context manager); flushes, DML and tables in PRIMARY_ONLY_TABLES always
+go to the primary.
+
+A user who just wrote something is kept on the primary for
+READ_YOUR_WRITES_SECONDS so their own /update, settings or feedback changes are
+visible on the next page despite replication lag.
+"""
+
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+import sqlalchemy as sa
+from flask import current_app, has_request_context, request, session
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+from sqlalchemy.sql.util import find_tables
+
+REPLICA_BIND_PREFIX = "replica_"
+# Flask session key holding the time of the user's last committed write
+LAST_WRITE_KEY = "db_last_write"
+DEFAULT_READ_YOUR_WRITES_SECONDS = 60
+# Tables read and written on every request (activity counters), never lagged
+PRIMARY_ONLY_TABLES = frozenset({"users"})
+SAFE_METHODS = frozenset({"GET", "HEAD"})
+
+_use_replicas = ContextVar("use_replicas", default=False)
+
+
+def configure_replica_binds(app):
+    """Register SQLALCHEMY_REPLICA_URIS as replica_N binds before db.init_app()."""
+    uris = app.config.get("SQLALCHEMY_REPLICA_URIS") or []
+    if not uris:
+        return
+    binds = dict(app.config.get("SQLALCHEMY_BINDS") or {})
+    for index, uri in enumerate(uris, start=1):
+        binds[f"{REPLICA_BIND_PREFIX}{index}"] = uri
+    app.config["SQLALCHEMY_BINDS"] = binds
+
+
+def replicas_active():
+    """True while reads of the current context are routed to replicas."""
+    return _use_replicas.get()
+
+
+@contextmanager
+def use_replicas():
+    """Route reads inside the block to a replica (no-op without replicas)."""
+    token = _use_replicas.set(True)
+    try:
+        yield
+    finally:
+        _use_replicas.reset(token)
+
+
+def read_your_writes_seconds():
+    return int(current_app.config.get("READ_YOUR_WRITES_SECONDS", DEFAULT_READ_YOUR_WRITES_SECONDS))
+
+
+def recent_write(now=None):
+    """True if the current user committed a write within the read-your-writes window."""
+    last_write = session.get(LAST_WRITE_KEY)
+    if last_write is None:
+        return False
+    now = time.time() if now is None else now
+    return now - last_write < read_your_writes_seconds()
+
+
+def replica_reads(f):
+    """Decorator routing a read-only route's queries to a replica.
+
+    Only GET/HEAD requests are routed, and only when the user has not written
+    anything within the read-your-writes window.
+
+    Usage:
+        @blueprint.route('/stats')
+        @require_authentication
+        @replica_reads
+        def stats():
+            # Queries here read from a replica
+    """
+
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if request.method not in SAFE_METHODS or recent_write():
+            return f(*args, **kwargs)
+        with use_replicas():
+            return f(*args, **kwargs)
+
+    return decorated_function
+
+
+def _is_write(clause):
+    if isinstance(clause, sa.sql.dml.UpdateBase):
+        return True
+    if isinstance(clause, sa.TextClause):
+        return not clause.text.lstrip().upper().startswith(("SELECT", "WITH", "EXPLAIN", "SHOW"))
+    return False
+
+
+def _touches_primary_only(mapper, clause):
+    tables = find_tables(clause, include_crud=True) if clause is not None else []
+    if mapper is not None:
+        tables.append(sa.inspect(mapper).local_table)
+    return any(table.name in PRIMARY_ONLY_TABLES for table in tables)
+
+
+class RoutingSession(Session):
+    """Session that reads from a replica while use_replicas() is active."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if (
+            bind is None
+            and replicas_active()
+            and not self._flushing
+            and not _is_write(clause)
+            and not _touches_primary_only(mapper, clause)
+        ):
+            replicas = [
+                engine
+                for key, engine in self._db.engines.items()
+                if key and key.startswith(REPLICA_BIND_PREFIX)
+            ]
+            if replicas:
+                return random.choice(replicas)
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _remember_flush(db_session, _flush_context):
+    db_session.info["wrote"] = True
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def _forget_flush(db_session):
+    db_session.info.pop("wrote", None)
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _stamp_user_write(db_session):
+    """Start the read-your-writes window for the user who committed a write.
+
+    Activity counters committed while a route reads from replicas do not count.
+    """
+    if db_session.info.pop("wrote", False) and has_request_context() and not replicas_active():
+        session[LAST_WRITE_KEY] = time.time()
@@ -1,5 +1,6 @@
 """Standardized error handling utilities for HTStatus application."""
 
+from app.chpp.exceptions import CHPPUnavailableError
 from app.utils import create_page
 
 
@@ -212,6 +213,12 @@ def register_error_handlers(app):
         log_error_to_database('404', error)
         return handle_error("Page not found"), 404
 
+    @app.errorhandler(CHPPUnavailableError)
+    def handle_chpp_unavailable(error):
+        """Fail fast while the CHPP circuit breaker is open."""
+        page = create_page(template="error.html", title="Hattrick Unavailable", error=str(error))
+        return page, 503, {"Retry-After": str(max(1, round(error.retry_after)))}
+
     @app.errorhandler(Exception)
     def handle_generic_exception(error):
         """Handle any unhandled exception."""
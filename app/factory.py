@@ -9,6 +9,10 @@ from flask_bootstrap import Bootstrap
 from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
 
+from app.chpp.xml_backend import set_backend as set_xml_backend
+from app.db_pool import configure_engine_options
+from app.db_routing import RoutingSession, configure_replica_binds
+
 # Python 3.14 removed pkgutil.get_loader; add a minimal shim for Flask/werkzeug
 if not hasattr(pkgutil, "get_loader"):
 
@@ -22,7 +26,7 @@ if not hasattr(pkgutil, "get_loader"):
 load_dotenv()
 
 # Initialize extensions
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 migrate = Migrate()
 bootstrap = Bootstrap()
 
@@ -47,6 +51,9 @@ def create_app(config_object=None, include_routes=True):
         config_object = Config
 
     app.config.from_object(config_object)
+    configure_replica_binds(app)
+    configure_engine_options(app)
+    set_xml_backend(app.config.get("CHPP_XML_BACKEND") or "auto")
 
     # Initialize extensions with app
     db.init_app(app)
@@ -100,6 +107,7 @@ def setup_routes(app_instance, db_instance):
     init_routes_bp(app_instance, db_instance)
 
     # Import blueprint functions and blueprints
+    from app.api.export import export_bp, setup_export_blueprint
     from app.api.players import api_bp, setup_api_blueprint
     from app.blueprints.auth import auth_bp, setup_auth_blueprint
     from app.blueprints.compare import compare_bp, setup_compare_blueprint
@@ -171,8 +179,9 @@ def setup_routes(app_instance, db_instance):
 
     setup_training_blueprint(db_instance, TRACE_COLUMNS)
 
-    # Setup API blueprint
+    # Setup API blueprints
     setup_api_blueprint(db_instance)
+    setup_export_blueprint(db_instance)
 
     # Setup comparison blueprint
     setup_compare_blueprint(db_instance)
@@ -187,6 +196,7 @@ def setup_routes(app_instance, db_instance):
     app_instance.register_blueprint(stats_bp)
     app_instance.register_blueprint(training_bp)
     app_instance.register_blueprint(api_bp)
+    app_instance.register_blueprint(export_bp)
     app_instance.register_blueprint(compare_bp)
 
 
@@ -207,14 +217,34 @@ def _display_startup_status():
 
     # Get database migration status
     db_status = _get_database_migration_status()
+    pool_status = _get_database_pool_status()
 
     print(f"\n{separator}")
     print("Configuration Status:")
     print(f"{STATUS_PREFIX}{chpp_status}")
     print(f"{STATUS_PREFIX}{db_status}")
+    print(f"{STATUS_PREFIX}{pool_status}")
     print(f"{separator}\n")
 
 
+def _get_database_pool_status():
+    """Get the engine profile and pool sizing for startup display.
+
+    Returns:
+        str: Formatted pool status message
+    """
+    from flask import current_app
+
+    from app.db_pool import DEFAULT_ENGINE_PROFILE
+
+    profile = current_app.config.get("SQLALCHEMY_ENGINE_PROFILE") or DEFAULT_ENGINE_PROFILE
+    options = current_app.config.get("SQLALCHEMY_ENGINE_OPTIONS", {})
+    sizing = ", ".join(
+        f"{name}={options[name]}" for name in ("pool_size", "max_overflow") if name in options
+    )
+    return f"🔌 Database pool: {profile}" + (f" ({sizing})" if sizing else "")
+
+
 def _get_database_migration_status():
     """Get current database migration status for startup display.
 
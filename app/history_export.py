@@ -0,0 +1,201 @@
+"""Streaming export of a team's player history and matches.
+
+Rows are read through server-side cursors (yield_per) and serialised chunk by
+chunk into CSV, NDJSON or Parquet, so an export runs in constant memory no
+matter how many snapshots a team has. Both the /api/export routes and
+scripts/database/export_team_history.py use these generators.
+
+Parquet needs the optional pyarrow package (pip install "htstatus[export]").
+
+Usage:
+    from app.history_export import export_format, player_history_rows, stream_export
+
+    export_format("csv")
+    columns = select_columns("ht_id,data_date,tsi", PLAYER_EXPORT_COLUMNS)
+    rows = player_history_rows(db.session, team_id, columns)
+    for chunk in stream_export(rows, columns, "csv", PLAYER_COLUMN_TYPES):
+        out.write(chunk)
+"""
+
+import csv
+import io
+import json
+from datetime import date, datetime
+
+from sqlalchemy import or_, select
+
+from app.error_handlers import ValidationError
+from app.player_snapshots import DEFAULT_STREAM_CHUNK_SIZE, iter_player_history
+from models import MATCH_ANALYTICS_FIELDS, Match, MatchAnalytics, Players
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+PLAYER_EXPORT_COLUMNS = [column.key for column in Players.__table__.columns]
+PLAYER_COLUMN_TYPES = {column.key: column.type for column in Players.__table__.columns}
+
+MATCH_EXPORT_COLUMNS = [column.key for column in Match.__table__.columns] + list(MATCH_ANALYTICS_FIELDS)
+MATCH_COLUMN_TYPES = {
+    column.key: column.type
+    for table in (Match.__table__, MatchAnalytics.__table__)
+    for column in table.columns
+    if column.key != "match_id"
+}
+
+
+def export_format(name):
+    """Validate an export format and return its mimetype."""
+    if name not in EXPORT_FORMATS:
+        raise ValidationError(
+            f"Unknown export format '{name}', expected one of {', '.join(EXPORT_FORMATS)}", "format"
+        )
+    if name == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ValidationError("Parquet export requires the optional pyarrow package", "format") from None
+    return EXPORT_FORMATS[name]
+
+
+def select_columns(requested, available):
+    """Return the requested columns (comma-separated or list), all if empty."""
+    if not requested:
+        return list(available)
+    if isinstance(requested, str):
+        requested = [name.strip() for name in requested.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in available]
+    if unknown:
+        raise ValidationError(f"Unknown columns: {', '.join(unknown)}", "columns")
+    return list(requested)
+
+
+def player_history_rows(session, owner, columns, chunk_size=DEFAULT_STREAM_CHUNK_SIZE):
+    """Yield the projected columns of every snapshot of an owner's players."""
+    for record in iter_player_history(session, owner, chunk_size):
+        yield {name: getattr(record, name) for name in columns}
+
+
+def team_match_rows(session, team_id, columns, chunk_size=DEFAULT_STREAM_CHUNK_SIZE):
+    """Yield the projected columns of every match a team played, oldest first."""
+    selected = [
+        Match.__table__.c[name] if name in Match.__table__.c else MatchAnalytics.__table__.c[name]
+        for name in columns
+    ]
+    query = select(*selected).select_from(Match.__table__)
+    if any(name in MATCH_ANALYTICS_FIELDS for name in columns):
+        query = query.outerjoin(MatchAnalytics, MatchAnalytics.match_id == Match.ht_id)
+    query = (
+        query.where(or_(Match.home_team_id == team_id, Match.away_team_id == team_id))
+        .order_by(Match.datetime, Match.ht_id)
+        .execution_options(yield_per=chunk_size)
+    )
+    for row in session.execute(query):
+        yield dict(row._mapping)
+
+
+def stream_export(rows, columns, fmt, column_types, chunk_size=DEFAULT_STREAM_CHUNK_SIZE):
+    """Serialise row dicts into `fmt`, yielding one bytes chunk per `chunk_size` rows."""
+    if fmt == "csv":
+        return _stream_csv(rows, columns, chunk_size)
+    if fmt == "ndjson":
+        return _stream_ndjson(rows, columns, chunk_size)
+    return _stream_parquet(rows, columns, column_types, chunk_size)
+
+
+def _chunks(rows, chunk_size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _stream_csv(rows, columns, chunk_size):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for chunk in _chunks(rows, chunk_size):
+        writer.writerows([row[name] for name in columns] for row in chunk)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def _stream_ndjson(rows, columns, chunk_size):
+    for chunk in _chunks(rows, chunk_size):
+        yield "".join(
+            json.dumps({name: row[name] for name in columns}, default=_json_default) + "\n"
+            for row in chunk
+        ).encode()
+
+
+class _DrainSink(io.RawIOBase):
+    """Write-only file that hands written bytes back instead of keeping them.
+
+    tell() keeps counting across drains, as Parquet records absolute offsets
+    in its footer.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._pending = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        data = bytes(data)
+        self._pending.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self):
+        data = b"".join(self._pending)
+        self._pending.clear()
+        return data
+
+
+def _arrow_type(column_type):
+    import pyarrow as pa
+
+    python_type = column_type.python_type
+    if python_type is bool:
+        return pa.bool_()
+    if python_type is int:
+        return pa.int64()
+    if python_type is float:
+        return pa.float64()
+    if python_type is datetime:
+        return pa.timestamp("us")
+    return pa.string()
+
+
+def _stream_parquet(rows, columns, column_types, chunk_size):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([(name, _arrow_type(column_types[name])) for name in columns])
+    sink = _DrainSink()
+    with pq.ParquetWriter(sink, schema) as writer:
+        for chunk in _chunks(rows, chunk_size):
+            writer.write_table(pa.Table.from_pylist(chunk, schema=schema))
+            yield sink.drain()
+    yield sink.drain()
@@ -0,0 +1,158 @@
+"""Player Snapshot Partitions
+
+On PostgreSQL the players table is range-partitioned by data_date, one
+partition per calendar month (players_pYYYY_MM). Queries that bound
+data_date only touch the matching months, and retention detaches whole
+months instead of deleting rows one by one.
+
+Other databases (SQLite in tests) keep a plain players table; every function
+here is then a no-op.
+
+Usage:
+    from app.player_partitions import ensure_player_partitions
+
+    ensure_player_partitions(db.session)
+    detach_expired_partitions(db.session, retain_months=24)
+"""
+
+import re
+from datetime import date, datetime
+
+from sqlalchemy import text
+
+from app.player_snapshots import rebase_expiring_deltas
+
+PARENT_TABLE = "players"
+DEFAULT_MONTHS_AHEAD = 2
+
+_PARTITION_NAME = re.compile(r"^players_p(\d{4})_(\d{2})$")
+
+
+def month_start(value):
+    """Return the first day of the month containing a date or datetime."""
+    return date(value.year, value.month, 1)
+
+
+def add_months(month, count):
+    """Return the first day of the month `count` months after `month`."""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month):
+    """Return the partition table name for a month."""
+    return f"{PARENT_TABLE}_p{month.year:04d}_{month.month:02d}"
+
+
+def partition_month(name):
+    """Return the month a partition name covers, or None for other tables."""
+    match = _PARTITION_NAME.match(name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def create_partition_sql(month):
+    """Return the DDL that creates the partition for a month."""
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(month)} "
+        f"PARTITION OF {PARENT_TABLE} "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+    )
+
+
+def is_partitioned(session):
+    """Return True if players is a partitioned PostgreSQL table."""
+    if session.get_bind().dialect.name != "postgresql":
+        return False
+    return bool(
+        session.execute(
+            text(
+                "SELECT 1 FROM pg_partitioned_table p "
+                "JOIN pg_class c ON c.oid = p.partrelid "
+                "WHERE c.relname = :parent AND c.relnamespace = current_schema()::regnamespace"
+            ),
+            {"parent": PARENT_TABLE},
+        ).scalar()
+    )
+
+
+def list_player_partitions(session):
+    """Return {month: name} for the partitions currently attached to players."""
+    if not is_partitioned(session):
+        return {}
+    return _attached_partitions(session)
+
+
+def _attached_partitions(session):
+    rows = session.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits i "
+            "JOIN pg_class parent ON parent.oid = i.inhparent "
+            "JOIN pg_class child ON child.oid = i.inhrelid "
+            "WHERE parent.relname = :parent"
+        ),
+        {"parent": PARENT_TABLE},
+    )
+    partitions = {}
+    for (name,) in rows:
+        month = partition_month(name)
+        if month is not None:
+            partitions[month] = name
+    return partitions
+
+
+def ensure_player_partitions(session, months_ahead=DEFAULT_MONTHS_AHEAD, today=None):
+    """Create partitions for the current month and the next `months_ahead` (caller commits).
+
+    Returns:
+        list: Names of the partitions that were created
+    """
+    if not is_partitioned(session):
+        return []
+
+    existing = _attached_partitions(session)
+    current = month_start(today or datetime.now())
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        if month not in existing:
+            session.execute(text(create_partition_sql(month)))
+            created.append(partition_name(month))
+    return created
+
+
+def detach_expired_partitions(session, retain_months, drop=False, today=None):
+    """Detach (and optionally drop) months older than the retention window (caller commits).
+
+    Detached months stay available as standalone tables for archiving unless
+    drop is set. Deltas inside the window whose keyframe is in a removed month
+    are first rebased onto a new keyframe inside the window; only deltas
+    dated before the window are deleted.
+
+    Returns:
+        list: Names of the partitions that were detached
+    """
+    if not is_partitioned(session):
+        return []
+
+    cutoff = add_months(month_start(today or datetime.now()), -retain_months)
+    expired = [
+        name
+        for month, name in sorted(_attached_partitions(session).items())
+        if add_months(month, 1) <= cutoff
+    ]
+    if not expired:
+        return []
+
+    rebase_expiring_deltas(session, datetime.combine(cutoff, datetime.min.time()))
+    for name in expired:
+        session.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+        if drop:
+            session.execute(text(f"DROP TABLE {name}"))
+
+    session.execute(
+        text("DELETE FROM player_snapshot_delta WHERE data_date < :cutoff"),
+        {"cutoff": cutoff},
+    )
+    return expired
@@ -0,0 +1,599 @@
+"""Player Snapshot Storage
+
+The /update route stores one snapshot per player per day. In the default
+"full" storage mode every snapshot is a complete Players row. In "delta" mode
+(PLAYER_SNAPSHOT_STORAGE = "delta") only keyframes are complete rows:
+
+- the latest snapshot of every player (the head) is always a full Players row,
+  so "current squad" readers keep working unchanged
+- older snapshots are full rows only every PLAYER_KEYFRAME_DAYS days or when
+  the owner changes; the days in between are PlayerSnapshotDelta rows holding
+  just the columns that differ from their keyframe
+
+Readers that walk a player's history use get_player_snapshot() and
+load_player_history(), which rebuild Players-shaped records from keyframes
+and deltas in either mode; iter_player_history() does the same for a whole
+team through server-side cursors, for exports that must not load
+everything. Readers that only need the current squad use
+get_current_roster(), an indexed lookup through the player_latest table.
+
+Usage:
+    from app.player_snapshots import get_player_snapshot, store_player_snapshot
+
+    store_player_snapshot(db.session, thisplayer)
+    db.session.commit()
+    latest = get_player_snapshot(db.session, ht_id, before=cutoff)
+"""
+
+import heapq
+from datetime import date, datetime, timedelta
+
+from flask import current_app, has_app_context
+from sqlalchemy import and_, desc, select
+
+from app.constants import TRACE_COLUMNS
+from models import PlayerLatest, Players, PlayerSnapshotDelta
+
+STORAGE_FULL = "full"
+STORAGE_DELTA = "delta"
+DEFAULT_KEYFRAME_DAYS = 7
+DEFAULT_DAILY_HISTORY_DAYS = 120
+DEFAULT_STREAM_CHUNK_SIZE = 1000
+
+# Identity and ownership live in real columns on both tables, so they are
+# never part of a delta
+SNAPSHOT_COLUMNS = [
+    column.key
+    for column in Players.__table__.columns
+    if column.key not in ("ht_id", "data_date", "owner", "old_owner")
+]
+_DATETIME_COLUMNS = {
+    column.key
+    for column in Players.__table__.columns
+    if column.key in SNAPSHOT_COLUMNS and column.type.python_type is datetime
+}
+
+
+def snapshot_storage_mode():
+    """Return the configured storage mode, "full" outside an app context."""
+    if not has_app_context():
+        return STORAGE_FULL
+    return current_app.config.get("PLAYER_SNAPSHOT_STORAGE", STORAGE_FULL)
+
+
+def keyframe_interval():
+    """Return the maximum distance between keyframes as a timedelta."""
+    days = DEFAULT_KEYFRAME_DAYS
+    if has_app_context():
+        days = current_app.config.get("PLAYER_KEYFRAME_DAYS", DEFAULT_KEYFRAME_DAYS)
+    return timedelta(days=days)
+
+
+def daily_history_days():
+    """Return how many recent days keep every daily snapshot."""
+    if has_app_context():
+        return current_app.config.get("PLAYER_DAILY_HISTORY_DAYS", DEFAULT_DAILY_HISTORY_DAYS)
+    return DEFAULT_DAILY_HISTORY_DAYS
+
+
+# =============================================================================
+# Delta encoding
+# =============================================================================
+
+
+def _encode(key, value):
+    if key in _DATETIME_COLUMNS and isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _decode(key, value):
+    if key in _DATETIME_COLUMNS and isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
+
+
+def _as_datetime(value):
+    """Normalise a snapshot date (string, date or datetime) to a datetime."""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime.combine(value, datetime.min.time())
+    return datetime.strptime(str(value)[:10], "%Y-%m-%d")
+
+
+def make_delta(keyframe, snapshot):
+    """Build the PlayerSnapshotDelta that turns keyframe into snapshot."""
+    changes = {}
+    for key in SNAPSHOT_COLUMNS:
+        value = getattr(snapshot, key)
+        if value != getattr(keyframe, key):
+            changes[key] = _encode(key, value)
+    return PlayerSnapshotDelta(
+        ht_id=snapshot.ht_id,
+        data_date=snapshot.data_date,
+        keyframe_date=keyframe.data_date,
+        owner=snapshot.owner,
+        old_owner=snapshot.old_owner,
+        changes=changes,
+    )
+
+
+def apply_delta(keyframe, delta):
+    """Rebuild the snapshot a delta describes as a detached Players record."""
+    player = Players.__mapper__.class_manager.new_instance()
+    for key in SNAPSHOT_COLUMNS:
+        setattr(player, key, getattr(keyframe, key))
+    for key, value in (delta.changes or {}).items():
+        if key in SNAPSHOT_COLUMNS:
+            setattr(player, key, _decode(key, value))
+    player.ht_id = delta.ht_id
+    player.data_date = delta.data_date
+    player.owner = delta.owner
+    player.old_owner = delta.old_owner
+    return player
+
+
+def _starts_new_keyframe(keyframe, snapshot, interval):
+    return (
+        keyframe is None
+        or keyframe.owner != snapshot.owner
+        or snapshot.data_date - keyframe.data_date >= interval
+    )
+
+
+# =============================================================================
+# Writing
+# =============================================================================
+
+
+def store_player_snapshot(session, playerdata):
+    """Add today's snapshot of a player to the session (caller commits).
+
+    A snapshot already stored for the same day is replaced. In delta mode the
+    previous head is folded into a delta unless it has to stay a keyframe.
+    The player's player_latest entry is moved to the new snapshot.
+    """
+    snapshot = Players(playerdata)
+    snapshot.data_date = _as_datetime(snapshot.data_date)
+
+    existing = session.get(Players, (snapshot.ht_id, snapshot.data_date))
+    if existing is not None:
+        session.delete(existing)
+        session.flush()
+
+    if snapshot_storage_mode() == STORAGE_DELTA:
+        _fold_head(session, snapshot.ht_id)
+
+    session.add(snapshot)
+    _point_latest_at(session, snapshot)
+    return snapshot
+
+
+def update_snapshot_columns(session, record, columns):
+    """Set columns on a stored snapshot, a Players row or a delta (caller commits).
+
+    None values are skipped. Deltas only list the columns that differ from
+    their keyframe, so before a keyframe row changes, the old value is
+    written into every delta rebuilt from it that does not list the column;
+    those days keep their own value. A delta stores the new value as a change,
+    or drops it when it equals the keyframe.
+
+    Returns:
+        bool: True if any column changed
+    """
+    columns = {key: value for key, value in columns.items() if value is not None and key in SNAPSHOT_COLUMNS}
+    if isinstance(record, PlayerSnapshotDelta):
+        keyframe = session.get(Players, (record.ht_id, record.keyframe_date))
+        if keyframe is None:
+            return False
+        changes = dict(record.changes or {})
+        for key, value in columns.items():
+            if value == getattr(keyframe, key):
+                changes.pop(key, None)
+            else:
+                changes[key] = _encode(key, value)
+        if changes == (record.changes or {}):
+            return False
+        record.changes = changes
+        return True
+
+    changed = {key: value for key, value in columns.items() if getattr(record, key) != value}
+    if not changed:
+        return False
+    dependents = session.query(PlayerSnapshotDelta).filter_by(
+        ht_id=record.ht_id, keyframe_date=record.data_date
+    )
+    for delta in dependents:
+        missing = {key: _encode(key, getattr(record, key)) for key in changed if key not in (delta.changes or {})}
+        if missing:
+            delta.changes = {**(delta.changes or {}), **missing}
+    for key, value in changed.items():
+        setattr(record, key, value)
+    return True
+
+
+def _point_latest_at(session, snapshot):
+    latest = session.get(PlayerLatest, snapshot.ht_id)
+    if latest is None:
+        latest = PlayerLatest(ht_id=snapshot.ht_id)
+        session.add(latest)
+    latest.data_date = snapshot.data_date
+    latest.owner = snapshot.owner
+    latest.first_name = snapshot.first_name
+    latest.last_name = snapshot.last_name
+    latest.number = snapshot.number
+    latest.tsi = snapshot.tsi
+
+
+def release_player(session, ht_id, owner):
+    """Mark a player as gone from a team in every snapshot table (caller commits)."""
+    released = {"old_owner": owner, "owner": 0}
+    session.query(Players).filter_by(ht_id=ht_id, owner=owner).update(released)
+    session.query(PlayerSnapshotDelta).filter_by(ht_id=ht_id, owner=owner).update(released)
+    session.query(PlayerLatest).filter_by(ht_id=ht_id, owner=owner).update({"owner": 0})
+
+
+def _fold_head(session, ht_id):
+    """Turn the current head row into a delta if it is not needed as a keyframe."""
+    rows = (
+        session.query(Players)
+        .filter_by(ht_id=ht_id)
+        .order_by(desc(Players.data_date))
+        .limit(2)
+        .all()
+    )
+    if len(rows) < 2:
+        return
+    head, keyframe = rows
+    if _starts_new_keyframe(keyframe, head, keyframe_interval()):
+        return
+    referenced = (
+        session.query(PlayerSnapshotDelta.data_date)
+        .filter_by(ht_id=ht_id, keyframe_date=head.data_date)
+        .first()
+    )
+    if referenced is not None:
+        return
+    session.add(make_delta(keyframe, head))
+    session.delete(head)
+    session.flush()
+
+
+# =============================================================================
+# Reading
+# =============================================================================
+
+
+def get_current_roster(session, owner, *order_by):
+    """Return the newest snapshot of every player currently owned by a team.
+
+    Args:
+        session: SQLAlchemy session
+        owner: Owning team ID
+        order_by: Optional Players columns/clauses to order by
+
+    Returns:
+        List of Players records, one per player
+    """
+    query = (
+        session.query(Players)
+        .join(
+            PlayerLatest,
+            and_(
+                PlayerLatest.ht_id == Players.ht_id,
+                PlayerLatest.data_date == Players.data_date,
+            ),
+        )
+        .filter(PlayerLatest.owner == owner)
+    )
+    if order_by:
+        query = query.order_by(*order_by)
+    return query.all()
+
+
+def get_player_snapshot(session, ht_id, owner=None, since=None, before=None):
+    """Return the latest snapshot of a player with since <= data_date < before.
+
+    Args:
+        session: SQLAlchemy session
+        ht_id: Hattrick player ID
+        owner: Optional owning team ID
+        since: Optional inclusive lower bound on data_date
+        before: Optional exclusive upper bound on data_date
+
+    Returns:
+        Players record (detached if rebuilt from a delta) or None
+    """
+    criteria = {"ht_id": ht_id}
+    if owner is not None:
+        criteria["owner"] = owner
+
+    query = session.query(Players).filter_by(**criteria)
+    bounds = _date_bounds(Players, since, before)
+    if bounds:
+        query = query.filter(*bounds)
+    record = query.order_by(desc(Players.data_date)).first()
+
+    if snapshot_storage_mode() != STORAGE_DELTA:
+        return record
+
+    delta_query = session.query(PlayerSnapshotDelta).filter_by(**criteria)
+    bounds = _date_bounds(PlayerSnapshotDelta, since, before)
+    if record is not None:
+        bounds.append(PlayerSnapshotDelta.data_date > record.data_date)
+    if bounds:
+        delta_query = delta_query.filter(*bounds)
+    delta = delta_query.order_by(desc(PlayerSnapshotDelta.data_date)).first()
+    if delta is None:
+        return record
+
+    if record is not None and record.data_date == delta.keyframe_date:
+        keyframe = record
+    else:
+        keyframe = session.get(Players, (delta.ht_id, delta.keyframe_date))
+    if keyframe is None:
+        return record
+    return apply_delta(keyframe, delta)
+
+
+def load_player_history(session, ht_id=None, owner=None, order_by=("data_date",)):
+    """Return every stored snapshot for a player and/or owner.
+
+    Args:
+        session: SQLAlchemy session
+        ht_id: Optional Hattrick player ID
+        owner: Optional owning team ID
+        order_by: Players attribute names to sort by, in priority order
+
+    Returns:
+        List of Players records; rebuilt snapshots are detached
+    """
+    criteria = {}
+    if ht_id is not None:
+        criteria["ht_id"] = ht_id
+    if owner is not None:
+        criteria["owner"] = owner
+
+    query = session.query(Players).filter_by(**criteria)
+    for key in order_by:
+        query = query.order_by(getattr(Players, key))
+    records = query.all()
+
+    if snapshot_storage_mode() != STORAGE_DELTA:
+        return records
+
+    deltas = session.query(PlayerSnapshotDelta).filter_by(**criteria).all()
+    if not deltas:
+        return records
+
+    keyframes = {(record.ht_id, record.data_date): record for record in records}
+    for delta in deltas:
+        key = (delta.ht_id, delta.keyframe_date)
+        if key not in keyframes:
+            keyframes[key] = session.get(Players, key)
+        if keyframes[key] is not None:
+            records.append(apply_delta(keyframes[key], delta))
+
+    records.sort(key=lambda record: tuple(_sort_value(getattr(record, k)) for k in order_by))
+    return records
+
+
+def iter_player_history(session, owner, chunk_size=DEFAULT_STREAM_CHUNK_SIZE):
+    """Yield every stored snapshot of an owner's players without loading them all.
+
+    Full rows and deltas are read through server-side cursors ordered by
+    (ht_id, data_date) and merged, so memory stays bounded by one chunk plus
+    the current keyframe regardless of history size.
+
+    Args:
+        session: SQLAlchemy session
+        owner: Owning team ID
+        chunk_size: Rows fetched per round trip
+
+    Yields:
+        Players records ordered by ht_id, then data_date
+    """
+    rows = session.scalars(
+        select(Players)
+        .filter_by(owner=owner)
+        .order_by(Players.ht_id, Players.data_date)
+        .execution_options(yield_per=chunk_size)
+    )
+    if snapshot_storage_mode() != STORAGE_DELTA:
+        yield from rows
+        return
+
+    deltas = session.scalars(
+        select(PlayerSnapshotDelta)
+        .filter_by(owner=owner)
+        .order_by(PlayerSnapshotDelta.ht_id, PlayerSnapshotDelta.data_date)
+        .execution_options(yield_per=chunk_size)
+    )
+    keyframe = None
+    for record in heapq.merge(rows, deltas, key=lambda r: (r.ht_id, r.data_date)):
+        if isinstance(record, Players):
+            keyframe = record
+            yield record
+            continue
+        if keyframe is None or (keyframe.ht_id, keyframe.data_date) != (record.ht_id, record.keyframe_date):
+            keyframe = session.get(Players, (record.ht_id, record.keyframe_date))
+        if keyframe is not None:
+            yield apply_delta(keyframe, record)
+
+
+def _date_bounds(model, since, before):
+    bounds = []
+    if since is not None:
+        bounds.append(model.data_date >= since)
+    if before is not None:
+        bounds.append(model.data_date < before)
+    return bounds
+
+
+def _sort_value(value):
+    # Rows with NULLs sort last, matching PostgreSQL's default for ASC
+    return (value is None, value if value is not None else 0)
+
+
+# =============================================================================
+# Converting existing history
+# =============================================================================
+
+
+def compact_player_history(session, ht_id, interval=None):
+    """Fold a player's non-keyframe full rows into deltas (caller commits).
+
+    Returns:
+        int: Number of rows converted
+    """
+    interval = interval or keyframe_interval()
+    rows = (
+        session.query(Players)
+        .filter_by(ht_id=ht_id)
+        .order_by(Players.data_date)
+        .all()
+    )
+    referenced = {
+        keyframe_date
+        for (keyframe_date,) in session.query(PlayerSnapshotDelta.keyframe_date)
+        .filter_by(ht_id=ht_id)
+        .distinct()
+    }
+
+    converted = 0
+    keyframe = None
+    # The head stays a full row so latest-snapshot readers need no changes
+    for row in rows[:-1]:
+        if row.data_date in referenced or _starts_new_keyframe(keyframe, row, interval):
+            keyframe = row
+            continue
+        session.add(make_delta(keyframe, row))
+        session.delete(row)
+        converted += 1
+    session.flush()
+    return converted
+
+
+def expand_player_history(session, ht_id):
+    """Turn a player's deltas back into full Players rows (caller commits).
+
+    Returns:
+        int: Number of rows restored
+    """
+    deltas = session.query(PlayerSnapshotDelta).filter_by(ht_id=ht_id).all()
+    restored = 0
+    for delta in deltas:
+        keyframe = session.get(Players, (delta.ht_id, delta.keyframe_date))
+        if keyframe is None:
+            continue
+        player = apply_delta(keyframe, delta)
+        session.add(player)
+        session.delete(delta)
+        restored += 1
+    session.flush()
+    return restored
+
+
+def rebase_expiring_deltas(session, cutoff):
+    """Detach deltas dated on or after cutoff from keyframes before it (caller commits).
+
+    Used before snapshots older than cutoff are removed: the first such delta
+    of each keyframe chain becomes a full Players row and the chain's later
+    deltas are re-encoded against it, so recent history stays rebuildable.
+
+    Returns:
+        int: Number of deltas promoted to keyframes
+    """
+    deltas = (
+        session.query(PlayerSnapshotDelta)
+        .filter(PlayerSnapshotDelta.keyframe_date < cutoff, PlayerSnapshotDelta.data_date >= cutoff)
+        .order_by(PlayerSnapshotDelta.ht_id, PlayerSnapshotDelta.keyframe_date, PlayerSnapshotDelta.data_date)
+        .all()
+    )
+    promoted = 0
+    chain = old_keyframe = new_keyframe = None
+    for delta in deltas:
+        if (delta.ht_id, delta.keyframe_date) != chain:
+            chain = (delta.ht_id, delta.keyframe_date)
+            old_keyframe = session.get(Players, chain)
+            new_keyframe = None
+        if old_keyframe is None:
+            continue
+        snapshot = apply_delta(old_keyframe, delta)
+        if new_keyframe is None:
+            session.add(snapshot)
+            session.delete(delta)
+            new_keyframe = snapshot
+            promoted += 1
+        else:
+            delta.keyframe_date = new_keyframe.data_date
+            delta.changes = make_delta(new_keyframe, snapshot).changes
+    session.flush()
+    return promoted
+
+
+# =============================================================================
+# Downsampling old history
+# =============================================================================
+
+
+def downsample_player_history(session, ht_id, keep_days=None, today=None):
+    """Thin a player's snapshots older than keep_days to one per week (caller commits).
+
+    Kept outside the daily window: the first snapshot, the last snapshot of
+    each week per owner, and every day where a training skill or the owner
+    changed. The weekly training chart only forward-fills skill values, so it
+    renders the same before and after. Keyframes still referenced by a kept
+    delta are kept too.
+
+    Returns:
+        int: Number of snapshots removed
+    """
+    if keep_days is None:
+        keep_days = daily_history_days()
+    cutoff = datetime.combine(
+        (today or date.today()) - timedelta(days=keep_days), datetime.min.time()
+    )
+
+    rows = session.query(Players).filter_by(ht_id=ht_id).all()
+    deltas = session.query(PlayerSnapshotDelta).filter_by(ht_id=ht_id).all()
+    keyframes = {row.data_date: row for row in rows}
+    history = rows + [
+        apply_delta(keyframes[delta.keyframe_date], delta)
+        for delta in deltas
+        if delta.keyframe_date in keyframes
+    ]
+    history.sort(key=lambda record: record.data_date)
+    if len(history) < 3:
+        return 0
+
+    keep = {history[0].data_date, history[-1].data_date}
+    last_of_week = {}
+    previous = None
+    for record in history:
+        if record.data_date >= cutoff:
+            keep.add(record.data_date)
+        else:
+            week = record.data_date.isocalendar()[:2]
+            last_of_week[(record.owner, week)] = record.data_date
+        if previous is not None and (
+            record.owner != previous.owner
+            or any(getattr(record, key) != getattr(previous, key) for key in TRACE_COLUMNS)
+        ):
+            keep.add(record.data_date)
+        previous = record
+    keep.update(last_of_week.values())
+
+    removed = 0
+    for delta in deltas:
+        if delta.data_date < cutoff and delta.data_date not in keep:
+            session.delete(delta)
+            removed += 1
+    keep.update(delta.keyframe_date for delta in deltas if delta.data_date in keep)
+    for row in rows:
+        if row.data_date < cutoff and row.data_date not in keep:
+            session.delete(row)
+            removed += 1
+    session.flush()
+    return removed
@@ -120,10 +120,13 @@ def get_admin_feedback_counts(user_id=None):
     """Get feedback counts for admin indicators (hobby project scale).
 
     Returns dict with no_replies and needs_followup counts, or None if not admin.
-    Uses simple queries appropriate for <50 feedback items.
+    Both counts come from a single aggregate query: the latest comment per
+    feedback item is picked with a row_number() window over
+    feedback_comment(feedback_id, created_at), so the cost no longer grows
+    with the number of answered feedback items.
     """
     # Import here to avoid circular imports
-    from sqlalchemy import and_, exists
+    from sqlalchemy import and_, case, exists, func, or_, select
 
     from models import Feedback, FeedbackComment, User
 
@@ -137,52 +140,67 @@ def get_admin_feedback_counts(user_id=None):
 
     # Handle case where feedback tables don't exist (graceful degradation)
     try:
-        # Get all admin user IDs for query optimization
-        admin_users = User.query.filter(
-            (User.role == "Admin") | (User.ht_id == 182085)
-        ).all()
-        admin_user_ids = [admin.ht_id for admin in admin_users]
-
-        # Count feedback with no admin replies (simple approach for hobby scale)
-        no_replies_query = Feedback.query.filter(
-            Feedback.status.in_(['open', 'planned', 'in-progress']),
-            ~Feedback.archived,
-            ~exists().where(
-                and_(
-                    FeedbackComment.feedback_id == Feedback.id,
-                    FeedbackComment.author_id.in_(admin_user_ids)
-                )
+        admin_user_ids = select(User.ht_id).where(
+            or_(User.role == "Admin", User.ht_id == 182085)
+        )
+
+        has_admin_reply = exists().where(
+            and_(
+                FeedbackComment.feedback_id == Feedback.id,
+                FeedbackComment.author_id.in_(admin_user_ids)
             )
         )
-        no_replies = no_replies_query.count()
-
-        # Count feedback needing admin follow-up (simplified approach)
-        # For hobby scale: check if latest comment is from non-admin after admin reply exists
-        needs_followup = 0
-        feedback_with_admin_replies = Feedback.query.filter(
-            Feedback.status.in_(['open', 'planned', 'in-progress']),
-            ~Feedback.archived,
-            exists().where(
+
+        # Latest comment per feedback item (rn == 1)
+        ranked_comments = select(
+            FeedbackComment.feedback_id,
+            FeedbackComment.author_id,
+            func.row_number().over(
+                partition_by=FeedbackComment.feedback_id,
+                order_by=(
+                    FeedbackComment.created_at.desc(),
+                    FeedbackComment.id.desc(),
+                ),
+            ).label("rn"),
+        ).subquery()
+
+        # Needs follow-up: an admin has replied, but the latest comment is not
+        # from an admin
+        needs_followup_case = case(
+            (
                 and_(
-                    FeedbackComment.feedback_id == Feedback.id,
-                    FeedbackComment.author_id.in_(admin_user_ids)
-                )
-            )
-        ).all()
+                    has_admin_reply,
+                    ~ranked_comments.c.author_id.in_(admin_user_ids),
+                ),
+                1,
+            ),
+            else_=0,
+        )
 
-        for feedback in feedback_with_admin_replies:
-            # Get latest comment for this feedback
-            latest_comment = FeedbackComment.query.filter_by(
-                feedback_id=feedback.id
-            ).order_by(FeedbackComment.created_at.desc()).first()
+        stmt = (
+            select(
+                func.coalesce(func.sum(case((~has_admin_reply, 1), else_=0)), 0),
+                func.coalesce(func.sum(needs_followup_case), 0),
+            )
+            .select_from(Feedback)
+            .outerjoin(
+                ranked_comments,
+                and_(
+                    ranked_comments.c.feedback_id == Feedback.id,
+                    ranked_comments.c.rn == 1,
+                ),
+            )
+            .where(
+                Feedback.status.in_(['open', 'planned', 'in-progress']),
+                ~Feedback.archived,
+            )
+        )
 
-            # If latest comment is from non-admin, needs follow-up
-            if latest_comment and latest_comment.author_id not in admin_user_ids:
-                needs_followup += 1
+        no_replies, needs_followup = Feedback.query.session.execute(stmt).one()
 
         return {
-            "no_replies": no_replies,
-            "needs_followup": needs_followup
+            "no_replies": int(no_replies),
+            "needs_followup": int(needs_followup)
         }
     except Exception:
         # Graceful degradation if feedback tables don't exist or other DB errors
@@ -315,29 +333,17 @@ def player_diff(playerid, daysago, team_name="Unknown Team"):
         from datetime import datetime
 
         from dateutil.relativedelta import relativedelta
-        from sqlalchemy import desc
 
-        from models import Players
+        from app.player_snapshots import get_player_snapshot
 
         # Query for player data from specified days ago
         cutoff_date = datetime.now() - relativedelta(days=daysago)
 
-        # Get the most recent record before or on the cutoff date
-        old_player = (
-            db.session.query(Players)
-            .filter_by(ht_id=playerid)
-            .filter(Players.data_date <= cutoff_date)
-            .order_by(desc(Players.data_date))
-            .first()
-        )
+        # Get the most recent record before the cutoff date
+        old_player = get_player_snapshot(db.session, playerid, before=cutoff_date)
 
         # Get the most recent record overall
-        current_player = (
-            db.session.query(Players)
-            .filter_by(ht_id=playerid)
-            .order_by(desc(Players.data_date))
-            .first()
-        )
+        current_player = get_player_snapshot(db.session, playerid)
 
         if not old_player or not current_player:
             return []
@@ -398,30 +404,21 @@ def player_daily_changes(playerid, days_ago, team_name="Unknown Team"):
     try:
         from datetime import datetime, timedelta
 
-        from sqlalchemy import Date, cast, desc
-
-        from models import Players
+        from app.player_snapshots import get_player_snapshot
 
-        # Calculate target dates
+        # Calculate target day as a half-open [start, end) timestamp range so the
+        # (ht_id, data_date) primary key can serve the lookup as a range scan
         target_date = (datetime.now() - timedelta(days=days_ago)).date()
+        day_start = datetime.combine(target_date, datetime.min.time())
+        day_end = day_start + timedelta(days=1)
 
         # Get the most recent record for target date
-        target_player = (
-            db.session.query(Players)
-            .filter_by(ht_id=playerid)
-            .filter(cast(Players.data_date, Date) == target_date)
-            .order_by(desc(Players.data_date))
-            .first()
+        target_player = get_player_snapshot(
+            db.session, playerid, since=day_start, before=day_end
         )
 
         # Get the most recent record BEFORE target date (not necessarily previous day)
-        prev_player = (
-            db.session.query(Players)
-            .filter_by(ht_id=playerid)
-            .filter(cast(Players.data_date, Date) < target_date)
-            .order_by(desc(Players.data_date))
-            .first()
-        )
+        prev_player = get_player_snapshot(db.session, playerid, before=day_start)
 
         if not target_player or not prev_player:
             return []
@@ -488,30 +485,18 @@ def get_player_changes(player_id, start_days_ago, end_days_ago):
     try:
         from datetime import datetime, timedelta
 
-        from sqlalchemy import Date, cast, desc
+        from app.player_snapshots import get_player_snapshot
 
-        from models import Players
-
-        # Calculate dates
+        # Calculate dates; "on or before day X" becomes "before the start of day
+        # X+1" so the comparison stays on the raw, indexed data_date column
         start_date = (datetime.now() - timedelta(days=start_days_ago)).date()
         end_date = (datetime.now() - timedelta(days=end_days_ago)).date()
+        start_cutoff = datetime.combine(start_date, datetime.min.time()) + timedelta(days=1)
+        end_cutoff = datetime.combine(end_date, datetime.min.time()) + timedelta(days=1)
 
         # Get records at start and end of period
-        old_record = (
-            db.session.query(Players)
-            .filter_by(ht_id=player_id)
-            .filter(cast(Players.data_date, Date) <= start_date)
-            .order_by(desc(Players.data_date))
-            .first()
-        )
-
-        new_record = (
-            db.session.query(Players)
-            .filter_by(ht_id=player_id)
-            .filter(cast(Players.data_date, Date) <= end_date)
-            .order_by(desc(Players.data_date))
-            .first()
-        )
+        old_record = get_player_snapshot(db.session, player_id, before=start_cutoff)
+        new_record = get_player_snapshot(db.session, player_id, before=end_cutoff)
 
         if (
             not old_record
@@ -993,9 +978,11 @@ def get_team_match_statistics(teamid):
     try:
         # Query match data for the team (check both home and away)
         from sqlalchemy import or_
+        from sqlalchemy.orm import load_only
 
         matches = (
             db.session.query(Match)
+            .options(load_only(Match.home_team_id, Match.home_goals, Match.away_goals))
             .filter(or_(Match.home_team_id == teamid, Match.away_team_id == teamid))
             .all()
         )
@@ -1110,7 +1097,7 @@ def downloadRecentMatches(teamid, chpp=None):
     try:
         # Use provided CHPP client or create one
         if chpp is None:
-            from app.chpp import CHPP
+            from app.chpp_utilities import get_chpp_client
             consumer_key = current_app.config.get("CONSUMER_KEY")
             consumer_secret = current_app.config.get("CONSUMER_SECRETS")
 
@@ -1124,10 +1111,7 @@ def downloadRecentMatches(teamid, chpp=None):
                     "message": "CHPP configuration missing"
                 }
 
-            chpp = CHPP(
-                consumer_key, consumer_secret,
-                session["access_key"], session["access_secret"]
-            )
+            chpp = get_chpp_client(session, consumer_key, consumer_secret)
 
         dprint(2, f"Fetching recent/upcoming matches for team {teamid}")
 
@@ -1222,14 +1206,11 @@ def downloadMatches(teamid, chpp=None):
     try:
         # Use provided CHPP client or create one
         if chpp is None:
-            from app.chpp import CHPP
+            from app.chpp_utilities import get_chpp_client
             consumer_key = current_app.config.get("CONSUMER_KEY")
             consumer_secret = current_app.config.get("CONSUMER_SECRETS")
 
-            chpp = CHPP(
-                consumer_key, consumer_secret,
-                session["access_key"], session["access_secret"]
-            )
+            chpp = get_chpp_client(session, consumer_key, consumer_secret)
 
         dprint(1, f"Downloading recent match archive for team {teamid}")
 
@@ -1372,6 +1353,104 @@ def _process_matches(matches):
     return added, updated
 
 
+def match_details_columns(details):
+    """Map a CHPPMatchDetails to Match analytics columns.
+
+    Shared by the live fetch and the archive reparse
+    (scripts/database/reparse_chpp_archive.py).
+    """
+    return {
+        "possession_first_half_home": details.possession_first_half_home,
+        "possession_first_half_away": details.possession_first_half_away,
+        "possession_second_half_home": details.possession_second_half_home,
+        "possession_second_half_away": details.possession_second_half_away,
+        "home_team_chances_left": details.home_team_chances_left,
+        "home_team_chances_center": details.home_team_chances_center,
+        "home_team_chances_right": details.home_team_chances_right,
+        "home_team_chances_special": details.home_team_chances_special,
+        "home_team_chances_other": details.home_team_chances_other,
+        "away_team_chances_left": details.away_team_chances_left,
+        "away_team_chances_center": details.away_team_chances_center,
+        "away_team_chances_right": details.away_team_chances_right,
+        "away_team_chances_special": details.away_team_chances_special,
+        "away_team_chances_other": details.away_team_chances_other,
+        "home_team_rating": details.home_team_rating,
+        "away_team_rating": details.away_team_rating,
+        "home_team_rating_right_def": details.home_team_rating_right_def,
+        "home_team_rating_mid_def": details.home_team_rating_mid_def,
+        "home_team_rating_left_def": details.home_team_rating_left_def,
+        "away_team_rating_right_def": details.away_team_rating_right_def,
+        "away_team_rating_mid_def": details.away_team_rating_mid_def,
+        "away_team_rating_left_def": details.away_team_rating_left_def,
+        "home_team_rating_right_att": details.home_team_rating_right_att,
+        "home_team_rating_mid_att": details.home_team_rating_mid_att,
+        "home_team_rating_left_att": details.home_team_rating_left_att,
+        "away_team_rating_right_att": details.away_team_rating_right_att,
+        "away_team_rating_mid_att": details.away_team_rating_mid_att,
+        "away_team_rating_left_att": details.away_team_rating_left_att,
+        "home_team_rating_set_pieces_def": details.home_team_rating_set_pieces_def,
+        "home_team_rating_set_pieces_att": details.home_team_rating_set_pieces_att,
+        "away_team_rating_set_pieces_def": details.away_team_rating_set_pieces_def,
+        "away_team_rating_set_pieces_att": details.away_team_rating_set_pieces_att,
+        "attendance": details.attendance,
+        "arena_capacity_terraces": details.arena_capacity_terraces,
+        "arena_capacity_basic": details.arena_capacity_basic,
+        "arena_capacity_roof": details.arena_capacity_roof,
+        "arena_capacity_vip": details.arena_capacity_vip,
+        "weather_id": details.weather_id,
+        "added_minutes": details.added_minutes,
+        "referee_id": details.referee_id,
+        "referee_name": details.referee_name,
+        "referee_country_id": details.referee_country_id,
+        "referee_country": details.referee_country,
+        "referee_team_id": details.referee_team_id,
+        "referee_team_name": details.referee_team_name,
+        "home_team_dress_uri": details.home_team_dress_uri,
+        "away_team_dress_uri": details.away_team_dress_uri,
+        "home_team_attitude": details.home_team_attitude,
+        "away_team_attitude": details.away_team_attitude,
+        "home_team_tactic_type": details.home_team_tactic_type,
+        "home_team_tactic_skill": details.home_team_tactic_skill,
+        "away_team_tactic_type": details.away_team_tactic_type,
+        "away_team_tactic_skill": details.away_team_tactic_skill,
+    }
+
+
+def match_lineup_columns(lineup):
+    """Map a CHPPMatchLineup to Match formation and tactic columns."""
+    return {
+        "home_team_formation": lineup.home_team_formation,
+        "away_team_formation": lineup.away_team_formation,
+        "home_team_tactic": lineup.home_team_tactic,
+        "away_team_tactic": lineup.away_team_tactic,
+    }
+
+
+def player_details_columns(player):
+    """Map a playerdetails CHPPPlayer to the Players columns it provides.
+
+    Shared by the /update route and the archive reparse
+    (scripts/database/reparse_chpp_archive.py).
+    """
+    return {
+        "tsi": player.tsi,
+        "salary": player.salary,
+        "caps": player.caps,
+        "caps_u20": player.caps_u20,
+        "career_goals": player.career_goals,
+        "career_hattricks": player.career_hattricks,
+        "league_goals": player.league_goals,
+        "cup_goals": player.cup_goals,
+        "friendly_goals": player.friendlies_goals,  # Custom CHPP field name
+        "current_team_matches": player.matches_current_team,  # Custom CHPP field name
+        "current_team_goals": player.goals_current_team,  # Custom CHPP field name
+        "national_team_id": player.national_team_id,
+        "is_transfer_listed": player.transfer_listed,  # Custom CHPP field name
+        "mother_club_bonus": player.mother_club_bonus,
+        "leadership": player.leadership,
+    }
+
+
 def fetch_enhanced_match_data(match_id, chpp=None):
     """Fetch enhanced match data (statistics, lineup, events) for a finished match.
 
@@ -1386,24 +1465,21 @@ def fetch_enhanced_match_data(match_id, chpp=None):
     from flask import current_app, session
 
     if chpp is None:
-        from app.chpp import CHPP
+        from app.chpp_utilities import get_chpp_client
         consumer_key = current_app.config.get("CONSUMER_KEY")
         consumer_secret = current_app.config.get("CONSUMER_SECRETS")
 
         if not consumer_key or not consumer_secret:
             return {}
 
-        chpp = CHPP(
-            consumer_key, consumer_secret,
-            session["access_key"], session["access_secret"]
-        )
+        chpp = get_chpp_client(session, consumer_key, consumer_secret)
 
     enhanced_data = {}
 
     try:
         # Fetch match details for comprehensive statistics
         dprint(3, f"Fetching match details for match {match_id}")
-        details = chpp.matchdetails(id_=match_id, match_events=True)
+        details = chpp.matchdetails(id_=match_id, match_events=True, stream=True)
 
         # Calculate average possession for debug output
         home_poss_avg = None
@@ -1436,72 +1512,13 @@ def fetch_enhanced_match_data(match_id, chpp=None):
                f"chances: {home_total}/{away_total}, "
                f"attendance: {details.attendance}")
 
-        enhanced_data.update({
-            "possession_first_half_home": details.possession_first_half_home,
-            "possession_first_half_away": details.possession_first_half_away,
-            "possession_second_half_home": details.possession_second_half_home,
-            "possession_second_half_away": details.possession_second_half_away,
-            "home_team_chances_left": details.home_team_chances_left,
-            "home_team_chances_center": details.home_team_chances_center,
-            "home_team_chances_right": details.home_team_chances_right,
-            "home_team_chances_special": details.home_team_chances_special,
-            "home_team_chances_other": details.home_team_chances_other,
-            "away_team_chances_left": details.away_team_chances_left,
-            "away_team_chances_center": details.away_team_chances_center,
-            "away_team_chances_right": details.away_team_chances_right,
-            "away_team_chances_special": details.away_team_chances_special,
-            "away_team_chances_other": details.away_team_chances_other,
-            "home_team_rating": details.home_team_rating,
-            "away_team_rating": details.away_team_rating,
-            "home_team_rating_right_def": details.home_team_rating_right_def,
-            "home_team_rating_mid_def": details.home_team_rating_mid_def,
-            "home_team_rating_left_def": details.home_team_rating_left_def,
-            "away_team_rating_right_def": details.away_team_rating_right_def,
-            "away_team_rating_mid_def": details.away_team_rating_mid_def,
-            "away_team_rating_left_def": details.away_team_rating_left_def,
-            "home_team_rating_right_att": details.home_team_rating_right_att,
-            "home_team_rating_mid_att": details.home_team_rating_mid_att,
-            "home_team_rating_left_att": details.home_team_rating_left_att,
-            "away_team_rating_right_att": details.away_team_rating_right_att,
-            "away_team_rating_mid_att": details.away_team_rating_mid_att,
-            "away_team_rating_left_att": details.away_team_rating_left_att,
-            "home_team_rating_set_pieces_def": details.home_team_rating_set_pieces_def,
-            "home_team_rating_set_pieces_att": details.home_team_rating_set_pieces_att,
-            "away_team_rating_set_pieces_def": details.away_team_rating_set_pieces_def,
-            "away_team_rating_set_pieces_att": details.away_team_rating_set_pieces_att,
-            "attendance": details.attendance,
-            "arena_capacity_terraces": details.arena_capacity_terraces,
-            "arena_capacity_basic": details.arena_capacity_basic,
-            "arena_capacity_roof": details.arena_capacity_roof,
-            "arena_capacity_vip": details.arena_capacity_vip,
-            "weather_id": details.weather_id,
-            "added_minutes": details.added_minutes,
-            "referee_id": details.referee_id,
-            "referee_name": details.referee_name,
-            "referee_country_id": details.referee_country_id,
-            "referee_country": details.referee_country,
-            "referee_team_id": details.referee_team_id,
-            "referee_team_name": details.referee_team_name,
-            "home_team_dress_uri": details.home_team_dress_uri,
-            "away_team_dress_uri": details.away_team_dress_uri,
-            "home_team_attitude": details.home_team_attitude,
-            "away_team_attitude": details.away_team_attitude,
-            "home_team_tactic_type": details.home_team_tactic_type,
-            "home_team_tactic_skill": details.home_team_tactic_skill,
-            "away_team_tactic_type": details.away_team_tactic_type,
-            "away_team_tactic_skill": details.away_team_tactic_skill,
-        })
+        enhanced_data.update(match_details_columns(details))
 
         # Fetch match lineup for formation and tactical data
         dprint(3, f"Fetching match lineup for match {match_id}")
         lineup = chpp.matchlineup(id_=match_id)
 
-        enhanced_data.update({
-            "home_team_formation": lineup.home_team_formation,
-            "away_team_formation": lineup.away_team_formation,
-            "home_team_tactic": lineup.home_team_tactic,
-            "away_team_tactic": lineup.away_team_tactic,
-        })
+        enhanced_data.update(match_lineup_columns(lineup))
 
         # Filter out None values - only save fields that have actual data
         enhanced_data = {k: v for k, v in enhanced_data.items() if v is not None}
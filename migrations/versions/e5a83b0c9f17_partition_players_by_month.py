@@ -0,0 +1,81 @@
+"""partition players by month
+
+Revision ID: e5a83b0c9f17
+Revises: c47d1e9a0b52
+Create Date: 2026-10-19 15:02:31.904417
+
+Turns players into a PostgreSQL table range-partitioned by data_date with one
+partition per month (see app/player_partitions.py), moving existing rows into
+their partitions. Other databases are left untouched.
+"""
+from datetime import date, datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a83b0c9f17'
+down_revision = 'c47d1e9a0b52'
+branch_labels = None
+depends_on = None
+
+MONTHS_AHEAD = 2
+
+
+def _add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _months(first, last):
+    month = date(first.year, first.month, 1)
+    while month <= last:
+        yield month
+        month = _add_months(month, 1)
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    op.execute('ALTER TABLE players RENAME TO players_unpartitioned')
+    op.execute('ALTER INDEX players_pkey RENAME TO players_unpartitioned_pkey')
+    op.execute('ALTER INDEX ix_players_owner_data_date RENAME TO ix_players_unpartitioned_owner_data_date')
+
+    op.execute(
+        'CREATE TABLE players (LIKE players_unpartitioned INCLUDING DEFAULTS) '
+        'PARTITION BY RANGE (data_date)'
+    )
+    op.execute('ALTER TABLE players ADD CONSTRAINT players_pkey PRIMARY KEY (ht_id, data_date)')
+    op.create_index('ix_players_owner_data_date', 'players', ['owner', 'data_date'], unique=False)
+
+    oldest = bind.execute(sa.text('SELECT min(data_date) FROM players_unpartitioned')).scalar()
+    newest = bind.execute(sa.text('SELECT max(data_date) FROM players_unpartitioned')).scalar()
+    today = datetime.now().date()
+    last = _add_months(date(today.year, today.month, 1), MONTHS_AHEAD)
+    if newest is not None and newest.date() > last:
+        last = newest.date()
+    for month in _months(oldest or today, last):
+        op.execute(
+            f"CREATE TABLE players_p{month.year:04d}_{month.month:02d} PARTITION OF players "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')"
+        )
+
+    op.execute('INSERT INTO players SELECT * FROM players_unpartitioned')
+    op.execute('DROP TABLE players_unpartitioned')
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE TABLE players_unpartitioned (LIKE players INCLUDING DEFAULTS)')
+    op.execute('INSERT INTO players_unpartitioned SELECT * FROM players')
+    # Dropping the partitioned parent drops every attached partition with it
+    op.execute('DROP TABLE players')
+    op.execute('ALTER TABLE players_unpartitioned RENAME TO players')
+    op.execute('ALTER TABLE players ADD CONSTRAINT players_pkey PRIMARY KEY (ht_id, data_date)')
+    op.create_index('ix_players_owner_data_date', 'players', ['owner', 'data_date'], unique=False)
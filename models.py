@@ -2,6 +2,8 @@ import pickle
 import time
 from datetime import datetime
 
+from sqlalchemy.ext.associationproxy import association_proxy
+
 from app import db
 
 # --------------------------------------------------------------------------------
@@ -22,6 +24,12 @@ class MatchPlay(db.Model):
     rating_stars_eom = db.Column(db.Float)
     behaviour = db.Column(db.Integer)
 
+    # Lineups are read per match (matches page) and per player (star ratings)
+    __table_args__ = (
+        db.Index("ix_matchplay_match_id", "match_id"),
+        db.Index("ix_matchplay_player_id_datetime", "player_id", "datetime"),
+    )
+
     def __init__(self, matchdata):
         self.match_id = matchdata["match_id"]
         self.player_id = matchdata["player_id"]
@@ -58,7 +66,119 @@ class Match(db.Model):
     home_goals = db.Column(db.Integer)
     away_goals = db.Column(db.Integer)
 
-    # Enhanced analytics fields from CHPP matchdetails (nullable for backward compatibility)
+    # Enhanced analytics live in match_analytics and are only loaded on demand;
+    # the column names are proxied below so callers can keep using match.<field>
+    analytics = db.relationship(
+        "MatchAnalytics", uselist=False, cascade="all, delete-orphan"
+    )
+
+    # Team match lists filter on either side and order by kickoff
+    __table_args__ = (
+        db.Index("ix_match_home_team_id_datetime", "home_team_id", "datetime"),
+        db.Index("ix_match_away_team_id_datetime", "away_team_id", "datetime"),
+    )
+
+    def __init__(self, matchdata):
+        self.ht_id = matchdata["ht_id"]
+        self.home_team_id = matchdata["home_team_id"]
+        self.home_team_name = matchdata["home_team_name"]
+        self.away_team_id = matchdata["away_team_id"]
+        self.away_team_name = matchdata["away_team_name"]
+        self.datetime = matchdata["datetime"]
+        self.matchtype = matchdata["matchtype"]
+        self.context_id = matchdata["context_id"]
+        self.rule_id = matchdata["rule_id"]
+        self.cup_level = matchdata["cup_level"]
+        self.cup_level_index = matchdata["cup_level_index"]
+        self.home_goals = matchdata["home_goals"]
+        self.away_goals = matchdata["away_goals"]
+
+        # Enhanced analytics (optional fields)
+        analytics = {
+            field: matchdata[field]
+            for field in MATCH_ANALYTICS_FIELDS
+            if matchdata.get(field) is not None
+        }
+        if analytics:
+            self.analytics = MatchAnalytics(**analytics)
+
+    @property
+    def home_team_possession(self):
+        """Calculate average possession for home team from both halves."""
+        if (self.possession_first_half_home is not None and
+            self.possession_second_half_home is not None):
+            return (self.possession_first_half_home + self.possession_second_half_home) / 2
+        return None
+
+    @property
+    def away_team_possession(self):
+        """Calculate average possession for away team from both halves."""
+        if (self.possession_first_half_away is not None and
+            self.possession_second_half_away is not None):
+            return (self.possession_first_half_away + self.possession_second_half_away) / 2
+        return None
+
+    @property
+    def home_team_total_chances(self):
+        """Calculate total chances for home team (sum of all chance types)."""
+        chances = [
+            self.home_team_chances_left,
+            self.home_team_chances_center,
+            self.home_team_chances_right,
+            self.home_team_chances_special,
+            self.home_team_chances_other
+        ]
+        if all(c is not None for c in chances):
+            return sum(chances)
+        return None
+
+    @property
+    def away_team_total_chances(self):
+        """Calculate total chances for away team (sum of all chance types)."""
+        chances = [
+            self.away_team_chances_left,
+            self.away_team_chances_center,
+            self.away_team_chances_right,
+            self.away_team_chances_special,
+            self.away_team_chances_other
+        ]
+        if all(c is not None for c in chances):
+            return sum(chances)
+        return None
+
+    def has_enhanced_data(self):
+        """Check if this match has enhanced analytics data.
+
+        Returns True if ANY enhanced field is available.
+        Note: CHPP added NrOfChances in v3.1 (March 2022).
+        """
+        if self.analytics is None:
+            return False
+        return (self.possession_first_half_home is not None or
+                self.home_team_chances_left is not None or
+                self.attendance is not None or
+                self.home_team_formation or  # Empty string is falsy
+                self.home_team_rating is not None)
+
+    def __repr__(self):
+        return f"{self.home_team_name} - {self.away_team_name}: {self.ht_id}"
+
+
+# --------------------------------------------------------------------------------
+
+
+class MatchAnalytics(db.Model):
+    """Enhanced CHPP matchdetails/matchlineup data for a single match.
+
+    Kept out of the match table so list queries read narrow rows.
+    """
+
+    __tablename__ = "match_analytics"
+
+    match_id = db.Column(
+        db.Integer, db.ForeignKey("match.ht_id", ondelete="CASCADE"), primary_key=True
+    )
+
     # Possession - stored by half as CHPP provides (at Match level, not inside teams)
     possession_first_half_home = db.Column(db.Integer, nullable=True)
     possession_first_half_away = db.Column(db.Integer, nullable=True)
@@ -136,138 +256,20 @@ class Match(db.Model):
     home_team_tactic = db.Column(db.String(50), nullable=True)
     away_team_tactic = db.Column(db.String(50), nullable=True)
 
-    def __init__(self, matchdata):
-        self.ht_id = matchdata["ht_id"]
-        self.home_team_id = matchdata["home_team_id"]
-        self.home_team_name = matchdata["home_team_name"]
-        self.away_team_id = matchdata["away_team_id"]
-        self.away_team_name = matchdata["away_team_name"]
-        self.datetime = matchdata["datetime"]
-        self.matchtype = matchdata["matchtype"]
-        self.context_id = matchdata["context_id"]
-        self.rule_id = matchdata["rule_id"]
-        self.cup_level = matchdata["cup_level"]
-        self.cup_level_index = matchdata["cup_level_index"]
-        self.home_goals = matchdata["home_goals"]
-        self.away_goals = matchdata["away_goals"]
-
-        # Enhanced analytics (optional fields)
-        self.possession_first_half_home = matchdata.get("possession_first_half_home")
-        self.possession_first_half_away = matchdata.get("possession_first_half_away")
-        self.possession_second_half_home = matchdata.get("possession_second_half_home")
-        self.possession_second_half_away = matchdata.get("possession_second_half_away")
-        self.home_team_chances_left = matchdata.get("home_team_chances_left")
-        self.home_team_chances_center = matchdata.get("home_team_chances_center")
-        self.home_team_chances_right = matchdata.get("home_team_chances_right")
-        self.home_team_chances_special = matchdata.get("home_team_chances_special")
-        self.home_team_chances_other = matchdata.get("home_team_chances_other")
-        self.away_team_chances_left = matchdata.get("away_team_chances_left")
-        self.away_team_chances_center = matchdata.get("away_team_chances_center")
-        self.away_team_chances_right = matchdata.get("away_team_chances_right")
-        self.away_team_chances_special = matchdata.get("away_team_chances_special")
-        self.away_team_chances_other = matchdata.get("away_team_chances_other")
-        self.home_team_rating = matchdata.get("home_team_rating")
-        self.away_team_rating = matchdata.get("away_team_rating")
-        self.home_team_rating_right_def = matchdata.get("home_team_rating_right_def")
-        self.home_team_rating_mid_def = matchdata.get("home_team_rating_mid_def")
-        self.home_team_rating_left_def = matchdata.get("home_team_rating_left_def")
-        self.away_team_rating_right_def = matchdata.get("away_team_rating_right_def")
-        self.away_team_rating_mid_def = matchdata.get("away_team_rating_mid_def")
-        self.away_team_rating_left_def = matchdata.get("away_team_rating_left_def")
-        self.home_team_rating_right_att = matchdata.get("home_team_rating_right_att")
-        self.home_team_rating_mid_att = matchdata.get("home_team_rating_mid_att")
-        self.home_team_rating_left_att = matchdata.get("home_team_rating_left_att")
-        self.away_team_rating_right_att = matchdata.get("away_team_rating_right_att")
-        self.away_team_rating_mid_att = matchdata.get("away_team_rating_mid_att")
-        self.away_team_rating_left_att = matchdata.get("away_team_rating_left_att")
-        self.home_team_rating_set_pieces_def = matchdata.get("home_team_rating_set_pieces_def")
-        self.home_team_rating_set_pieces_att = matchdata.get("home_team_rating_set_pieces_att")
-        self.away_team_rating_set_pieces_def = matchdata.get("away_team_rating_set_pieces_def")
-        self.away_team_rating_set_pieces_att = matchdata.get("away_team_rating_set_pieces_att")
-        self.attendance = matchdata.get("attendance")
-        self.arena_capacity_terraces = matchdata.get("arena_capacity_terraces")
-        self.arena_capacity_basic = matchdata.get("arena_capacity_basic")
-        self.arena_capacity_roof = matchdata.get("arena_capacity_roof")
-        self.arena_capacity_vip = matchdata.get("arena_capacity_vip")
-        self.weather_id = matchdata.get("weather_id")
-        self.added_minutes = matchdata.get("added_minutes")
-        self.referee_id = matchdata.get("referee_id")
-        self.referee_name = matchdata.get("referee_name")
-        self.referee_country_id = matchdata.get("referee_country_id")
-        self.referee_country = matchdata.get("referee_country")
-        self.referee_team_id = matchdata.get("referee_team_id")
-        self.referee_team_name = matchdata.get("referee_team_name")
-        self.home_team_dress_uri = matchdata.get("home_team_dress_uri")
-        self.away_team_dress_uri = matchdata.get("away_team_dress_uri")
-        self.home_team_attitude = matchdata.get("home_team_attitude")
-        self.away_team_attitude = matchdata.get("away_team_attitude")
-        self.home_team_tactic_type = matchdata.get("home_team_tactic_type")
-        self.home_team_tactic_skill = matchdata.get("home_team_tactic_skill")
-        self.away_team_tactic_type = matchdata.get("away_team_tactic_type")
-        self.away_team_tactic_skill = matchdata.get("away_team_tactic_skill")
-        self.home_team_formation = matchdata.get("home_team_formation")
-        self.away_team_formation = matchdata.get("away_team_formation")
-        self.home_team_tactic = matchdata.get("home_team_tactic")
-        self.away_team_tactic = matchdata.get("away_team_tactic")
 
-    @property
-    def home_team_possession(self):
-        """Calculate average possession for home team from both halves."""
-        if (self.possession_first_half_home is not None and
-            self.possession_second_half_home is not None):
-            return (self.possession_first_half_home + self.possession_second_half_home) / 2
-        return None
+MATCH_ANALYTICS_FIELDS = tuple(
+    column.name for column in MatchAnalytics.__table__.columns if column.name != "match_id"
+)
 
-    @property
-    def away_team_possession(self):
-        """Calculate average possession for away team from both halves."""
-        if (self.possession_first_half_away is not None and
-            self.possession_second_half_away is not None):
-            return (self.possession_first_half_away + self.possession_second_half_away) / 2
-        return None
-
-    @property
-    def home_team_total_chances(self):
-        """Calculate total chances for home team (sum of all chance types)."""
-        chances = [
-            self.home_team_chances_left,
-            self.home_team_chances_center,
-            self.home_team_chances_right,
-            self.home_team_chances_special,
-            self.home_team_chances_other
-        ]
-        if all(c is not None for c in chances):
-            return sum(chances)
-        return None
 
-    @property
-    def away_team_total_chances(self):
-        """Calculate total chances for away team (sum of all chance types)."""
-        chances = [
-            self.away_team_chances_left,
-            self.away_team_chances_center,
-            self.away_team_chances_right,
-            self.away_team_chances_special,
-            self.away_team_chances_other
-        ]
-        if all(c is not None for c in chances):
-            return sum(chances)
-        return None
-
-    def has_enhanced_data(self):
-        """Check if this match has enhanced analytics data.
+def _analytics_proxy(field):
+    return association_proxy(
+        "analytics", field, creator=lambda value: MatchAnalytics(**{field: value})
+    )
 
-        Returns True if ANY enhanced field is available.
-        Note: CHPP added NrOfChances in v3.1 (March 2022).
-        """
-        return (self.possession_first_half_home is not None or
-                self.home_team_chances_left is not None or
-                self.attendance is not None or
-                self.home_team_formation or  # Empty string is falsy
-                self.home_team_rating is not None)
 
-    def __repr__(self):
-        return f"{self.home_team_name} - {self.away_team_name}: {self.ht_id}"
+for _field in MATCH_ANALYTICS_FIELDS:
+    setattr(Match, _field, _analytics_proxy(_field))
 
 
 # --------------------------------------------------------------------------------
@@ -281,6 +283,10 @@ class PlayerSetting(db.Model):
     group_id = db.Column(db.Integer, db.ForeignKey("playergroup.id"))
     player_id = db.Column(db.Integer, nullable=False)
 
+    __table_args__ = (
+        db.Index("ix_playersetting_user_id_player_id", "user_id", "player_id"),
+    )
+
     def __init__(self, player_id, user_id, group_id):
         self.user_id = user_id
         self.player_id = player_id
@@ -536,6 +542,12 @@ class Players(db.Model):
     mother_club_bonus = db.Column(db.Boolean)
     leadership = db.Column(db.Integer)
 
+    # Team pages read snapshot history by owner; per-player history lookups
+    # are already served by the (ht_id, data_date) primary key
+    __table_args__ = (
+        db.Index("ix_players_owner_data_date", "owner", "data_date"),
+    )
+
     def __init__(self, playerdata):
         self.ht_id = playerdata["ht_id"]
         self.data_date = time.strftime("%Y-%m-%d")
@@ -659,6 +671,53 @@ class Players(db.Model):
         return iter(ret)
 
 
+class PlayerSnapshotDelta(db.Model):
+    """Daily player snapshot stored as the columns that differ from its keyframe.
+
+    Used when PLAYER_SNAPSHOT_STORAGE is "delta": the keyframe is the full
+    Players row at keyframe_date, see app/player_snapshots.py.
+    """
+    __tablename__ = "player_snapshot_delta"
+
+    ht_id = db.Column(db.Integer, primary_key=True)
+    data_date = db.Column(db.DateTime, primary_key=True)
+    keyframe_date = db.Column(db.DateTime, nullable=False)
+    owner = db.Column(db.Integer)
+    old_owner = db.Column(db.Integer)
+    changes = db.Column(db.JSON, nullable=False)
+
+    __table_args__ = (
+        db.Index("ix_player_snapshot_delta_owner_data_date", "owner", "data_date"),
+    )
+
+    def __repr__(self):
+        return f"<PlayerSnapshotDelta {self.ht_id} {self.data_date}>"
+
+
+class PlayerLatest(db.Model):
+    """Current roster entry per player, pointing at its newest Players row.
+
+    Maintained by /update in the same transaction as the snapshot itself, see
+    get_current_roster() in app/player_snapshots.py.
+    """
+    __tablename__ = "player_latest"
+
+    ht_id = db.Column(db.Integer, primary_key=True)
+    data_date = db.Column(db.DateTime, nullable=False)
+    owner = db.Column(db.Integer)
+    first_name = db.Column(db.String)
+    last_name = db.Column(db.String)
+    number = db.Column(db.Integer)
+    tsi = db.Column(db.Integer)
+
+    __table_args__ = (
+        db.Index("ix_player_latest_owner", "owner"),
+    )
+
+    def __repr__(self):
+        return f"<PlayerLatest {self.ht_id} owner={self.owner}>"
+
+
 # --------------------------------------------------------------------------------
 
 
@@ -715,6 +774,11 @@ class FeedbackComment(db.Model):
     # Relationships
     author = db.relationship('User', backref='feedback_comments')
 
+    # Supports "latest comment per feedback" lookups for admin indicators
+    __table_args__ = (
+        db.Index('ix_feedback_comment_feedback_id_created_at', 'feedback_id', 'created_at'),
+    )
+
     def __init__(self, feedback_id, author_id, content, is_admin=False):
         self.feedback_id = feedback_id
         self.author_id = author_id
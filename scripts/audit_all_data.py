@@ -5,6 +5,8 @@ Audit ALL data in the database to understand what's there
 import sys
 from pathlib import Path
 
+from app.db_batching import stream_rows
+from app.db_routing import use_replicas
 from app.factory import create_app
 from models import Group, Match, MatchPlay, Players, PlayerSetting, User, db
 
@@ -17,21 +19,21 @@ def audit_all_data():
     """Audit all data in database"""
     app = create_app()
 
-    with app.app_context():
+    with app.app_context(), use_replicas():
         print('=== COMPLETE DATABASE AUDIT ===')
 
-        # Users table
-        users = User.query.all()
-        print(f'\n--- USERS ({len(users)}) ---')
-        for user in users:
-            print(f'  User {user.ht_id}: {user.username}')
+        # Users table, streamed rather than loaded in one go
+        total_users = User.query.count()
+        print(f'\n--- USERS ({total_users}) ---')
+        for ht_id, username in stream_rows(db.session, db.select(User.ht_id, User.username).order_by(User.ht_id)):
+            print(f'  User {ht_id}: {username}')
 
-        # Teams (unique team_ids from players)
-        teams = db.session.query(Players.team_id).distinct().all()
-        team_ids = [t[0] for t in teams]
-        print(f'\n--- TEAMS ({len(team_ids)}) ---')
-        for team_id in team_ids:
-            player_count = Players.query.filter_by(team_id=team_id).count()
+        # Teams (unique team_ids from players), counted in a single pass
+        team_counts = db.session.execute(
+            db.select(Players.team_id, db.func.count()).group_by(Players.team_id).order_by(Players.team_id)
+        ).all()
+        print(f'\n--- TEAMS ({len(team_counts)}) ---')
+        for team_id, player_count in team_counts:
             print(f'  Team {team_id}: {player_count} players')
 
         # All players
@@ -43,8 +45,7 @@ def audit_all_data():
                 print(f'  Player {player.ht_id}: {player.name} (Team {player.team_id})')
         else:
             # Show by team
-            for team_id in team_ids:
-                count = Players.query.filter_by(team_id=team_id).count()
+            for team_id, count in team_counts:
                 print(f'  Team {team_id}: {count} players')
 
         # Groups
@@ -79,8 +80,8 @@ def audit_all_data():
         print(f'\n--- MATCHPLAY (Total: {total_matchplay}) ---')
 
         print('\n=== SUMMARY ===')
-        print(f'Users: {len(users)}')
-        print(f'Teams: {len(team_ids)}')
+        print(f'Users: {total_users}')
+        print(f'Teams: {len(team_counts)}')
         print(f'Players: {total_players}')
         print(f'Groups: {total_groups}')
         print(f'Settings: {total_settings}')
@@ -5,8 +5,9 @@ Audit all data for a specific user and team
 import sys
 from pathlib import Path
 
+from app.db_routing import use_replicas
 from app.factory import create_app
-from models import Group, Match, MatchPlay, Players, PlayerSetting, User
+from models import Group, Match, MatchPlay, Players, PlayerSetting, User, db
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -17,7 +18,7 @@ def audit_user_data(user_id, team_id):
     """Audit all data for specific user and team"""
     app = create_app()
 
-    with app.app_context():
+    with app.app_context(), use_replicas():
         print('=== USER DATA AUDIT ===')
 
         # Users table
@@ -45,15 +46,11 @@ def audit_user_data(user_id, team_id):
         print(f'Matches as home team: {home_matches}')
         print(f'Matches as away team: {away_matches}')
 
-        # Check MatchPlay for players from this team - get player IDs first
-        team_players = Players.query.filter_by(team_id=team_id).all()
-        player_ids = [p.ht_id for p in team_players]
-
-        if player_ids:
-            matchplay_count = MatchPlay.query.filter(MatchPlay.player_id.in_(player_ids)).count()
-            print(f'MatchPlay records for team players: {matchplay_count}')
-        else:
-            print('MatchPlay records for team players: 0')
+        # Check MatchPlay for players from this team, matched in the database
+        # rather than by loading every player snapshot
+        team_player_ids = db.select(Players.ht_id).where(Players.team_id == team_id)
+        matchplay_count = MatchPlay.query.filter(MatchPlay.player_id.in_(team_player_ids)).count()
+        print(f'MatchPlay records for team players: {matchplay_count}')
 
 if __name__ == "__main__":
     if len(sys.argv) != 3:
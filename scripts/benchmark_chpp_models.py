@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+HTStatus CHPP Model Memory Benchmark
+
+Measure the memory retained by parsed CHPP models (app/chpp/models.py, slotted
+dataclasses) against __dict__-backed twins with the same fields, built from
+the recorded responses in tests/fixtures/chpp.
+Usage: uv run python scripts/benchmark_chpp_models.py [-n COUNT]
+
+Every instance is parsed from XML, so field values are fresh objects as in a
+real batch job; the difference between the two columns is the per-instance
+__dict__ the slotted models no longer carry.
+"""
+
+import argparse
+import dataclasses
+import gc
+import sys
+import tracemalloc
+from itertools import cycle
+from pathlib import Path
+
+# Setup path for app imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.chpp.models import CHPPMatchDetails, CHPPPlayer  # noqa: E402
+from app.chpp.parsers import parse_matchdetails_node, parse_players_node  # noqa: E402
+from app.chpp.xml_backend import findall, fromstring  # noqa: E402
+
+FIXTURES = project_root / "tests" / "fixtures" / "chpp"
+
+BENCHMARKS = [
+    (CHPPPlayer, parse_players_node, "players.xml", ".//PlayerList/Player"),
+    (CHPPMatchDetails, parse_matchdetails_node, "matchdetails.xml", ".//Match"),
+]
+
+
+def dict_backed(cls):
+    """Return a regular dataclass with the same fields as the slotted cls."""
+    return dataclasses.make_dataclass(
+        f"{cls.__name__}Dict",
+        [(f.name, f.type, dataclasses.field(default=f.default, default_factory=f.default_factory))
+         for f in dataclasses.fields(cls)],
+    )
+
+
+def retained_bytes(build, count):
+    """Return the bytes still allocated after keeping count built instances."""
+    gc.collect()
+    tracemalloc.start()
+    instances = [build() for _ in range(count)]
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return current
+
+
+def benchmark(count):
+    """Print retained MB for count instances of each model, slotted vs dict-backed."""
+    print(f"{'model':<18} {'count':>8} {'dict MB':>9} {'slots MB':>9} {'saved':>7} {'B/instance':>11}")
+    savings = {}
+    for cls, parse, fixture, path in BENCHMARKS:
+        nodes = findall(fromstring((FIXTURES / fixture).read_bytes()), path)
+        twin = dict_backed(cls)
+
+        def slotted(nodes=cycle(nodes), parse=parse):
+            return parse(next(nodes))
+
+        def unslotted(nodes=cycle(nodes), parse=parse, twin=twin):
+            model = parse(next(nodes))
+            return twin(**{f.name: getattr(model, f.name) for f in dataclasses.fields(model)})
+
+        before = retained_bytes(unslotted, count)
+        after = retained_bytes(slotted, count)
+        savings[cls.__name__] = 1 - after / before
+        print(
+            f"{cls.__name__:<18} {count:>8} {before / 2**20:>9.1f} {after / 2**20:>9.1f} "
+            f"{savings[cls.__name__]:>6.0%} {(before - after) / count:>11.0f}"
+        )
+    return savings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure memory of parsed CHPP models")
+    parser.add_argument(
+        "-n", "--count",
+        type=int,
+        default=100_000,
+        help="Instances kept per model (default: 100000)"
+    )
+    args = parser.parse_args()
+
+    benchmark(args.count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+HTStatus CHPP Parser Benchmark
+
+Time the single-pass field-map parsers in app/chpp/parsers.py against the
+previous find-per-field implementations (tests/chpp_reference_parsers.py) on
+the recorded CHPP responses in tests/fixtures/chpp, then compares the XML
+backends (ElementTree and, when installed, lxml) end to end.
+Usage: uv run python scripts/benchmark_chpp_parsers.py [-n ROUNDS]
+
+The first table parses the same pre-parsed XML tree with both
+implementations, so it measures field extraction only. The backend table
+times fromstring() plus the parser, from raw bytes to models.
+"""
+
+import argparse
+import sys
+import timeit
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+# Setup path for app imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.chpp import parsers, xml_backend  # noqa: E402
+from tests import chpp_reference_parsers as reference  # noqa: E402
+
+FIXTURES = project_root / "tests" / "fixtures" / "chpp"
+
+BENCHMARKS = [
+    ("parse_players", "players.xml"),
+    ("parse_player", "player.xml"),
+    ("parse_matchdetails", "matchdetails.xml"),
+]
+
+
+def benchmark(rounds):
+    """Print the time per call of each parser pair and return the speedups."""
+    print(f"{'parser':<20} {'fixture':<18} {'before µs':>10} {'after µs':>10} {'speedup':>8}")
+    speedups = {}
+    for name, fixture in BENCHMARKS:
+        root = ET.parse(FIXTURES / fixture).getroot()
+        before_parser, after_parser = getattr(reference, name), getattr(parsers, name)
+        if before_parser(root) != after_parser(root):
+            raise AssertionError(f"{name} results differ on {fixture}")
+
+        before = min(timeit.repeat(lambda parse=before_parser, root=root: parse(root), number=rounds, repeat=5)) / rounds
+        after = min(timeit.repeat(lambda parse=after_parser, root=root: parse(root), number=rounds, repeat=5)) / rounds
+        speedups[name] = before / after
+        print(f"{name:<20} {fixture:<18} {before * 1e6:>10.1f} {after * 1e6:>10.1f} {speedups[name]:>7.1f}x")
+    return speedups
+
+
+def benchmark_backends(rounds):
+    """Print the bytes-to-models time per call of each parser on each available backend."""
+    backends = ["etree"] + (["lxml"] if xml_backend.lxml_etree is not None else [])
+    previous = xml_backend.backend_name()
+    print(f"\n{'parser':<20} " + " ".join(f"{name + ' µs':>10}" for name in backends))
+    try:
+        for name, fixture in BENCHMARKS:
+            data = (FIXTURES / fixture).read_bytes()
+            parse = getattr(parsers, name)
+            timings = []
+            for backend in backends:
+                xml_backend.set_backend(backend)
+                best = min(timeit.repeat(lambda parse=parse, data=data: parse(xml_backend.fromstring(data)), number=rounds, repeat=5))
+                timings.append(best / rounds)
+            print(f"{name:<20} " + " ".join(f"{t * 1e6:>10.1f}" for t in timings))
+    finally:
+        xml_backend.set_backend(previous)
+
+    if len(backends) == 1:
+        print("lxml is not installed (uv sync --extra xml), only ElementTree was timed")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CHPP XML parsers on recorded responses")
+    parser.add_argument(
+        "-n", "--rounds",
+        type=int,
+        default=200,
+        help="Calls per timing repeat (default: 200)"
+    )
+    args = parser.parse_args()
+
+    benchmark(args.rounds)
+    benchmark_backends(args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+HTStatus CHPP Transport Benchmark
+
+Measure connection reuse of the shared CHPP transport (app/chpp/transport.py)
+against the previous one-adapter-per-client setup, using the fake CHPP server
+(scripts/fake_chpp_server.py) with a per-connection delay standing in for the
+TCP and TLS handshake to chpp.hattrick.org.
+Usage: uv run python scripts/benchmark_chpp_transport.py [--pages 40] [--calls 5] [--threads 4] [--handshake 60]
+
+Each simulated page view builds a new CHPP client, as get_chpp_client() does
+per Flask request, and makes --calls requests with it; --threads page views
+run concurrently, like gunicorn worker threads.
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Setup path for app imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fake_chpp_server import FakeCHPPServer  # noqa: E402
+
+from app.chpp.client import CHPP  # noqa: E402
+from app.chpp.transport import build_adapter, reset_shared_adapter  # noqa: E402
+
+
+def page_view(url, calls, shared):
+    """Build a client the way a request handler does and make calls requests."""
+    chpp = CHPP("bench_key", "bench_secret", "bench_token", "bench_token_secret", base_url=url)
+    adapter = None
+    if not shared:
+        # Previous behaviour: every client brought its own connection pool
+        adapter = build_adapter()
+        chpp.session.mount("http://", adapter)
+    try:
+        for number in range(calls):
+            chpp.matchdetails(9000001 + number % 4)
+    finally:
+        if adapter is not None:
+            adapter.close()
+
+
+def run(server, pages, calls, threads, shared):
+    """Return (seconds, connections opened) for pages page views."""
+    reset_shared_adapter()
+    server.connections = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(lambda _: page_view(server.url, calls, shared), range(pages)))
+    return time.perf_counter() - start, server.connections
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark connection reuse of the CHPP transport")
+    parser.add_argument("--pages", type=int, default=40, help="Simulated page views (default: 40)")
+    parser.add_argument("--calls", type=int, default=5, help="CHPP calls per page view (default: 5)")
+    parser.add_argument("--threads", type=int, default=4, help="Concurrent page views (default: 4)")
+    parser.add_argument("--handshake", type=float, default=60.0, metavar="MS",
+                        help="Delay per new connection, i.e. TCP + TLS handshake (default: 60)")
+    parser.add_argument("--latency", type=float, default=20.0, metavar="MS",
+                        help="Delay per response (default: 20)")
+    args = parser.parse_args()
+
+    total = args.pages * args.calls
+    print(f"⏱️  {args.pages} page views x {args.calls} calls, {args.threads} threads, "
+          f"{args.handshake:.0f}ms handshake, {args.latency:.0f}ms latency")
+    print(f"{'transport':<18} {'seconds':>8} {'connections':>12} {'requests/conn':>14}")
+    results = {}
+    with FakeCHPPServer(latency_ms=args.latency, handshake_ms=args.handshake) as server:
+        for label, shared in (("per-client", False), ("shared", True)):
+            seconds, connections = run(server, args.pages, args.calls, args.threads, shared)
+            results[label] = (seconds, connections)
+            print(f"{label:<18} {seconds:>8.2f} {connections:>12} {total / max(connections, 1):>14.1f}")
+    reset_shared_adapter()
+
+    (before, before_connections), (after, after_connections) = results["per-client"], results["shared"]
+    print(f"✅ {before_connections - after_connections} handshakes saved, "
+          f"{before - after:.2f}s faster ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
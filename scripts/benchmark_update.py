@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+HTStatus /update Benchmark
+
+Time the /update route end to end, over real HTTP, against the fake CHPP
+server (scripts/fake_chpp_server.py) and a throwaway SQLite database, so the
+full fetch, parse and store path can be measured offline and repeatably.
+Usage: uv run python scripts/benchmark_update.py [--runs 5] [--teams 2] [--players 25] [--latency 80]
+
+Each run updates every team of a fake manager; later runs store on the same
+day and so exercise the unchanged-snapshot path. Reports per-run wall time
+and the CHPP requests the server answered.
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Setup path for app imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fake_chpp_server import FakeCHPPServer  # noqa: E402
+
+import models  # noqa: E402, F401 - registers tables for create_all
+from app.factory import create_app, db  # noqa: E402
+from config import TestConfig  # noqa: E402
+
+USER_ID = 182085
+
+
+def benchmark_app(chpp_url, database_path):
+    """Return an app with routes, a fresh SQLite database and CHPP_URL set.
+
+    No User row is created: User() stores string timestamps that SQLite
+    rejects, and /update only uses it for usage counters.
+    """
+
+    class BenchmarkConfig(TestConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{database_path}"
+        CHPP_URL = chpp_url
+        DEBUG_LEVEL = 0
+
+    app = create_app(BenchmarkConfig, include_routes=True)
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+def benchmark(runs, teams, server):
+    """Run /update runs times for teams fake teams; return the per-run seconds."""
+    team_ids = [9000 + number for number in range(teams)]
+    with tempfile.TemporaryDirectory() as tmp:
+        app = benchmark_app(server.url, Path(tmp) / "benchmark.db")
+        client = app.test_client()
+        with client.session_transaction() as sess:
+            sess["access_key"] = "bench_key"
+            sess["access_secret"] = "bench_secret"
+            sess["current_user"] = "bench"
+            sess["current_user_id"] = USER_ID
+            sess["all_teams"] = team_ids
+            sess["all_team_names"] = [f"Fake Team {team_id}" for team_id in team_ids]
+
+        timings = []
+        for run in range(1, runs + 1):
+            server.stats.clear()
+            start = time.perf_counter()
+            response = client.get("/update")
+            elapsed = time.perf_counter() - start
+            if response.status_code != 200 or b"Update Failed" in response.data:
+                print(f"❌ Run {run} failed with HTTP {response.status_code}")
+                sys.exit(1)
+            timings.append(elapsed)
+            print(f"  run {run}: {elapsed:7.2f}s  {sum(server.stats.values()):>5} CHPP requests  {dict(server.stats)}")
+
+        with app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark /update against the fake CHPP server")
+    parser.add_argument("--runs", type=int, default=3, help="Number of /update runs (default: 3)")
+    parser.add_argument("--teams", type=int, default=1, help="Teams per manager (default: 1)")
+    parser.add_argument("--players", type=int, default=25, help="Players per team (default: 25)")
+    parser.add_argument("--matches", type=int, default=10, help="Matches per team (default: 10)")
+    parser.add_argument("--latency", type=float, default=0.0, metavar="MS", help="Fake CHPP latency per request")
+    parser.add_argument("--jitter", type=float, default=0.0, metavar="MS", help="Extra random latency, 0..MS")
+    args = parser.parse_args()
+
+    print(f"⏱️  /update x{args.runs}: {args.teams} team(s) of {args.players} players, "
+          f"{args.latency:.0f}ms CHPP latency")
+    with FakeCHPPServer(latency_ms=args.latency, jitter_ms=args.jitter,
+                        players_per_team=args.players, matches_per_team=args.matches) as server:
+        timings = benchmark(args.runs, args.teams, server)
+
+    print(f"✅ median {statistics.median(timings):.2f}s, best {min(timings):.2f}s")
+
+
+if __name__ == "__main__":
+    main()
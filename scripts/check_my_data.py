@@ -2,6 +2,7 @@
 import sys
 from pathlib import Path
 
+from app.db_routing import use_replicas
 from app.factory import create_app
 from models import Players, PlayerSetting, User
 
@@ -10,7 +11,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 app = create_app()
-with app.app_context():
+with app.app_context(), use_replicas():
     print('=== YOUR USER/TEAM ANALYSIS ===')
 
     # Check your user
@@ -10,149 +10,185 @@ historical data from 2005 mixed with current data creates user confusion when
 teams were inactive for years and then reactivated with different names.
 
 This script:
-1. Creates a safety backup of match data
-2. Removes all matches before 2024-01-01
+1. Streams a gzip-compressed safety backup of the matches to be removed
+2. Removes all matches before 2024-01-01 in small keyset batches, one
+   transaction each, pausing between batches to keep locks short
 3. Keeps recent matches (2024-2026) that align with CHPP download capability
-4. Provides detailed logging and rollback capability
+4. Records progress in a checkpoint file, so an interrupted run resumes
+   where it stopped with --resume
+
+Usage:
+    uv run python scripts/database/clean_historical_matches.py --dry-run
+    uv run python scripts/database/clean_historical_matches.py --batch-size 500 --pause 0.5
+    uv run python scripts/database/clean_historical_matches.py --resume
 
 Safety: Non-destructive operation with backup and rollback support.
 """
 
+import argparse
+import gzip
 import json
+import math
 import os
 import sys
-from datetime import datetime
+import time
+from datetime import date, datetime
 from pathlib import Path
 
 # Add app directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 
-from app.factory import create_app
-from models import Match, db
+from app.db_batching import DEFAULT_BATCH_SIZE, iter_keyset, stream_rows  # noqa: E402
+from app.factory import create_app  # noqa: E402
+from models import MATCH_ANALYTICS_FIELDS, Match, MatchAnalytics, db  # noqa: E402
+
+DEFAULT_CUTOFF = '2024-01-01'
+DEFAULT_PAUSE_SECONDS = 0.2
+BACKUP_DIR = Path(__file__).parent / "backups"
+DEFAULT_CHECKPOINT = BACKUP_DIR / "match_cleanup_checkpoint.json"
+
 
+def _old_matches(cutoff):
+    return Match.datetime < cutoff
 
-def create_backup():
-    """Create a backup of match data before cleanup."""
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def create_backup(cutoff, backup_file=None, chunk_size=DEFAULT_BATCH_SIZE):
+    """Stream the matches older than `cutoff` to a gzip NDJSON file, one match per line."""
     print("=== CREATING BACKUP ===")
 
-    app = create_app()
-    with app.app_context():
-        # Get all matches with metadata
-        matches = Match.query.order_by(Match.datetime).all()
-
-        backup_data = {
-            'backup_timestamp': datetime.now().isoformat(),
-            'total_matches': len(matches),
-            'script_version': '1.0',
-            'matches': []
-        }
-
-        for match in matches:
-            match_data = {
-                'ht_id': match.ht_id,
-                'home_team_id': match.home_team_id,
-                'home_team_name': match.home_team_name,
-                'away_team_id': match.away_team_id,
-                'away_team_name': match.away_team_name,
-                'datetime': match.datetime.isoformat() if match.datetime else None,
-                'matchtype': match.matchtype,
-                'context_id': match.context_id,
-                'rule_id': match.rule_id,
-                'cup_level': match.cup_level,
-                'cup_level_index': match.cup_level_index,
-                'home_goals': match.home_goals,
-                'away_goals': match.away_goals
-            }
-            backup_data['matches'].append(match_data)
-
-    # Save backup file with timestamp
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    backup_file = f"scripts/database/backups/matches_backup_{timestamp}.json"
-
-    # Ensure backup directory exists
-    os.makedirs(os.path.dirname(backup_file), exist_ok=True)
-
-    with open(backup_file, 'w') as f:
-        json.dump(backup_data, f, indent=2)
+    if backup_file is None:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        backup_file = BACKUP_DIR / f"matches_backup_{timestamp}.ndjson.gz"
+    backup_file = Path(backup_file)
+    backup_file.parent.mkdir(parents=True, exist_ok=True)
+
+    analytics = [MatchAnalytics.__table__.c[field] for field in MATCH_ANALYTICS_FIELDS]
+    query = (
+        db.select(*Match.__table__.columns, *analytics)
+        .outerjoin(MatchAnalytics, MatchAnalytics.match_id == Match.ht_id)
+        .where(_old_matches(cutoff))
+        .order_by(Match.ht_id)
+    )
+
+    total = 0
+    with gzip.open(backup_file, 'wt', encoding='utf-8') as f:
+        for row in stream_rows(db.session, query, chunk_size):
+            f.write(json.dumps(dict(row._mapping), default=_json_default) + "\n")
+            total += 1
+    db.session.rollback()
 
     print(f"✅ Backup created: {backup_file}")
-    print(f"   Total matches backed up: {backup_data['total_matches']}")
+    print(f"   Total matches backed up: {total}")
+
+    return str(backup_file), total
 
-    return backup_file
 
-def analyze_cleanup_impact():
+def analyze_cleanup_impact(cutoff):
     """Analyze what will be deleted and what will be kept."""
     print("\n=== ANALYZING CLEANUP IMPACT ===")
 
-    app = create_app()
-    with app.app_context():
-        cutoff_date = '2024-01-01'
+    old_count = Match.query.filter(_old_matches(cutoff)).count()
+    recent_count = Match.query.filter(Match.datetime >= cutoff).count()
 
-        # Count matches to delete
-        old_matches = Match.query.filter(Match.datetime < cutoff_date).all()
-        recent_matches = Match.query.filter(Match.datetime >= cutoff_date).all()
+    print(f"Cutoff date: {cutoff}")
+    print(f"Matches to DELETE: {old_count} (before {cutoff})")
+    print(f"Matches to KEEP: {recent_count}")
 
-        print(f"Cutoff date: {cutoff_date}")
-        print(f"Matches to DELETE: {len(old_matches)} (pre-2024)")
-        print(f"Matches to KEEP: {len(recent_matches)} (2024-2026)")
+    # Show year breakdown of what gets deleted
+    year = db.extract('year', Match.datetime)
+    years_to_delete = db.session.execute(
+        db.select(year, db.func.count()).where(_old_matches(cutoff)).group_by(year).order_by(year)
+    ).all()
 
-        # Show year breakdown of what gets deleted
-        years_to_delete = {}
-        for match in old_matches:
-            year = match.datetime.year if match.datetime else 'Unknown'
-            years_to_delete[year] = years_to_delete.get(year, 0) + 1
+    print("\nDeletion breakdown by year:")
+    for match_year, count in years_to_delete:
+        print(f"  {int(match_year)}: {count} matches")
 
-        print("\nDeletion breakdown by year:")
-        for year, count in sorted(years_to_delete.items()):
-            print(f"  {year}: {count} matches")
+    # Show sample of what gets deleted
+    print("\nSample matches to be deleted (showing first 5):")
+    for match in Match.query.filter(_old_matches(cutoff)).order_by(Match.datetime).limit(5):
+        date_str = match.datetime.strftime('%Y-%m-%d')
+        print(f"  {date_str}: {match.home_team_name} vs {match.away_team_name}")
 
-        # Show sample of what gets deleted
-        print("\nSample matches to be deleted (showing first 5):")
-        for match in old_matches[:5]:
-            date_str = match.datetime.strftime('%Y-%m-%d') if match.datetime else 'No date'
-            print(f"  {date_str}: {match.home_team_name} vs {match.away_team_name}")
+    if old_count > 5:
+        print(f"  ... and {old_count - 5} more")
 
-        if len(old_matches) > 5:
-            print(f"  ... and {len(old_matches) - 5} more")
+    return old_count, recent_count
 
-        return len(old_matches), len(recent_matches)
 
-def perform_cleanup():
-    """Perform the actual cleanup operation."""
-    print("\n=== PERFORMING CLEANUP ===")
+def read_checkpoint(checkpoint_file):
+    """Return the saved checkpoint, or None if there is none."""
+    try:
+        with open(checkpoint_file) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
 
-    app = create_app()
-    with app.app_context():
-        cutoff_date = '2024-01-01'
 
-        # Delete old matches
-        old_matches = Match.query.filter(Match.datetime < cutoff_date)
-        deleted_count = old_matches.count()
+def write_checkpoint(checkpoint_file, checkpoint):
+    """Save the checkpoint atomically, so a crash never leaves half a file."""
+    checkpoint_file = Path(checkpoint_file)
+    checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
+    partial = checkpoint_file.with_suffix(".tmp")
+    with open(partial, 'w') as f:
+        json.dump(checkpoint, f, indent=2)
+    os.replace(partial, checkpoint_file)
 
-        print(f"Deleting {deleted_count} matches older than {cutoff_date}...")
 
-        # Use ORM for safe bulk delete (table name is 'match', not 'matches')
-        deleted_count = old_matches.count()
-        old_matches.delete()
+def perform_cleanup(checkpoint, checkpoint_file, batch_size=DEFAULT_BATCH_SIZE,
+                    pause=DEFAULT_PAUSE_SECONDS):
+    """Delete old matches batch by batch, checkpointing after every committed batch."""
+    print("\n=== PERFORMING CLEANUP ===")
 
+    cutoff = checkpoint['cutoff']
+    after = [checkpoint['last_ht_id']] if checkpoint['last_ht_id'] is not None else None
+    print(f"Deleting matches older than {cutoff} in batches of {batch_size}...")
+    if after:
+        print(f"Resuming after match {after[0]} ({checkpoint['deleted']} already deleted)")
+
+    pages = iter_keyset(
+        db.session, db.select(Match.ht_id).where(_old_matches(cutoff)), [Match.ht_id], batch_size, after
+    )
+    for page in pages:
+        ht_ids = [row.ht_id for row in page]
+
+        # Bulk deletes skip ORM cascades; PostgreSQL cascades the FK, SQLite does not
+        MatchAnalytics.query.filter(MatchAnalytics.match_id.in_(ht_ids)).delete(synchronize_session=False)
+        deleted = Match.query.filter(Match.ht_id.in_(ht_ids)).delete(synchronize_session=False)
         db.session.commit()
 
-        print(f"✅ Successfully deleted {deleted_count} matches")
-        # Verify cleanup
-        remaining_old = Match.query.filter(Match.datetime < cutoff_date).count()
-        remaining_recent = Match.query.filter(Match.datetime >= cutoff_date).count()
+        checkpoint['last_ht_id'] = ht_ids[-1]
+        checkpoint['deleted'] += deleted
+        write_checkpoint(checkpoint_file, checkpoint)
+        print(f"  Progress: {checkpoint['deleted']}/{checkpoint['total']} matches deleted", flush=True)
 
-        print("Verification:")
-        print(f"  Remaining old matches (should be 0): {remaining_old}")
-        print(f"  Remaining recent matches: {remaining_recent}")
+        if pause:
+            time.sleep(pause)
+
+    print(f"✅ Successfully deleted {checkpoint['deleted']} matches")
+    # Verify cleanup
+    remaining_old = Match.query.filter(_old_matches(cutoff)).count()
+    remaining_recent = Match.query.filter(Match.datetime >= cutoff).count()
+
+    print("Verification:")
+    print(f"  Remaining old matches (should be 0): {remaining_old}")
+    print(f"  Remaining recent matches: {remaining_recent}")
+
+    if remaining_old > 0:
+        print("⚠️  WARNING: Some old matches still remain!")
+        return False
+    else:
+        Path(checkpoint_file).unlink(missing_ok=True)
+        print("✅ Cleanup completed successfully!")
+        return True
 
-        if remaining_old > 0:
-            print("⚠️  WARNING: Some old matches still remain!")
-            return False
-        else:
-            print("✅ Cleanup completed successfully!")
-            return True
 
 def create_rollback_script(backup_file):
     """Create a rollback script for emergency recovery."""
@@ -162,67 +198,59 @@ def create_rollback_script(backup_file):
 #
 # Usage: python scripts/database/rollback_match_cleanup.py
 #
-# This script restores matches from backup: {backup_file}
+# This script restores the deleted matches from backup: {backup_file}
+# Matches that are already present are left untouched.
 
-import sys
+import gzip
 import json
-from pathlib import Path
+import sys
 from datetime import datetime
+from pathlib import Path
 
 # Add app directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from models import Match, db
 from app.factory import create_app
+from models import Match, db
+
+BATCH_SIZE = {DEFAULT_BATCH_SIZE}
+
+
+def restore_batch(batch):
+    existing = {{
+        ht_id for (ht_id,) in db.session.query(Match.ht_id).filter(Match.ht_id.in_([m['ht_id'] for m in batch]))
+    }}
+    for match_data in batch:
+        if match_data['ht_id'] not in existing:
+            db.session.add(Match(match_data))
+    db.session.commit()
+    return len(batch) - len(existing)
+
 
 def rollback_matches():
     print("=== EMERGENCY MATCH ROLLBACK ===")
     print("Backup file: {backup_file}")
 
-    # Load backup
-    with open('{backup_file}', 'r') as f:
-        backup_data = json.load(f)
-
     app = create_app()
     with app.app_context():
-        print(f"Restoring {{backup_data['total_matches']}} matches...")
-
-        # Clear existing matches (if any)
-        existing_count = Match.query.count()
-        if existing_count > 0:
-            print(f"Clearing {{existing_count}} existing matches...")
-            Match.query.delete()
-
-        # Restore matches from backup
         restored_count = 0
-        for match_data in backup_data['matches']:
-            match = Match(
-                ht_id=match_data['ht_id'],
-                home_team_id=match_data['home_team_id'],
-                home_team_name=match_data['home_team_name'],
-                away_team_id=match_data['away_team_id'],
-                away_team_name=match_data['away_team_name'],
-                datetime=datetime.fromisoformat(match_data['datetime']) if match_data['datetime'] else None,
-                matchtype=match_data['matchtype'],
-                context_id=match_data['context_id'],
-                rule_id=match_data['rule_id'],
-                cup_level=match_data['cup_level'],
-                cup_level_index=match_data['cup_level_index'],
-                home_goals=match_data['home_goals'],
-                away_goals=match_data['away_goals']
-            )
-            db.session.add(match)
-            restored_count += 1
-
-            if restored_count % 50 == 0:
-                print(f"  Progress: {{restored_count}}/{{backup_data['total_matches']}} matches restored...")
-
-        db.session.commit()
+        batch = []
+        with gzip.open('{backup_file}', 'rt', encoding='utf-8') as f:
+            for line in f:
+                match_data = json.loads(line)
+                if match_data['datetime']:
+                    match_data['datetime'] = datetime.fromisoformat(match_data['datetime'])
+                batch.append(match_data)
+                if len(batch) >= BATCH_SIZE:
+                    restored_count += restore_batch(batch)
+                    batch = []
+                    print(f"  Progress: {{restored_count}} matches restored...")
+        if batch:
+            restored_count += restore_batch(batch)
 
-        final_count = Match.query.count()
         print(f"✅ Rollback completed!")
-        print(f"   Expected matches: {{backup_data['total_matches']}}")
-        print(f"   Actual matches: {{final_count}}")
+        print(f"   Restored matches: {{restored_count}}")
+        print(f"   Total matches now: {{Match.query.count()}}")
 
 if __name__ == "__main__":
     rollback_matches()
@@ -235,8 +263,54 @@ if __name__ == "__main__":
     print(f"✅ Rollback script created: {rollback_file}")
     return rollback_file
 
+
 def main():
     """Main cleanup process."""
+    parser = argparse.ArgumentParser(
+        description="Remove historical matches in resumable batches",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--cutoff",
+        default=DEFAULT_CUTOFF,
+        help=f"Delete matches played before this date (default: {DEFAULT_CUTOFF})"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Matches deleted per transaction (default: {DEFAULT_BATCH_SIZE})"
+    )
+    parser.add_argument(
+        "--pause",
+        type=float,
+        default=DEFAULT_PAUSE_SECONDS,
+        metavar="SECONDS",
+        help=f"Pause between batches to limit load (default: {DEFAULT_PAUSE_SECONDS})"
+    )
+    parser.add_argument(
+        "--checkpoint",
+        default=str(DEFAULT_CHECKPOINT),
+        metavar="FILE",
+        help="Progress file used to resume an interrupted cleanup"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue the cleanup recorded in the checkpoint file"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only analyze what would be deleted"
+    )
+    parser.add_argument(
+        "--yes",
+        action="store_true",
+        help="Do not ask for confirmation"
+    )
+    args = parser.parse_args()
+
     print("=" * 60)
     print("HISTORICAL MATCHES CLEANUP")
     print("=" * 60)
@@ -246,47 +320,78 @@ def main():
     print("=" * 60)
 
     try:
-        # Step 1: Analyze impact
-        old_count, recent_count = analyze_cleanup_impact()
-
-        if old_count == 0:
-            print("\n✅ No old matches to clean up! Database is already clean.")
-            return
-
-        # Step 2: Confirm operation
-        print("\nThis operation will:")
-        print(f"  ❌ DELETE {old_count} historical matches (pre-2024)")
-        print(f"  ✅ KEEP {recent_count} recent matches (2024-2026)")
-        print("  💾 CREATE full backup for rollback capability")
-
-        response = input("\nProceed with cleanup? (yes/no): ").lower().strip()
-        if response not in ['yes', 'y']:
-            print("❌ Operation cancelled by user.")
-            return
-
-        # Step 3: Create backup
-        backup_file = create_backup()
-
-        # Step 4: Create rollback script
-        rollback_file = create_rollback_script(backup_file)
-
-        # Step 5: Perform cleanup
-        success = perform_cleanup()
+        app = create_app()
+        with app.app_context():
+            checkpoint = read_checkpoint(args.checkpoint)
+            if checkpoint and not args.resume:
+                print(f"\n❌ An unfinished cleanup is recorded in {args.checkpoint}")
+                print("   Run again with --resume to continue it")
+                sys.exit(1)
+            if args.resume and not checkpoint:
+                print(f"\n❌ No checkpoint found at {args.checkpoint}")
+                sys.exit(1)
+
+            if not checkpoint:
+                # Step 1: Analyze impact
+                old_count, recent_count = analyze_cleanup_impact(args.cutoff)
+
+                if old_count == 0:
+                    print("\n✅ No old matches to clean up! Database is already clean.")
+                    return
+                if args.dry_run:
+                    batches = math.ceil(old_count / args.batch_size)
+                    print(f"\n[dry run] Would delete {old_count} matches in {batches} batches")
+                    return
+
+                # Step 2: Confirm operation
+                print("\nThis operation will:")
+                print(f"  ❌ DELETE {old_count} historical matches (before {args.cutoff})")
+                print(f"  ✅ KEEP {recent_count} recent matches")
+                print("  💾 CREATE compressed backup for rollback capability")
+
+                if not args.yes:
+                    response = input("\nProceed with cleanup? (yes/no): ").lower().strip()
+                    if response not in ['yes', 'y']:
+                        print("❌ Operation cancelled by user.")
+                        return
+
+                # Step 3: Create backup
+                backup_file, total = create_backup(args.cutoff)
+
+                # Step 4: Create rollback script
+                create_rollback_script(backup_file)
+
+                checkpoint = {
+                    'cutoff': args.cutoff,
+                    'backup_file': backup_file,
+                    'total': total,
+                    'deleted': 0,
+                    'last_ht_id': None,
+                    'started': datetime.now().isoformat(),
+                }
+                write_checkpoint(args.checkpoint, checkpoint)
+
+            # Step 5: Perform cleanup
+            backup_file = checkpoint['backup_file']
+            success = perform_cleanup(checkpoint, args.checkpoint, args.batch_size, args.pause)
 
         if success:
             print("\n🎉 CLEANUP COMPLETED SUCCESSFULLY!")
             print("   All teams now have a clean slate with recent matches only")
             print(f"   Backup available: {backup_file}")
-            print(f"   Emergency rollback: python {rollback_file}")
+            print("   Emergency rollback: python scripts/database/rollback_match_cleanup.py")
         else:
             print("\n❌ CLEANUP FAILED!")
             print("   Check the error messages above")
             print(f"   Backup available for rollback: {backup_file}")
 
+    except KeyboardInterrupt:
+        print(f"\n⏸️  Interrupted - continue later with --resume (checkpoint: {args.checkpoint})")
+        sys.exit(1)
     except Exception as e:
         print(f"\n💥 ERROR during cleanup: {e}")
         print("   Operation may be partially completed")
-        print("   Use rollback script if needed")
+        print("   Run again with --resume to continue, or use the rollback script")
         raise
 
 if __name__ == "__main__":
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+HTStatus Player Snapshot Compaction
+
+Convert existing player history between full-row and delta storage
+(see app/player_snapshots.py).
+
+Usage:
+    uv run python scripts/database/compact_player_snapshots.py --dry-run
+    uv run python scripts/database/compact_player_snapshots.py --keyframe-days 7
+    uv run python scripts/database/compact_player_snapshots.py --expand
+
+Features:
+    - Fold daily full rows between keyframes into per-day deltas
+    - Keep the latest snapshot of every player as a full row
+    - Expand deltas back into full rows before switching storage to "full"
+    - Commits per player, so an interrupted run can simply be restarted
+
+Related Scripts:
+    - backup_database.py: Take a backup before converting history
+    - apply_migrations.py: Database migration management
+"""
+
+import argparse
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+# Add project root to path to import config
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.factory import create_app  # noqa: E402
+from app.player_snapshots import (  # noqa: E402
+    compact_player_history,
+    expand_player_history,
+)
+from models import Players, PlayerSnapshotDelta, db  # noqa: E402
+
+
+def convert_history(expand=False, keyframe_days=None, dry_run=False):
+    """Compact (or expand) the stored history of every player."""
+    app = create_app()
+    with app.app_context():
+        model = PlayerSnapshotDelta if expand else Players
+        player_ids = [
+            ht_id for (ht_id,) in db.session.query(model.ht_id).distinct().order_by(model.ht_id)
+        ]
+        interval = timedelta(days=keyframe_days) if keyframe_days else None
+        print(f"Processing {len(player_ids)} players")
+
+        total = 0
+        for ht_id in player_ids:
+            if expand:
+                count = expand_player_history(db.session, ht_id)
+            else:
+                count = compact_player_history(db.session, ht_id, interval)
+            if dry_run:
+                db.session.rollback()
+            else:
+                db.session.commit()
+            total += count
+
+        action = "restored as full rows" if expand else "converted to deltas"
+        prefix = "[dry run] " if dry_run else ""
+        print(f"✅ {prefix}{total} snapshots {action}")
+        return total
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert player snapshot history between full and delta storage",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+
+    parser.add_argument(
+        "--expand",
+        action="store_true",
+        help="Turn deltas back into full rows instead of compacting"
+    )
+
+    parser.add_argument(
+        "--keyframe-days",
+        type=int,
+        metavar="N",
+        help="Days between keyframes (default: PLAYER_KEYFRAME_DAYS)"
+    )
+
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would change and roll back"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        convert_history(args.expand, args.keyframe_days, args.dry_run)
+    except Exception as e:
+        print(f"❌ Error converting player history: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ Created as part of REFACTOR-034: Database Script Consolidation.
 Author: HTStatus Development Team
 """
 
+import math
 import os
 
 from dotenv import load_dotenv
@@ -62,3 +63,50 @@ def load_database_config():
     if not database_url:
         raise ValueError("DATABASE_URL environment variable not set")
     return parse_database_url(database_url)
+
+
+def run_batched_cleanup(session, steps, batch_size=1000, dry_run=False, assume_yes=False):
+    """Estimate, confirm and run a list of deletes in bounded batches.
+
+    Every step is deleted through app.db_batching.batched_delete(), which
+    commits after each batch, so a cleanup cannot be rolled back once started
+    but can be interrupted and simply run again.
+
+    Args:
+        session: SQLAlchemy session
+        steps: (label, model, where clauses) tuples, in foreign key order
+        batch_size: Rows deleted per transaction
+        dry_run: Only print the estimate
+        assume_yes: Skip the confirmation prompt
+
+    Returns:
+        Rows per label (estimated on a dry run), or None when not confirmed
+    """
+    from app.db_batching import batched_delete, estimate_rows
+
+    print("ESTIMATE:")
+    estimates = {}
+    for label, model, where in steps:
+        estimates[label] = estimate_rows(session, model, *where)
+        batches = math.ceil(estimates[label] / batch_size)
+        print(f"  {label}: ~{estimates[label]:,} rows in {batches:,} batches of {batch_size:,}")
+    session.rollback()
+
+    if dry_run:
+        print("\n[dry run] No data was deleted.")
+        return estimates
+
+    if not assume_yes:
+        response = input("\nDo you want to delete this data? Batches are committed as they go (yes/no): ")
+        if response.lower() != "yes":
+            print("❌ Cancelled - no data was deleted.")
+            return None
+
+    deleted = {}
+    for label, model, where in steps:
+        deleted[label] = batched_delete(
+            session, model, *where, batch_size=batch_size,
+            progress=lambda done, label=label: print(f"   {label}: {done:,} deleted", flush=True),
+        )
+        print(f"✅ {label}: {deleted[label]:,}")
+    return deleted
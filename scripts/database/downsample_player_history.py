@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+HTStatus Player History Downsampling
+
+Keep daily player snapshots for a recent window and thin older history to one
+snapshot per week, keeping every day where a training skill or the owner
+changed (see downsample_player_history() in app/player_snapshots.py).
+
+Usage:
+    uv run python scripts/database/downsample_player_history.py --dry-run
+    uv run python scripts/database/downsample_player_history.py --keep-days 120
+
+Features:
+    - Weekly training charts render the same before and after
+    - Works on both full-row and delta snapshot storage
+    - Commits per player, so an interrupted run can simply be restarted
+
+Related Scripts:
+    - backup_database.py: Take a backup before removing history
+    - manage_player_partitions.py: Month-based retention on PostgreSQL
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path to import config
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.factory import create_app  # noqa: E402
+from app.player_snapshots import daily_history_days, downsample_player_history  # noqa: E402
+from models import Players, db  # noqa: E402
+
+
+def downsample_all(keep_days=None, dry_run=False):
+    """Downsample the history of every player and return the snapshots removed."""
+    app = create_app()
+    with app.app_context():
+        keep_days = keep_days if keep_days is not None else daily_history_days()
+        player_ids = [
+            ht_id for (ht_id,) in db.session.query(Players.ht_id).distinct().order_by(Players.ht_id)
+        ]
+        print(f"Downsampling {len(player_ids)} players, keeping {keep_days} days of daily history")
+
+        total = 0
+        for ht_id in player_ids:
+            total += downsample_player_history(db.session, ht_id, keep_days)
+            if dry_run:
+                db.session.rollback()
+            else:
+                db.session.commit()
+
+        prefix = "[dry run] " if dry_run else ""
+        print(f"✅ {prefix}{total} snapshots reclaimed")
+        return total
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Thin old player snapshots to one per week",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+
+    parser.add_argument(
+        "--keep-days",
+        type=int,
+        metavar="N",
+        help="Days of daily history to keep (default: PLAYER_DAILY_HISTORY_DAYS)"
+    )
+
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would be removed and roll back"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        downsample_all(args.keep_days, args.dry_run)
+    except Exception as e:
+        print(f"❌ Error downsampling player history: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
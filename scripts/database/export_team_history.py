@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+HTStatus Team History Export
+
+Stream a team's player snapshot history or matches to a CSV, NDJSON or Parquet
+file (see app/history_export.py). Rows are read through server-side cursors,
+so memory use stays flat however long the history is.
+
+Usage:
+    uv run python scripts/database/export_team_history.py --team-id 12345 --output players.csv
+    uv run python scripts/database/export_team_history.py --team-id 12345 --format ndjson --output players.ndjson
+    uv run python scripts/database/export_team_history.py --team-id 12345 --matches --format parquet --output matches.parquet
+    uv run python scripts/database/export_team_history.py --team-id 12345 --columns ht_id,data_date,tsi,form --output tsi.csv
+
+Features:
+    - Same output as the /api/export/players and /api/export/matches routes
+    - Reads from a replica when DATABASE_REPLICA_URLS is configured
+    - Parquet needs the optional pyarrow package (uv sync --extra export)
+
+Related Scripts:
+    - backup_database.py: Full database backups
+    - compact_player_snapshots.py: Delta storage for player history
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path to import config
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.db_routing import use_replicas  # noqa: E402
+from app.factory import create_app  # noqa: E402
+from app.history_export import (  # noqa: E402
+    EXPORT_FORMATS,
+    MATCH_COLUMN_TYPES,
+    MATCH_EXPORT_COLUMNS,
+    PLAYER_COLUMN_TYPES,
+    PLAYER_EXPORT_COLUMNS,
+    export_format,
+    player_history_rows,
+    select_columns,
+    stream_export,
+    team_match_rows,
+)
+from models import db  # noqa: E402
+
+
+def export_team_history(team_id, out, fmt="csv", columns=None, matches=False):
+    """Write a team's history to the binary stream `out` and return bytes written."""
+    if matches:
+        rows_for_team, available, column_types = team_match_rows, MATCH_EXPORT_COLUMNS, MATCH_COLUMN_TYPES
+    else:
+        rows_for_team, available, column_types = player_history_rows, PLAYER_EXPORT_COLUMNS, PLAYER_COLUMN_TYPES
+
+    export_format(fmt)
+    columns = select_columns(columns, available)
+
+    app = create_app()
+    with app.app_context(), use_replicas():
+        written = 0
+        rows = rows_for_team(db.session, team_id, columns)
+        for chunk in stream_export(rows, columns, fmt, column_types):
+            out.write(chunk)
+            written += len(chunk)
+        return written
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export a team's player history or matches",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+
+    parser.add_argument(
+        "--team-id",
+        type=int,
+        required=True,
+        help="Team to export"
+    )
+
+    parser.add_argument(
+        "--format",
+        choices=list(EXPORT_FORMATS),
+        default="csv",
+        help="Output format (default: csv)"
+    )
+
+    parser.add_argument(
+        "--columns",
+        help="Comma-separated columns to export (default: all)"
+    )
+
+    parser.add_argument(
+        "--matches",
+        action="store_true",
+        help="Export the team's matches instead of player history"
+    )
+
+    parser.add_argument(
+        "--output",
+        metavar="FILE",
+        required=True,
+        help="File to write the export to"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        with open(args.output, "wb") as out:
+            written = export_team_history(args.team_id, out, args.format, args.columns, args.matches)
+        print(f"✅ Wrote {written:,} bytes to {args.output}")
+    except Exception as e:
+        print(f"❌ Error exporting team history: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
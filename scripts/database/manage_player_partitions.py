@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+HTStatus Player Partition Maintenance
+
+Create upcoming monthly partitions of the players table and apply retention
+by detaching old months (see app/player_partitions.py). PostgreSQL only.
+
+Usage:
+    uv run python scripts/database/manage_player_partitions.py --list
+    uv run python scripts/database/manage_player_partitions.py --ensure --months-ahead 3
+    uv run python scripts/database/manage_player_partitions.py --retain-months 24
+    uv run python scripts/database/manage_player_partitions.py --retain-months 24 --drop
+
+Features:
+    - /update creates the current and next months on demand; run --ensure from
+      cron to create them ahead of time
+    - Retention detaches whole months, leaving them as standalone tables for
+      archiving (pg_dump -t players_pYYYY_MM) unless --drop is given
+
+Related Scripts:
+    - backup_database.py: Take a backup before dropping partitions
+    - compact_player_snapshots.py: Delta storage for player history
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path to import config
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.factory import create_app  # noqa: E402
+from app.player_partitions import (  # noqa: E402
+    DEFAULT_MONTHS_AHEAD,
+    detach_expired_partitions,
+    ensure_player_partitions,
+    is_partitioned,
+    list_player_partitions,
+)
+from models import db  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Maintain monthly partitions of the players table",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="List attached partitions"
+    )
+
+    parser.add_argument(
+        "--ensure",
+        action="store_true",
+        help="Create partitions for the current and upcoming months"
+    )
+
+    parser.add_argument(
+        "--months-ahead",
+        type=int,
+        default=DEFAULT_MONTHS_AHEAD,
+        metavar="N",
+        help=f"Upcoming months to create with --ensure (default: {DEFAULT_MONTHS_AHEAD})"
+    )
+
+    parser.add_argument(
+        "--retain-months",
+        type=int,
+        metavar="N",
+        help="Detach partitions that ended more than N months ago"
+    )
+
+    parser.add_argument(
+        "--drop",
+        action="store_true",
+        help="Drop detached partitions instead of keeping them as archive tables"
+    )
+
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        try:
+            if not is_partitioned(db.session):
+                print("ℹ️  players is not a partitioned PostgreSQL table, nothing to do")
+                return
+
+            if args.ensure:
+                created = ensure_player_partitions(db.session, args.months_ahead)
+                db.session.commit()
+                print(f"✅ Created {len(created)} partitions: {', '.join(created) or '-'}")
+
+            if args.retain_months is not None:
+                detached = detach_expired_partitions(db.session, args.retain_months, drop=args.drop)
+                db.session.commit()
+                action = "Dropped" if args.drop else "Detached"
+                print(f"✅ {action} {len(detached)} partitions: {', '.join(detached) or '-'}")
+
+            if args.list or not (args.ensure or args.retain_months is not None):
+                for month, name in sorted(list_player_partitions(db.session).items()):
+                    print(f"   {month:%Y-%m}  {name}")
+
+        except Exception as e:
+            db.session.rollback()
+            print(f"❌ Error maintaining player partitions: {e}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,14 @@
 #!/usr/bin/env python
-"""Quick script to query match data from database."""
+"""Quick script to query match data from database.
+
+Analytics columns live in match_analytics, so they are LEFT JOINed in and
+print as None for matches without analytics.
+"""
 import sys
 
 from sqlalchemy import text
 
+from app.db_routing import use_replicas
 from app.factory import create_app
 
 if len(sys.argv) < 2:
@@ -13,9 +18,14 @@ if len(sys.argv) < 2:
 match_id = int(sys.argv[1])
 
 app = create_app()
-with app.app_context():
+with app.app_context(), use_replicas():
     from models import db
-    result = db.session.execute(text("SELECT * FROM match WHERE ht_id = :match_id"), {"match_id": match_id})
+    query = (
+        "SELECT m.*, a.* FROM match m "
+        "LEFT JOIN match_analytics a ON a.match_id = m.ht_id "
+        "WHERE m.ht_id = :match_id"
+    )
+    result = db.session.execute(text(query), {"match_id": match_id})
     row = result.fetchone()
 
     if not row:
@@ -24,7 +34,7 @@ with app.app_context():
 
     # Print all columns
     print(f"\n{'='*80}")
-    print(f"SELECT * FROM match WHERE ht_id = {match_id}")
+    print(f"match + match_analytics WHERE ht_id = {match_id}")
     print(f"{'='*80}")
     for key, value in row._mapping.items():
         print(f"{key:30s} = {value}")
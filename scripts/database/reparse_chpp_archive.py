@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Reparse CHPP Archive - Backfill Columns Without API Calls
+
+Purpose: Re-run the current CHPP parsers over the raw responses stored in the
+CHPP response archive (CHPP_ARCHIVE_DIR, see app/chpp/archive.py) and write
+the resulting values into existing database rows. Use it after a parser fix
+to backfill old data that CHPP no longer serves, without spending API quota.
+
+Backfilled per archived CHPP file:
+- playerdetails: detail columns (TSI, salary, goals, caps, ...) of the Players
+  snapshot stored on the day of the fetch
+- matchdetails / matchlineup: Match analytics, formation and tactic columns
+- matches / matchesarchive: Match teams, type and score columns
+
+Only existing rows are updated and only with values the parser produced
+(None never overwrites). In delta snapshot storage, days stored as deltas
+are updated in their changes, and when a keyframe row is corrected the delta
+days rebuilt from it keep their own stored values (see
+update_snapshot_columns() in app/player_snapshots.py).
+
+Usage:
+    uv run python scripts/database/reparse_chpp_archive.py --dry-run
+    uv run python scripts/database/reparse_chpp_archive.py --file playerdetails --since 2025-01-01
+    uv run python scripts/database/reparse_chpp_archive.py --archive-dir /backups/chpp-archive
+
+Related Scripts:
+- export_team_history.py: Export the backfilled history
+"""
+
+import argparse
+import sys
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+# Add app directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.chpp.archive import ResponseArchive  # noqa: E402
+from app.chpp.parsers import (  # noqa: E402
+    parse_matchdetails,
+    parse_matches,
+    parse_matchlineup,
+    parse_player,
+)
+from app.chpp.xml_backend import PARSE_ERRORS, fromstring  # noqa: E402
+from app.db_batching import DEFAULT_BATCH_SIZE  # noqa: E402
+from app.factory import create_app  # noqa: E402
+from app.player_snapshots import update_snapshot_columns  # noqa: E402
+from app.utils import (  # noqa: E402
+    match_details_columns,
+    match_lineup_columns,
+    player_details_columns,
+)
+from models import Match, Players, PlayerSnapshotDelta, db  # noqa: E402
+
+ARCHIVED_FILES = ("playerdetails", "matchdetails", "matchlineup", "matches", "matchesarchive")
+
+# CHPPMatch attributes stored under the same name on Match
+MATCH_LIST_COLUMNS = (
+    "home_team_id", "home_team_name", "away_team_id", "away_team_name",
+    "matchtype", "context_id", "rule_id", "cup_level", "cup_level_index",
+    "home_goals", "away_goals",
+)
+
+
+def apply_columns(record, columns):
+    """Set the non-None columns that differ on record; return True if any changed."""
+    changed = False
+    for column, value in columns.items():
+        if value is None or not hasattr(record, column):
+            continue
+        if getattr(record, column) != value:
+            setattr(record, column, value)
+            changed = True
+    return changed
+
+
+def backfill_targets(session, entry, root):
+    """Yield (kind, record or None, columns) for every row an archived response covers.
+
+    Player snapshots are a Players row or, in delta storage, a PlayerSnapshotDelta.
+    """
+    if entry.file == "playerdetails":
+        player = parse_player(root)
+        day = datetime(entry.fetched_at.year, entry.fetched_at.month, entry.fetched_at.day)
+        record = session.query(Players).filter_by(ht_id=player.player_id, data_date=day).first()
+        if record is None:
+            record = session.get(PlayerSnapshotDelta, (player.player_id, day))
+        yield "players", record, player_details_columns(player)
+
+    elif entry.file == "matchdetails":
+        details = parse_matchdetails(root)
+        yield "matches", session.query(Match).filter_by(ht_id=details.ht_id).first(), match_details_columns(details)
+
+    elif entry.file == "matchlineup":
+        lineup = parse_matchlineup(root)
+        yield "matches", session.query(Match).filter_by(ht_id=lineup.ht_id).first(), match_lineup_columns(lineup)
+
+    elif entry.file in ("matches", "matchesarchive"):
+        for match in parse_matches(root):
+            columns = {column: getattr(match, column) for column in MATCH_LIST_COLUMNS}
+            yield "matches", session.query(Match).filter_by(ht_id=match.ht_id).first(), columns
+
+
+def reparse_archive(session, archive, files=ARCHIVED_FILES, since=None,
+                    batch_size=DEFAULT_BATCH_SIZE, dry_run=False):
+    """Backfill database rows from archived responses; return outcome counts.
+
+    Counts: entries read, "<kind> updated", "<kind> unchanged", "<kind> missing"
+    (no row to update) and "unreadable" (body that no longer parses).
+    Changes are committed every batch_size entries, or rolled back in dry-run.
+    """
+    stats = Counter()
+    for entry in archive.entries(files=files, since=since):
+        stats["entries"] += 1
+        try:
+            root = fromstring(archive.read(entry.digest))
+            targets = list(backfill_targets(session, entry, root))
+        except (OSError, *PARSE_ERRORS) as e:
+            print(f"⚠️  {entry.file} {entry.digest[:12]}: {e}")
+            stats["unreadable"] += 1
+            continue
+
+        for kind, record, columns in targets:
+            if record is None:
+                stats[f"{kind} missing"] += 1
+            elif (update_snapshot_columns(session, record, columns) if kind == "players"
+                  else apply_columns(record, columns)):
+                stats[f"{kind} updated"] += 1
+            else:
+                stats[f"{kind} unchanged"] += 1
+
+        if stats["entries"] % batch_size == 0:
+            _finish_batch(session, dry_run)
+            print(f"  ... {stats['entries']} responses reparsed")
+
+    _finish_batch(session, dry_run)
+    return stats
+
+
+def _finish_batch(session, dry_run):
+    if dry_run:
+        session.rollback()
+    else:
+        session.commit()
+
+
+def main():
+    """Reparse the archive and print what was backfilled."""
+    parser = argparse.ArgumentParser(
+        description="Backfill Players/Match columns from the raw CHPP response archive",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--archive-dir",
+        help="Archive directory (default: CHPP_ARCHIVE_DIR from config)"
+    )
+    parser.add_argument(
+        "--file",
+        action="append",
+        choices=ARCHIVED_FILES,
+        help="Only reparse this CHPP file (repeatable, default: all)"
+    )
+    parser.add_argument(
+        "--since",
+        type=datetime.fromisoformat,
+        metavar="YYYY-MM-DD",
+        help="Only reparse responses fetched on or after this date"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Responses reparsed per transaction (default: {DEFAULT_BATCH_SIZE})"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would change without writing"
+    )
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        archive_dir = args.archive_dir or app.config.get("CHPP_ARCHIVE_DIR")
+        if not archive_dir:
+            print("❌ No archive directory: set CHPP_ARCHIVE_DIR or pass --archive-dir")
+            sys.exit(1)
+
+        print(f"🔁 Reparsing CHPP archive in {archive_dir}{' (dry run)' if args.dry_run else ''}")
+        stats = reparse_archive(
+            db.session, ResponseArchive(archive_dir), args.file or ARCHIVED_FILES,
+            args.since, args.batch_size, args.dry_run,
+        )
+
+        if not stats["entries"]:
+            print("❌ No archived responses matched")
+            sys.exit(1)
+        for outcome, count in sorted(stats.items()):
+            print(f"  {outcome}: {count}")
+        print("✅ Dry run complete, nothing written" if args.dry_run else "✅ Backfill complete")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+HTStatus Fake CHPP Server
+
+A self-contained stand-in for chpp.hattrick.org/chppxml.ashx, for load and
+integration testing the real HTTP, OAuth signing and XML parsing path
+offline. Point CHPP_URL at it (or pass base_url to CHPP) and every client
+request is answered locally.
+Usage: uv run python scripts/fake_chpp_server.py [--port 8765] [--latency 80] [--error-rate 0.02] [--rate-limit 20]
+
+Served files: managercompendium, teamdetails, players, playerdetails, matches,
+matchesarchive, matchdetails and matchlineup. Responses are, in order of
+preference:
+- replayed from a raw response archive (--archive, see app/chpp/archive.py),
+  matching file and query parameters
+- recorded files named <file>.xml in --recorded DIR, served verbatim
+- generated deterministically from the request IDs (teams of --players
+  players, --matches matches per team)
+
+Requests must carry an OAuth Authorization header (signatures are not
+verified). --latency/--jitter delay every response, --handshake delays every
+new connection (standing in for the TCP and TLS handshake of the live API),
+--error-rate answers that fraction with HTTP 503 and --rate-limit answers
+requests beyond N per second with HTTP 429, so client retries, throttling and
+connection reuse can be exercised. Connections are kept alive and counted.
+
+Related Scripts:
+- benchmark_update.py: Times the /update route end to end against this server
+- benchmark_chpp_transport.py: Measures connection reuse of the shared CHPP transport
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+# Setup path for app imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.chpp.archive import ResponseArchive  # noqa: E402
+
+ENDPOINT_PATH = "/chppxml.ashx"
+XML_HEADER = '<?xml version="1.0" encoding="utf-8"?>\n'
+FIRST_NAMES = ["Anders", "Bruno", "Carlos", "Dario", "Emil", "Fabio", "Goran", "Hugo", "Ivan", "Jonas"]
+LAST_NAMES = ["Berg", "Costa", "Dahl", "Eriksen", "Ferro", "Gomez", "Holm", "Ivanov", "Jensen", "Kovac"]
+
+
+def _hattrick_data(file, body):
+    return f'{XML_HEADER}<HattrickData><FileName>{file}.xml</FileName>{body}</HattrickData>'
+
+
+def chpp_error(code, message):
+    """Return a CHPP error document."""
+    return _hattrick_data("chpperror", f"<Error>{message}</Error><ErrorCode>{code}</ErrorCode>")
+
+
+def _player_ids(team_id, count):
+    return [team_id * 100 + number for number in range(1, count + 1)]
+
+
+def _skill(player_id, offset):
+    return (player_id * 7 + offset * 3) % 18 + 2
+
+
+def _player_name(player_id):
+    return FIRST_NAMES[player_id % len(FIRST_NAMES)], LAST_NAMES[(player_id // 10) % len(LAST_NAMES)]
+
+
+def _match_ids(team_id, count):
+    return [team_id * 1000 + number for number in range(1, count + 1)]
+
+
+class ResponseFactory:
+    """Builds the XML body for a CHPP file and its query parameters."""
+
+    def __init__(self, players_per_team=25, matches_per_team=10, recorded_dir=None, archive=None):
+        self.players_per_team = players_per_team
+        self.matches_per_team = matches_per_team
+        self.recorded_dir = Path(recorded_dir) if recorded_dir else None
+        self.archive = archive
+        self._archived = self._index_archive(archive) if archive is not None else {}
+
+    @staticmethod
+    def _index_archive(archive):
+        # Latest response per (file, params), later fetches win
+        index = {}
+        for entry in archive.entries():
+            params = tuple(sorted((key, str(value)) for key, value in entry.params.items()))
+            index[(entry.file, params)] = entry.digest
+        return index
+
+    def build(self, file, params):
+        """Return the response body for a request, or a CHPP error document."""
+        digest = self._archived.get((file, tuple(sorted(params.items()))))
+        if digest:
+            return self.archive.read(digest).decode("utf-8")
+        if self.recorded_dir is not None and (self.recorded_dir / f"{file}.xml").exists():
+            return (self.recorded_dir / f"{file}.xml").read_text(encoding="utf-8")
+
+        generate = getattr(self, f"_{file}", None)
+        if generate is None:
+            return chpp_error(52, f"Unknown file {file}")
+        try:
+            return _hattrick_data(file, generate(params))
+        except (KeyError, ValueError):
+            return chpp_error(50, f"Missing or invalid ID for {file}")
+
+    def _managercompendium(self, params):
+        user_id = int(params.get("userId", 182085))
+        return (
+            f"<Manager><UserId>{user_id}</UserId><Loginname>fake_manager_{user_id}</Loginname>"
+            f"<Teams><Team><TeamId>{user_id % 100000 + 9000}</TeamId><TeamName>Fake United</TeamName></Team></Teams>"
+            "<YouthTeam><YouthTeamId>0</YouthTeamId></YouthTeam></Manager>"
+        )
+
+    def _teamdetails(self, params):
+        team_id = int(params["teamId"])
+        return (
+            f"<Teams><Team><TeamID>{team_id}</TeamID><TeamName>Fake Team {team_id}</TeamName>"
+            f"<ShortTeamName>FT{team_id % 1000}</ShortTeamName><FoundedDate>2004-08-01 12:00:00</FoundedDate>"
+            "<League><LeagueID>1</LeagueID><LeagueName>Sverige</LeagueName></League>"
+            "<LeagueLevelUnit><LeagueLevelUnitID>100</LeagueLevelUnitID>"
+            "<LeagueLevelUnitName>III.1</LeagueLevelUnitName><LeagueLevel>3</LeagueLevel></LeagueLevelUnit>"
+            "<Arena><ArenaId>4242</ArenaId><ArenaName>Fake Arena</ArenaName></Arena>"
+            "<Cup><StillInCup>True</StillInCup><CupName>Cup</CupName><CupLevel>1</CupLevel></Cup>"
+            "<PowerRating><PowerRating>1200</PowerRating><GlobalRanking>5000</GlobalRanking></PowerRating>"
+            "<Fanclub><FanClubSize>1500</FanClubSize></Fanclub></Team></Teams>"
+        )
+
+    def _player_fields(self, player_id):
+        first_name, last_name = _player_name(player_id)
+        return (
+            f"<PlayerID>{player_id}</PlayerID><FirstName>{first_name}</FirstName><LastName>{last_name}</LastName>"
+            f"<Age>{17 + player_id % 15}</Age><AgeDays>{player_id % 112}</AgeDays>"
+            f"<TSI>{1000 + (player_id * 37) % 50000}</TSI><PlayerNumber>{player_id % 100}</PlayerNumber>"
+            f"<PlayerForm>{player_id % 8 + 1}</PlayerForm><Experience>{player_id % 12}</Experience>"
+            f"<Loyalty>{player_id % 20}</Loyalty><Specialty>{player_id % 6}</Specialty>"
+            f"<InjuryLevel>-1</InjuryLevel><TransferListed>False</TransferListed>"
+            f"<Salary>{20000 + (player_id * 13) % 80000}</Salary><Caps>0</Caps>"
+            f"<CareerGoals>{player_id % 40}</CareerGoals><LeagueGoals>{player_id % 9}</LeagueGoals>"
+            f"<MatchesCurrentTeam>{player_id % 60}</MatchesCurrentTeam><GoalsCurrentTeam>{player_id % 20}</GoalsCurrentTeam>"
+        )
+
+    def _player_skills(self, player_id):
+        tags = ["StaminaSkill", "KeeperSkill", "DefenderSkill", "PlaymakerSkill",
+                "WingerSkill", "PassingSkill", "ScorerSkill", "SetPiecesSkill"]
+        skills = "".join(f"<{tag}>{_skill(player_id, offset)}</{tag}>" for offset, tag in enumerate(tags))
+        return f"<PlayerSkills>{skills}</PlayerSkills>"
+
+    def _players(self, params):
+        team_id = int(params["teamId"])
+        players = "".join(
+            f"<Player>{self._player_fields(player_id)}{self._player_skills(player_id)}</Player>"
+            for player_id in _player_ids(team_id, self.players_per_team)
+        )
+        return f"<Team><TeamID>{team_id}</TeamID><PlayerList>{players}</PlayerList></Team>"
+
+    def _playerdetails(self, params):
+        player_id = int(params["playerID"])
+        return (
+            f"<Player>{self._player_fields(player_id)}{self._player_skills(player_id)}"
+            f"<ArrivalDate>2024-06-01 10:00:00</ArrivalDate><Cards>0</Cards>"
+            f"<Leadership>{player_id % 7 + 1}</Leadership><MotherClubBonus>False</MotherClubBonus>"
+            f"<Owner><OwningTeamID>{player_id // 100}</OwningTeamID></Owner></Player>"
+        )
+
+    def _match_list(self, team_id):
+        matches = []
+        for number, match_id in enumerate(_match_ids(team_id, self.matches_per_team)):
+            home = number % 2 == 0
+            played = number < self.matches_per_team - 2
+            goals = f"<HomeGoals>{match_id % 4}</HomeGoals><AwayGoals>{match_id % 3}</AwayGoals>" if played else ""
+            matches.append(
+                f"<Match><MatchID>{match_id}</MatchID>"
+                f"<HomeTeam><HomeTeamID>{team_id if home else team_id + 1}</HomeTeamID>"
+                f"<HomeTeamName>Fake Team {team_id if home else team_id + 1}</HomeTeamName></HomeTeam>"
+                f"<AwayTeam><AwayTeamID>{team_id + 1 if home else team_id}</AwayTeamID>"
+                f"<AwayTeamName>Fake Team {team_id + 1 if home else team_id}</AwayTeamName></AwayTeam>"
+                f"<MatchDate>2026-0{number % 9 + 1}-1{number % 9} 18:00:00</MatchDate>"
+                f"<MatchType>1</MatchType><MatchContextId>0</MatchContextId>{goals}"
+                f"<Status>{'FINISHED' if played else 'UPCOMING'}</Status></Match>"
+            )
+        return f"<Team><TeamID>{team_id}</TeamID><MatchList>{''.join(matches)}</MatchList></Team>"
+
+    def _matches(self, params):
+        return self._match_list(int(params["teamID"]))
+
+    def _matchesarchive(self, params):
+        return self._match_list(int(params["teamID"]))
+
+    def _side(self, side, team_id, match_id):
+        ratings = "".join(
+            f"<Rating{area}>{(match_id + offset) % 15 + 5}</Rating{area}>"
+            for offset, area in enumerate(["Midfield", "RightDef", "MidDef", "LeftDef", "RightAtt", "MidAtt", "LeftAtt"])
+        )
+        return (
+            f"<{side}><{side}ID>{team_id}</{side}ID><{side}Name>Fake Team {team_id}</{side}Name>"
+            f"<{side}Goals>{match_id % 3}</{side}Goals>{ratings}"
+            f"<NrOfChancesLeft>1</NrOfChancesLeft><NrOfChancesCenter>2</NrOfChancesCenter>"
+            f"<NrOfChancesRight>1</NrOfChancesRight><NrOfChancesSpecialEvents>0</NrOfChancesSpecialEvents>"
+            f"<NrOfChancesOther>1</NrOfChancesOther><TacticType>0</TacticType><TacticSkill>0</TacticSkill>"
+            f"<TeamAttitude>0</TeamAttitude></{side}>"
+        )
+
+    def _matchdetails(self, params):
+        match_id = int(params["matchID"])
+        team_id = match_id // 1000
+        return (
+            f"<Match><MatchID>{match_id}</MatchID><MatchType>1</MatchType>"
+            f"<MatchDate>2026-03-01 18:00:00</MatchDate>"
+            f"{self._side('HomeTeam', team_id, match_id)}{self._side('AwayTeam', team_id + 1, match_id)}"
+            f"<Arena><ArenaID>4242</ArenaID><ArenaName>Fake Arena</ArenaName>"
+            f"<SoldTotal>{20000 + match_id % 10000}</SoldTotal></Arena>"
+            f"<PossessionFirstHalfHome>{45 + match_id % 10}</PossessionFirstHalfHome>"
+            f"<PossessionFirstHalfAway>{55 - match_id % 10}</PossessionFirstHalfAway>"
+            f"<Scorers><Goal><ScorerPlayerID>{team_id * 100 + 9}</ScorerPlayerID>"
+            f"<ScorerTeamID>{team_id}</ScorerTeamID><ScorerMinute>{match_id % 90}</ScorerMinute></Goal></Scorers>"
+            f"<EventList><Event><Minute>1</Minute><EventText>Kick-off</EventText></Event></EventList></Match>"
+        )
+
+    def _matchlineup(self, params):
+        match_id = int(params["matchID"])
+        team_id = match_id // 1000
+
+        def lineup(side, owner):
+            players = "".join(
+                f"<Player><PlayerID>{player_id}</PlayerID><RoleID>{100 + position}</RoleID>"
+                f"<PlayerName>{' '.join(_player_name(player_id))}</PlayerName>"
+                f"<RatingStars>{(player_id % 9) / 2 + 1}</RatingStars></Player>"
+                for position, player_id in enumerate(_player_ids(owner, min(11, self.players_per_team)))
+            )
+            return (f"<{side}><Formation>4-4-2</Formation><TacticType>0</TacticType>"
+                    f"<StartingLineup>{players}</StartingLineup></{side}>")
+
+        return (f"<MatchID>{match_id}</MatchID><Match><MatchID>{match_id}</MatchID>"
+                f"{lineup('HomeTeam', team_id)}{lineup('AwayTeam', team_id + 1)}</Match>")
+
+
+class FakeCHPPServer:
+    """Threaded HTTP server answering CHPP XML requests locally.
+
+    Example:
+        >>> with FakeCHPPServer(latency_ms=50) as server:
+        ...     chpp = CHPP(key, secret, token, token_secret, base_url=server.url)
+        ...     team = chpp.team(ht_id=9838)
+        ...     print(server.stats)
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0,
+                 rate_limit=None, seed=0, verbose=False, handshake_ms=0.0, **factory_options):
+        self.latency_ms = latency_ms
+        self.handshake_ms = handshake_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.verbose = verbose
+        self.factory = ResponseFactory(**factory_options)
+        self.stats = Counter()
+        self.connections = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = float(rate_limit or 0)
+        self._refilled = time.monotonic()
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.fake = self
+        self._thread = None
+
+    @property
+    def url(self):
+        """CHPP endpoint URL to use as CHPP_URL."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{ENDPOINT_PATH}"
+
+    def start(self):
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serve requests on the calling thread until interrupted."""
+        self._httpd.serve_forever()
+
+    def stop(self):
+        """Stop serving and close the socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _take_token(self):
+        # Token bucket: rate_limit requests per second, bursts up to rate_limit
+        if not self.rate_limit:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate_limit, self._tokens + (now - self._refilled) * self.rate_limit)
+            self._refilled = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def _delay(self):
+        with self._lock:
+            jitter = self._random.uniform(0, self.jitter_ms)
+            fail = self._random.random() < self.error_rate
+        return (self.latency_ms + jitter) / 1000, fail
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; don't let Nagle hold the body back
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        # One handler per TCP connection; keep-alive requests reuse it
+        super().setup()
+        fake = self.server.fake
+        with fake._lock:
+            fake.connections += 1
+        if fake.handshake_ms:
+            time.sleep(fake.handshake_ms / 1000)
+
+    def do_GET(self):
+        fake = self.server.fake
+        url = urlsplit(self.path)
+        params = dict(parse_qsl(url.query))
+        file = params.pop("file", "")
+        params.pop("version", None)
+
+        auth = self.headers.get("Authorization", "")
+        if url.path != ENDPOINT_PATH:
+            return self._reply(fake, "not found", 404, "Not found")
+        if not auth.startswith("OAuth ") or "oauth_signature=" not in auth:
+            return self._reply(fake, "unauthorized", 401, chpp_error(401, "Missing OAuth signature"))
+        if not fake._take_token():
+            return self._reply(fake, "throttled", 429, chpp_error(429, "Too many requests"), {"Retry-After": "1"})
+
+        delay, fail = fake._delay()
+        if delay:
+            time.sleep(delay)
+        if fail:
+            return self._reply(fake, "errors", 503, "Service unavailable")
+
+        body = fake.factory.build(file, params)
+        self._reply(fake, file, 200, body)
+
+    def _reply(self, fake, outcome, status, body, headers=None):
+        data = body.encode("utf-8")
+        with fake._lock:
+            fake.stats[outcome] += 1
+        self.send_response(status)
+        self.send_header("Content-Type", "text/xml; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if self.server.fake.verbose:
+            super().log_message(format, *args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve fake CHPP XML responses for offline testing")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765)")
+    parser.add_argument("--latency", type=float, default=0.0, metavar="MS", help="Delay added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, metavar="MS", help="Extra random delay, 0..MS")
+    parser.add_argument("--handshake", type=float, default=0.0, metavar="MS", help="Delay added to every new connection")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with HTTP 503")
+    parser.add_argument("--rate-limit", type=float, metavar="N", help="Requests per second before HTTP 429")
+    parser.add_argument("--players", type=int, default=25, help="Players per generated team (default: 25)")
+    parser.add_argument("--matches", type=int, default=10, help="Matches per generated team (default: 10)")
+    parser.add_argument("--recorded", metavar="DIR", help="Serve <file>.xml from DIR verbatim when present")
+    parser.add_argument("--archive", metavar="DIR", help="Replay responses from a CHPP response archive")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for jitter and errors")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    server = FakeCHPPServer(
+        args.host, args.port, args.latency, args.jitter, args.error_rate, args.rate_limit, args.seed,
+        args.verbose, args.handshake, players_per_team=args.players, matches_per_team=args.matches,
+        recorded_dir=args.recorded, archive=ResponseArchive(args.archive) if args.archive else None,
+    )
+    print(f"✅ Fake CHPP server on {server.url}")
+    print(f"   export CHPP_URL={server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\nServed: {dict(server.stats)} over {server.connections} connections")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,515 @@
+"""Reference CHPP parsers for parity tests and the parser benchmark.
+
+These are the parse_players(), parse_player() and parse_matchdetails()
+implementations that app/chpp/parsers.py used before its single-pass field
+maps: one Element.find() per field, several of them whole-tree .// scans.
+tests/test_parsers.py checks the current parsers against them on the
+recorded responses in tests/fixtures/chpp, and
+scripts/benchmark_chpp_parsers.py times both.
+"""
+
+import xml.etree.ElementTree as ET
+from datetime import datetime
+
+from app.chpp.models import BidderTeam, CHPPMatchDetails, CHPPPlayer, TransferDetails
+from app.chpp.parsers import (
+    safe_find_bool,
+    safe_find_float,
+    safe_find_int,
+    safe_find_text,
+)
+
+
+def parse_players(root: ET.Element) -> list[CHPPPlayer]:
+    """Parse players XML to list of CHPPPlayer objects.
+
+    Args:
+        root: XML root element from players response
+
+    Returns:
+        List of CHPPPlayer instances with full skill data
+
+    Example:
+        >>> root = ET.fromstring(xml_response)
+        >>> players = parse_players(root)
+        >>> for player in players:
+        ...     print(player.first_name, player.scorer)
+    """
+    players = []
+
+    for player_node in root.findall(".//PlayerList/Player"):
+        # Extract player identity
+        player_id = safe_find_int(player_node, "PlayerID")
+        first_name = safe_find_text(player_node, "FirstName", "")
+        last_name = safe_find_text(player_node, "LastName", "")
+        nick_name = safe_find_text(player_node, "NickName")
+
+        # Player attributes
+        age = safe_find_int(player_node, "Age")
+        age_days = safe_find_int(player_node, "AgeDays")
+        tsi = safe_find_int(player_node, "TSI")
+        player_number = safe_find_int(player_node, "PlayerNumber")
+
+        # Current form and condition
+        form = safe_find_int(player_node, "PlayerForm")
+        experience = safe_find_int(player_node, "Experience")
+        loyalty = safe_find_int(player_node, "Loyalty")
+
+        # 7 Core Skills (extract from PlayerSkills container)
+        player_skills = player_node.find("PlayerSkills")
+        if player_skills is not None:
+            # Use correct API field names from PlayerSkills container
+            stamina = safe_find_int(player_skills, "StaminaSkill")
+            keeper = safe_find_int(player_skills, "KeeperSkill")
+            defender = safe_find_int(player_skills, "DefenderSkill")
+            playmaker = safe_find_int(player_skills, "PlaymakerSkill")
+            winger = safe_find_int(player_skills, "WingerSkill")
+            passing = safe_find_int(player_skills, "PassingSkill")
+            scorer = safe_find_int(player_skills, "ScorerSkill")
+            set_pieces = safe_find_int(player_skills, "SetPiecesSkill")
+        else:
+            # Fallback: try direct field names (may not exist in players endpoint)
+            stamina = safe_find_int(player_node, "Stamina")
+            keeper = safe_find_int(player_node, "Keeper")
+            defender = safe_find_int(player_node, "Defender")
+            playmaker = safe_find_int(player_node, "Playmaker")
+            winger = safe_find_int(player_node, "Winger")
+            passing = safe_find_int(player_node, "Passing")
+            scorer = safe_find_int(player_node, "Scorer")
+            set_pieces = safe_find_int(player_node, "SetPieces")
+
+        # Additional attributes
+        specialty = safe_find_int(player_node, "Specialty", None)
+        injury_level = safe_find_int(player_node, "InjuryLevel", 0)
+        statement = safe_find_text(player_node, "Statement")
+        owner_notes = safe_find_text(player_node, "OwnerNotes")
+
+        # Transfer data
+        transfer_listed = safe_find_bool(player_node, "TransferListed")
+
+        # Goal statistics extraction (MISSING IN ORIGINAL IMPLEMENTATION)
+        career_goals = safe_find_int(player_node, "CareerGoals", 0)
+        career_hattricks = safe_find_int(player_node, "CareerHattricks", 0)
+        league_goals = safe_find_int(player_node, "LeagueGoals", 0)
+        cup_goals = safe_find_int(player_node, "CupGoals", 0)
+        friendlies_goals = safe_find_int(player_node, "FriendliesGoals", 0)
+        current_team_matches = safe_find_int(player_node, "MatchesCurrentTeam", 0)
+        goals_current_team = safe_find_int(player_node, "GoalsCurrentTeam", 0)
+        assists_current_team = safe_find_int(player_node, "AssistsCurrentTeam", 0)
+        career_assists = safe_find_int(player_node, "CareerAssists", 0)
+
+        # Team and league data
+        caps = safe_find_int(player_node, "Caps", 0)
+        caps_u20 = safe_find_int(player_node, "CapsU20", 0)
+        country_id = safe_find_int(player_node, "NativeLeagueID", None)
+        salary = safe_find_int(player_node, "Salary", None)
+        national_team_id = safe_find_int(player_node, "NationalTeamID", None)
+
+        player = CHPPPlayer(
+            player_id=player_id,
+            first_name=first_name,
+            last_name=last_name,
+            nick_name=nick_name,
+            age=age,
+            age_days=age_days,
+            tsi=tsi,
+            player_number=player_number,
+            form=form,
+            stamina=stamina,
+            experience=experience,
+            loyalty=loyalty,
+            keeper=keeper,
+            defender=defender,
+            playmaker=playmaker,
+            winger=winger,
+            passing=passing,
+            scorer=scorer,
+            set_pieces=set_pieces,
+            specialty=specialty,
+            injury_level=injury_level,
+            statement=statement,
+            owner_notes=owner_notes,
+            transfer_listed=transfer_listed,
+            # Goal statistics (ADDED)
+            career_goals=career_goals,
+            career_hattricks=career_hattricks,
+            league_goals=league_goals,
+            cup_goals=cup_goals,
+            friendlies_goals=friendlies_goals,
+            matches_current_team=current_team_matches,
+            goals_current_team=goals_current_team,
+            assists_current_team=assists_current_team,
+            career_assists=career_assists,
+            # Team data (ADDED)
+            caps=caps,
+            caps_u20=caps_u20,
+            country_id=country_id,
+            salary=salary,
+            national_team_id=national_team_id,
+            _SOURCE_FILE="players",
+        )
+        players.append(player)
+
+    return players
+
+
+def parse_player(root: ET.Element) -> CHPPPlayer:
+    """Parse player XML to CHPPPlayer object (single player).
+
+    Used for individual player fetches via player() endpoint.
+
+    Args:
+        root: XML root element from player response
+
+    Returns:
+        CHPPPlayer instance
+
+    Example:
+        >>> root = ET.fromstring(xml_response)
+        >>> player = parse_player(root)
+        >>> print(player.first_name, player.scorer)
+    """
+    # Navigate to Player element (API returns it under HattrickData/Player)
+    player_elem = root.find(".//Player")
+    if player_elem is None:
+        raise ValueError("No Player element found in XML response")
+
+    # Extract all player fields using safe_find_* helpers
+    player_id = safe_find_int(player_elem, "PlayerID")
+    first_name = safe_find_text(player_elem, "FirstName", "")
+    last_name = safe_find_text(player_elem, "LastName", "")
+    nick_name = safe_find_text(player_elem, "NickName")
+    age = safe_find_int(player_elem, "Age")
+    age_days = safe_find_int(player_elem, "AgeDays")
+    tsi = safe_find_int(player_elem, "TSI")
+    player_number = safe_find_int(player_elem, "PlayerNumber")
+    category_id_text = safe_find_text(player_elem, "PlayerCategoryID")
+    category_id = int(category_id_text) if category_id_text else None
+    form = safe_find_int(player_elem, "PlayerForm")  # Form is PlayerForm in API
+    experience = safe_find_int(player_elem, "Experience")
+    loyalty = safe_find_int(player_elem, "Loyalty")
+
+    # 7 core skills - from PlayerSkills container per CHPP API docs
+    player_skills_elem = player_elem.find("PlayerSkills")
+    if player_skills_elem is not None:
+        stamina = safe_find_int(player_skills_elem, "StaminaSkill")
+        keeper = safe_find_int(player_skills_elem, "KeeperSkill")
+        defender = safe_find_int(player_skills_elem, "DefenderSkill")
+        playmaker = safe_find_int(player_skills_elem, "PlaymakerSkill")
+        winger = safe_find_int(player_skills_elem, "WingerSkill")
+        passing = safe_find_int(player_skills_elem, "PassingSkill")
+        scorer = safe_find_int(player_skills_elem, "ScorerSkill")
+        set_pieces = safe_find_int(player_skills_elem, "SetPiecesSkill")
+    else:
+        # Fallback if PlayerSkills container not found
+        stamina = 0
+        keeper = 0
+        defender = 0
+        playmaker = 0
+        winger = 0
+        passing = 0
+        scorer = 0
+        set_pieces = 0
+
+    # Additional attributes
+    specialty = safe_find_int(player_elem, "Specialty", 0)  # Default to 0, not None
+    category_id_text = safe_find_text(player_elem, "PlayerCategoryID")
+    category_id = int(category_id_text) if category_id_text else None
+    arrival_date_str = safe_find_text(player_elem, "ArrivalDate")
+    # Parse arrival_date string to datetime object
+    arrival_date = None
+    if arrival_date_str:
+        try:
+            # Try parsing ISO format from API: "2024-01-15 14:30:00"
+            arrival_date = datetime.fromisoformat(arrival_date_str.replace(" ", "T"))
+        except (ValueError, AttributeError, TypeError):
+            # If parsing fails, keep as None
+            arrival_date = None
+    cards = safe_find_int(player_elem, "Cards")
+    agreeability = safe_find_text(player_elem, "Agreeability")
+    aggressiveness = safe_find_text(player_elem, "Aggressiveness")
+    honesty = safe_find_text(player_elem, "Honesty")
+    country_id_text = safe_find_text(player_elem, "NativeLeagueID")
+    country_id = int(country_id_text) if country_id_text else None
+    salary_text = safe_find_text(player_elem, "Salary")
+    salary = int(salary_text) if salary_text else None
+    caps = safe_find_int(player_elem, "Caps")
+    caps_u20 = safe_find_int(player_elem, "CapsU20")
+    career_goals = safe_find_int(player_elem, "CareerGoals")
+    career_hattricks = safe_find_int(player_elem, "CareerHattricks")
+    league_goals = safe_find_int(player_elem, "LeagueGoals")
+    cup_goals = safe_find_int(player_elem, "CupGoals")
+    friendlies_goals = safe_find_int(player_elem, "FriendliesGoals")
+    matches_current_team = safe_find_int(player_elem, "MatchesCurrentTeam")
+    goals_current_team = safe_find_int(player_elem, "GoalsCurrentTeam")
+    assists_current_team = safe_find_int(player_elem, "AssistsCurrentTeam")
+    career_assists = safe_find_int(player_elem, "CareerAssists")
+    national_team_id_text = safe_find_text(player_elem, "NationalTeamID")
+    national_team_id = int(national_team_id_text) if national_team_id_text else None
+    mother_club_bonus = safe_find_int(player_elem, "MotherClubBonus")
+    leadership = safe_find_int(player_elem, "Leadership")
+    injury_level = safe_find_int(player_elem, "InjuryLevel", -1)
+    statement = safe_find_text(player_elem, "Statement")
+    owner_notes = safe_find_text(player_elem, "OwnerNotes")
+    transfer_listed = safe_find_bool(player_elem, "TransferListed")
+
+    # Parse TransferDetails if player is on transfer list
+    transfer_details = None
+    if transfer_listed:
+        transfer_elem = player_elem.find("TransferDetails")
+        if transfer_elem is not None:
+            asking_price = safe_find_int(transfer_elem, "AskingPrice")
+            deadline = safe_find_text(transfer_elem, "Deadline", "")
+            highest_bid = safe_find_int(transfer_elem, "HighestBid")
+            max_bid_text = safe_find_text(transfer_elem, "MaxBid")
+            max_bid = int(max_bid_text) if max_bid_text else None
+
+            bidder_team = None
+            bidder_elem = transfer_elem.find("BidderTeam")
+            if bidder_elem is not None:
+                bidder_team_id = safe_find_int(bidder_elem, "TeamID")
+                bidder_team_name = safe_find_text(bidder_elem, "TeamName", "")
+                if bidder_team_id:  # Only create if we have a team ID
+                    bidder_team = BidderTeam(team_id=bidder_team_id, team_name=bidder_team_name)
+
+            transfer_details = TransferDetails(
+                asking_price=asking_price,
+                deadline=deadline,
+                highest_bid=highest_bid,
+                max_bid=max_bid,
+                bidder_team=bidder_team,
+            )
+
+    return CHPPPlayer(
+        player_id=player_id,
+        first_name=first_name,
+        last_name=last_name,
+        nick_name=nick_name,
+        age=age,
+        age_days=age_days,
+        tsi=tsi,
+        player_number=player_number,
+        form=form,
+        stamina=stamina,
+        experience=experience,
+        loyalty=loyalty,
+        keeper=keeper,
+        defender=defender,
+        playmaker=playmaker,
+        winger=winger,
+        passing=passing,
+        scorer=scorer,
+        set_pieces=set_pieces,
+        specialty=specialty,
+        category_id=category_id,
+        arrival_date=arrival_date,
+        cards=cards,
+        agreeability=agreeability,
+        aggressiveness=aggressiveness,
+        honesty=honesty,
+        country_id=country_id,
+        salary=salary,
+        caps=caps,
+        caps_u20=caps_u20,
+        career_goals=career_goals,
+        career_hattricks=career_hattricks,
+        league_goals=league_goals,
+        cup_goals=cup_goals,
+        friendlies_goals=friendlies_goals,
+        matches_current_team=matches_current_team,
+        goals_current_team=goals_current_team,
+        assists_current_team=assists_current_team,
+        career_assists=career_assists,
+        national_team_id=national_team_id,
+        mother_club_bonus=mother_club_bonus,
+        leadership=leadership,
+        injury_level=injury_level,
+        statement=statement,
+        owner_notes=owner_notes,
+        transfer_listed=transfer_listed,
+        transfer_details=transfer_details,
+        _SOURCE_FILE="player",
+    )
+
+
+def parse_matchdetails(root: ET.Element) -> "CHPPMatchDetails":
+    """Parse matchdetails XML response into CHPPMatchDetails object.
+
+    Args:
+        root: XML root element from matchdetails endpoint
+
+    Returns:
+        CHPPMatchDetails object with comprehensive match statistics
+    """
+    # Extract match ID
+    ht_id = safe_find_int(root, ".//Match/MatchID")
+
+    # Extract team statistics - possession split by halves (at Match level)
+    possession_first_half_home = safe_find_int(root, ".//PossessionFirstHalfHome", None)
+    possession_first_half_away = safe_find_int(root, ".//PossessionFirstHalfAway", None)
+    possession_second_half_home = safe_find_int(root, ".//PossessionSecondHalfHome", None)
+    possession_second_half_away = safe_find_int(root, ".//PossessionSecondHalfAway", None)
+
+    # CHPP API provides 5 chance types per team (added in v3.1, March 2022)
+    # Path: HattrickData → Match → HomeTeam → NrOfChances*
+    home_team_chances_left = safe_find_int(root, ".//Match/HomeTeam/NrOfChancesLeft", None)
+    home_team_chances_center = safe_find_int(root, ".//Match/HomeTeam/NrOfChancesCenter", None)
+    home_team_chances_right = safe_find_int(root, ".//Match/HomeTeam/NrOfChancesRight", None)
+    home_team_chances_special = safe_find_int(root, ".//Match/HomeTeam/NrOfChancesSpecialEvents", None)
+    home_team_chances_other = safe_find_int(root, ".//Match/HomeTeam/NrOfChancesOther", None)
+
+    away_team_chances_left = safe_find_int(root, ".//Match/AwayTeam/NrOfChancesLeft", None)
+    away_team_chances_center = safe_find_int(root, ".//Match/AwayTeam/NrOfChancesCenter", None)
+    away_team_chances_right = safe_find_int(root, ".//Match/AwayTeam/NrOfChancesRight", None)
+    away_team_chances_special = safe_find_int(root, ".//Match/AwayTeam/NrOfChancesSpecialEvents", None)
+    away_team_chances_other = safe_find_int(root, ".//Match/AwayTeam/NrOfChancesOther", None)
+
+    # Team ratings - midfield (primary)
+    home_team_rating = safe_find_float(root, ".//HomeTeam/RatingMidfield", None)
+    away_team_rating = safe_find_float(root, ".//AwayTeam/RatingMidfield", None)
+
+    # Team ratings - defense by position
+    home_team_rating_right_def = safe_find_float(root, ".//HomeTeam/RatingRightDef", None)
+    home_team_rating_mid_def = safe_find_float(root, ".//HomeTeam/RatingMidDef", None)
+    home_team_rating_left_def = safe_find_float(root, ".//HomeTeam/RatingLeftDef", None)
+    away_team_rating_right_def = safe_find_float(root, ".//AwayTeam/RatingRightDef", None)
+    away_team_rating_mid_def = safe_find_float(root, ".//AwayTeam/RatingMidDef", None)
+    away_team_rating_left_def = safe_find_float(root, ".//AwayTeam/RatingLeftDef", None)
+
+    # Team ratings - attack by position
+    home_team_rating_right_att = safe_find_float(root, ".//HomeTeam/RatingRightAtt", None)
+    home_team_rating_mid_att = safe_find_float(root, ".//HomeTeam/RatingMidAtt", None)
+    home_team_rating_left_att = safe_find_float(root, ".//HomeTeam/RatingLeftAtt", None)
+    away_team_rating_right_att = safe_find_float(root, ".//AwayTeam/RatingRightAtt", None)
+    away_team_rating_mid_att = safe_find_float(root, ".//AwayTeam/RatingMidAtt", None)
+    away_team_rating_left_att = safe_find_float(root, ".//AwayTeam/RatingLeftAtt", None)
+
+    # Set pieces ratings
+    home_team_rating_set_pieces_def = safe_find_float(root, ".//HomeTeam/RatingIndirectSetPiecesDef", None)
+    home_team_rating_set_pieces_att = safe_find_float(root, ".//HomeTeam/RatingIndirectSetPiecesAtt", None)
+    away_team_rating_set_pieces_def = safe_find_float(root, ".//AwayTeam/RatingIndirectSetPiecesDef", None)
+    away_team_rating_set_pieces_att = safe_find_float(root, ".//AwayTeam/RatingIndirectSetPiecesAtt", None)
+
+    # Arena data
+    attendance = safe_find_int(root, ".//Arena/SoldTotal", None)
+    arena_capacity_terraces = safe_find_int(root, ".//Arena/SoldTerraces", None)
+    arena_capacity_basic = safe_find_int(root, ".//Arena/SoldBasic", None)
+    arena_capacity_roof = safe_find_int(root, ".//Arena/SoldRoof", None)
+    arena_capacity_vip = safe_find_int(root, ".//Arena/SoldVIP", None)
+    weather_id = safe_find_int(root, ".//Arena/WeatherID", None)
+    added_minutes = safe_find_int(root, ".//Match/AddedMinutes", None)
+
+    # Match officials (primary referee)
+    referee_id = safe_find_int(root, ".//MatchOfficials/Referee/RefereeId", None)
+    referee_name = safe_find_text(root, ".//MatchOfficials/Referee/RefereeName", "")
+    referee_country_id = safe_find_int(root, ".//MatchOfficials/Referee/RefereeCountryId", None)
+    referee_country = safe_find_text(root, ".//MatchOfficials/Referee/RefereeCountryName", "")
+    referee_team_id = safe_find_int(root, ".//MatchOfficials/Referee/RefereeTeamId", None)
+    referee_team_name = safe_find_text(root, ".//MatchOfficials/Referee/RefereeTeamname", "")
+
+    # Team details
+    home_team_dress_uri = safe_find_text(root, ".//HomeTeam/DressURI", "")
+    away_team_dress_uri = safe_find_text(root, ".//AwayTeam/DressURI", "")
+    home_team_attitude = safe_find_int(root, ".//HomeTeam/TeamAttitude", None)
+    away_team_attitude = safe_find_int(root, ".//AwayTeam/TeamAttitude", None)
+    home_team_tactic_type = safe_find_int(root, ".//HomeTeam/TacticType", None)
+    home_team_tactic_skill = safe_find_int(root, ".//HomeTeam/TacticSkill", None)
+    away_team_tactic_type = safe_find_int(root, ".//AwayTeam/TacticType", None)
+    away_team_tactic_skill = safe_find_int(root, ".//AwayTeam/TacticSkill", None)
+
+    # Parse scorers (goals)
+    scorers = []
+    for goal in root.findall(".//Scorers/Goal"):
+        scorer_data = {
+            "player_id": safe_find_int(goal, "ScorerPlayerID"),
+            "player_name": safe_find_text(goal, "ScorerPlayerName", ""),
+            "team_id": safe_find_int(goal, "ScorerTeamID"),
+            "minute": safe_find_int(goal, "ScorerMinute"),
+            "home_goals": safe_find_int(goal, "ScorerHomeGoals"),
+            "away_goals": safe_find_int(goal, "ScorerAwayGoals"),
+        }
+        scorers.append(scorer_data)
+
+    # Parse bookings (yellow/red cards)
+    bookings = []
+    for booking in root.findall(".//Bookings/Booking"):
+        booking_data = {
+            "player_id": safe_find_int(booking, "BookingPlayerID"),
+            "player_name": safe_find_text(booking, "BookingPlayerName", ""),
+            "team_id": safe_find_int(booking, "BookingTeamID"),
+            "booking_type": safe_find_int(booking, "BookingType"),  # 1=yellow, 2=red
+            "minute": safe_find_int(booking, "BookingMinute"),
+        }
+        bookings.append(booking_data)
+
+    # Parse injuries
+    injuries = []
+    for injury in root.findall(".//Injuries/Injury"):
+        injury_data = {
+            "player_id": safe_find_int(injury, "InjuryPlayerID"),
+            "player_name": safe_find_text(injury, "InjuryPlayerName", ""),
+            "team_id": safe_find_int(injury, "InjuryTeamID"),
+            "injury_type": safe_find_int(injury, "InjuryType"),  # 1=bruise, 2=injury
+            "minute": safe_find_int(injury, "InjuryMinute"),
+        }
+        injuries.append(injury_data)
+
+    return CHPPMatchDetails(
+        ht_id=ht_id,
+        possession_first_half_home=possession_first_half_home,
+        possession_first_half_away=possession_first_half_away,
+        possession_second_half_home=possession_second_half_home,
+        possession_second_half_away=possession_second_half_away,
+        home_team_chances_left=home_team_chances_left,
+        home_team_chances_center=home_team_chances_center,
+        home_team_chances_right=home_team_chances_right,
+        home_team_chances_special=home_team_chances_special,
+        home_team_chances_other=home_team_chances_other,
+        away_team_chances_left=away_team_chances_left,
+        away_team_chances_center=away_team_chances_center,
+        away_team_chances_right=away_team_chances_right,
+        away_team_chances_special=away_team_chances_special,
+        away_team_chances_other=away_team_chances_other,
+        home_team_rating=home_team_rating,
+        away_team_rating=away_team_rating,
+        home_team_rating_right_def=home_team_rating_right_def,
+        home_team_rating_mid_def=home_team_rating_mid_def,
+        home_team_rating_left_def=home_team_rating_left_def,
+        away_team_rating_right_def=away_team_rating_right_def,
+        away_team_rating_mid_def=away_team_rating_mid_def,
+        away_team_rating_left_def=away_team_rating_left_def,
+        home_team_rating_right_att=home_team_rating_right_att,
+        home_team_rating_mid_att=home_team_rating_mid_att,
+        home_team_rating_left_att=home_team_rating_left_att,
+        away_team_rating_right_att=away_team_rating_right_att,
+        away_team_rating_mid_att=away_team_rating_mid_att,
+        away_team_rating_left_att=away_team_rating_left_att,
+        home_team_rating_set_pieces_def=home_team_rating_set_pieces_def,
+        home_team_rating_set_pieces_att=home_team_rating_set_pieces_att,
+        away_team_rating_set_pieces_def=away_team_rating_set_pieces_def,
+        away_team_rating_set_pieces_att=away_team_rating_set_pieces_att,
+        attendance=attendance,
+        arena_capacity_terraces=arena_capacity_terraces,
+        arena_capacity_basic=arena_capacity_basic,
+        arena_capacity_roof=arena_capacity_roof,
+        arena_capacity_vip=arena_capacity_vip,
+        weather_id=weather_id,
+        added_minutes=added_minutes,
+        referee_id=referee_id,
+        referee_name=referee_name,
+        referee_country_id=referee_country_id,
+        referee_country=referee_country,
+        referee_team_id=referee_team_id,
+        referee_team_name=referee_team_name,
+        home_team_dress_uri=home_team_dress_uri,
+        away_team_dress_uri=away_team_dress_uri,
+        home_team_attitude=home_team_attitude,
+        away_team_attitude=away_team_attitude,
+        home_team_tactic_type=home_team_tactic_type,
+        home_team_tactic_skill=home_team_tactic_skill,
+        away_team_tactic_type=away_team_tactic_type,
+        away_team_tactic_skill=away_team_tactic_skill,
+        scorers=scorers,
+        bookings=bookings,
+        injuries=injuries
+    )
@@ -0,0 +1,181 @@
+"""Tests for the raw CHPP response archive and the offline reparse script."""
+
+import os
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.chpp.archive import ResponseArchive
+from app.chpp.client import CHPP
+from app.chpp.exceptions import CHPPAPIError
+from app.player_snapshots import get_player_snapshot
+from models import Match, Players, PlayerSnapshotDelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts', 'database'))
+import reparse_chpp_archive as reparse  # noqa: E402
+
+FIXTURES = Path(__file__).parent / "fixtures" / "chpp"
+FETCHED = datetime(2026, 3, 2, 18, 45)
+
+
+def _client(archive, body):
+    client = CHPP("test_key", "test_secret", "access_key", "access_secret", archive=archive)
+    response = MagicMock(ok=True, content=body)
+    response.iter_content.side_effect = lambda size: (body[i:i + 64] for i in range(0, len(body), 64))
+    client.session = MagicMock()
+    client.session.get.return_value = response
+    return client
+
+
+class TestResponseArchive:
+    """Responses are stored once per content, with one index line per fetch."""
+
+    def test_identical_bodies_are_stored_once(self, tmp_path):
+        archive = ResponseArchive(tmp_path)
+
+        first = archive.store("players", "2.7", {"teamId": 1}, b"<HattrickData/>", FETCHED)
+        second = archive.store("players", "2.7", {"teamId": 1}, b"<HattrickData/>")
+
+        assert first == second
+        assert len(list((tmp_path / "objects").rglob("*.xml.gz"))) == 1
+        assert archive.read(first) == b"<HattrickData/>"
+        entries = list(archive.entries())
+        assert [(e.file, e.params) for e in entries] == [("players", {"teamId": 1})] * 2
+        assert entries[0].fetched_at == FETCHED
+
+    def test_entries_filter_by_file_and_time(self, tmp_path):
+        archive = ResponseArchive(tmp_path)
+        archive.store("players", "2.7", {}, b"<a/>", datetime(2026, 1, 1))
+        archive.store("matchdetails", "3.1", {}, b"<b/>", datetime(2026, 2, 1))
+        archive.store("matchdetails", "3.1", {}, b"<c/>", datetime(2026, 3, 1))
+
+        entries = archive.entries(files=["matchdetails"], since=datetime(2026, 2, 15))
+
+        assert [archive.read(e.digest) for e in entries] == [b"<c/>"]
+
+    def test_discarded_writer_leaves_nothing(self, tmp_path):
+        archive = ResponseArchive(tmp_path)
+        writer = archive.writer("players", "2.7", {})
+        writer.write(b"<Hattrick")
+
+        writer.discard()
+
+        assert list(archive.entries()) == []
+        assert not any(path.is_file() for path in tmp_path.rglob("*"))
+
+
+class TestClientArchiving:
+    """The client archives successful responses, whole or streamed."""
+
+    def test_request_archives_body(self, tmp_path):
+        body = (FIXTURES / "player.xml").read_bytes()
+        archive = ResponseArchive(tmp_path)
+
+        _client(archive, body).player(476003339)
+
+        (entry,) = archive.entries()
+        assert (entry.file, entry.params["playerID"]) == ("playerdetails", 476003339)
+        assert archive.read(entry.digest) == body
+
+    def test_stream_archives_complete_body(self, tmp_path):
+        body = (FIXTURES / "matchdetails.xml").read_bytes()
+        archive = ResponseArchive(tmp_path)
+
+        _client(archive, body).matchdetails(742113901, stream=True)
+
+        (entry,) = archive.entries()
+        assert archive.read(entry.digest) == body
+
+    def test_error_responses_are_not_archived(self, tmp_path):
+        body = b"<HattrickData><Error>Unknown team</Error><ErrorCode>50</ErrorCode></HattrickData>"
+        archive = ResponseArchive(tmp_path)
+
+        with pytest.raises(CHPPAPIError):
+            list(_client(archive, body).iter_players(team_id=1))
+
+        assert list(archive.entries()) == []
+        assert not list(tmp_path.rglob("*.xml.gz"))
+
+
+def _add_player(session, ht_id, day, **columns):
+    session.execute(Players.__table__.insert().values(
+        ht_id=ht_id, data_date=day, first_name="Archived", last_name="Player", **columns
+    ))
+    session.commit()
+
+
+def _add_match(session, ht_id):
+    session.add(Match({
+        "ht_id": ht_id, "home_team_id": 100, "home_team_name": "Home FC",
+        "away_team_id": 200, "away_team_name": "Away FC", "datetime": datetime(2026, 3, 1),
+        "matchtype": 1, "context_id": 0, "rule_id": 0, "cup_level": 0, "cup_level_index": 0,
+        "home_goals": 0, "away_goals": 0,
+    }))
+    session.commit()
+
+
+class TestReparseArchive:
+    """Archived responses backfill existing rows without API calls."""
+
+    @pytest.fixture
+    def archive(self, tmp_path):
+        archive = ResponseArchive(tmp_path)
+        archive.store("playerdetails", "3.1", {"playerID": 476003339},
+                      (FIXTURES / "player.xml").read_bytes(), FETCHED)
+        archive.store("matchdetails", "3.1", {"matchID": 742113901},
+                      (FIXTURES / "matchdetails.xml").read_bytes(), FETCHED)
+        return archive
+
+    def test_backfills_player_snapshot_and_match(self, app, db_session, archive):
+        _add_player(db_session, 476003339, datetime(2026, 3, 2), tsi=1)
+        _add_match(db_session, 742113901)
+
+        stats = reparse.reparse_archive(db_session, archive)
+
+        assert stats == {"entries": 2, "players updated": 1, "matches updated": 1}
+        player = db_session.query(Players).filter_by(ht_id=476003339).one()
+        assert (player.tsi, player.salary, player.leadership) == (23418, 62182, 4)
+        assert db_session.query(Match).filter_by(ht_id=742113901).one().attendance == 31250
+
+    def test_rows_from_other_days_are_not_touched(self, app, db_session, archive):
+        _add_player(db_session, 476003339, datetime(2026, 3, 1), tsi=1)
+
+        stats = reparse.reparse_archive(db_session, archive, files=["playerdetails"])
+
+        assert stats == {"entries": 1, "players missing": 1}
+        assert db_session.query(Players).filter_by(ht_id=476003339).one().tsi == 1
+
+    def test_dry_run_writes_nothing(self, app, db_session, archive):
+        _add_match(db_session, 742113901)
+
+        stats = reparse.reparse_archive(db_session, archive, files=["matchdetails"], dry_run=True)
+
+        assert stats["matches updated"] == 1
+        assert db_session.query(Match).filter_by(ht_id=742113901).one().attendance is None
+
+    def test_delta_days_keep_their_own_values(self, app, db_session, tmp_path, monkeypatch):
+        monkeypatch.setitem(app.config, "PLAYER_SNAPSHOT_STORAGE", "delta")
+        ht_id, first = 476003339, datetime(2026, 3, 2)
+        days = [first + timedelta(days=offset) for offset in range(4)]
+        for day in (days[0], days[3]):
+            _add_player(db_session, ht_id, day, career_goals=0, tsi=1)
+        for day in days[1:3]:
+            db_session.add(PlayerSnapshotDelta(ht_id=ht_id, data_date=day, keyframe_date=first, changes={}))
+        db_session.commit()
+        archive = ResponseArchive(tmp_path)
+        body = (FIXTURES / "player.xml").read_bytes()
+        archive.store("playerdetails", "3.1", {"playerID": ht_id}, body, FETCHED)
+        archive.store("playerdetails", "3.1", {"playerID": ht_id}, body, FETCHED + timedelta(days=2))
+
+        stats = reparse.reparse_archive(db_session, archive)
+
+        assert stats == {"entries": 2, "players updated": 2}
+        goals = [
+            get_player_snapshot(db_session, ht_id, since=day, before=day + timedelta(days=1)).career_goals
+            for day in days
+        ]
+        # Day 2 was never reparsed and keeps 0; day 3's delta got its own value
+        assert goals == [109, 0, 109, 0]
@@ -0,0 +1,172 @@
+"""Tests for the CHPP outage circuit breaker."""
+
+from contextlib import suppress
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from flask import Flask
+
+from app.chpp.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    configured_circuit_breaker,
+)
+from app.chpp.client import CHPP
+from app.chpp.exceptions import CHPPAPIError, CHPPAuthError, CHPPUnavailableError
+from app.factory import create_app
+from config import TestConfig
+
+USER_XML = b"<HattrickData><Manager><UserId>1</UserId><Loginname>breaker</Loginname></Manager></HattrickData>"
+ERROR_XML = b"<HattrickData><ErrorCode>50</ErrorCode><Error>Unknown file</Error></HattrickData>"
+
+
+def _client(breaker):
+    client = CHPP("test_key", "test_secret", "access_key", "access_secret", circuit_breaker=breaker)
+    client.session = MagicMock()
+    return client
+
+
+def _fail_until_open(client, breaker):
+    client.session.get.side_effect = requests.ConnectionError("connection refused")
+    for _ in range(breaker.threshold):
+        with pytest.raises(CHPPAuthError):
+            client.user()
+
+
+class TestCircuitBreaker:
+    """Consecutive outage failures open the circuit; a probe closes it again."""
+
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker(threshold=3, cooldown=60)
+        client = _client(breaker)
+
+        _fail_until_open(client, breaker)
+
+        assert breaker.state == OPEN
+        assert breaker.as_dict()["trips"] == 1
+        assert "ConnectionError" in breaker.last_error
+
+    def test_open_circuit_fails_fast(self):
+        breaker = CircuitBreaker(threshold=2, cooldown=60)
+        client = _client(breaker)
+        _fail_until_open(client, breaker)
+
+        with pytest.raises(CHPPUnavailableError) as excinfo:
+            client.user()
+
+        assert client.session.get.call_count == 2
+        assert 0 < excinfo.value.retry_after <= 60
+        assert breaker.rejected == 1
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker(threshold=2, cooldown=60)
+        client = _client(breaker)
+        client.session.get.side_effect = [
+            requests.ConnectionError("reset"),
+            MagicMock(ok=True, content=USER_XML),
+            requests.ConnectionError("reset"),
+        ]
+
+        for _ in range(3):
+            with suppress(CHPPAuthError):
+                client.user()
+
+        assert (breaker.state, breaker.failures) == (CLOSED, 1)
+
+    def test_single_probe_after_cooldown(self):
+        breaker = CircuitBreaker(threshold=1, cooldown=0)
+        breaker.record_failure(requests.Timeout("read timed out"))
+
+        breaker.before_request()
+        assert breaker.state == HALF_OPEN
+        with pytest.raises(CHPPUnavailableError):
+            breaker.before_request()
+
+        breaker.record_success()
+        assert breaker.state == CLOSED
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker(threshold=1, cooldown=0)
+        client = _client(breaker)
+        _fail_until_open(client, breaker)
+
+        with pytest.raises(CHPPAuthError):
+            client.user()
+
+        assert breaker.state == OPEN
+        assert breaker.trips == 2
+
+    def test_api_errors_and_client_errors_do_not_count(self):
+        breaker = CircuitBreaker(threshold=1, cooldown=60)
+        client = _client(breaker)
+        not_found = MagicMock(status_code=404)
+        client.session.get.side_effect = [
+            MagicMock(ok=True, content=ERROR_XML),
+            requests.HTTPError(response=not_found),
+        ]
+
+        with pytest.raises(CHPPAPIError):
+            client.user()
+        with pytest.raises(CHPPAuthError):
+            client.user()
+
+        assert breaker.state == CLOSED
+
+    def test_maintenance_page_counts_as_outage(self):
+        breaker = CircuitBreaker(threshold=1, cooldown=60)
+        client = _client(breaker)
+        client.session.get.return_value = MagicMock(ok=True, content=b"<html><body>Maintenance")
+
+        with pytest.raises(CHPPAuthError):
+            client.user()
+
+        assert breaker.state == OPEN
+
+    def test_open_circuit_fails_team_instead_of_basic_players(self):
+        client = _client(CircuitBreaker())
+        basic_players = [MagicMock(player_id=1), MagicMock(player_id=2)]
+
+        with (
+            patch.object(client, "request"),
+            patch("app.chpp.client.parse_team"),
+            patch("app.chpp.client.parse_players", return_value=basic_players),
+            patch.object(client, "player", side_effect=CHPPUnavailableError(30.0)),
+            pytest.raises(CHPPUnavailableError),
+        ):
+            client.team(1001)
+
+
+class TestConfiguredBreaker:
+    """The app shares one breaker; an open circuit renders a 503 page."""
+
+    def test_configured_breaker_is_shared(self):
+        app = Flask(__name__)
+        app.config.update(CHPP_BREAKER_THRESHOLD="4", CHPP_BREAKER_COOLDOWN=30)
+
+        with app.app_context():
+            breaker = configured_circuit_breaker()
+            assert configured_circuit_breaker() is breaker
+            assert (breaker.threshold, breaker.cooldown) == (4, 30.0)
+
+    def test_zero_threshold_disables_breaker(self):
+        app = Flask(__name__)
+        app.config["CHPP_BREAKER_THRESHOLD"] = 0
+
+        with app.app_context():
+            assert configured_circuit_breaker() is None
+
+    def test_unavailable_page(self):
+        app = create_app(TestConfig, include_routes=False)
+
+        @app.route("/chpp-down")
+        def chpp_down():
+            raise CHPPUnavailableError(12.4, "ConnectionError: refused")
+
+        response = app.test_client().get("/chpp-down")
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "12"
+        assert b"unavailable" in response.data
@@ -0,0 +1,92 @@
+"""Tests for CHPP request metrics and lazy request logging."""
+
+import logging
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from app.chpp import metrics
+from app.chpp.client import CHPP
+from app.chpp.exceptions import CHPPAuthError
+from app.chpp.metrics import request_metrics, reset_request_metrics
+
+PLAYERS_XML = (Path(__file__).parent / "fixtures" / "chpp" / "players.xml").read_bytes()
+USER_XML = b"<HattrickData><Manager><UserId>1</UserId><Loginname>metered</Loginname></Manager></HattrickData>"
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics():
+    reset_request_metrics()
+    yield
+    reset_request_metrics()
+
+
+def _client(**response):
+    client = CHPP("test_key", "test_secret", "access_key", "access_secret")
+    client.session = MagicMock()
+    client.session.get.return_value = MagicMock(ok=True, status_code=200, content=USER_XML, **response)
+    return client
+
+
+class TestRequestMetrics:
+    """Every request is counted per endpoint, whatever the log level."""
+
+    def test_request_is_recorded(self):
+        _client().user()
+
+        report = request_metrics()["managercompendium"]
+        assert (report["requests"], report["errors"], report["bytes"]) == (1, 0, len(USER_XML))
+        assert report["ms_max"] >= report["ms_avg"] >= 0
+
+    def test_streamed_body_is_counted_after_reading(self):
+        client = _client(headers={})
+        chunks = [PLAYERS_XML[i:i + 512] for i in range(0, len(PLAYERS_XML), 512)]
+        client.session.get.return_value.iter_content.return_value = iter(chunks)
+
+        players = client.iter_players(1001)
+        next(players)
+        assert request_metrics() == {}
+
+        list(players)
+        report = request_metrics()["players"]
+        assert (report["requests"], report["errors"], report["bytes"]) == (1, 0, len(PLAYERS_XML))
+
+    def test_connection_errors_are_recorded(self):
+        client = _client()
+        client.session.get.side_effect = requests.ConnectionError("refused")
+
+        with pytest.raises(CHPPAuthError):
+            client.user()
+
+        assert request_metrics()["managercompendium"]["errors"] == 1
+
+    def test_structured_log_record(self, caplog):
+        with caplog.at_level(logging.INFO, logger=metrics.__name__):
+            _client().user()
+
+        record = next(r for r in caplog.records if r.name == metrics.__name__)
+        assert record.chpp_request["endpoint"] == "managercompendium"
+        assert (record.chpp_request["status"], record.chpp_request["bytes"]) == (200, len(USER_XML))
+
+
+class TestLazyDebugLogging:
+    """Request and header dumps are only built when DEBUG is enabled."""
+
+    def test_no_header_dump_without_debug(self, caplog):
+        with caplog.at_level(logging.INFO, logger="app.chpp.client"), \
+                patch("app.chpp.client._log_exchange") as log_exchange:
+            _client().user()
+
+        log_exchange.assert_not_called()
+
+    def test_header_dump_with_debug(self, caplog):
+        client = _client()
+        client.session.get.return_value.request.headers = {"Authorization": 'OAuth oauth_token="abc"'}
+        client.session.get.return_value.request.body = None
+
+        with caplog.at_level(logging.DEBUG, logger="app.chpp.client"):
+            client.user()
+
+        assert any("OAuth parameters" in r.getMessage() for r in caplog.records)
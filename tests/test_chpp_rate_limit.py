@@ -0,0 +1,146 @@
+"""Tests for the client-side CHPP rate limiter."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Flask
+
+from app.chpp.client import CHPP
+from app.chpp.exceptions import CHPPRateLimitError
+from app.chpp.rate_limit import (
+    PRIORITY_ARCHIVE,
+    PRIORITY_BACKFILL,
+    PRIORITY_INTERACTIVE,
+    LocalStore,
+    RateLimiter,
+    configured_rate_limiter,
+)
+
+USER_XML = b"<HattrickData><Manager><UserId>1</UserId><Loginname>limited</Loginname></Manager></HattrickData>"
+
+
+class TestRateLimiter:
+    """Requests beyond the burst wait for tokens, highest priority first."""
+
+    def test_burst_is_free_then_requests_wait(self):
+        limiter = RateLimiter(rate=20, burst=2)
+
+        waits = [limiter.acquire() for _ in range(3)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert 0.02 < waits[2] < 0.5
+        metrics = limiter.metrics.as_dict()[PRIORITY_INTERACTIVE]
+        assert (metrics["requests"], metrics["waited"]) == (3, 1)
+        assert metrics["wait_ms_max"] > 20
+
+    def test_interactive_requests_overtake_queued_backfill(self):
+        limiter = RateLimiter(rate=20, burst=1)
+        limiter.acquire()
+        order = []
+
+        def request(priority):
+            limiter.acquire(priority)
+            order.append(priority)
+
+        threads = [threading.Thread(target=request, args=(PRIORITY_BACKFILL,)) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.01)
+        interactive = threading.Thread(target=request, args=(PRIORITY_INTERACTIVE,))
+        interactive.start()
+        for thread in [*threads, interactive]:
+            thread.join(timeout=5)
+
+        assert order[:2].count(PRIORITY_INTERACTIVE) == 1
+        assert sorted(order) == [PRIORITY_BACKFILL, PRIORITY_BACKFILL, PRIORITY_INTERACTIVE]
+
+    def test_timeout_raises(self):
+        limiter = RateLimiter(rate=1, burst=1, timeout=0.05)
+        limiter.acquire(PRIORITY_ARCHIVE)
+
+        with pytest.raises(CHPPRateLimitError):
+            limiter.acquire(PRIORITY_ARCHIVE)
+
+        assert limiter.metrics.as_dict()[PRIORITY_ARCHIVE]["timeouts"] == 1
+
+    def test_user_budget(self):
+        limiter = RateLimiter(rate=1000, user_budget=2)
+
+        limiter.acquire(user_id=1)
+        limiter.acquire(user_id=1)
+        limiter.acquire(user_id=2)
+        with pytest.raises(CHPPRateLimitError, match="budget"):
+            limiter.acquire(user_id=1)
+
+        assert limiter.metrics.as_dict()[PRIORITY_INTERACTIVE]["over_budget"] == 1
+
+    def test_unknown_priority(self):
+        with pytest.raises(ValueError):
+            RateLimiter(rate=1).acquire("urgent")
+
+    def test_local_store_refills(self):
+        store = LocalStore()
+
+        assert store.take("bucket", 100, 1) == 0
+        assert store.take("bucket", 100, 1) > 0
+        time.sleep(0.02)
+        assert store.take("bucket", 100, 1) == 0
+
+
+class TestClientRateLimiting:
+    """Every CHPP request passes through the limiter before it is sent."""
+
+    def _client(self, **kwargs):
+        client = CHPP("test_key", "test_secret", "access_key", "access_secret", **kwargs)
+        client.session = MagicMock()
+        client.session.get.return_value = MagicMock(ok=True, content=USER_XML)
+        return client
+
+    def test_requests_use_priority_and_user(self):
+        limiter = MagicMock()
+        client = self._client(rate_limiter=limiter, user_id=7, priority=PRIORITY_ARCHIVE)
+
+        client.user()
+
+        limiter.acquire.assert_called_once_with(PRIORITY_ARCHIVE, 7)
+
+    def test_refused_request_is_not_sent(self):
+        limiter = RateLimiter(rate=1000, user_budget=1)
+        client = self._client(rate_limiter=limiter, user_id=7)
+        client.user()
+
+        with pytest.raises(CHPPRateLimitError):
+            client.user()
+
+        assert client.session.get.call_count == 1
+
+    def test_refused_player_fails_team_instead_of_basic_data(self):
+        client = self._client()
+        basic_players = [MagicMock(player_id=1), MagicMock(player_id=2)]
+
+        with (
+            patch.object(client, "request"),
+            patch("app.chpp.client.parse_team"),
+            patch("app.chpp.client.parse_players", return_value=basic_players),
+            patch.object(client, "player", side_effect=CHPPRateLimitError("over budget")),
+            pytest.raises(CHPPRateLimitError),
+        ):
+            client.team(1001)
+
+    def test_configured_limiter_is_shared(self):
+        app = Flask(__name__)
+        app.config.update(CHPP_RATE_LIMIT=5, CHPP_RATE_BURST="8", CHPP_USER_BUDGET="100")
+
+        with app.app_context():
+            limiter = configured_rate_limiter()
+            assert configured_rate_limiter() is limiter
+            assert (limiter.rate, limiter.burst, limiter.user_budget) == (5.0, 8.0, 100)
+
+    def test_zero_rate_disables_limiting(self):
+        app = Flask(__name__)
+        app.config["CHPP_RATE_LIMIT"] = 0
+
+        with app.app_context():
+            assert configured_rate_limiter() is None
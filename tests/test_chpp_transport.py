@@ -0,0 +1,57 @@
+"""Tests for the shared CHPP HTTP transport."""
+
+import os
+import sys
+
+import pytest
+from flask import Flask
+
+from app.chpp import transport
+from app.chpp.client import CHPP
+from app.chpp.transport import reset_shared_adapter, shared_adapter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+from fake_chpp_server import FakeCHPPServer  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def fresh_adapter():
+    reset_shared_adapter()
+    yield
+    reset_shared_adapter()
+
+
+def _client(url="https://chpp.hattrick.org/chppxml.ashx"):
+    return CHPP("test_key", "test_secret", "access_key", "access_secret", base_url=url)
+
+
+class TestSharedTransport:
+    """Per-user clients sign their own requests over one connection pool."""
+
+    def test_clients_share_adapter_not_credentials(self):
+        first, second = _client(), CHPP("test_key", "test_secret", "other_key", "other_secret")
+
+        assert first.session is not second.session
+        assert first.session.get_adapter("https://chpp.hattrick.org/") is shared_adapter()
+        assert second.session.get_adapter("https://chpp.hattrick.org/") is shared_adapter()
+
+    def test_consecutive_clients_reuse_connection(self):
+        with FakeCHPPServer() as server:
+            for _ in range(3):
+                _client(server.url).matchdetails(9000001)
+
+        assert server.stats["matchdetails"] == 3
+        assert server.connections == 1
+
+    def test_pool_size_from_config(self):
+        app = Flask(__name__)
+        app.config["CHPP_POOL_MAXSIZE"] = "3"
+
+        with app.app_context():
+            assert shared_adapter()._pool_maxsize == 3
+
+    def test_new_adapter_after_fork(self, monkeypatch):
+        parent = shared_adapter()
+        monkeypatch.setattr(transport.os, "getpid", lambda: -1)
+
+        assert shared_adapter() is not parent
@@ -0,0 +1,85 @@
+"""Tests for the resumable historical match cleanup in scripts/database."""
+
+import gzip
+import json
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+from models import Match, MatchAnalytics
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts', 'database'))
+import clean_historical_matches as cleanup  # noqa: E402
+
+CUTOFF = '2024-01-01'
+
+
+def _match(ht_id, when, **analytics):
+    return Match({
+        "ht_id": ht_id,
+        "home_team_id": 100,
+        "home_team_name": "Home FC",
+        "away_team_id": 200,
+        "away_team_name": "Away FC",
+        "datetime": when,
+        "matchtype": 1, "context_id": 0, "rule_id": 0,
+        "cup_level": 0, "cup_level_index": 0,
+        "home_goals": 1, "away_goals": 0,
+        **analytics,
+    })
+
+
+@pytest.fixture
+def matches(db_session):
+    for ht_id in range(1, 6):
+        db_session.add(_match(ht_id, datetime(2020 + ht_id % 2, 5, ht_id), attendance=1000 + ht_id))
+    db_session.add(_match(10, datetime(2025, 1, 1)))
+    db_session.add(_match(11, datetime(2025, 2, 1), attendance=500))
+    db_session.commit()
+    return db_session
+
+
+def _checkpoint(total=5):
+    return {'cutoff': CUTOFF, 'backup_file': 'backup.ndjson.gz', 'total': total, 'deleted': 0, 'last_ht_id': None}
+
+
+class TestCleanHistoricalMatches:
+    """Old matches are backed up, then deleted in checkpointed batches."""
+
+    def test_impact_breaks_down_by_year(self, app, matches, capsys):
+        assert cleanup.analyze_cleanup_impact(CUTOFF) == (5, 2)
+
+        output = capsys.readouterr().out
+        assert "2020: 2 matches" in output
+        assert "2021: 3 matches" in output
+
+    def test_backup_streams_old_matches_with_analytics(self, app, matches, tmp_path):
+        backup_file, total = cleanup.create_backup(CUTOFF, tmp_path / "backup.ndjson.gz", chunk_size=2)
+
+        with gzip.open(backup_file, 'rt') as f:
+            records = [json.loads(line) for line in f]
+        assert total == 5
+        assert [record['ht_id'] for record in records] == [1, 2, 3, 4, 5]
+        assert records[0]['attendance'] == 1001
+        assert records[0]['datetime'] == '2021-05-01T00:00:00'
+
+    def test_interrupted_cleanup_resumes_from_checkpoint(self, app, matches, tmp_path, monkeypatch):
+        checkpoint_file = tmp_path / "checkpoint.json"
+
+        def interrupt(_seconds):
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(cleanup.time, "sleep", interrupt)
+        with pytest.raises(KeyboardInterrupt):
+            cleanup.perform_cleanup(_checkpoint(), checkpoint_file, batch_size=2, pause=1)
+
+        saved = cleanup.read_checkpoint(checkpoint_file)
+        assert (saved['last_ht_id'], saved['deleted']) == (2, 2)
+        assert Match.query.count() == 5
+
+        assert cleanup.perform_cleanup(saved, checkpoint_file, batch_size=2, pause=0)
+        assert not checkpoint_file.exists()
+        assert [m.ht_id for m in Match.query.order_by(Match.ht_id)] == [10, 11]
+        assert [a.match_id for a in MatchAnalytics.query.all()] == [11]
@@ -1,9 +1,15 @@
 """Tests for app/chpp/client.py"""
 
 import xml.etree.ElementTree as ET
-from unittest.mock import patch
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from app.chpp.client import CHPP
+from app.chpp.exceptions import CHPPAPIError, CHPPAuthError
+
+FIXTURES = Path(__file__).parent / "fixtures" / "chpp"
 
 
 def test_module_imports():
@@ -83,6 +89,69 @@ class TestCHPPClient:
             assert isinstance(matches, list)
 
 
+def _streaming_client(body: bytes) -> tuple[CHPP, MagicMock]:
+    """Return a client whose session streams body in small chunks."""
+    client = CHPP("test_key", "test_secret", "access_key", "access_secret")
+    response = MagicMock(ok=True)
+    response.iter_content.side_effect = lambda size: (body[i:i + 101] for i in range(0, len(body), 101))
+    client.session = MagicMock()
+    client.session.get.return_value = response
+    return client, response
+
+
+class TestCHPPStreaming:
+    """Test incremental parsing of CHPP responses."""
+
+    def test_iter_players(self):
+        """Test that players stream from a chunked body."""
+        client, response = _streaming_client((FIXTURES / "players.xml").read_bytes())
+
+        players = list(client.iter_players(team_id=9838))
+
+        assert len(players) == 25
+        assert client.session.get.call_args.kwargs["stream"] is True
+        assert client.session.get.call_args.kwargs["params"]["teamId"] == 9838
+        response.close.assert_called_once()
+
+    def test_iter_matches_archive_is_lazy(self):
+        """Test that no request is sent until iteration starts."""
+        client, _ = _streaming_client(b"<HattrickData><Team><MatchList/></Team></HattrickData>")
+
+        matches = client.iter_matches_archive(id_=1001, season=82)
+        client.session.get.assert_not_called()
+
+        assert list(matches) == []
+        params = client.session.get.call_args.kwargs["params"]
+        assert params["season"] == 82 and "FirstMatchDate" not in params
+
+    def test_streamed_matchdetails_match_request(self):
+        """Test that stream=True returns the same details without the event list."""
+        body = (FIXTURES / "matchdetails.xml").read_bytes()
+        client, response = _streaming_client(body)
+
+        details = client.matchdetails(id_=742113901, stream=True)
+
+        with patch.object(client, "request", return_value=ET.fromstring(body)):
+            assert details == client.matchdetails(id_=742113901)
+        response.close.assert_called_once()
+
+    def test_error_document_raises_api_error(self):
+        """Test that CHPP error responses raise CHPPAPIError."""
+        client, _ = _streaming_client(
+            b"<HattrickData><Error>Unknown team</Error><ErrorCode>50</ErrorCode></HattrickData>"
+        )
+
+        with pytest.raises(CHPPAPIError):
+            list(client.iter_players(team_id=1))
+
+    def test_malformed_body_raises_auth_error(self):
+        """Test that broken XML is wrapped like request() failures."""
+        client, _ = _streaming_client(b"<HattrickData><PlayerList><Player>")
+
+        with pytest.raises(CHPPAuthError):
+            list(client.iter_players(team_id=1))
+
+
 # TODO: Add comprehensive tests for CHPP client
 # TODO: Test CHPP API authentication
 # TODO: Test API request methods and responses
@@ -0,0 +1,138 @@
+"""Tests for chunked reads and batched deletes in maintenance scripts."""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+from app.db_batching import batched_delete, estimate_rows, iter_keyset, stream_rows
+from models import Group, Players, PlayerSnapshotDelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts', 'database'))
+from cleanup_user_data import cleanup_steps  # noqa: E402
+from db_utils import run_batched_cleanup  # noqa: E402
+
+DAY_ONE = datetime(2026, 3, 2)
+
+
+def _add_players(session, players=(1, 2, 3), days=3, team_id=100):
+    for ht_id in players:
+        for day in range(days):
+            session.execute(
+                Players.__table__.insert().values(
+                    ht_id=ht_id,
+                    data_date=DAY_ONE + timedelta(days=day),
+                    first_name=f"Player{ht_id}",
+                    last_name="Batch",
+                    team_id=team_id,
+                )
+            )
+    session.commit()
+
+
+def _player_count(session, *where):
+    return len(session.execute(select(Players.ht_id).where(*where)).all())
+
+
+class TestChunkedReads:
+    """Rows are read page by page in key order."""
+
+    def test_keyset_pages_over_composite_key(self, app, db_session):
+        _add_players(db_session)
+        stmt = select(Players.ht_id, Players.data_date, Players.first_name)
+
+        pages = list(iter_keyset(db_session, stmt, [Players.ht_id, Players.data_date], chunk_size=4))
+
+        assert [len(page) for page in pages] == [4, 4, 1]
+        keys = [(row.ht_id, (row.data_date - DAY_ONE).days) for page in pages for row in page]
+        assert keys == [(ht_id, day) for ht_id in (1, 2, 3) for day in range(3)]
+
+    def test_keyset_exact_multiple_and_filter(self, app, db_session):
+        _add_players(db_session, players=(1, 2), days=2)
+        stmt = select(Players.ht_id, Players.data_date).where(Players.ht_id == 2)
+
+        pages = list(iter_keyset(db_session, stmt, [Players.ht_id, Players.data_date], chunk_size=2))
+
+        assert len(pages) == 1
+        assert [row.ht_id for row in pages[0]] == [2, 2]
+
+    def test_stream_rows(self, app, db_session):
+        _add_players(db_session, players=(1, 2), days=1)
+
+        rows = stream_rows(db_session, select(Players.ht_id).order_by(Players.ht_id), chunk_size=1)
+
+        assert [ht_id for (ht_id,) in rows] == [1, 2]
+
+
+class TestBatchedDelete:
+    """Deletes run in bounded, separately committed batches."""
+
+    def test_deletes_only_matching_rows_in_batches(self, app, db_session):
+        _add_players(db_session)
+        _add_players(db_session, players=(9,), team_id=200)
+        progress = []
+
+        deleted = batched_delete(
+            db_session, Players, Players.team_id == 100, batch_size=4, progress=progress.append
+        )
+
+        assert deleted == 9
+        assert progress == [4, 8, 9]
+        assert _player_count(db_session, Players.team_id == 100) == 0
+        assert _player_count(db_session, Players.team_id == 200) == 3
+
+    def test_nothing_to_delete(self, app, db_session):
+        assert batched_delete(db_session, Players, Players.team_id == 100) == 0
+
+    def test_estimate_counts_matching_rows(self, app, db_session):
+        _add_players(db_session, players=(1, 2), days=2)
+
+        assert estimate_rows(db_session, Players, Players.ht_id == 1) == 2
+        assert estimate_rows(db_session, Players.__table__) == 4
+
+
+class TestBatchedCleanup:
+    """Cleanup scripts estimate first and only delete when confirmed."""
+
+    def test_dry_run_deletes_nothing(self, app, db_session, capsys):
+        _add_players(db_session)
+        steps = [("players", Players, [Players.team_id == 100]), ("groups", Group, [Group.user_id == 1])]
+
+        result = run_batched_cleanup(db_session, steps, batch_size=2, dry_run=True)
+
+        assert result == {"players": 9, "groups": 0}
+        assert "~9 rows in 5 batches of 2" in capsys.readouterr().out
+        assert _player_count(db_session) == 9
+
+    def test_confirmed_cleanup_deletes(self, app, db_session, capsys):
+        _add_players(db_session)
+
+        result = run_batched_cleanup(
+            db_session, [("players", Players, [Players.ht_id != 2])], batch_size=5, assume_yes=True
+        )
+
+        assert result == {"players": 6}
+        assert "players: 5 deleted" in capsys.readouterr().out
+        assert _player_count(db_session) == 3
+
+    def test_declined_cleanup_keeps_data(self, app, db_session, monkeypatch):
+        _add_players(db_session, players=(1,), days=1)
+        monkeypatch.setattr("builtins.input", lambda _prompt: "no")
+
+        assert run_batched_cleanup(db_session, [("players", Players, [])]) is None
+        assert _player_count(db_session) == 1
+
+    def test_user_cleanup_removes_snapshot_deltas(self, app, db_session):
+        _add_players(db_session, players=(1, 2), days=1)
+        _add_players(db_session, players=(9,), days=1, team_id=200)
+        for ht_id in (1, 2, 9):
+            db_session.add(PlayerSnapshotDelta(
+                ht_id=ht_id, data_date=DAY_ONE + timedelta(days=1), keyframe_date=DAY_ONE, changes={"tsi": 1}
+            ))
+        db_session.commit()
+
+        run_batched_cleanup(db_session, cleanup_steps(1, 100), assume_yes=True)
+
+        remaining = db_session.execute(select(PlayerSnapshotDelta.ht_id)).scalars().all()
+        assert remaining == [9]
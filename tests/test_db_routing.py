@@ -0,0 +1,129 @@
+"""Tests for read-replica session routing."""
+
+import time
+
+import pytest
+from flask import Flask, session
+from sqlalchemy import create_engine, insert, select, text
+
+from app.db_routing import (
+    LAST_WRITE_KEY,
+    RoutingSession,
+    configure_replica_binds,
+    replica_reads,
+    replicas_active,
+    use_replicas,
+)
+from app.factory import db
+from models import Group, Players, User
+
+
+@pytest.fixture
+def replica(monkeypatch):
+    engine = create_engine("sqlite://")
+    monkeypatch.setitem(db.engines, "replica_1", engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def routing_session():
+    routing = RoutingSession(db)
+    yield routing
+    routing.close()
+
+
+class TestReplicaBinds:
+    """Replica URIs become replica_N binds."""
+
+    def test_replica_uris_are_added_to_binds(self):
+        app = Flask(__name__)
+        app.config["SQLALCHEMY_BINDS"] = {"archive": "sqlite://"}
+        app.config["SQLALCHEMY_REPLICA_URIS"] = ["postgresql://r1/db", "postgresql://r2/db"]
+
+        configure_replica_binds(app)
+
+        assert app.config["SQLALCHEMY_BINDS"] == {
+            "archive": "sqlite://",
+            "replica_1": "postgresql://r1/db",
+            "replica_2": "postgresql://r2/db",
+        }
+
+    def test_no_replicas_leaves_binds_alone(self):
+        app = Flask(__name__)
+        app.config["SQLALCHEMY_REPLICA_URIS"] = []
+
+        configure_replica_binds(app)
+
+        assert "SQLALCHEMY_BINDS" not in app.config
+
+
+@pytest.mark.usefixtures("app")
+class TestRoutingSession:
+    """Reads go to a replica only while use_replicas() is active."""
+
+    def test_reads_use_primary_by_default(self, replica, routing_session):
+        assert routing_session.get_bind(Players, select(Players)) is db.engine
+
+    def test_reads_use_replica_when_active(self, replica, routing_session):
+        with use_replicas():
+            assert routing_session.get_bind(Players, select(Players)) is replica
+            assert routing_session.get_bind(clause=text("SELECT 1")) is replica
+
+    def test_writes_and_primary_only_tables_use_primary(self, replica, routing_session):
+        with use_replicas():
+            assert routing_session.get_bind(Players, insert(Players)) is db.engine
+            assert routing_session.get_bind(clause=text("DELETE FROM players")) is db.engine
+            assert routing_session.get_bind(User, select(User)) is db.engine
+            joined = select(Players).join(User, User.ht_id == Players.owner)
+            assert routing_session.get_bind(Players, joined) is db.engine
+
+    def test_without_replicas_everything_uses_primary(self, routing_session):
+        with use_replicas():
+            assert routing_session.get_bind(Players, select(Players)) is db.engine
+
+
+class TestReadYourWrites:
+    """Read-only routes stay on the primary right after the user's own writes."""
+
+    @staticmethod
+    @replica_reads
+    def _route():
+        return replicas_active()
+
+    def test_get_requests_read_from_replicas(self, app):
+        with app.test_request_context("/stats"):
+            assert self._route() is True
+        assert replicas_active() is False
+
+    def test_post_requests_stay_on_primary(self, app):
+        with app.test_request_context("/player", method="POST"):
+            assert self._route() is False
+
+    def test_recent_write_stays_on_primary(self, app, monkeypatch):
+        monkeypatch.setitem(app.config, "READ_YOUR_WRITES_SECONDS", 60)
+        with app.test_request_context("/stats"):
+            session[LAST_WRITE_KEY] = time.time() - 30
+            assert self._route() is False
+            session[LAST_WRITE_KEY] = time.time() - 90
+            assert self._route() is True
+
+    def test_committed_write_starts_window(self, app, monkeypatch):
+        primary = create_engine("sqlite://")
+        Group.__table__.create(primary)
+        monkeypatch.setitem(db.engines, None, primary)
+
+        with app.test_request_context("/settings", method="POST"):
+            routing = RoutingSession(db)
+            routing.add(Group(1, "Keepers", 1, "#000000", "#ffffff"))
+            routing.commit()
+            assert LAST_WRITE_KEY in session
+
+            session.pop(LAST_WRITE_KEY)
+            with use_replicas():
+                routing.add(Group(1, "Defenders", 2, "#000000", "#ffffff"))
+                routing.commit()
+            assert LAST_WRITE_KEY not in session
+            routing.close()
+
+        primary.dispose()
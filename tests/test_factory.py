@@ -58,6 +58,18 @@ class TestCreateApp:
         assert len(blueprint_names) == 1  # Bootstrap blueprint registered
         assert 'bootstrap' in blueprint_names  # Flask-Bootstrap blueprint
 
+    def test_xml_backend_defaults_to_auto(self):
+        """Test that a config without CHPP_XML_BACKEND uses the documented default."""
+        class MinimalConfig:
+            TESTING = True
+            SECRET_KEY = "test-key"
+            SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+
+        with patch("app.factory.set_xml_backend") as set_backend:
+            create_app(config_object=MinimalConfig, include_routes=False)
+
+        set_backend.assert_called_once_with("auto")
+
     def test_create_app_database_initialization(self):
         """Test create_app initializes database properly."""
         class TestConfig:
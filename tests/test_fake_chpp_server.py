@@ -0,0 +1,106 @@
+"""Tests for the fake CHPP server used for offline load testing."""
+
+import os
+import sys
+
+import pytest
+import requests
+
+from app.chpp.archive import ResponseArchive
+from app.chpp.client import CHPP
+from app.chpp.exceptions import CHPPAPIError
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+from fake_chpp_server import FakeCHPPServer  # noqa: E402
+
+
+def _client(server):
+    return CHPP("test_key", "test_secret", "access_key", "access_secret", base_url=server.url)
+
+
+@pytest.fixture
+def server():
+    with FakeCHPPServer(players_per_team=3, matches_per_team=4) as server:
+        yield server
+
+
+class TestFakeCHPPServer:
+    """The real client fetches and parses every served file over HTTP."""
+
+    def test_update_flow(self, server):
+        chpp = _client(server)
+
+        user = chpp.user()
+        team = chpp.team(ht_id=9000)
+        players = team.players()
+        matches = chpp.matches(id_=9000)
+        details = chpp.matchdetails(matches[0].ht_id, stream=True)
+        lineup = chpp.matchlineup(matches[0].ht_id)
+
+        assert user.username == "fake_manager_182085"
+        assert team.name == "Fake Team 9000"
+        assert [p.player_id for p in players] == [900001, 900002, 900003]
+        assert chpp.player(id_=900002).salary == players[1].salary
+        assert [m.ht_id for m in matches] == [9000001, 9000002, 9000003, 9000004]
+        assert details.ht_id == 9000001
+        assert len(lineup.home_team_players) == 3
+        assert server.stats["playerdetails"] >= 1
+
+    def test_chpp_url_config_is_used(self, app, server):
+        original = app.config["CHPP_URL"]
+        app.config["CHPP_URL"] = server.url
+        try:
+            chpp = CHPP("test_key", "test_secret", "access_key", "access_secret")
+            assert len(list(chpp.iter_matches_archive(9000))) == 4
+        finally:
+            app.config["CHPP_URL"] = original
+
+    def test_unknown_file_is_a_chpp_error(self, server):
+        with pytest.raises(CHPPAPIError):
+            _client(server).request("worlddetails", "1.9")
+
+    def test_archive_is_replayed(self, tmp_path):
+        archive = ResponseArchive(tmp_path)
+        body = b"<HattrickData><Manager><UserId>7</UserId><Loginname>archived</Loginname></Manager></HattrickData>"
+        archive.store("managercompendium", "1.6", {}, body)
+
+        with FakeCHPPServer(archive=archive) as server:
+            assert _client(server).user().username == "archived"
+
+    def test_archive_only_replays_matching_params(self, tmp_path):
+        archive = ResponseArchive(tmp_path)
+        archive.store("teamdetails", "3.5", {"teamId": 1}, b"<HattrickData><Archived/></HattrickData>")
+
+        with FakeCHPPServer(archive=archive) as server:
+            responses = [
+                requests.get(server.url, params={"file": "teamdetails", "teamId": team_id},
+                             headers={"Authorization": 'OAuth oauth_signature="x"'}, timeout=5)
+                for team_id in (1, 2)
+            ]
+
+        assert "<Archived/>" in responses[0].text
+        assert "<TeamID>2</TeamID>" in responses[1].text
+
+    def test_requires_oauth(self, server):
+        response = requests.get(server.url, params={"file": "players", "teamId": 1}, timeout=5)
+
+        assert response.status_code == 401
+        assert server.stats["unauthorized"] == 1
+
+    def test_error_rate(self):
+        with FakeCHPPServer(error_rate=1.0) as server:
+            response = requests.get(
+                server.url, params={"file": "players", "teamId": 1},
+                headers={"Authorization": 'OAuth oauth_signature="x"'}, timeout=5,
+            )
+
+        assert response.status_code == 503
+
+    def test_rate_limit_is_retried_after_delay(self):
+        with FakeCHPPServer(rate_limit=1) as server:
+            chpp = _client(server)
+            chpp.user()
+            chpp.user()
+
+        assert server.stats["throttled"] == 1
+        assert server.stats["managercompendium"] == 2
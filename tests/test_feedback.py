@@ -1,7 +1,12 @@
-"""Tests for feedback blueprint models."""
+"""Tests for feedback blueprint models and the feedback board."""
 
 from unittest.mock import patch
 
+import pytest
+from flask import session as flask_session
+
+from app.blueprints import feedback as feedback_module
+from app.factory import db
 from models import Feedback, FeedbackComment, FeedbackVote, User
 
 # NOTE: Feedback routes follow CHPP prevention policy (session + database only).
@@ -142,3 +147,70 @@ class TestFeedbackModels:
             role_admin.role = "admin"
 
             assert role_admin.is_admin()
+
+
+class TestFeedbackList:
+    """The feedback board loads authors, comment counts and archived pages in bulk."""
+
+    USER_ID = 12345
+
+    @pytest.fixture
+    def board(self, app, db_session, monkeypatch):
+        monkeypatch.setattr(feedback_module, "db", db)
+        monkeypatch.setattr(feedback_module, "ARCHIVED_PER_PAGE", 2)
+        # Page-view tracking assigns string timestamps, which SQLite's DateTime type rejects
+        monkeypatch.setattr(User, "feedback", lambda _user: None)
+        db_session.execute(User.__table__.insert().values(
+            ht_id=self.USER_ID, ht_user="testuser", username="testuser", password="test_password",
+            access_key="test_access_key", access_secret="test_access_secret",
+        ))
+        db_session.commit()
+        return db_session
+
+    def _add_feedback(self, session, title, archived=False, comments=0):
+        item = Feedback(title=title, description="Text", feedback_type="idea",
+                        author_id=self.USER_ID, archived=archived)
+        session.add(item)
+        session.flush()
+        for number in range(comments):
+            session.add(FeedbackComment(feedback_id=item.id, author_id=self.USER_ID, content=f"Comment {number}"))
+        session.commit()
+        return item
+
+    def _render(self, app, query=""):
+        with app.test_request_context(f"/feedback/{query}"), \
+                patch.object(feedback_module, "create_page", return_value="page") as create_page:
+            flask_session["access_key"] = "key"
+            flask_session["current_user_id"] = self.USER_ID
+            assert feedback_module.list_feedback() == "page"
+        return create_page.call_args.kwargs
+
+    def test_comment_counts_per_item(self, app, board):
+        busy = self._add_feedback(board, "Busy", comments=3)
+        quiet = self._add_feedback(board, "Quiet")
+        archived = self._add_feedback(board, "Old", archived=True, comments=1)
+
+        page = self._render(app)
+
+        assert page["comment_counts"] == {busy.id: 3, archived.id: 1}
+        assert page["comment_counts"].get(quiet.id, 0) == 0
+        assert {item.author.ht_id for item in page["active_feedback"]} == {self.USER_ID}
+
+    def test_second_archived_page(self, app, board):
+        archived = [self._add_feedback(board, f"Old {number}", archived=True) for number in range(3)]
+
+        page = self._render(app, "?archived_page=2")
+
+        assert page["archived_pagination"].page == 2
+        assert page["archived_pagination"].pages == 2
+        assert len(page["archived_feedback"]) == 1
+        assert page["archived_feedback"][0].id in {item.id for item in archived}
+
+    def test_out_of_range_archived_page_shows_last_page(self, app, board):
+        archived = [self._add_feedback(board, f"Old {number}", archived=True) for number in range(3)]
+
+        page = self._render(app, "?archived_page=9")
+
+        assert page["archived_pagination"].page == 2
+        assert len(page["archived_feedback"]) == 1
+        assert page["archived_feedback"][0].id in {item.id for item in archived}
@@ -0,0 +1,234 @@
+"""Tests for the streaming player history and match export."""
+
+import contextlib
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.error_handlers import ValidationError
+from app.history_export import (
+    MATCH_COLUMN_TYPES,
+    PLAYER_COLUMN_TYPES,
+    PLAYER_EXPORT_COLUMNS,
+    export_format,
+    player_history_rows,
+    select_columns,
+    stream_export,
+    team_match_rows,
+)
+from app.player_snapshots import iter_player_history, load_player_history
+from models import Match, Players
+
+OWNER_ID = 12345
+DAY_ONE = datetime(2026, 3, 2)
+
+
+def _add_history(session, players=(1, 2), days=3):
+    for ht_id in players:
+        for day in range(days):
+            session.execute(
+                Players.__table__.insert().values(
+                    ht_id=ht_id,
+                    data_date=DAY_ONE + timedelta(days=day),
+                    first_name=f"Player{ht_id}",
+                    last_name="Export",
+                    owner=OWNER_ID,
+                    tsi=1000 + day,
+                    form=5,
+                )
+            )
+    session.commit()
+
+
+def _match(ht_id, day, **analytics):
+    return Match({
+        "ht_id": ht_id,
+        "home_team_id": OWNER_ID,
+        "home_team_name": "Home FC",
+        "away_team_id": 54321,
+        "away_team_name": "Away FC",
+        "datetime": DAY_ONE + timedelta(days=day),
+        "matchtype": 1, "context_id": 0, "rule_id": 0,
+        "cup_level": 0, "cup_level_index": 0,
+        "home_goals": 2, "away_goals": 1,
+        **analytics,
+    })
+
+
+def _collect(chunks):
+    return b"".join(chunks)
+
+
+class TestPlayerHistoryStream:
+    """Snapshots are streamed in (ht_id, data_date) order in either storage mode."""
+
+    def test_streams_full_rows_in_player_order(self, app, db_session):
+        _add_history(db_session)
+
+        records = list(iter_player_history(db_session, OWNER_ID, chunk_size=2))
+
+        assert [(r.ht_id, (r.data_date - DAY_ONE).days) for r in records] == [
+            (1, 0), (1, 1), (1, 2), (2, 0), (2, 1), (2, 2)
+        ]
+
+    def test_streams_delta_history_like_load_player_history(self, app, db_session, monkeypatch):
+        from tests.test_player_snapshots import _store_week
+
+        monkeypatch.setitem(app.config, "PLAYER_SNAPSHOT_STORAGE", "delta")
+        _store_week(db_session)
+
+        streamed = [dict(iter(r)) for r in iter_player_history(db_session, OWNER_ID, chunk_size=1)]
+        loaded = [dict(iter(r)) for r in load_player_history(db_session, owner=OWNER_ID)]
+
+        assert len(streamed) == 4
+        assert streamed == loaded
+
+
+class TestExportFormats:
+    """Rows are serialised chunk by chunk with optional column projection."""
+
+    def test_csv_projection(self, app, db_session):
+        _add_history(db_session, players=(1,), days=2)
+        columns = select_columns("ht_id,data_date,tsi", PLAYER_EXPORT_COLUMNS)
+
+        chunks = list(stream_export(
+            player_history_rows(db_session, OWNER_ID, columns), columns, "csv", PLAYER_COLUMN_TYPES, chunk_size=1
+        ))
+
+        assert len(chunks) == 2
+        assert list(csv.reader(io.StringIO(_collect(chunks).decode()))) == [
+            ["ht_id", "data_date", "tsi"],
+            ["1", "2026-03-02 00:00:00", "1000"],
+            ["1", "2026-03-03 00:00:00", "1001"],
+        ]
+
+    def test_empty_csv_still_has_header(self, app, db_session):
+        chunks = stream_export(iter([]), ["ht_id", "tsi"], "csv", PLAYER_COLUMN_TYPES)
+
+        assert _collect(chunks) == b"ht_id,tsi\r\n"
+
+    def test_ndjson(self, app, db_session):
+        _add_history(db_session, players=(1,), days=1)
+        columns = ["ht_id", "data_date", "first_name"]
+
+        output = _collect(stream_export(
+            player_history_rows(db_session, OWNER_ID, columns), columns, "ndjson", PLAYER_COLUMN_TYPES
+        ))
+
+        assert [json.loads(line) for line in output.splitlines()] == [
+            {"ht_id": 1, "data_date": "2026-03-02T00:00:00", "first_name": "Player1"}
+        ]
+
+    def test_parquet_round_trips(self, app, db_session):
+        pq = pytest.importorskip("pyarrow.parquet")
+        _add_history(db_session, days=2)
+        columns = ["ht_id", "data_date", "tsi", "nick_name"]
+
+        output = _collect(stream_export(
+            player_history_rows(db_session, OWNER_ID, columns), columns, "parquet", PLAYER_COLUMN_TYPES, chunk_size=3
+        ))
+
+        table = pq.read_table(io.BytesIO(output))
+        assert table.column_names == columns
+        assert table.column("tsi").to_pylist() == [1000, 1001, 1000, 1001]
+        assert table.column("data_date").to_pylist()[1] == DAY_ONE + timedelta(days=1)
+        assert table.column("nick_name").to_pylist() == [None] * 4
+
+    def test_invalid_requests_are_rejected(self):
+        with pytest.raises(ValidationError, match="Unknown export format"):
+            export_format("xlsx")
+        with pytest.raises(ValidationError, match="Unknown columns: salary_eur"):
+            select_columns("ht_id,salary_eur", PLAYER_EXPORT_COLUMNS)
+
+
+class TestMatchExport:
+    """Match rows include analytics only when requested."""
+
+    def test_match_rows_join_analytics(self, app, db_session):
+        db_session.add(_match(2, 1, attendance=900))
+        db_session.add(_match(1, 0))
+        db_session.commit()
+
+        rows = list(team_match_rows(db_session, OWNER_ID, ["ht_id", "home_goals", "attendance"]))
+
+        assert rows == [
+            {"ht_id": 1, "home_goals": 2, "attendance": None},
+            {"ht_id": 2, "home_goals": 2, "attendance": 900},
+        ]
+
+    def test_match_rows_serialise_with_analytics_types(self, app, db_session):
+        db_session.add(_match(3, 0, home_team_rating=25.5))
+        db_session.commit()
+        columns = ["ht_id", "home_team_rating"]
+
+        output = _collect(stream_export(
+            team_match_rows(db_session, OWNER_ID, columns), columns, "ndjson", MATCH_COLUMN_TYPES
+        ))
+
+        assert json.loads(output) == {"ht_id": 3, "home_team_rating": 25.5}
+
+
+@pytest.fixture
+def app_with_routes():
+    """Create a fresh application with routes on its own in-memory database."""
+    import os
+
+    from app.factory import create_app, db
+    from config import TestConfig
+
+    class RoutesConfig(TestConfig):
+        SQLALCHEMY_DATABASE_URI = "sqlite://"
+
+    os.environ["FLASK_ENV"] = "testing"
+    app = create_app(RoutesConfig, include_routes=True)
+
+    with app.app_context():
+        db.create_all()
+        yield app
+
+        with contextlib.suppress(Exception):
+            db.session.remove()
+        with contextlib.suppress(Exception):
+            db.drop_all()
+        with contextlib.suppress(Exception):
+            db.engine.dispose()
+
+
+class TestExportRoutes:
+    """The /api/export routes stream attachments for the user's own teams."""
+
+    @pytest.fixture
+    def client(self, app_with_routes):
+        from app.factory import db
+
+        _add_history(db.session, players=(1,), days=2)
+        client = app_with_routes.test_client()
+        with client.session_transaction() as session:
+            session["current_user_id"] = 1
+            session["current_user"] = "testuser"
+            session["all_teams"] = [OWNER_ID]
+            session["all_team_names"] = ["Test Team"]
+        return client
+
+    def test_players_export_streams_csv(self, client):
+        response = client.get(f"/api/export/players?team_id={OWNER_ID}&columns=ht_id,tsi")
+
+        assert response.status_code == 200
+        assert response.is_streamed
+        assert response.mimetype == "text/csv"
+        assert response.headers["Content-Disposition"] == f'attachment; filename="players_{OWNER_ID}.csv"'
+        assert response.get_data() == b"ht_id,tsi\r\n1,1000\r\n1,1001\r\n"
+
+    def test_other_teams_are_forbidden(self, client):
+        response = client.get("/api/export/matches?team_id=999&format=ndjson")
+
+        assert response.status_code == 403
+
+    def test_bad_parameters_are_rejected(self, client):
+        response = client.get(f"/api/export/players?team_id={OWNER_ID}&columns=bogus")
+
+        assert response.status_code == 400
+        assert "bogus" in response.get_json()["error"]
@@ -147,3 +147,103 @@ class TestMainBlueprintSetup:
         assert isinstance(main_bp, Blueprint)
         assert main_bp.name == 'main'
         assert callable(setup_main_blueprint)
+
+
+class TestChangelogCache:
+    """Test the mtime-invalidated changelog cache behind /changes."""
+
+    def _write_entries(self, path, entries, mtime):
+        import json
+        import os
+
+        path.write_text(json.dumps({"entries": entries}), encoding="utf-8")
+        os.utime(path, ns=(mtime, mtime))
+
+    def test_changelog_sorted_and_cached(self, tmp_path):
+        """Test entries are merged newest first and reused while mtimes are unchanged."""
+        from unittest.mock import patch
+
+        import app.blueprints.main as main_module
+
+        self._write_entries(tmp_path / "changelog.json", [
+            {"date": "2026-01-01 10:00:00", "version": "3.1.1", "message": "old commit", "type": "commit"},
+            {"date": "2026-02-01 10:00:00", "version": "3.2.1", "message": "new commit", "type": "commit"},
+        ], 1_000_000_000)
+        self._write_entries(tmp_path / "releases.json", [
+            {"date": "2026-01-15 10:00:00", "version": "3.2", "message": "release", "type": "user_release"},
+        ], 1_000_000_000)
+
+        lines, page_starts = main_module._get_changelog(str(tmp_path))
+        assert len(lines) == 3
+        assert "new commit" in lines[0]
+        assert "USER RELEASE" in lines[1]
+        assert "old commit" in lines[2]
+        assert page_starts == [0]
+
+        with patch.object(main_module, "_build_changelog_lines") as mock_build:
+            assert main_module._get_changelog(str(tmp_path))[0] is lines
+            mock_build.assert_not_called()
+
+    def test_changelog_rebuilt_when_source_changes(self, tmp_path):
+        """Test the cache is rebuilt when any source file's mtime changes."""
+        import app.blueprints.main as main_module
+
+        changelog = tmp_path / "changelog.json"
+        self._write_entries(changelog, [
+            {"date": "2026-01-01 10:00:00", "version": "3.1.1", "message": "first", "type": "commit"},
+        ], 1_000_000_000)
+        assert len(main_module._get_changelog(str(tmp_path))[0]) == 1
+
+        self._write_entries(changelog, [
+            {"date": "2026-01-01 10:00:00", "version": "3.1.1", "message": "first", "type": "commit"},
+            {"date": "2026-01-02 10:00:00", "version": "3.1.2", "message": "second", "type": "commit"},
+        ], 2_000_000_000)
+        lines, _page_starts = main_module._get_changelog(str(tmp_path))
+        assert len(lines) == 2
+        assert "second" in lines[0]
+
+    def test_changes_route_pages_at_release_boundaries(self, tmp_path):
+        """Test /changes serves whole releases, one page at a time."""
+        from app.factory import create_app
+        from config import TestConfig
+
+        # Four technical releases of 60 commits each, 61 lines per release
+        commits, releases = [], []
+        for release in range(4):
+            day = f"2026-01-{10 + release:02d}"
+            releases.append({"date": f"{day} 12:00:00", "version": f"v{release}.0",
+                             "message": "release", "type": "internal_release"})
+            commits.extend(
+                {"date": f"{day} 10:{i:02d}:00", "version": f"v{release}.0",
+                 "message": f"r{release}-c{i}-", "type": "commit"}
+                for i in range(60)
+            )
+        self._write_entries(tmp_path / "changelog.json", commits, 1_000_000_000)
+        self._write_entries(tmp_path / "releases-internal.json", releases, 1_000_000_000)
+
+        test_app = create_app(TestConfig, include_routes=True)
+        test_app.static_folder = str(tmp_path)
+        with test_app.test_client() as client:
+            first = client.get("/changes")
+            second = client.get("/changes?page=2")
+
+        assert first.status_code == 200
+        assert b"v1.0 TECHNICAL RELEASE" in first.data
+        assert b"r1-c0-" in first.data
+        assert b"v0.0 TECHNICAL RELEASE" not in first.data
+        assert b"Page 1 of 2" in first.data
+        assert b"v0.0 TECHNICAL RELEASE" in second.data
+        assert b"r0-c59-" in second.data
+        assert b"r1-c0-" not in second.data
+        assert b"Page 2 of 2" in second.data
+
+    def test_long_release_is_not_split(self):
+        """Test a release longer than a page gets a page of its own."""
+        import app.blueprints.main as main_module
+
+        per_page = main_module.CHANGELOG_PER_PAGE
+
+        assert main_module._changelog_page_starts(per_page * 3, [10, per_page * 2 + 50]) == [
+            0, 10, per_page * 2 + 50
+        ]
+        assert main_module._changelog_page_starts(per_page * 3, []) == [0]
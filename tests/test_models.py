@@ -3,7 +3,10 @@
 from datetime import datetime
 from unittest.mock import patch
 
-from models import Group, Match, MatchPlay, Players, PlayerSetting, User
+import pytest
+
+from app.chpp.models import CHPPMatchDetails, CHPPPlayer
+from models import Group, Match, MatchAnalytics, MatchPlay, Players, PlayerSetting, User
 
 
 def test_root_models_imports():
@@ -18,6 +21,41 @@ def test_chpp_models_imports():
     assert app.chpp.models is not None
 
 
+class TestCHPPModelSlots:
+    """Test that CHPP models are compact but keep the pychpp interface."""
+
+    def _player(self):
+        skills = dict.fromkeys(
+            ["age_days", "tsi", "form", "stamina", "experience", "loyalty", "keeper", "defender",
+             "playmaker", "winger", "passing", "scorer", "set_pieces"], 5
+        )
+        return CHPPPlayer(player_id=7, first_name="Ada", last_name="Slot", nick_name=None,
+                          age=20, player_number=9, **skills)
+
+    def test_player_has_no_instance_dict(self):
+        """Test that slotted players reject undeclared attributes."""
+        player = self._player()
+
+        assert not hasattr(player, "__dict__")
+        with pytest.raises(AttributeError):
+            player.undeclared = 1
+
+    def test_player_keeps_dict_access_and_aliases(self):
+        """Test dict-style access and pychpp property aliases."""
+        player = self._player()
+        player.scorer = 12
+
+        assert player["scorer"] == 12
+        assert (player.id, player.number, player["_SOURCE_FILE"]) == (7, 9, "players")
+
+    def test_match_details_default_lists_are_per_instance(self):
+        """Test that list fields are not shared between instances."""
+        first, second = CHPPMatchDetails(ht_id=1), CHPPMatchDetails(ht_id=2)
+        first.scorers.append({"minute": 3})
+
+        assert second.scorers == []
+
+
 class TestUserModel:
     """Test User model functionality."""
 
@@ -317,6 +355,66 @@ class TestMatchModel:
         assert match.has_enhanced_data() is False
 
 
+class TestMatchAnalytics:
+    """Enhanced match data lives in the match_analytics side table."""
+
+    @staticmethod
+    def _match_data(ht_id, **analytics):
+        return {
+            "ht_id": ht_id,
+            "home_team_id": 1111,
+            "home_team_name": "Home FC",
+            "away_team_id": 2222,
+            "away_team_name": "Away FC",
+            "datetime": datetime(2024, 5, 1, 20, 0),
+            "matchtype": 1, "context_id": 0, "rule_id": 0,
+            "cup_level": 0, "cup_level_index": 0,
+            "home_goals": 2, "away_goals": 1,
+            **analytics,
+        }
+
+    def test_analytics_row_only_when_data_present(self, db_session):
+        db_session.add(Match(self._match_data(1, attendance=12500, home_team_formation="4-4-2")))
+        db_session.add(Match(self._match_data(2)))
+        db_session.commit()
+
+        rows = db_session.query(MatchAnalytics).all()
+        assert [(row.match_id, row.attendance, row.home_team_formation) for row in rows] == [
+            (1, 12500, "4-4-2")
+        ]
+
+    def test_setting_a_field_creates_analytics(self, db_session):
+        db_session.add(Match(self._match_data(3)))
+        db_session.commit()
+
+        match = db_session.get(Match, 3)
+        match.home_team_rating = 25.0
+        match.referee_name = "Test Referee"
+        db_session.commit()
+
+        analytics = db_session.get(MatchAnalytics, 3)
+        assert (analytics.home_team_rating, analytics.referee_name) == (25.0, "Test Referee")
+
+    def test_list_query_does_not_load_analytics(self, db_session):
+        db_session.add(Match(self._match_data(4, attendance=900)))
+        db_session.commit()
+        db_session.expire_all()
+
+        match = db_session.query(Match).filter_by(ht_id=4).one()
+
+        assert "analytics" not in match.__dict__
+        assert match.attendance == 900
+
+    def test_deleting_match_removes_analytics(self, db_session):
+        db_session.add(Match(self._match_data(5, attendance=900)))
+        db_session.commit()
+
+        db_session.delete(db_session.get(Match, 5))
+        db_session.commit()
+
+        assert db_session.get(MatchAnalytics, 5) is None
+
+
 class TestMatchPlayModel:
     """Test MatchPlay model functionality."""
 
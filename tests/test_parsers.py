@@ -1,18 +1,43 @@
 """Tests for app/chpp/parsers.py"""
 
-import xml.etree.ElementTree as ET
+from datetime import datetime
+from pathlib import Path
 
+import pytest
+
+from app.chpp import parsers as parsers_module
 from app.chpp.models import CHPPMatch, CHPPPlayer, CHPPTeam, CHPPUser
 from app.chpp.parsers import (
+    FieldMap,
+    iterparse_records,
+    parse_match_node,
+    parse_matchdetails,
+    parse_matchdetails_node,
     parse_matches,
     parse_player,
     parse_players,
+    parse_players_node,
     parse_team,
     parse_user,
     safe_find_bool,
     safe_find_int,
     safe_find_text,
 )
+from app.chpp.xml_backend import PARSE_ERRORS, backend_name, fromstring, set_backend
+from tests import chpp_reference_parsers
+
+FIXTURES = Path(__file__).parent / "fixtures" / "chpp"
+
+
+@pytest.fixture(autouse=True, params=["etree", "lxml"])
+def xml_backend(request):
+    """Run every parser test against both XML backends."""
+    if request.param == "lxml":
+        pytest.importorskip("lxml.etree")
+    previous = backend_name()
+    set_backend(request.param)
+    yield request.param
+    set_backend(previous)
 
 
 def test_module_imports():
@@ -27,28 +52,28 @@ class TestSafeFindText:
     def test_finds_existing_element(self):
         """Test finding an element that exists with text."""
         xml = "<root><item>test_value</item></root>"
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         result = safe_find_text(root, "item")
         assert result == "test_value"
 
     def test_returns_default_for_missing_element(self):
         """Test default value when element doesn't exist."""
         xml = "<root></root>"
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         result = safe_find_text(root, "missing", "default")
         assert result == "default"
 
     def test_returns_none_default_when_not_specified(self):
         """Test None default when no default specified."""
         xml = "<root></root>"
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         result = safe_find_text(root, "missing")
         assert result is None
 
     def test_returns_default_for_empty_text(self):
         """Test default value when element exists but is empty."""
         xml = "<root><item></item></root>"
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         result = safe_find_text(root, "item", "default")
         assert result == "default"
 
@@ -59,35 +84,35 @@ class TestSafeFindInt:
     def test_parses_valid_integer(self):
         """Test parsing valid integer from XML."""
         xml = "<root><count>42</count></root>"
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         result = safe_find_int(root, "count")
         assert result == 42
 
     def test_returns_default_for_missing_element(self):
         """Test default value when element doesn't exist."""
         xml = "<root></root>"
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         result = safe_find_int(root, "missing", 99)
         assert result == 99
 
     def test_returns_zero_default_when_not_specified(self):
         """Test zero default when no default specified."""
         xml = "<root></root>"
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         result = safe_find_int(root, "missing")
         assert result == 0
 
     def test_returns_default_for_invalid_integer(self):
         """Test default value when text cannot be parsed as integer."""
         xml = "<root><count>not_a_number</count></root>"
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         result = safe_find_int(root, "count", 99)
         assert result == 99
 
     def test_handles_negative_integers(self):
         """Test parsing negative integers."""
         xml = "<root><value>-123</value></root>"
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         result = safe_find_int(root, "value")
         assert result == -123
 
@@ -98,56 +123,56 @@ class TestSafeFindBool:
     def test_parses_true_string(self):
         """Test parsing 'True' string."""
         xml = "<root><flag>True</flag></root>"
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         result = safe_find_bool(root, "flag")
         assert result is True
 
     def test_parses_false_string(self):
         """Test parsing 'False' string."""
         xml = "<root><flag>False</flag></root>"
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         result = safe_find_bool(root, "flag")
         assert result is False
 
     def test_parses_one_as_true(self):
         """Test parsing '1' as True."""
         xml = "<root><flag>1</flag></root>"
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         result = safe_find_bool(root, "flag")
         assert result is True
 
     def test_parses_zero_as_false(self):
         """Test parsing '0' as False."""
         xml = "<root><flag>0</flag></root>"
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         result = safe_find_bool(root, "flag")
         assert result is False
 
     def test_parses_yes_as_true(self):
         """Test parsing 'yes' as True."""
         xml = "<root><flag>yes</flag></root>"
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         result = safe_find_bool(root, "flag")
         assert result is True
 
     def test_returns_default_for_missing_element(self):
         """Test default value when element doesn't exist."""
         xml = "<root></root>"
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         result = safe_find_bool(root, "missing", True)
         assert result is True
 
     def test_returns_false_default_when_not_specified(self):
         """Test False default when no default specified."""
         xml = "<root></root>"
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         result = safe_find_bool(root, "missing")
         assert result is False
 
     def test_case_insensitive_parsing(self):
         """Test case insensitive boolean parsing."""
         xml = "<root><flag>TRUE</flag></root>"
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         result = safe_find_bool(root, "flag")
         assert result is True
 
@@ -169,7 +194,7 @@ class TestParseUser:
             </Teams>
         </root>
         """
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         user = parse_user(root)
 
         assert isinstance(user, CHPPUser)
@@ -194,7 +219,7 @@ class TestParseUser:
             </Teams>
         </root>
         """
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         user = parse_user(root)
 
         assert user.youth_team_id == 99999
@@ -208,7 +233,7 @@ class TestParseUser:
             </Manager>
         </root>
         """
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         user = parse_user(root)
 
         assert user.ht_id == 12345
@@ -231,7 +256,7 @@ class TestParseUser:
             </Teams>
         </root>
         """
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         user = parse_user(root)
 
         # Should skip the empty team ID
@@ -263,7 +288,7 @@ class TestParseTeam:
             </Arena>
         </root>
         """
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         team = parse_team(root)
 
         assert isinstance(team, CHPPTeam)
@@ -296,7 +321,7 @@ class TestParseTeam:
             </Fans>
         </root>
         """
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         team = parse_team(root)
 
         assert team.fanclub_size == 1500
@@ -314,7 +339,7 @@ class TestParseTeam:
             </Team>
         </root>
         """
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         team = parse_team(root)
 
         assert team.team_id == 12345
@@ -360,7 +385,7 @@ class TestParsePlayer:
             </Player>
         </root>
         """
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         player = parse_player(root)
 
         assert isinstance(player, CHPPPlayer)
@@ -396,7 +421,7 @@ class TestParsePlayer:
             </Player>
         </root>
         """
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         player = parse_player(root)
 
         assert player.player_id == 12345
@@ -438,7 +463,7 @@ class TestParsePlayers:
             </PlayerList>
         </root>
         """
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         players = parse_players(root)
 
         assert len(players) == 2
@@ -464,7 +489,7 @@ class TestParsePlayers:
             </PlayerList>
         </root>
         """
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         players = parse_players(root)
 
         assert players == []
@@ -472,7 +497,7 @@ class TestParsePlayers:
     def test_handles_missing_player_list(self):
         """Test parsing when PlayerList is missing."""
         xml = "<root></root>"
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         players = parse_players(root)
 
         assert players == []
@@ -502,7 +527,7 @@ class TestParseMatches:
             </Team>
         </root>
         """
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         matches = parse_matches(root)
 
         assert len(matches) == 1
@@ -538,7 +563,7 @@ class TestParseMatches:
             </Team>
         </root>
         """
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         matches = parse_matches(root)
 
         assert len(matches) == 2
@@ -555,7 +580,189 @@ class TestParseMatches:
             </Team>
         </root>
         """
-        root = ET.fromstring(xml)
+        root = fromstring(xml)
         matches = parse_matches(root)
 
         assert matches == []
+
+
+class TestFieldMap:
+    """Test the single-pass FieldMap reader."""
+
+    FIELDS = FieldMap({
+        "id": ("ID", int, 0),
+        "name": ("Name", str, ""),
+        "rating": ("Team/Rating", float, None),
+        "goals": ("Goals/Goal", FieldMap({"minute": ("Minute", int, 0)}), []),
+    })
+
+    def test_reads_nested_and_repeated_fields(self):
+        """Test container paths and repeated child elements."""
+        root = fromstring("""
+        <Match>
+            <ID>7</ID>
+            <Team><Rating>12.5</Rating></Team>
+            <Goals><Goal><Minute>3</Minute></Goal><Goal><Minute>88</Minute></Goal></Goals>
+        </Match>
+        """)
+
+        assert self.FIELDS.read(root) == {
+            "id": 7, "name": "", "rating": 12.5, "goals": [{"minute": 3}, {"minute": 88}]
+        }
+
+    def test_invalid_and_empty_values_keep_defaults(self):
+        """Test that bad values fall back to defaults like safe_find_*."""
+        root = fromstring("<Match><ID>abc</ID><Name></Name><Team/></Match>")
+
+        values = self.FIELDS.read(root)
+
+        assert values == {"id": 0, "name": "", "rating": None, "goals": []}
+        assert self.FIELDS.read(root)["goals"] is not values["goals"]
+
+
+class TestRecordedResponses:
+    """Test the parsers on recorded CHPP responses."""
+
+    @pytest.mark.parametrize("parser, fixture", [
+        ("parse_players", "players.xml"),
+        ("parse_player", "player.xml"),
+        ("parse_matchdetails", "matchdetails.xml"),
+    ])
+    def test_matches_find_per_field_parsers(self, parser, fixture):
+        """Test that the field-map parsers equal the previous implementations."""
+        root = fromstring((FIXTURES / fixture).read_bytes())
+
+        assert globals()[parser](root) == getattr(chpp_reference_parsers, parser)(root)
+
+    def test_player_transfer_details(self):
+        """Test the nested TransferDetails of a transfer-listed player."""
+        player = parse_player(fromstring((FIXTURES / "player.xml").read_bytes()))
+
+        assert player.arrival_date == datetime(2025, 3, 17, 8, 17)
+        assert player.transfer_details.asking_price == 1250000
+        assert player.transfer_details.max_bid is None
+        assert player.transfer_details.bidder_team.team_name == "Bidders United"
+
+    def test_matchdetails(self):
+        """Test match statistics, officials and events lists."""
+        details = parse_matchdetails(fromstring((FIXTURES / "matchdetails.xml").read_bytes()))
+
+        assert details.ht_id == 742113901
+        assert details.possession_first_half_home == 54
+        assert details.attendance == 31250
+        assert details.referee_name == "Official 1"
+        assert details.home_team_dress_uri == "//res.hattrick.org/kits/9838/kit.png"
+        assert [goal["minute"] for goal in details.scorers] == [10, 27, 44, 61]
+        assert details.bookings[0]["booking_type"] == 2
+        assert details.injuries == [{
+            "player_id": 470055433, "player_name": "Hurt Player", "team_id": 41270,
+            "injury_type": 1, "minute": 61,
+        }]
+
+    def test_matchdetails_without_match(self):
+        """Test that a response without a Match element yields defaults."""
+        details = parse_matchdetails(fromstring("<HattrickData/>"))
+
+        assert details.ht_id == 0
+        assert details.home_team_rating is None
+        assert details.scorers == []
+
+
+def _chunks(data: bytes, size: int = 97):
+    """Split a document into small chunks that cut through tags."""
+    return (data[i:i + size] for i in range(0, len(data), size))
+
+
+class TestIterparseRecords:
+    """Test incremental parsing of response bodies."""
+
+    ARCHIVE = b"""<HattrickData><Team><TeamID>1</TeamID><MatchList>
+        <Match><MatchID>11</MatchID><HomeTeamName>A</HomeTeamName></Match>
+        <Match><MatchID>12</MatchID><HomeTeamName>B</HomeTeamName></Match>
+    </MatchList></Team></HattrickData>"""
+
+    def test_yields_records_and_frees_them(self):
+        """Test that records are parsed in order and removed from the tree."""
+        roots = []
+
+        matches = list(iterparse_records(
+            _chunks(self.ARCHIVE, 7), "MatchList/Match", parse_match_node, check=roots.append
+        ))
+
+        assert [(m.ht_id, m.home_team_name) for m in matches] == [(11, "A"), (12, "B")]
+        assert roots[0].find(".//Match") is None
+        assert roots[0].find("Team/TeamID").text == "1"
+
+    def test_is_lazy(self):
+        """Test that the first record is available before the body is consumed."""
+        chunks = _chunks(self.ARCHIVE, 7)
+
+        first = next(iterparse_records(chunks, "MatchList/Match", parse_match_node))
+
+        assert first.ht_id == 11
+        assert next(chunks, None) is not None
+
+    def test_path_requires_parent_tags(self):
+        """Test that elements under a different parent are not records."""
+        xml = b"<HattrickData><Match><MatchID>1</MatchID></Match></HattrickData>"
+
+        assert list(iterparse_records([xml], "MatchList/Match", parse_match_node)) == []
+
+    @pytest.mark.parametrize("path, parser, fixture", [
+        ("PlayerList/Player", parse_players_node, "players.xml"),
+        ("HattrickData/Match", parse_matchdetails_node, "matchdetails.xml"),
+    ])
+    def test_matches_tree_parsers(self, path, parser, fixture):
+        """Test that streamed records equal the whole-tree parse."""
+        data = (FIXTURES / fixture).read_bytes()
+        expected = {"players.xml": parse_players, "matchdetails.xml": lambda r: [parse_matchdetails(r)]}[fixture]
+
+        streamed = list(iterparse_records(_chunks(data), path, parser, discard=("EventList",)))
+
+        assert streamed == expected(fromstring(data))
+
+    def test_discarded_children_are_dropped_as_they_close(self, monkeypatch):
+        """Test that a discarded subtree never holds more than one child."""
+        events = "".join(
+            f"<Event><EventTypeID>{i}</EventTypeID><EventText>goal</EventText></Event>" for i in range(50)
+        )
+        xml = f"<HattrickData><Match><MatchID>7</MatchID><EventList>{events}</EventList></Match></HattrickData>"
+        pull_events = parsers_module._pull_events
+        sizes = []
+
+        def watched(chunks):
+            # Sampled when an Event starts, after every earlier event was handled
+            event_list = None
+            for event, elem in pull_events(chunks):
+                if event == "start" and elem.tag == "EventList":
+                    event_list = elem
+                elif event == "start" and elem.tag == "Event":
+                    sizes.append(len(event_list))
+                yield event, elem
+
+        monkeypatch.setattr(parsers_module, "_pull_events", watched)
+
+        matches = list(iterparse_records(_chunks(xml.encode(), 31), "HattrickData/Match",
+                                         parse_matchdetails_node, discard=("EventList",)))
+
+        assert matches[0].ht_id == 7
+        assert sizes == [1] * 50
+
+    def test_malformed_document_raises(self):
+        """Test that truncated bodies surface as parse errors."""
+        with pytest.raises(PARSE_ERRORS):
+            list(iterparse_records([self.ARCHIVE[:-20]], "MatchList/Match", parse_match_node))
+
+
+class TestXmlBackend:
+    """Test XML backend selection."""
+
+    def test_selected_backend_builds_the_trees(self, xml_backend):
+        """Test that fromstring uses the selected backend."""
+        assert backend_name() == xml_backend
+        assert type(fromstring("<a/>")).__module__.startswith("lxml" if xml_backend == "lxml" else "xml")
+
+    def test_unknown_backend_rejected(self):
+        """Test that typos in CHPP_XML_BACKEND fail loudly."""
+        with pytest.raises(ValueError):
+            set_backend("expat")
@@ -6,11 +6,13 @@ Tests player_diff, player_daily_changes, and get_player_changes functions
 that have significant uncovered lines according to coverage report.
 """
 
+from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from app.utils import player_daily_changes, player_diff
+from app.utils import get_player_changes, player_daily_changes, player_diff
+from models import Players
 
 
 class TestPlayerDiffFunctions:
@@ -217,6 +219,60 @@ class TestPlayerDiffFunctions:
         assert "Error in player_daily_changes" in str(mock_dprint.call_args)
 
 
+class TestSnapshotDayBoundaries:
+    """Day lookups run as timestamp ranges and must keep whole-day semantics."""
+
+    def _add_snapshots(self, db_session, snapshots, player_id=10000):
+        """Store one player's history as (data_date, keeper) snapshots."""
+        for data_date, keeper in snapshots:
+            db_session.execute(
+                Players.__table__.insert().values(
+                    ht_id=player_id,
+                    data_date=data_date,
+                    owner=12345,
+                    first_name="TestPlayer0",
+                    last_name="LastName0",
+                    keeper=keeper,
+                )
+            )
+        db_session.commit()
+        return player_id
+
+    def test_player_daily_changes_uses_latest_snapshot_of_day(self, app, db_session):
+        """Late-evening snapshots belong to their own day, not the next one."""
+        today = datetime.combine(datetime.now().date(), datetime.min.time())
+        player_id = self._add_snapshots(
+            db_session,
+            [
+                (today - timedelta(days=3) + timedelta(hours=23, minutes=30), 1),
+                (today - timedelta(days=2) + timedelta(minutes=15), 2),
+                (today - timedelta(days=2) + timedelta(hours=23, minutes=59), 3),
+                (today - timedelta(days=1), 9),
+            ],
+        )
+
+        result = player_daily_changes(player_id, 2, "Day Team")
+
+        assert result[0] == ["Day Team", "TestPlayer0", "LastName0"]
+        assert result[1][3:] == ["Keeper", 1, 3]
+
+    def test_get_player_changes_includes_whole_end_day(self, app, db_session):
+        """The end of a period includes snapshots taken late on that day."""
+        today = datetime.combine(datetime.now().date(), datetime.min.time())
+        player_id = self._add_snapshots(
+            db_session,
+            [
+                (today - timedelta(days=5) + timedelta(hours=22), 1),
+                (today - timedelta(days=1) + timedelta(hours=23), 4),
+                (today + timedelta(hours=1), 7),
+            ],
+        )
+
+        changes = get_player_changes(player_id, 5, 1)
+
+        assert [change[2:] for change in changes] == [[1, 4, "skill"]]
+
+
 def test_module_imports():
     """Test that player diff module imports work correctly."""
     from app import utils
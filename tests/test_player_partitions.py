@@ -0,0 +1,86 @@
+"""Tests for monthly players partition maintenance."""
+
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+from app.player_partitions import (
+    add_months,
+    create_partition_sql,
+    detach_expired_partitions,
+    ensure_player_partitions,
+    is_partitioned,
+    partition_month,
+    partition_name,
+)
+
+
+class TestPartitionNaming:
+    """Month arithmetic and partition names."""
+
+    def test_add_months_crosses_year_boundaries(self):
+        assert add_months(date(2026, 11, 1), 2) == date(2027, 1, 1)
+        assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+    def test_partition_name_round_trips(self):
+        assert partition_name(date(2026, 3, 1)) == "players_p2026_03"
+        assert partition_month("players_p2026_03") == date(2026, 3, 1)
+        assert partition_month("players_unpartitioned") is None
+
+    def test_create_partition_sql_uses_half_open_month(self):
+        sql = create_partition_sql(date(2026, 12, 1))
+
+        assert "players_p2026_12 PARTITION OF players" in sql
+        assert "FROM ('2026-12-01') TO ('2027-01-01')" in sql
+
+
+class TestPartitionMaintenance:
+    """Maintenance is a no-op without PostgreSQL partitioning."""
+
+    def test_plain_table_is_left_alone(self, app, db_session):
+        assert is_partitioned(db_session) is False
+        assert ensure_player_partitions(db_session) == []
+        assert detach_expired_partitions(db_session, retain_months=1) == []
+
+    @patch("app.player_partitions._attached_partitions")
+    @patch("app.player_partitions.is_partitioned", return_value=True)
+    def test_ensure_creates_missing_upcoming_months(self, _partitioned, mock_attached):
+        session = MagicMock()
+        mock_attached.return_value = {date(2026, 10, 1): "players_p2026_10"}
+
+        created = ensure_player_partitions(session, months_ahead=2, today=datetime(2026, 10, 19))
+
+        assert created == ["players_p2026_11", "players_p2026_12"]
+        assert session.execute.call_count == 2
+
+    @patch("app.player_partitions.rebase_expiring_deltas")
+    @patch("app.player_partitions._attached_partitions")
+    @patch("app.player_partitions.is_partitioned", return_value=True)
+    def test_detach_only_touches_months_outside_retention(self, _partitioned, mock_attached, mock_rebase):
+        session = MagicMock()
+        mock_attached.return_value = {
+            date(2026, 7, 1): "players_p2026_07",
+            date(2026, 8, 1): "players_p2026_08",
+            date(2026, 9, 1): "players_p2026_09",
+        }
+
+        detached = detach_expired_partitions(
+            session, retain_months=2, drop=True, today=datetime(2026, 10, 19)
+        )
+
+        assert detached == ["players_p2026_07"]
+        statements = [str(call.args[0]) for call in session.execute.call_args_list]
+        assert statements[0] == "ALTER TABLE players DETACH PARTITION players_p2026_07"
+        assert statements[1] == "DROP TABLE players_p2026_07"
+        assert "DELETE FROM player_snapshot_delta WHERE data_date < :cutoff" in statements[2]
+        mock_rebase.assert_called_once_with(session, datetime(2026, 8, 1))
+
+    @patch("app.player_partitions.rebase_expiring_deltas")
+    @patch("app.player_partitions._attached_partitions")
+    @patch("app.player_partitions.is_partitioned", return_value=True)
+    def test_nothing_expired_keeps_deltas(self, _partitioned, mock_attached, mock_rebase):
+        session = MagicMock()
+        mock_attached.return_value = {date(2026, 9, 1): "players_p2026_09"}
+
+        assert detach_expired_partitions(session, retain_months=2, today=datetime(2026, 10, 19)) == []
+        session.execute.assert_not_called()
+        mock_rebase.assert_not_called()
@@ -0,0 +1,326 @@
+"""Tests for full and delta player snapshot storage."""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from app.player_snapshots import (
+    compact_player_history,
+    downsample_player_history,
+    expand_player_history,
+    get_current_roster,
+    get_player_snapshot,
+    load_player_history,
+    rebase_expiring_deltas,
+    release_player,
+    store_player_snapshot,
+)
+from models import PlayerLatest, Players, PlayerSnapshotDelta
+
+PLAYER_ID = 20001
+OWNER_ID = 12345
+DAY_ONE = datetime(2026, 3, 2)
+
+
+def _playerdata(**overrides):
+    data = {
+        "ht_id": PLAYER_ID,
+        "first_name": "Delta",
+        "nick_name": "",
+        "last_name": "Player",
+        "number": 7,
+        "category_id": 1,
+        "owner_notes": "",
+        "age_years": 21,
+        "age_days": 10,
+        "age": "21.10",
+        "next_birthday": datetime(2026, 5, 1, 12, 0),
+        "arrival_date": datetime(2025, 1, 1),
+        "form": 6,
+        "cards": 0,
+        "injury_level": -1,
+        "statement": "",
+        "language": "English",
+        "language_id": 2,
+        "agreeability": 3,
+        "aggressiveness": 3,
+        "honesty": 3,
+        "experience": 2,
+        "loyalty": 4,
+        "specialty": 0,
+        "native_country_id": 1,
+        "native_league_id": 1,
+        "native_league_name": "Test League",
+        "tsi": 1500,
+        "salary": 5000,
+        "caps": 0,
+        "caps_u20": 0,
+        "career_goals": 0,
+        "career_hattricks": 0,
+        "league_goals": 0,
+        "cup_goals": 0,
+        "friendly_goals": 0,
+        "current_team_matches": 0,
+        "current_team_goals": 0,
+        "national_team_id": None,
+        "national_team_name": None,
+        "is_transfer_listed": False,
+        "team_id": OWNER_ID,
+        "stamina": 7,
+        "keeper": 1,
+        "defender": 5,
+        "playmaker": 4,
+        "winger": 3,
+        "passing": 3,
+        "scorer": 2,
+        "set_pieces": 2,
+        "owner": OWNER_ID,
+        "old_owner": None,
+        "mother_club_bonus": False,
+        "leadership": 3,
+    }
+    data.update(overrides)
+    return data
+
+
+def _store(session, day, **overrides):
+    """Store a snapshot as if /update ran `day` days after DAY_ONE."""
+    snapshot_date = (DAY_ONE + timedelta(days=day)).strftime("%Y-%m-%d")
+    with patch("models.time.strftime", return_value=snapshot_date):
+        store_player_snapshot(session, _playerdata(**overrides))
+    session.commit()
+
+
+def _store_week(session):
+    _store(session, 0)
+    _store(session, 1, form=7)
+    _store(session, 2, form=7, defender=6, next_birthday=datetime(2026, 5, 2, 12, 0))
+    _store(session, 3, form=5, defender=6)
+
+
+@pytest.fixture
+def delta_storage(app, monkeypatch):
+    monkeypatch.setitem(app.config, "PLAYER_SNAPSHOT_STORAGE", "delta")
+    monkeypatch.setitem(app.config, "PLAYER_KEYFRAME_DAYS", 7)
+
+
+class TestFullStorage:
+    """Default storage keeps one complete row per player per day."""
+
+    def test_every_day_is_a_full_row(self, app, db_session):
+        _store_week(db_session)
+
+        assert db_session.query(Players).filter_by(ht_id=PLAYER_ID).count() == 4
+        assert db_session.query(PlayerSnapshotDelta).count() == 0
+
+    def test_same_day_update_replaces_snapshot(self, app, db_session):
+        _store(db_session, 0)
+        _store(db_session, 0, form=8)
+
+        rows = db_session.query(Players).filter_by(ht_id=PLAYER_ID).all()
+        assert [row.form for row in rows] == [8]
+
+
+class TestDeltaStorage:
+    """Delta storage keeps keyframes plus changed columns per day."""
+
+    def test_days_between_keyframe_and_head_become_deltas(self, delta_storage, db_session):
+        _store_week(db_session)
+
+        full_dates = [
+            row.data_date
+            for row in db_session.query(Players).filter_by(ht_id=PLAYER_ID).order_by(Players.data_date)
+        ]
+        assert full_dates == [DAY_ONE, DAY_ONE + timedelta(days=3)]
+
+        deltas = db_session.query(PlayerSnapshotDelta).order_by(PlayerSnapshotDelta.data_date).all()
+        assert [delta.keyframe_date for delta in deltas] == [DAY_ONE, DAY_ONE]
+        assert deltas[0].changes == {"form": 7}
+        assert deltas[1].changes == {
+            "form": 7,
+            "defender": 6,
+            "next_birthday": "2026-05-02T12:00:00",
+        }
+
+    def test_history_is_rebuilt_in_date_order(self, delta_storage, db_session):
+        _store_week(db_session)
+
+        history = load_player_history(db_session, owner=OWNER_ID)
+
+        assert [record.data_date for record in history] == [
+            DAY_ONE + timedelta(days=day) for day in range(4)
+        ]
+        assert [record.form for record in history] == [6, 7, 7, 5]
+        assert [record.defender for record in history] == [5, 5, 6, 6]
+        assert history[2].next_birthday == datetime(2026, 5, 2, 12, 0)
+        assert dict(iter(history[1]))["first_name"] == "Delta"
+
+    def test_snapshot_lookup_reads_deltas(self, delta_storage, db_session):
+        _store_week(db_session)
+
+        snapshot = get_player_snapshot(
+            db_session, PLAYER_ID, before=DAY_ONE + timedelta(days=3)
+        )
+        assert snapshot.data_date == DAY_ONE + timedelta(days=2)
+        assert snapshot.defender == 6
+
+        day = DAY_ONE + timedelta(days=1)
+        snapshot = get_player_snapshot(
+            db_session, PLAYER_ID, since=day, before=day + timedelta(days=1)
+        )
+        assert (snapshot.data_date, snapshot.form) == (day, 7)
+
+    def test_keyframe_interval_and_owner_change_start_keyframes(
+        self, app, delta_storage, db_session, monkeypatch
+    ):
+        monkeypatch.setitem(app.config, "PLAYER_KEYFRAME_DAYS", 2)
+        _store(db_session, 0)
+        _store(db_session, 1, form=7)
+        _store(db_session, 2, form=8)
+        _store(db_session, 3, owner=67890)
+        _store(db_session, 4, owner=67890)
+
+        full_dates = [
+            row.data_date
+            for row in db_session.query(Players).filter_by(ht_id=PLAYER_ID).order_by(Players.data_date)
+        ]
+        assert full_dates == [DAY_ONE + timedelta(days=day) for day in (0, 2, 3, 4)]
+
+    def test_head_still_used_as_keyframe_is_not_folded(self, app, delta_storage, db_session, monkeypatch):
+        monkeypatch.setitem(app.config, "PLAYER_KEYFRAME_DAYS", 2)
+        for day in range(5):
+            _store(db_session, day, form=day)
+        # Full rows on days 0, 2 and 4; day 3 is a delta on day 2. With a longer
+        # interval, replacing day 4 makes day 2 the head while day 3 needs it.
+        monkeypatch.setitem(app.config, "PLAYER_KEYFRAME_DAYS", 7)
+        _store(db_session, 4, form=9)
+
+        history = load_player_history(db_session, ht_id=PLAYER_ID)
+        assert [(record.data_date, record.form) for record in history] == [
+            (DAY_ONE + timedelta(days=day), form) for day, form in enumerate((0, 1, 2, 3, 9))
+        ]
+
+class TestCurrentRoster:
+    """player_latest follows every stored snapshot."""
+
+    def test_roster_returns_newest_snapshot(self, app, db_session):
+        _store_week(db_session)
+        _store(db_session, 1, ht_id=PLAYER_ID + 1, first_name="Other")
+
+        roster = get_current_roster(db_session, OWNER_ID, Players.ht_id)
+
+        assert [(p.ht_id, p.data_date) for p in roster] == [
+            (PLAYER_ID, DAY_ONE + timedelta(days=3)),
+            (PLAYER_ID + 1, DAY_ONE + timedelta(days=1)),
+        ]
+        assert roster[0].form == 5
+
+    def test_roster_follows_delta_folding(self, delta_storage, db_session):
+        _store_week(db_session)
+
+        roster = get_current_roster(db_session, OWNER_ID)
+
+        assert [(p.data_date, p.defender) for p in roster] == [(DAY_ONE + timedelta(days=3), 6)]
+
+    def test_released_player_leaves_roster(self, app, db_session):
+        _store_week(db_session)
+
+        release_player(db_session, PLAYER_ID, OWNER_ID)
+        db_session.commit()
+
+        assert get_current_roster(db_session, OWNER_ID) == []
+        assert db_session.get(PlayerLatest, PLAYER_ID).owner == 0
+        assert {row.old_owner for row in db_session.query(Players)} == {OWNER_ID}
+
+
+class TestHistoryConversion:
+    """Existing full-row history can be compacted and expanded again."""
+
+    def test_compact_then_expand_round_trips(self, delta_storage, db_session, app, monkeypatch):
+        monkeypatch.setitem(app.config, "PLAYER_SNAPSHOT_STORAGE", "full")
+        _store_week(db_session)
+        original = [dict(iter(row)) for row in load_player_history(db_session, ht_id=PLAYER_ID)]
+
+        monkeypatch.setitem(app.config, "PLAYER_SNAPSHOT_STORAGE", "delta")
+        assert compact_player_history(db_session, PLAYER_ID) == 2
+        db_session.commit()
+        assert compact_player_history(db_session, PLAYER_ID) == 0
+
+        compacted = [dict(iter(row)) for row in load_player_history(db_session, ht_id=PLAYER_ID)]
+        assert compacted == original
+
+        assert expand_player_history(db_session, PLAYER_ID) == 2
+        db_session.commit()
+        assert db_session.query(PlayerSnapshotDelta).count() == 0
+        expanded = [dict(iter(row)) for row in load_player_history(db_session, ht_id=PLAYER_ID)]
+        assert expanded == original
+
+    def test_rebase_keeps_chain_spanning_cutoff(self, delta_storage, db_session):
+        _store_week(db_session)
+        _store(db_session, 4, form=4, defender=6)
+        original = [dict(iter(row)) for row in load_player_history(db_session, ht_id=PLAYER_ID)]
+        cutoff = DAY_ONE + timedelta(days=2)
+
+        assert rebase_expiring_deltas(db_session, cutoff) == 1
+        db_session.commit()
+
+        full_dates = [
+            row.data_date
+            for row in db_session.query(Players).filter_by(ht_id=PLAYER_ID).order_by(Players.data_date)
+        ]
+        assert full_dates == [DAY_ONE, cutoff, DAY_ONE + timedelta(days=4)]
+        deltas = db_session.query(PlayerSnapshotDelta).order_by(PlayerSnapshotDelta.data_date).all()
+        assert [(d.data_date, d.keyframe_date) for d in deltas] == [
+            (DAY_ONE + timedelta(days=1), DAY_ONE),
+            (DAY_ONE + timedelta(days=3), cutoff),
+        ]
+        assert deltas[1].changes == {"form": 5, "next_birthday": "2026-05-01T12:00:00"}
+
+        # Dropping everything before the cutoff leaves the window rebuildable
+        db_session.query(Players).filter(Players.data_date < cutoff).delete()
+        db_session.query(PlayerSnapshotDelta).filter(PlayerSnapshotDelta.data_date < cutoff).delete()
+        db_session.commit()
+        remaining = [dict(iter(row)) for row in load_player_history(db_session, ht_id=PLAYER_ID)]
+        assert remaining == original[2:]
+
+
+class TestDownsampling:
+    """Old daily history is thinned to weekly without losing skill changes."""
+
+    def test_old_days_thinned_to_weekly_and_skill_changes(self, app, db_session):
+        # DAY_ONE is a Monday; three weeks of daily snapshots, one skill pop
+        for day in range(21):
+            _store(db_session, day, form=day % 8, defender=6 if day >= 9 else 5)
+        before = load_player_history(db_session, ht_id=PLAYER_ID)
+
+        removed = downsample_player_history(
+            db_session, PLAYER_ID, keep_days=3, today=(DAY_ONE + timedelta(days=20)).date()
+        )
+        db_session.commit()
+
+        kept = [(record.data_date - DAY_ONE).days for record in load_player_history(db_session, ht_id=PLAYER_ID)]
+        # first day, skill change (day 9), last old day of each week, daily window
+        assert kept == [0, 6, 9, 13, 16, 17, 18, 19, 20]
+        assert removed == 21 - len(kept)
+
+        def skill_on(history, day):
+            return [r.defender for r in history if (r.data_date - DAY_ONE).days <= day][-1]
+
+        after = load_player_history(db_session, ht_id=PLAYER_ID)
+        assert [skill_on(after, day) for day in range(21)] == [
+            skill_on(before, day) for day in range(21)
+        ]
+
+    def test_referenced_keyframes_survive(self, delta_storage, db_session):
+        for day in range(10):
+            _store(db_session, day, form=day)
+
+        downsample_player_history(
+            db_session, PLAYER_ID, keep_days=1, today=(DAY_ONE + timedelta(days=9)).date()
+        )
+        db_session.commit()
+
+        history = load_player_history(db_session, ht_id=PLAYER_ID)
+        assert [(record.data_date - DAY_ONE).days for record in history] == [0, 6, 7, 8, 9]
+        assert [record.form for record in history] == [0, 6, 7, 8, 9]
@@ -0,0 +1,178 @@
+"""
+Query plan regression tests for the hot read paths.
+
+Each test seeds a small team, runs the real player, training or matches view
+(or the team timeline) while recording every SELECT it sends to the database,
+then EXPLAINs those statements with their parameters. A test fails if the
+planner falls back to a full table scan on one of the indexed tables, which is
+what happens when a composite index in models.py is dropped or a view's query
+changes so that the index no longer matches.
+"""
+
+import re
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from flask import session as flask_session
+from sqlalchemy import event, text
+
+from app import utils as utils_module
+from app.blueprints import matches as matches_module
+from app.blueprints import player as player_module
+from app.blueprints import training as training_module
+from app.factory import db
+from app.model_registry import ModelRegistry
+from app.utils import get_team_timeline
+from models import Group, Match, MatchPlay, Players, PlayerSetting, User
+
+OWNER_ID = 12345
+USER_ID = 182085
+PLAYER_IDS = (1001, 1002)
+MATCH_IDS = (501, 502)
+INDEXED_TABLES = ("players", "player_latest", "match", "matchplay", "playersetting")
+
+
+def _seed(session):
+    """Store a user, a group and two weeks of history for two players and matches."""
+    today = datetime.combine(datetime.now().date(), datetime.min.time())
+    session.execute(User.__table__.insert().values(
+        ht_id=USER_ID, ht_user="planner", username="planner", password="test_password",
+        access_key="test_access_key", access_secret="test_access_secret",
+    ))
+    group = Group(user_id=USER_ID, name="Starters", order=1, textcolor="#000000", bgcolor="#FFFFFF")
+    session.add(group)
+    session.flush()
+    session.add(PlayerSetting(player_id=PLAYER_IDS[0], user_id=USER_ID, group_id=group.id))
+    for ht_id in PLAYER_IDS:
+        for days_ago in (14, 7, 0):
+            session.execute(Players.__table__.insert().values(
+                ht_id=ht_id, data_date=today - timedelta(days=days_ago), owner=OWNER_ID,
+                first_name=f"Player{ht_id}", last_name="Plan", number=ht_id % 100,
+                keeper=1, defender=5 + (14 - days_ago) // 7, playmaker=4, winger=3,
+                passing=4, scorer=3, set_pieces=2, form=5, stamina=6, tsi=1000,
+            ))
+    for match_id, days_ago in zip(MATCH_IDS, (10, 3), strict=True):
+        kickoff = today - timedelta(days=days_ago)
+        session.execute(Match.__table__.insert().values(
+            ht_id=match_id, home_team_id=OWNER_ID, home_team_name="Home FC",
+            away_team_id=54321, away_team_name="Away FC", datetime=kickoff,
+            matchtype=1, context_id=0, rule_id=0, cup_level=0, cup_level_index=0,
+            home_goals=2, away_goals=1,
+        ))
+        for ht_id in PLAYER_IDS:
+            session.execute(MatchPlay.__table__.insert().values(
+                id=match_id * 10 + ht_id % 10, match_id=match_id, player_id=ht_id, datetime=kickoff,
+                first_name=f"Player{ht_id}", last_name="Plan", role_id=100,
+                rating_stars=3.5, rating_stars_eom=3.0, behaviour=0,
+            ))
+    session.commit()
+
+
+def _explain(session, statement, parameters):
+    """Return the plan lines of a captured statement on the test database."""
+    connection = session.connection()
+    if connection.dialect.name == "postgresql":
+        # Tiny test tables are always cheaper to scan sequentially; disabling
+        # seqscans leaves them in the plan only when no index can serve the query
+        connection.execute(text("SET LOCAL enable_seqscan = off"))
+        rows = connection.exec_driver_sql(f"EXPLAIN {statement}", parameters).all()
+        return [row[0] for row in rows]
+    rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    return [row[-1] for row in rows]
+
+
+def _full_scans(plan, table):
+    """Return plan lines that read every row of the given table."""
+    full = []
+    for line in plan:
+        # SQLite reports index lookups as SEARCH and walks as SCAN
+        if f"Seq Scan on {table}" in line or line.split()[:2] == ["SCAN", table]:
+            full.append(line)
+    return full
+
+
+@pytest.mark.usefixtures("app")
+class TestHotQueryPlans:
+    """The queries the hot pages actually run must be served by an index."""
+
+    @pytest.fixture
+    def team(self, db_session, monkeypatch):
+        for module in (player_module, training_module, matches_module, utils_module):
+            monkeypatch.setattr(module, "db", db)
+        # The registry tests leave ModelRegistry cleared; let it register the models again
+        monkeypatch.setattr(ModelRegistry, "_models", {})
+        monkeypatch.setattr(ModelRegistry, "_initialized", False)
+        # Page-view tracking assigns string timestamps, which SQLite's DateTime type rejects
+        for page in ("player", "training", "matches"):
+            monkeypatch.setattr(User, page, lambda _user: None)
+        _seed(db_session)
+        return db_session
+
+    def _capture(self, session, run):
+        """Call run() and return every SELECT it sent, with its parameters."""
+        statements = []
+
+        def record(_conn, _cursor, statement, parameters, _context, _executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append((statement, parameters))
+
+        connection = session.connection()
+        event.listen(connection, "before_cursor_execute", record)
+        try:
+            result = run()
+        finally:
+            event.remove(connection, "before_cursor_execute", record)
+        return result, statements
+
+    def _render(self, app, session, module, view, path):
+        """Run a page view as the seeded user; return its page arguments and SELECTs."""
+        with app.test_request_context(path), \
+                patch.object(module, "create_page", return_value="page") as create_page:
+            flask_session["current_user"] = "planner"
+            flask_session["current_user_id"] = USER_ID
+            flask_session["all_teams"] = [OWNER_ID]
+            flask_session["all_team_names"] = ["Plan FC"]
+            page, statements = self._capture(session, view)
+        assert page == "page"
+        return create_page.call_args.kwargs, statements
+
+    def _assert_indexed(self, session, statements, *tables):
+        """Fail on any captured statement that fully scans an indexed table."""
+        queried = {table for table in INDEXED_TABLES for statement, _ in statements
+                   if re.search(rf'\b(FROM|JOIN)\s+"?{table}\b', statement)}
+        assert set(tables) <= queried, queried
+        for statement, parameters in statements:
+            plan = _explain(session, statement, parameters)
+            for table in INDEXED_TABLES:
+                assert _full_scans(plan, table) == [], (statement, plan)
+
+    def test_player_page(self, app, team):
+        """player() loads history, first snapshots, star ratings and groups by index."""
+        page, statements = self._render(app, team, player_module, player_module.player, f"/player?id={OWNER_ID}")
+
+        assert sorted(page["allplayerids"]) == list(PLAYER_IDS)
+        self._assert_indexed(team, statements, "players", "matchplay", "playersetting")
+
+    def test_training_page(self, app, team):
+        """training() reads the team's snapshot history by owner."""
+        page, statements = self._render(app, team, training_module, training_module.training,
+                                        f"/training?id={OWNER_ID}")
+
+        assert sorted(page["allplayerids"]) == list(PLAYER_IDS)
+        self._assert_indexed(team, statements, "players")
+
+    def test_matches_page(self, app, team):
+        """matches() lists home and away games and loads each lineup."""
+        page, statements = self._render(app, team, matches_module, matches_module.matches,
+                                        f"/matches?id={OWNER_ID}")
+
+        assert [m.ht_id for m in page["matches"]] == list(reversed(MATCH_IDS))
+        self._assert_indexed(team, statements, "match", "matchplay")
+
+    def test_team_timeline(self, team):
+        """get_team_timeline() lists a team's players and reads their weekly snapshots."""
+        timeline, statements = self._capture(team, lambda: get_team_timeline(OWNER_ID))
+
+        assert timeline["week_1"]["changes"]
+        self._assert_indexed(team, statements, "players")
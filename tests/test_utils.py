@@ -707,50 +707,41 @@ class TestAdminFeedbackCounts:
 
         assert result is None
 
-    @patch('models.FeedbackComment')
-    @patch('models.Feedback')
-    @patch('models.User')
-    @patch('sqlalchemy.exists')
-    @patch('sqlalchemy.and_')
-    def test_get_admin_feedback_counts_admin_user_returns_counts(self, mock_and, mock_exists,
-                                                               mock_user_model, mock_feedback_model,
-                                                               mock_comment_model):
+    def test_get_admin_feedback_counts_admin_user_returns_counts(self, app, db_session):
         """Test get_admin_feedback_counts returns counts for admin users."""
-
-        # Mock admin user
-        mock_admin = Mock()
-        mock_admin.role = "Admin"
-        mock_admin.ht_id = 182085
-
-        # Mock admin users query
-        mock_admin_users = [mock_admin]
-
-        # Mock feedback queries
-        mock_no_replies_query = Mock()
-        mock_no_replies_query.count.return_value = 3
-
-        mock_feedback_with_replies = [Mock(id=1), Mock(id=2)]
-
-        # Mock latest comments (one needs follow-up)
-        mock_latest_comment1 = Mock(author_id=99999)  # Non-admin
-        mock_latest_comment2 = Mock(author_id=182085)  # Admin
-
-        # Setup mocks
-        mock_user_model.query.filter_by.return_value.first.return_value = mock_admin
-        mock_user_model.query.filter.return_value.all.return_value = mock_admin_users
-        mock_feedback_model.query.filter.return_value = mock_no_replies_query
-        mock_feedback_model.query.filter.return_value.all.return_value = mock_feedback_with_replies
-
-        # Mock comment queries for follow-up check
-        mock_comment_model.query.filter_by.return_value.order_by.return_value.first.side_effect = [
-            mock_latest_comment1,  # First feedback needs follow-up
-            mock_latest_comment2   # Second feedback doesn't need follow-up
+        from models import Feedback, FeedbackComment, User
+
+        admin = User(182085, "admin", "admin", "pw", "key", "secret")
+        member = User(99999, "member", "member", "pw", "key", "secret")
+        for user in (admin, member):
+            # Explicit datetimes keep the fixture portable across database backends
+            user.last_login = user.last_update = user.last_usage = user.created = datetime(2024, 1, 1)
+        db_session.add_all([admin, member])
+        db_session.commit()
+
+        unanswered = Feedback("Unanswered", "No replies yet", "bug", member.ht_id)
+        followup = Feedback("Follow-up", "User replied last", "idea", member.ht_id)
+        answered = Feedback("Answered", "Admin replied last", "feature", member.ht_id)
+        archived = Feedback("Archived", "Ignored", "bug", member.ht_id, archived=True)
+        db_session.add_all([unanswered, followup, answered, archived])
+        db_session.commit()
+
+        comments = [
+            (followup, admin, datetime(2024, 1, 1)),
+            (followup, member, datetime(2024, 1, 2)),
+            (answered, member, datetime(2024, 1, 1)),
+            (answered, admin, datetime(2024, 1, 2)),
         ]
+        for feedback, author, created_at in comments:
+            comment = FeedbackComment(feedback.id, author.ht_id, "Comment text")
+            comment.created_at = created_at
+            db_session.add(comment)
+        db_session.commit()
 
         result = get_admin_feedback_counts(182085)
 
         assert result is not None
-        assert result["no_replies"] == 3
+        assert result["no_replies"] == 1
         assert result["needs_followup"] == 1
 
     @patch('models.FeedbackComment')